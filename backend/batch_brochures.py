@@ -0,0 +1,74 @@
+import argparse
+import asyncio
+import json
+import os
+
+from components.batch_runner import load_completed, read_urls
+from container.salesbrochure_container import SalesBrochureContainer
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Generate sales brochures for a list of URLs."
+    )
+    parser.add_argument("input", help="CSV, JSONL or text file of base URLs")
+    parser.add_argument(
+        "-o", "--output", default="brochures.jsonl", help="JSONL results file"
+    )
+    parser.add_argument(
+        "--no-resume",
+        action="store_true",
+        help="Regenerate URLs already completed in the output file",
+    )
+    return parser.parse_args()
+
+
+async def run_batch(input_path: str, output_path: str, resume: bool = True) -> None:
+    """
+    Generate brochures for every URL in ``input_path``.
+
+    Results are appended to ``output_path`` one line per URL as soon as
+    each finishes, so an interrupted run loses no completed work. With
+    ``resume``, URLs that already succeeded in the output are skipped.
+
+    Concurrency and rate limits come from the same environment variables
+    as the API (``BROWSER_POOL_*``, ``LLM_*`` and ``BATCH_*``). With
+    ``SITE_SNAPSHOT_PATH`` set, rerunning a batch only regenerates what
+    changed on each site since the previous run.
+    """
+    urls = read_urls(input_path)
+    done = load_completed(output_path) if resume else set()
+    pending = [url for url in urls if url not in done]
+    print(f"{len(urls)} URLs, {len(urls) - len(pending)} already done")
+
+    browser_pool = SalesBrochureContainer.create_async_browser_pool()
+    scope = SalesBrochureContainer.create_app_scope(
+        browser_pool=browser_pool,
+        page_cache=SalesBrochureContainer.create_page_cache(),
+        response_cache=SalesBrochureContainer.create_response_cache(),
+        site_store=SalesBrochureContainer.create_site_snapshot_store(),
+        llm_limiter=SalesBrochureContainer.create_llm_rate_limiter(),
+    )
+    await browser_pool.start()
+    try:
+        runner = SalesBrochureContainer.create_batch_runner(scope)
+        failed = 0
+        with open(output_path, "a", encoding="utf-8") as out:
+            async for result in runner.run(pending):
+                out.write(json.dumps(result) + "\n")
+                out.flush()
+                os.fsync(out.fileno())
+                failed += result["status"] != "ok"
+                print(f"[{result['status']}] {result['url']} ({result['elapsed']}s)")
+    finally:
+        await scope.aclose()
+        await browser_pool.close()
+
+    print(f"Finished: {len(pending) - failed} ok, {failed} failed")
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    asyncio.run(run_batch(args.input, args.output, resume=not args.no_resume))
+
+# python batch_brochures.py urls.csv -o brochures.jsonl
@@ -1,24 +1,107 @@
-from http.client import HTTPException
+import asyncio
+import json
+import os
+from contextlib import asynccontextmanager
+from typing import List
 
 import uvicorn
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import PlainTextResponse, StreamingResponse
 from pydantic import BaseModel
 
 from container.salesbrochure_container import SalesBrochureContainer
+from components.job_queue import JobQueueFullError
+from core.single_flight import AsyncSingleFlight
+from interfaces.i_browser_pool import BrowserPoolExhaustedError
+from logs.log_context import request_context
+from utils.url_utils import normalize_url
 
-app = FastAPI(title="LLM Sales Brochure API")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Own the app-scoped dependencies (browser pool, OpenAI clients and their
+    connection pools, caches, limiters, orchestrators and job queue) for
+    the lifetime of the application. Orchestrators are stateless, so every
+    request shares the one built for its cache flags.
+    """
+    browser_pool = SalesBrochureContainer.create_async_browser_pool()
+    await browser_pool.start()
+    app.state.browser_pool = browser_pool
+    app.state.page_cache = SalesBrochureContainer.create_page_cache()
+    app.state.response_cache = SalesBrochureContainer.create_response_cache()
+    app.state.site_store = SalesBrochureContainer.create_site_snapshot_store()
+    # Coalesce concurrent duplicate brochure jobs and LLM calls
+    app.state.brochure_flight = AsyncSingleFlight()
+    app.state.llm_flight = AsyncSingleFlight()
+    # Global LLM concurrency and rate limits shared by every request
+    app.state.llm_limiter = SalesBrochureContainer.create_llm_rate_limiter()
+    app.state.scope = SalesBrochureContainer.create_app_scope(
+        browser_pool=browser_pool,
+        page_cache=app.state.page_cache,
+        response_cache=app.state.response_cache,
+        llm_flight=app.state.llm_flight,
+        llm_limiter=app.state.llm_limiter,
+        site_store=app.state.site_store,
+    )
+    app.state.orchestrators = {
+        (bypass, refresh): SalesBrochureContainer.create_async_orchestrator(
+            cache_bypass=bypass, cache_refresh=refresh, scope=app.state.scope
+        )
+        for bypass in (False, True)
+        for refresh in (False, True)
+    }
+    # Background brochure jobs, sized independently of HTTP concurrency
+    app.state.job_queue = SalesBrochureContainer.create_job_queue(
+        scope=app.state.scope, loop=asyncio.get_running_loop()
+    )
+    metrics = app.state.scope.tracer.metrics
+    if metrics is not None:
+        metrics.register_collector("job_queue", app.state.job_queue.stats)
+        metrics.register_collector("brochure_flight", app.state.brochure_flight.stats)
+    app.state.job_queue.start()
+    try:
+        yield
+    finally:
+        await asyncio.to_thread(app.state.job_queue.stop)
+        await app.state.scope.aclose()
+        await browser_pool.close()
+
+
+app = FastAPI(title="LLM Sales Brochure API", lifespan=lifespan)
+
+
+@app.middleware("http")
+async def request_id_middleware(request: Request, call_next):
+    """
+    Tag every log line written while handling a request with its id.
+
+    The id is taken from the ``X-Request-ID`` header, or generated, and
+    returned in the response's ``X-Request-ID`` header. Streamed bodies
+    keep the id, since their tasks copy the context when they start.
+    """
+    request_id = (request.headers.get("x-request-id") or "")[:64] or None
+    with request_context(request_id) as request_id:
+        response = await call_next(request)
+    response.headers["X-Request-ID"] = request_id
+    return response
 
 
 class URLRequest(BaseModel):
     """
     Request model for providing a base URL.
+
+    ``cache_bypass`` skips the LLM response cache entirely; ``cache_refresh``
+    ignores cached responses and stores the new ones.
     """
 
     base_url: str
+    cache_bypass: bool = False
+    cache_refresh: bool = False
 
 
 @app.post("/generate_prompt")
-def get_links(data: URLRequest):
+async def get_links(data: URLRequest, request: Request):
     """
     Endpoint to generate a prompt and fetch relevant links for the given URL.
 
@@ -28,16 +111,273 @@ def get_links(data: URLRequest):
     Returns:
         dict: Contains company brochure details.
     """
+    state = request.app.state
+
+    async def generate() -> str:
+        orchestrator = state.orchestrators[(data.cache_bypass, data.cache_refresh)]
+        return await orchestrator.orchestrate(data.base_url)
+
+    # Identical concurrent requests share one in-flight job
+    flight_key = (
+        f"{normalize_url(data.base_url)}|{data.cache_bypass}|{data.cache_refresh}"
+    )
+
     try:
-        orchestrator = SalesBrochureContainer.create_orchestrator(data.base_url)
-        company_brochure = orchestrator.orchestrate(data.base_url)
+        company_brochure = await state.brochure_flight.do(flight_key, generate)
         return {"company_brochure": company_brochure}
 
+    except BrowserPoolExhaustedError as e:
+        # Pool is saturated: ask the client to retry later
+        raise HTTPException(status_code=503, detail=str(e))
+
     except Exception as e:
         # Raise HTTPException to return proper HTTP status code (500)
         raise HTTPException(status_code=500, detail=f"Error fetching links: {str(e)}")
 
 
+def _sse(event: dict) -> str:
+    """
+    Format an orchestrator event as a Server-Sent Events message.
+    """
+    return f"event: {event['type']}\ndata: {json.dumps(event)}\n\n"
+
+
+@app.post("/generate_brochure/stream")
+async def stream_brochure(data: URLRequest, request: Request):
+    """
+    Endpoint streaming brochure generation as Server-Sent Events.
+
+    Emits ``progress`` events for the scrape, link-selection, crawl and
+    generation stages, ``token`` events with brochure text as it is
+    generated, and a final ``done`` (or ``error``) event.
+
+    Args:
+        data (URLRequest): Contains the base_url to scrape.
+
+    Returns:
+        StreamingResponse: ``text/event-stream`` response.
+    """
+    state = request.app.state
+    orchestrator = state.orchestrators[(data.cache_bypass, data.cache_refresh)]
+
+    async def events():
+        try:
+            async for event in orchestrator.orchestrate_stream(data.base_url):
+                yield _sse(event)
+        except Exception as e:
+            yield _sse({"type": "error", "detail": str(e)})
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+class BatchRequest(BaseModel):
+    """
+    Request model for generating brochures for several base URLs.
+    """
+
+    urls: List[str]
+
+
+@app.post("/batch")
+async def batch_brochures(data: BatchRequest, request: Request):
+    """
+    Endpoint generating brochures for many URLs, streamed as NDJSON.
+
+    Each line is the result for one URL, written as soon as it finishes.
+    URLs share the application's browser pool, caches and LLM limits.
+
+    Args:
+        data (BatchRequest): The base URLs to process.
+
+    Returns:
+        StreamingResponse: ``application/x-ndjson`` response.
+    """
+    max_urls = int(os.getenv("BATCH_MAX_URLS", "100"))
+    if len(data.urls) > max_urls:
+        raise HTTPException(
+            status_code=413, detail=f"A batch may contain at most {max_urls} URLs"
+        )
+
+    runner = SalesBrochureContainer.create_batch_runner(request.app.state.scope)
+
+    async def results():
+        async for result in runner.run(data.urls):
+            yield json.dumps(result) + "\n"
+
+    return StreamingResponse(results(), media_type="application/x-ndjson")
+
+
+@app.post("/jobs", status_code=202)
+def create_job(data: URLRequest, request: Request):
+    """
+    Endpoint queueing a brochure job and returning its id immediately.
+
+    Args:
+        data (URLRequest): Contains the base_url to scrape.
+
+    Returns:
+        dict: The job id and its initial status.
+    """
+    try:
+        job = request.app.state.job_queue.submit(data.base_url)
+    except JobQueueFullError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    return {"job_id": job.id, "status": job.status}
+
+
+@app.get("/jobs/{job_id}")
+def get_job(job_id: str, request: Request):
+    """
+    Endpoint returning a job's status, per-stage timings and result.
+
+    Args:
+        job_id (str): Id returned by ``POST /jobs``.
+
+    Returns:
+        dict: The job record.
+    """
+    job = request.app.state.job_queue.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found or expired")
+    return job.to_dict()
+
+
+@app.get("/job_queue/stats")
+def job_queue_stats(request: Request):
+    """
+    Endpoint exposing job queue depth and worker counters.
+
+    Returns:
+        dict: Current job queue statistics.
+    """
+    return request.app.state.job_queue.stats()
+
+
+@app.get("/browser_pool/stats")
+def browser_pool_stats(request: Request):
+    """
+    Endpoint exposing browser pool wait time and utilisation metrics.
+
+    Returns:
+        dict: Current browser pool statistics.
+    """
+    return request.app.state.browser_pool.stats()
+
+
+@app.get("/scraper/stats")
+def scraper_stats(request: Request):
+    """
+    Endpoint exposing page load timings, bytes and fallbacks per load profile.
+
+    Returns:
+        dict: Current scraper statistics per load profile.
+    """
+    return request.app.state.scope.scrape_stats.stats()
+
+
+@app.get("/extraction/stats")
+def extraction_stats(request: Request):
+    """
+    Endpoint exposing characters in and out of main-content extraction and
+    cross-page boilerplate removal.
+
+    Returns:
+        dict: Runs, characters in and out, and their ratio per stage.
+    """
+    return request.app.state.scope.extraction_stats.stats()
+
+
+@app.get("/page_cache/stats")
+def page_cache_stats(request: Request):
+    """
+    Endpoint exposing page cache hit, miss and eviction counters.
+
+    Returns:
+        dict: Current page cache statistics per tier.
+    """
+    return request.app.state.page_cache.stats()
+
+
+@app.get("/llm_cache/stats")
+def llm_cache_stats(request: Request):
+    """
+    Endpoint exposing LLM response cache hit rate and eviction counters.
+
+    Returns:
+        dict: Current response cache statistics per tier.
+    """
+    return request.app.state.response_cache.stats()
+
+
+@app.get("/llm_limiter/stats")
+def llm_limiter_stats(request: Request):
+    """
+    Endpoint exposing LLM rate limits, call counts and limiter wait time.
+
+    Returns:
+        dict: Current LLM rate limiter statistics.
+    """
+    return request.app.state.llm_limiter.stats()
+
+
+@app.get("/llm_resilience/stats")
+def llm_resilience_stats(request: Request):
+    """
+    Endpoint exposing LLM retries, timeouts, hedged requests and the circuit
+    breaker state.
+
+    Returns:
+        dict: Current LLM resilience statistics per operation and model.
+    """
+    return request.app.state.scope.llm_resilience_stats()
+
+
+@app.get("/llm_usage/stats")
+def llm_usage_stats(request: Request):
+    """
+    Endpoint exposing LLM calls, fallbacks, latency and cost per operation
+    and model, for tuning which model serves which operation.
+
+    Returns:
+        dict: Current LLM usage statistics per operation and model.
+    """
+    return request.app.state.scope.llm_usage.stats()
+
+
+@app.get("/single_flight/stats")
+def single_flight_stats(request: Request):
+    """
+    Endpoint exposing how many brochure jobs and LLM calls were coalesced.
+
+    Returns:
+        dict: Single-flight counters for brochure jobs and LLM calls.
+    """
+    return {
+        "brochures": request.app.state.brochure_flight.stats(),
+        "llm_calls": request.app.state.llm_flight.stats(),
+    }
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+def metrics(request: Request):
+    """
+    Endpoint exposing stage latencies, LLM tokens and cost, and the cache,
+    pool and limiter counters in the Prometheus text format.
+
+    Returns:
+        PlainTextResponse: Every metric, ready to be scraped.
+    """
+    registry = request.app.state.scope.tracer.metrics
+    return PlainTextResponse(
+        registry.render() if registry is not None else "",
+        media_type="text/plain; version=0.0.4",
+    )
+
+
 if __name__ == "__main__":
     uvicorn.run(
         host="127.0.0.1", port=8000, app="sales_brochure_fastapi:app", reload=True
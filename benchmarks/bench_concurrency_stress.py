@@ -0,0 +1,145 @@
+"""
+Stress one shared orchestrator with many concurrent requests and check
+that no request sees another request's data.
+
+Starts several fixture sites, each about a different company on its own
+port, and the fake LLM server, whose brochures list the URLs they were
+given as sources. One sync orchestrator serves every request from a
+thread pool, then one async orchestrator serves them as concurrent
+tasks. Each result is checked against the site it was generated for:
+the landing page, selected links, contents and brochure sources must all
+belong to that site. Exits non-zero if any request leaked.
+
+Pages are fetched over plain HTTP (the ``http`` load profile), so no
+browser is needed.
+
+Usage:
+    python benchmarks/bench_concurrency_stress.py [--sites 8] [--requests 200]
+        [--concurrency 32]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from urllib.parse import urlparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from fake_llm_server import URL_PATTERN, FakeLLMServer, FaultConfig  # noqa: E402
+from fixture_site import FixtureSite  # noqa: E402
+
+from container.salesbrochure_container import SalesBrochureContainer  # noqa: E402
+from core.brochure_request import BrochureRequest  # noqa: E402
+
+
+def brochure_leaks(url: str, brochure: str) -> list:
+    """
+    Return what is wrong with ``brochure`` as the brochure for ``url``.
+    """
+    host = urlparse(url).netloc
+    sources = URL_PATTERN.findall(brochure)
+    if not sources:
+        return ["brochure lists no sources"]
+    return [
+        f"brochure cites {source}"
+        for source in sources
+        if urlparse(source).netloc != host
+    ]
+
+
+def request_leaks(request: BrochureRequest, company: str) -> list:
+    """
+    Return every field of ``request`` holding another request's data.
+    """
+    host = urlparse(request.base_url).netloc
+    problems = []
+    if request.snapshot is None or request.snapshot.url != request.base_url:
+        problems.append("landing page of another site")
+    problems += [
+        f"relevant link {link}"
+        for link in request.relevant_links
+        if urlparse(link).netloc != host
+    ]
+    if company not in request.contents:
+        problems.append(f"contents not about {company}")
+    return problems + brochure_leaks(request.base_url, request.brochure)
+
+
+def report(label: str, results: list, elapsed: float) -> int:
+    leaked = [(url, problems) for url, problems in results if problems]
+    print(
+        f"{label:<6} requests={len(results)} elapsed={elapsed:.2f}s "
+        f"throughput={len(results) / elapsed:.1f}/s leaked={len(leaked)}"
+    )
+    for url, problems in leaked[:5]:
+        print(f"  {url}: {problems}")
+    return len(leaked)
+
+
+def run_threads(scope, sites: dict, urls: list, concurrency: int) -> int:
+    orchestrator = SalesBrochureContainer.create_orchestrator(scope=scope)
+
+    def one(url: str):
+        request = orchestrator.run(BrochureRequest(base_url=url))
+        return url, request_leaks(request, sites[url])
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(concurrency) as pool:
+        results = list(pool.map(one, urls))
+    return report("sync", results, time.perf_counter() - started)
+
+
+async def run_tasks(scope, urls: list, concurrency: int) -> int:
+    orchestrator = SalesBrochureContainer.create_async_orchestrator(scope=scope)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(url: str):
+        async with semaphore:
+            brochure = await orchestrator.orchestrate(url)
+        return url, brochure_leaks(url, brochure)
+
+    started = time.perf_counter()
+    results = await asyncio.gather(*(one(url) for url in urls))
+    return report("async", results, time.perf_counter() - started)
+
+
+async def bench(sites: dict, requests: int, concurrency: int) -> int:
+    # Interleave the sites so concurrent requests always differ
+    urls = [list(sites)[i % len(sites)] for i in range(requests)]
+    scope = SalesBrochureContainer.create_app_scope()
+    try:
+        leaked = await asyncio.to_thread(run_threads, scope, sites, urls, concurrency)
+        leaked += await run_tasks(scope, urls, concurrency)
+    finally:
+        await scope.aclose()
+    return leaked
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sites", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=32)
+    args = parser.parse_args()
+
+    with ExitStack() as stack:
+        server = stack.enter_context(FakeLLMServer(FaultConfig(latency=0.02)))
+        sites = {}
+        for index in range(args.sites):
+            site = stack.enter_context(FixtureSite(company=f"Company{index}Ltd"))
+            sites[site.base_url] = site.company
+
+        os.environ["OPENAI_BASE_URL"] = server.base_url
+        os.environ.setdefault("OPENAI_API_KEY", "sk-proj-fake-benchmark-key")
+        os.environ["SCRAPER_LOAD_PROFILE"] = "http"
+        leaked = asyncio.run(bench(sites, args.requests, args.concurrency))
+
+    sys.exit(1 if leaked else 0)
+
+
+if __name__ == "__main__":
+    main()
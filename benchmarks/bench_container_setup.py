@@ -0,0 +1,87 @@
+"""
+Measure per-request container setup with and without a shared app scope.
+
+The "per request" case reproduces the previous wiring: every orchestrator
+reloads ``.env``, validates the API key and builds new OpenAI clients with
+new connection pools. The "app scope" case builds those once and only
+creates the scraper, service and orchestrator per call.
+
+Only object construction is timed; no network calls are made. With a
+shared scope, requests also reuse warm HTTP connections to the API, which
+saves a TLS handshake per request on top of the numbers shown here.
+
+Usage:
+    python benchmarks/bench_container_setup.py [--runs 200]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from container.salesbrochure_container import SalesBrochureContainer  # noqa: E402
+
+
+def measure(fn, runs: int) -> list:
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def report(label: str, timings: list) -> None:
+    print(
+        f"{label:<12} median={statistics.median(timings) * 1000:.3f}ms "
+        f"mean={statistics.mean(timings) * 1000:.3f}ms "
+        f"max={max(timings) * 1000:.3f}ms"
+    )
+
+
+async def run(runs: int) -> None:
+    page_cache = SalesBrochureContainer.create_page_cache()
+    response_cache = SalesBrochureContainer.create_response_cache()
+
+    before = measure(
+        lambda: SalesBrochureContainer.create_async_orchestrator(
+            page_cache=page_cache, response_cache=response_cache
+        ),
+        runs,
+    )
+
+    start = time.perf_counter()
+    scope = SalesBrochureContainer.create_app_scope(
+        page_cache=page_cache, response_cache=response_cache
+    )
+    startup = time.perf_counter() - start
+
+    after = measure(
+        lambda: SalesBrochureContainer.create_async_orchestrator(scope=scope),
+        runs,
+    )
+    await scope.aclose()
+
+    report("per request", before)
+    report("app scope", after)
+    print(f"one-off scope startup: {startup * 1000:.3f}ms")
+    saved = statistics.median(before) - statistics.median(after)
+    print(f"saved per request: {saved * 1000:.3f}ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=200)
+    args = parser.parse_args()
+
+    # Clients are only constructed, so a placeholder key is enough
+    os.environ.setdefault("OPENAI_API_KEY", "sk-proj-benchmark")
+    asyncio.run(run(args.runs))
+
+
+if __name__ == "__main__":
+    main()
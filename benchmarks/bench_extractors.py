@@ -0,0 +1,115 @@
+"""
+Compare HTML extractor backends on throughput and peak memory.
+
+Every backend parses the same corpus: ``--corpus DIR`` reads saved
+``*.html`` files, otherwise pages generated by the fixture site at several
+sizes are used. Each backend runs in its own process so peak RSS (which
+includes memory allocated by C parsers) is measured in isolation. Output
+is also checked against the BeautifulSoup reference.
+
+The in-page extractor runs inside the browser and is not measured here.
+
+Usage:
+    python benchmarks/bench_extractors.py [--runs 5] [--corpus DIR]
+"""
+
+import argparse
+import glob
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from fixture_site import PAGES, render_page  # noqa: E402
+
+from infrastructure.html_extractor import EXTRACTORS  # noqa: E402
+
+BACKENDS = ["bs4", "lxml", "selectolax"]
+SIZES = [10, 100, 1000]
+
+
+def load_corpus(corpus_dir: str = None) -> list:
+    if corpus_dir:
+        corpus = []
+        for path in sorted(glob.glob(os.path.join(corpus_dir, "*.html"))):
+            with open(path, encoding="utf-8", errors="replace") as f:
+                corpus.append((f"file://{os.path.abspath(path)}", f.read()))
+        return corpus
+    return [
+        (f"https://acme.test/{page}", render_page(page, size))
+        for page in PAGES
+        for size in SIZES
+    ]
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale
+
+
+def worker(backend: str, corpus_dir: str, runs: int) -> dict:
+    corpus = load_corpus(corpus_dir)
+    try:
+        extractor = EXTRACTORS[backend]()
+    except ImportError as e:
+        return {"backend": backend, "skipped": str(e)}
+
+    baseline = peak_rss_mb()
+    start = time.perf_counter()
+    for _ in range(runs):
+        snapshots = [extractor.extract(url, html) for url, html in corpus]
+    elapsed = time.perf_counter() - start
+
+    pages = len(corpus) * runs
+    megabytes = sum(len(html) for _, html in corpus) * runs / 1e6
+    return {
+        "backend": backend,
+        "pages_per_second": round(pages / elapsed, 1),
+        "mb_per_second": round(megabytes / elapsed, 2),
+        "peak_rss_delta_mb": round(peak_rss_mb() - baseline, 1),
+        "output": [[s.text, sorted(s.links)] for s in snapshots],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--corpus", help="Directory of saved *.html pages")
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(worker(args.worker, args.corpus, args.runs)))
+        return
+
+    results = []
+    for backend in BACKENDS:
+        command = [sys.executable, __file__, "--worker", backend]
+        command += ["--runs", str(args.runs)]
+        if args.corpus:
+            command += ["--corpus", args.corpus]
+        output = subprocess.run(command, capture_output=True, text=True, check=True)
+        results.append(json.loads(output.stdout.strip().splitlines()[-1]))
+
+    reference = results[0].get("output")
+    print(f"{len(load_corpus(args.corpus))} pages x {args.runs} runs")
+    for result in results:
+        if "skipped" in result:
+            print(f"{result['backend']:<11} skipped: {result['skipped']}")
+            continue
+        matches = result.pop("output") == reference
+        print(
+            f"{result['backend']:<11} {result['pages_per_second']:>8} pages/s "
+            f"{result['mb_per_second']:>7} MB/s "
+            f"peak +{result['peak_rss_delta_mb']} MB "
+            f"{'matches bs4' if matches else 'DIFFERS from bs4'}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+Measure LLM call latency and success rate under injected provider faults.
+
+Runs the same batch of concurrent chat completions against the fake LLM
+server with the bare OpenAI client, with AsyncResilientAIClient (retries,
+deadline, circuit breaker) and with hedging enabled, for each fault
+scenario, and prints the success rate, latency percentiles, requests the
+server received and the resilience counters.
+
+Usage:
+    python benchmarks/bench_llm_resilience.py [--calls 200] [--concurrency 20]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from fake_llm_server import FakeLLMServer, FaultConfig  # noqa: E402
+
+from core.circuit_breaker import CircuitBreaker  # noqa: E402
+from core.retry_policy import RetryPolicy  # noqa: E402
+from infrastructure.async_openai_client import AsyncOpenAIClientWrapper  # noqa: E402
+from infrastructure.dotenv import DotEnvLoader  # noqa: E402
+from infrastructure.openai_provider import OpenAIApiKeyProvider  # noqa: E402
+from infrastructure.resilient_ai_client import AsyncResilientAIClient  # noqa: E402
+
+SCENARIOS = {
+    "healthy": FaultConfig(latency=0.05),
+    "slow_tail": FaultConfig(latency=0.05, tail_rate=0.05, tail_latency=3.0),
+    "errors": FaultConfig(latency=0.05, error_rate=0.2),
+    "rate_limited": FaultConfig(latency=0.05, rate_limit_rate=0.3),
+    "outage": FaultConfig(latency=0.05, error_rate=1.0),
+}
+
+POLICY = RetryPolicy(
+    max_attempts=3, attempt_timeout=5.0, deadline=10.0, base_delay=0.1, max_delay=1.0
+)
+
+
+def percentile(values: list, q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))] if ordered else 0.0
+
+
+async def run_calls(client, calls: int, concurrency: int) -> dict:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies, failures = [], 0
+
+    async def one(index: int) -> None:
+        nonlocal failures
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                await client.chat_completions_create(
+                    system="You write brochures.", user=f"Company {index}"
+                )
+                latencies.append(time.perf_counter() - started)
+            except Exception:
+                failures += 1
+
+    await asyncio.gather(*(one(i) for i in range(calls)))
+    return {
+        "success": round(len(latencies) / calls, 3),
+        "p50": round(statistics.median(latencies), 3) if latencies else 0.0,
+        "p95": round(percentile(latencies, 0.95), 3),
+        "p99": round(percentile(latencies, 0.99), 3),
+        "failures": failures,
+    }
+
+
+def build_clients(policy: RetryPolicy) -> dict:
+    key_provider = OpenAIApiKeyProvider(DotEnvLoader())
+    timeout = policy.attempt_timeout
+
+    def raw():
+        return AsyncOpenAIClientWrapper(key_provider, timeout=timeout, max_retries=0)
+
+    hedged = RetryPolicy(**{**vars(policy), "hedge": True, "hedge_min_delay": 0.1})
+    return {
+        "bare": raw(),
+        "resilient": AsyncResilientAIClient(raw(), policy, CircuitBreaker()),
+        "hedged": AsyncResilientAIClient(raw(), hedged, CircuitBreaker()),
+    }
+
+
+async def bench(calls: int, concurrency: int) -> None:
+    for scenario, faults in SCENARIOS.items():
+        for name in ("bare", "resilient", "hedged"):
+            with FakeLLMServer(FaultConfig(**vars(faults))) as server:
+                os.environ["OPENAI_BASE_URL"] = server.base_url
+                client = build_clients(POLICY)[name]
+                if name == "hedged":
+                    # Learn the latency distribution before hedging kicks in
+                    await run_calls(client, 40, concurrency)
+                    server.responses.clear()
+                result = await run_calls(client, calls, concurrency)
+                result["server_requests"] = sum(server.responses.values())
+                if name != "bare":
+                    counters = client.stats()
+                    result.update(
+                        retries=counters["retries"],
+                        hedges=counters["hedges"],
+                        breaker_rejected=counters["breaker"]["rejected"],
+                    )
+                print(f"{scenario:<13} {name:<10} {result}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=20)
+    args = parser.parse_args()
+
+    os.environ.setdefault("OPENAI_API_KEY", "sk-proj-fake-benchmark-key")
+    asyncio.run(bench(args.calls, args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
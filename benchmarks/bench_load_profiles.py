@@ -0,0 +1,54 @@
+"""
+Compare scraper load profiles on the same pages.
+
+Loads every page with each profile (``full``, ``fast`` and ``http``) and
+prints the per-profile timing, bytes transferred, blocked requests and
+HTTP-to-browser fallbacks collected by ``ScrapeStats``.
+
+The fixture site is plain server-rendered HTML with no trackers, so it
+mostly shows the readiness and HTTP fast-path savings; pass ``--url`` to
+see resource blocking on a real site.
+
+Usage:
+    python benchmarks/bench_load_profiles.py [--runs 3] [--url URL ...]
+"""
+
+import argparse
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from fixture_site import PAGES, FixtureSite  # noqa: E402
+
+from core.load_profile import LOAD_PROFILES  # noqa: E402
+from core.scrape_stats import ScrapeStats  # noqa: E402
+from infrastructure.playwright_scraper import PlaywrightWebScraper  # noqa: E402
+
+
+def run(urls: list, runs: int) -> None:
+    stats = ScrapeStats()
+    for profile in LOAD_PROFILES.values():
+        scraper = PlaywrightWebScraper(load_profile=profile, stats=stats)
+        for _ in range(runs):
+            for url in urls:
+                scraper.fetch_page(url)
+    print(json.dumps(stats.stats(), indent=2))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--url", nargs="*", help="Benchmark live URLs instead")
+    args = parser.parse_args()
+
+    if args.url:
+        run(args.url, args.runs)
+    else:
+        with FixtureSite() as site:
+            run([site.base_url + page for page in ["", *PAGES]], args.runs)
+
+
+if __name__ == "__main__":
+    main()
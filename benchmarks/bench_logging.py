@@ -0,0 +1,185 @@
+"""
+Measure logging overhead per request for each logging configuration.
+
+A simulated request logs what the pipeline logs for one brochure: a few
+INFO lines per stage, DEBUG lines including the raw LLM responses, and a
+burst of DEBUG lines from one call site in a loop. Only time spent in the
+calling thread is counted, which is what a request pays; with
+``LOG_ASYNC=1`` the writing happens on the listener thread, whose drain
+time is reported separately.
+
+The "legacy" case reproduces the previous setup: a file and console
+handler per logger name, synchronous writes, full raw responses logged
+and a global lock on every ``Logger(...)`` lookup.
+
+Each configuration runs in its own process, since logging is configured
+once per process from environment variables.
+
+Usage:
+    python benchmarks/bench_logging.py [--requests 2000]
+"""
+
+import argparse
+import json
+import logging
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+CONFIGS = {
+    "legacy": {},
+    "sync text": {"LOG_FORMAT": "text"},
+    "sync json": {"LOG_FORMAT": "json"},
+    "async text": {"LOG_FORMAT": "text", "LOG_ASYNC": "1"},
+    "async json": {"LOG_FORMAT": "json", "LOG_ASYNC": "1"},
+    # Drops most lines: every call site is limited to 5 lines per minute
+    "async json limited": {
+        "LOG_FORMAT": "json",
+        "LOG_ASYNC": "1",
+        "LOG_RATE_LIMIT": "5",
+    },
+}
+LOGGER_NAMES = [
+    "AsyncSalesBrochureOrchestrator",
+    "AsyncPlaywrightWebScraper",
+    "AsyncOpenAIService",
+    "ContentBudgeter",
+    "LinkPrefilter",
+]
+RAW_RESPONSE = json.dumps({"links": [{"url": "https://acme.test/a"}] * 120})
+
+
+class LegacyLogger:
+    """
+    The previous Logger: one file and console handler per name, created
+    behind a global lock on every lookup.
+    """
+
+    _instances = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def get(cls, name: str) -> "LegacyLogger":
+        with cls._lock:
+            if name not in cls._instances:
+                cls._instances[name] = cls(name)
+        return cls._instances[name]
+
+    def __init__(self, name: str):
+        self._logger = logging.getLogger(f"legacy.{name}")
+        self._logger.setLevel(logging.DEBUG)
+        formatter = logging.Formatter(
+            "%(asctime)s - %(name)s.%(funcName)s - %(levelname)s - %(message)s"
+        )
+        for handler, level in (
+            (logging.FileHandler("logs.log"), logging.DEBUG),
+            (logging.StreamHandler(), logging.INFO),
+        ):
+            handler.setLevel(level)
+            handler.setFormatter(formatter)
+            self._logger.addHandler(handler)
+
+    def debug(self, message: str):
+        self._logger.debug(message, stacklevel=2)
+
+    def info(self, message: str):
+        self._logger.info(message, stacklevel=2)
+
+    def warning(self, message: str):
+        self._logger.warning(message, stacklevel=2)
+
+
+def simulate_request(get_logger, raw_response: str) -> None:
+    for name in LOGGER_NAMES:
+        logger = get_logger(name)
+        logger.info(f"{name} started")
+        logger.debug(f"{name} details: stage=1 items=12")
+        logger.info(f"{name} finished in 0.123s")
+    service = get_logger("AsyncOpenAIService")
+    service.debug(f"Raw response content: {raw_response}")
+    service.debug(f"Raw response content: {raw_response}")
+    scraper = get_logger("AsyncPlaywrightWebScraper")
+    for index in range(20):
+        scraper.debug(f"Blocked request {index}")
+    scraper.warning("Readiness selector timed out")
+
+
+def worker(config: str, requests: int) -> dict:
+    os.environ.update(CONFIGS[config])
+    os.chdir(tempfile.mkdtemp())
+
+    if config == "legacy":
+        get_logger = LegacyLogger.get
+        raw_response = RAW_RESPONSE
+        shutdown = None
+    else:
+        from logs.log_config import shutdown_logging
+        from logs.logger_singleton import Logger
+
+        get_logger = Logger
+        raw_response = RAW_RESPONSE[:200]
+        shutdown = shutdown_logging
+
+    simulate_request(get_logger, raw_response)  # warm up handlers and loggers
+    start = time.perf_counter()
+    for _ in range(requests):
+        simulate_request(get_logger, raw_response)
+    elapsed = time.perf_counter() - start
+
+    drain_start = time.perf_counter()
+    if shutdown is not None:
+        shutdown()
+    drain = time.perf_counter() - drain_start
+
+    lookups = 100_000
+    lookup_start = time.perf_counter()
+    for _ in range(lookups):
+        get_logger(LOGGER_NAMES[0])
+    lookup = time.perf_counter() - lookup_start
+
+    return {
+        "config": config,
+        "us_per_request": round(elapsed / requests * 1e6, 1),
+        "drain_ms": round(drain * 1000, 1),
+        "lookup_ns": round(lookup / lookups * 1e9),
+        "log_bytes": os.path.getsize("logs.log"),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(worker(args.worker, args.requests)))
+        return
+
+    print(f"{args.requests} simulated requests per configuration")
+    for config in CONFIGS:
+        command = [sys.executable, __file__, "--worker", config]
+        command += ["--requests", str(args.requests)]
+        output = subprocess.run(
+            command,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            check=True,
+        )
+        result = json.loads(output.stdout.strip().splitlines()[-1])
+        print(
+            f"{result['config']:<19} {result['us_per_request']:>8} us/request "
+            f"drain {result['drain_ms']:>7} ms "
+            f"lookup {result['lookup_ns']:>4} ns "
+            f"log {result['log_bytes'] / 1e6:.1f} MB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Compare the old two-navigation scrape with the single page snapshot.
+
+The "two loads" case reproduces the previous orchestrator behaviour: one
+scraper renders the page for its content and another renders it again for
+its links. The "snapshot" case serves both from one render.
+
+Usage:
+    python benchmarks/bench_page_snapshot.py [--runs 5] [--url URL]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from fixture_site import FixtureSite  # noqa: E402
+
+from infrastructure.playwright_scraper import PlaywrightWebScraper  # noqa: E402
+
+
+def two_loads(url: str) -> None:
+    scraper = PlaywrightWebScraper()
+    scraper.fetch_content(url)
+    scraper.fetch_links(url)
+
+
+def snapshot(url: str) -> None:
+    # Text and links both come from the one returned snapshot
+    PlaywrightWebScraper().fetch_page(url)
+
+
+def measure(fn, url: str, runs: int) -> list:
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn(url)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def report(label: str, timings: list) -> None:
+    print(
+        f"{label:<10} median={statistics.median(timings):.3f}s "
+        f"mean={statistics.mean(timings):.3f}s min={min(timings):.3f}s"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--url", help="Benchmark a live URL instead of the fixture")
+    args = parser.parse_args()
+
+    def run(url: str) -> None:
+        before = measure(two_loads, url, args.runs)
+        after = measure(snapshot, url, args.runs)
+        report("two loads", before)
+        report("snapshot", after)
+        saved = statistics.median(before) - statistics.median(after)
+        print(f"saved per brochure: {saved:.3f}s")
+
+    if args.url:
+        run(args.url)
+    else:
+        with FixtureSite() as site:
+            run(site.base_url)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,428 @@
+"""
+Offline benchmark suite for the brochure pipeline.
+
+Starts the fixture site and the fake LLM server locally, so nothing
+touches the network, and measures each layer on its own and end to end:
+
+- ``scraper``: PlaywrightWebScraper on static and JS-rendered pages of
+  each fixture size.
+- ``service``: OpenAIService link selection and brochure generation.
+- ``orchestrator``: SalesBrochureOrchestrator at each concurrency level,
+  with per-stage latency percentiles from its stage timings.
+- ``api``: ``POST /generate_prompt`` on the FastAPI app served by
+  uvicorn, at each concurrency level. The app runs as deployed, with its
+  page cache; each request names a distinct URL and sets
+  ``cache_bypass`` so requests are neither coalesced nor answered from
+  the LLM cache.
+
+Peak RSS and the peak number of Chromium processes in this process tree
+are sampled per section. Results are written as JSON; pass ``--compare``
+with an earlier results file to print the metrics that moved by more
+than ``--threshold``.
+
+The scraper uses the ``SCRAPER_LOAD_PROFILE`` profile, so set it to
+``full`` to render every page or ``http`` to take the HTTP fast path.
+
+Usage:
+    python benchmarks/bench_suite.py [--runs 5] [--requests 40]
+        [--concurrency 1,4,16] [--llm-latency 0.2] [--tokens-per-second 0]
+        [--error-rate 0] [--sections scraper,service,orchestrator,api]
+        [--output bench_results.json] [--compare OLD.json] [--threshold 0.1]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import resource
+import socket
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "backend"))
+
+from fake_llm_server import FakeLLMServer, FaultConfig  # noqa: E402
+from fixture_site import SIZES, FixtureSite  # noqa: E402
+
+from container.salesbrochure_container import SalesBrochureContainer  # noqa: E402
+from core.brochure_request import BrochureRequest  # noqa: E402
+from infrastructure.openai_service import OpenAIService  # noqa: E402
+from infrastructure.playwright_scraper import PlaywrightWebScraper  # noqa: E402
+
+SECTIONS = ("scraper", "service", "orchestrator", "api")
+
+
+def percentiles(values: list) -> dict:
+    """
+    Summarise latencies in seconds as count, p50, p90, p99 and max.
+    """
+    ordered = sorted(values)
+
+    def at(q: float) -> float:
+        if not ordered:
+            return 0.0
+        return round(ordered[min(len(ordered) - 1, int(q * len(ordered)))], 4)
+
+    return {
+        "count": len(ordered),
+        "p50": at(0.5),
+        "p90": at(0.9),
+        "p99": at(0.99),
+        "max": round(ordered[-1], 4) if ordered else 0.0,
+    }
+
+
+def timed(fn, *args) -> float:
+    started = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - started
+
+
+class ResourceSampler:
+    """
+    Background thread sampling the memory and Chromium processes of this
+    process and its descendants, keeping the peaks of each section.
+
+    Descendants are found through ``/proc``; elsewhere only this process's
+    own peak RSS is reported.
+    """
+
+    def __init__(self, interval: float = 0.1):
+        self.interval = interval
+        self.peaks = {}
+        self._section = "setup"
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._procfs = os.path.isdir("/proc/self")
+
+    @contextmanager
+    def section(self, name: str):
+        previous, self._section = self._section, name
+        try:
+            yield
+        finally:
+            self._sample()
+            self._section = previous
+
+    def __enter__(self) -> "ResourceSampler":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+    def stats(self) -> dict:
+        own_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+        return {"self_peak_rss_mb": round(own_mb, 1), "sections": self.peaks}
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def _sample(self) -> None:
+        if not self._procfs:
+            return
+        rss, chromium = self._tree()
+        for name in (self._section, "total"):
+            peak = self.peaks.setdefault(name, {"rss_mb": 0.0, "chromium": 0})
+            peak["rss_mb"] = max(peak["rss_mb"], round(rss / 2**20, 1))
+            peak["chromium"] = max(peak["chromium"], chromium)
+
+    @staticmethod
+    def _tree():
+        children, names = {}, {}
+        for entry in os.listdir("/proc"):
+            if not entry.isdigit():
+                continue
+            try:
+                with open(f"/proc/{entry}/stat") as f:
+                    stat = f.read()
+            except OSError:
+                continue
+            # The command name is in parentheses and may contain spaces
+            name = stat[stat.index("(") + 1 : stat.rindex(")")]
+            ppid = int(stat[stat.rindex(")") + 2 :].split()[1])
+            children.setdefault(ppid, []).append(int(entry))
+            names[int(entry)] = name
+
+        page = os.sysconf("SC_PAGE_SIZE")
+        rss, chromium, pending = 0, 0, [os.getpid()]
+        while pending:
+            pid = pending.pop()
+            pending.extend(children.get(pid, []))
+            try:
+                with open(f"/proc/{pid}/statm") as f:
+                    rss += int(f.read().split()[1]) * page
+            except OSError:
+                continue
+            if pid != os.getpid() and "chrom" in names.get(pid, "").lower():
+                chromium += 1
+        return rss, chromium
+
+
+def bench_scraper(scope, browser_pool, base_url: str, runs: int) -> dict:
+    scraper = PlaywrightWebScraper(
+        browser_pool=browser_pool,
+        load_profile=scope.load_profile,
+        stats=scope.scrape_stats,
+        http_fetcher=scope.http_fetcher,
+        extractor=scope.html_extractor,
+        tracer=scope.tracer,
+    )
+    results = {}
+    for render in ("static", "js"):
+        for size, paragraphs in SIZES.items():
+            prefix = "js/" if render == "js" else ""
+            url = f"{base_url}{prefix}about?paragraphs={paragraphs}"
+            text = scraper.fetch_page(url).text
+            results[f"{render}_{size}"] = {
+                "latency": percentiles(
+                    [timed(scraper.fetch_page, url) for _ in range(runs)]
+                ),
+                "text_chars": len(text),
+            }
+    results["profile"] = scope.load_profile.name
+    results["stats"] = scope.scrape_stats.stats()
+    return results
+
+
+def bench_service(scope, browser_pool, base_url: str, runs: int) -> dict:
+    snapshot = PlaywrightWebScraper(browser_pool=browser_pool).fetch_page(base_url)
+    service = OpenAIService(
+        scope.ai_client, scope.prompt_provider, link_ai_client=scope.link_ai_client
+    )
+    select = [
+        timed(service.select_relevant_links, base_url, snapshot.links)
+        for _ in range(runs)
+    ]
+    links = "\n".join(snapshot.links)
+    brochure = [
+        timed(service.create_brochure, "Acme", snapshot.text, links)
+        for _ in range(runs)
+    ]
+    return {
+        "select_relevant_links": percentiles(select),
+        "create_brochure": percentiles(brochure),
+    }
+
+
+def bench_orchestrator(
+    scope, browser_pool, base_url: str, requests: int, levels: list
+) -> dict:
+    orchestrator = SalesBrochureContainer.create_orchestrator(
+        browser_pool=browser_pool, scope=scope
+    )
+
+    def one(index: int) -> BrochureRequest:
+        return orchestrator.run(BrochureRequest(f"{base_url}?r={index}"))
+
+    results = {}
+    for level in levels:
+        started = time.perf_counter()
+        with ThreadPoolExecutor(level) as pool:
+            outcomes = list(pool.map(lambda i: _attempt(one, i), range(requests)))
+        elapsed = time.perf_counter() - started
+
+        done = [request for request, _ in outcomes if request is not None]
+        stages = {}
+        for request in done:
+            for name, run in request.stages["stages"].items():
+                stages.setdefault(name, []).append(run["seconds"])
+        results[str(level)] = {
+            "throughput": round(len(done) / elapsed, 2),
+            "elapsed": round(elapsed, 3),
+            "errors": len(outcomes) - len(done),
+            "latency": percentiles([seconds for _, seconds in outcomes]),
+            "stages": {name: percentiles(values) for name, values in stages.items()},
+        }
+    return results
+
+
+def _attempt(fn, index: int):
+    started = time.perf_counter()
+    try:
+        return fn(index), time.perf_counter() - started
+    except Exception:
+        return None, time.perf_counter() - started
+
+
+def bench_api(base_url: str, requests: int, levels: list) -> dict:
+    import httpx
+    import uvicorn
+    from sales_brochure_fastapi import app
+
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    server = uvicorn.Server(
+        uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning")
+    )
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started and thread.is_alive():
+        time.sleep(0.05)
+    if not server.started:
+        raise RuntimeError("API server failed to start")
+
+    async def level_run(level: int, offset: int) -> dict:
+        semaphore = asyncio.Semaphore(level)
+        latencies, errors = [], 0
+
+        async def one(client, index: int) -> None:
+            nonlocal errors
+            payload = {"base_url": f"{base_url}?r={index}", "cache_bypass": True}
+            async with semaphore:
+                started = time.perf_counter()
+                try:
+                    response = await client.post("/generate_prompt", json=payload)
+                    errors += response.status_code != 200
+                except httpx.HTTPError:
+                    errors += 1
+                latencies.append(time.perf_counter() - started)
+
+        async with httpx.AsyncClient(
+            base_url=f"http://127.0.0.1:{port}", timeout=300
+        ) as client:
+            started = time.perf_counter()
+            await asyncio.gather(*(one(client, offset + i) for i in range(requests)))
+            elapsed = time.perf_counter() - started
+        return {
+            "throughput": round((requests - errors) / elapsed, 2),
+            "elapsed": round(elapsed, 3),
+            "errors": errors,
+            "latency": percentiles(latencies),
+        }
+
+    try:
+        return {
+            str(level): asyncio.run(level_run(level, index * requests))
+            for index, level in enumerate(levels)
+        }
+    finally:
+        server.should_exit = True
+        thread.join()
+
+
+def flatten(results: dict, prefix: str = "") -> dict:
+    """
+    Return the numeric leaves of ``results`` keyed by dotted path.
+    """
+    flat = {}
+    for key, value in results.items():
+        path = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(flatten(value, f"{path}."))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            flat[path] = value
+    return flat
+
+
+def compare(old: dict, new: dict, threshold: float) -> None:
+    """
+    Print every metric that changed by more than ``threshold`` (a share).
+    """
+    before, after = flatten(old), flatten(new)
+    changed = 0
+    for key in sorted(before.keys() & after.keys()):
+        if key.startswith(("config.", "started_at")) or not before[key]:
+            continue
+        change = (after[key] - before[key]) / abs(before[key])
+        if abs(change) > threshold:
+            changed += 1
+            print(f"{key:<60} {before[key]:>10} -> {after[key]:<10} ({change:+.0%})")
+    print(f"{changed} metrics changed by more than {threshold:.0%}")
+
+
+def run(args, levels: list, sections: list) -> dict:
+    faults = FaultConfig(
+        latency=args.llm_latency,
+        tokens_per_second=args.tokens_per_second,
+        error_rate=args.error_rate,
+    )
+    results = {
+        "config": {**vars(args), "load_profile": os.getenv("SCRAPER_LOAD_PROFILE")},
+        "started_at": time.time(),
+        "platform": platform.platform(),
+        "python": platform.python_version(),
+    }
+
+    with ExitStack() as stack:
+        sampler = stack.enter_context(ResourceSampler())
+        server = stack.enter_context(FakeLLMServer(faults))
+        site = stack.enter_context(FixtureSite())
+        os.environ["OPENAI_BASE_URL"] = server.base_url
+
+        if set(sections) - {"api"}:
+            browser_pool = SalesBrochureContainer.create_browser_pool()
+            browser_pool.start()
+            stack.callback(browser_pool.close)
+            scope = SalesBrochureContainer.create_app_scope()
+            stack.callback(lambda: asyncio.run(scope.aclose()))
+
+        for name in sections:
+            print(f"Running {name}...")
+            with sampler.section(name):
+                if name == "scraper":
+                    result = bench_scraper(
+                        scope, browser_pool, site.base_url, args.runs
+                    )
+                elif name == "service":
+                    result = bench_service(
+                        scope, browser_pool, site.base_url, args.runs
+                    )
+                elif name == "orchestrator":
+                    result = bench_orchestrator(
+                        scope, browser_pool, site.base_url, args.requests, levels
+                    )
+                else:
+                    result = bench_api(site.base_url, args.requests, levels)
+            results[name] = result
+
+        results["llm_responses"] = {
+            str(status): count for status, count in server.responses.items()
+        }
+        results["resources"] = sampler.stats()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--requests", type=int, default=40)
+    parser.add_argument("--concurrency", default="1,4,16")
+    parser.add_argument("--llm-latency", type=float, default=0.2)
+    parser.add_argument("--tokens-per-second", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--sections", default=",".join(SECTIONS))
+    parser.add_argument("--output", default="bench_results.json")
+    parser.add_argument("--compare", help="Earlier results file to compare with")
+    parser.add_argument("--threshold", type=float, default=0.1)
+    args = parser.parse_args()
+
+    levels = [int(level) for level in args.concurrency.split(",")]
+    sections = [name for name in args.sections.split(",") if name]
+    unknown = set(sections) - set(SECTIONS)
+    if unknown:
+        parser.error(f"unknown sections: {', '.join(sorted(unknown))}")
+
+    os.environ.setdefault("OPENAI_API_KEY", "sk-proj-fake-benchmark-key")
+    results = run(args, levels, sections)
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+    print(json.dumps(results["resources"], indent=2))
+    print(f"Results written to {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            compare(json.load(f), results, args.threshold)
+
+
+if __name__ == "__main__":
+    main()
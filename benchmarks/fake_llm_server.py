@@ -0,0 +1,253 @@
+"""
+Local OpenAI-compatible chat completions server with injected faults.
+
+Answers ``POST /v1/chat/completions``, streamed or not, so the real
+OpenAI clients and everything wrapped around them can be exercised
+without the network. Link selection prompts get a JSON list of the links
+found in the prompt; every other prompt gets a short markdown brochure
+that lists the URLs it was given as sources, so callers can check which
+request's data reached the model.
+
+Latency, token throughput, slow-tail requests, server errors and 429s
+are injected with a seeded random generator, and the settings can be
+changed while the server runs, e.g. to simulate an outage and its
+recovery.
+
+Point the application at it with ``OPENAI_BASE_URL``:
+
+    python benchmarks/fake_llm_server.py --port 8001 --latency 0.5 \\
+        --tail-rate 0.05 --tail-latency 8 --error-rate 0.1
+    OPENAI_BASE_URL=http://127.0.0.1:8001/v1 OPENAI_API_KEY=sk-proj-fake ...
+"""
+
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+URL_PATTERN = re.compile(r"https?://[^\s'\",\]]+")
+SKIP_LINKS = ("privacy", "terms", "mailto")
+
+
+@dataclass
+class FaultConfig:
+    """
+    Faults injected into each request.
+
+    Attributes:
+        latency (float): Seconds before every response starts.
+        tail_rate (float): Share of requests that take ``tail_latency``.
+        tail_latency (float): Seconds taken by slow-tail requests.
+        error_rate (float): Share of requests answered with ``error_status``.
+        error_status (int): HTTP status of injected errors.
+        rate_limit_rate (float): Share of requests answered with 429.
+        retry_after (float): Seconds sent in ``retry-after-ms`` with a 429.
+        chunk_delay (float): Seconds between streamed chunks.
+        tokens_per_second (float): Completion tokens generated per second,
+            paced across streamed chunks; 0 answers at once.
+        words (int): Words in a generated brochure.
+    """
+
+    latency: float = 0.05
+    tail_rate: float = 0.0
+    tail_latency: float = 5.0
+    error_rate: float = 0.0
+    error_status: int = 503
+    rate_limit_rate: float = 0.0
+    retry_after: float = 0.2
+    chunk_delay: float = 0.0
+    tokens_per_second: float = 0.0
+    words: int = 300
+
+
+def reply_for(system: str, user: str, words: int) -> str:
+    """
+    Build a plausible answer for a brochure pipeline prompt.
+    """
+    if '"links"' in system:
+        urls = URL_PATTERN.findall(user)
+        links = [
+            {"type": "relevant page", "url": url}
+            for url in dict.fromkeys(urls)
+            if not any(skip in url for skip in SKIP_LINKS)
+        ]
+        return json.dumps({"links": links[:5]})
+    body = " ".join(f"word{i}" for i in range(words))
+    sources = "".join(f"- {url}\n" for url in dict.fromkeys(URL_PATTERN.findall(user)))
+    if sources:
+        body += f"\n\n## Sources\n\n{sources}"
+    return f"# Acme\n\n## About\n\n{body}\n"
+
+
+class _FakeLLMHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: "FakeLLMServer._Server"
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        request = json.loads(self.rfile.read(length) or b"{}")
+        faults = self.server.owner.faults
+        rng = self.server.owner.random
+
+        with self.server.owner.lock:
+            roll = rng.random()
+            slow = rng.random() < faults.tail_rate
+        time.sleep(faults.tail_latency if slow else faults.latency)
+
+        if roll < faults.rate_limit_rate:
+            self.server.owner.record(429)
+            return self._error(
+                429,
+                "rate_limit_exceeded",
+                {"retry-after-ms": str(int(faults.retry_after * 1000))},
+            )
+        if roll < faults.rate_limit_rate + faults.error_rate:
+            self.server.owner.record(faults.error_status)
+            return self._error(faults.error_status, "server_error")
+        self.server.owner.record(200)
+
+        messages = {m["role"]: m["content"] for m in request.get("messages", [])}
+        content = reply_for(
+            messages.get("system", ""), messages.get("user", ""), faults.words
+        )
+        model = request.get("model", "gpt-4")
+        if request.get("stream"):
+            self._stream(model, content, faults)
+        else:
+            if faults.tokens_per_second:
+                time.sleep(len(content) / 4 / faults.tokens_per_second)
+            self._json(200, self._completion(model, messages, content))
+
+    def _completion(self, model: str, messages: dict, content: str) -> dict:
+        prompt_tokens = sum(len(text) for text in messages.values()) // 4
+        completion_tokens = len(content) // 4
+        return {
+            "id": f"chatcmpl-fake-{time.time_ns()}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": model,
+            "choices": [
+                {
+                    "index": 0,
+                    "finish_reason": "stop",
+                    "message": {"role": "assistant", "content": content},
+                }
+            ],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            },
+        }
+
+    def _stream(self, model: str, content: str, faults: FaultConfig) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        created = int(time.time())
+        for piece in re.findall(r"\S+\s*", content):
+            chunk = {
+                "id": "chatcmpl-fake-stream",
+                "object": "chat.completion.chunk",
+                "created": created,
+                "model": model,
+                "choices": [
+                    {"index": 0, "delta": {"content": piece}, "finish_reason": None}
+                ],
+            }
+            self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode("utf-8"))
+            self.wfile.flush()
+            delay = faults.chunk_delay
+            if faults.tokens_per_second:
+                delay += len(piece) / 4 / faults.tokens_per_second
+            if delay:
+                time.sleep(delay)
+        self.wfile.write(b"data: [DONE]\n\n")
+        self.close_connection = True
+
+    def _error(self, status: int, code: str, headers: dict = None) -> None:
+        payload = {"error": {"message": f"Injected {status}", "code": code}}
+        self._json(status, payload, headers)
+
+    def _json(self, status: int, payload: dict, headers: dict = None) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FakeLLMServer:
+    """
+    Context manager running the fake LLM server on a local port.
+
+    Attributes:
+        base_url (str): API root to use as ``OPENAI_BASE_URL``.
+        faults (FaultConfig): Injected faults; may be changed at any time.
+        responses (Counter): Responses sent, by HTTP status.
+    """
+
+    class _Server(ThreadingHTTPServer):
+        daemon_threads = True
+        owner: "FakeLLMServer"
+
+    def __init__(self, faults: FaultConfig = None, port: int = 0, seed: int = 0):
+        self.faults = faults or FaultConfig()
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.responses: Counter = Counter()
+        self._server = self._Server(("127.0.0.1", port), _FakeLLMHandler)
+        self._server.owner = self
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self.base_url = f"http://127.0.0.1:{self._server.server_address[1]}/v1"
+
+    def record(self, status: int) -> None:
+        with self.lock:
+            self.responses[status] += 1
+
+    def __enter__(self) -> "FakeLLMServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument("--seed", type=int, default=0)
+    for name, value in vars(FaultConfig()).items():
+        parser.add_argument(f"--{name.replace('_', '-')}", type=type(value))
+    args = parser.parse_args()
+
+    faults = FaultConfig(
+        **{
+            name: getattr(args, name)
+            for name in vars(FaultConfig())
+            if getattr(args, name) is not None
+        }
+    )
+    with FakeLLMServer(faults, port=args.port, seed=args.seed) as server:
+        print(f"Fake LLM server on {server.base_url} with {faults}")
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Local fixture website used by the benchmarks.
+
+Serves a small generated company site from an in-process HTTP server so
+benchmarks never touch the network.
+
+Every page is served server-rendered at ``/<page>`` and client-rendered
+at ``/js/<page>``, where a script builds the text after load so only a
+browser sees it. ``?paragraphs=N`` overrides the page size, and
+``SIZES`` names a few typical ones.
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+PAGES = ["about", "careers", "customers", "blog", "privacy", "terms"]
+
+# Paragraphs per page for the size variants used by the benchmark suite
+SIZES = {"small": 5, "medium": 40, "large": 400}
+
+
+def render_page(
+    name: str, paragraphs: int = 40, company: str = "Acme", js: bool = False
+) -> str:
+    """
+    Build the HTML for a fixture page.
+
+    Args:
+        name (str): Page name, used in headings and text.
+        paragraphs (int): Number of paragraphs to generate.
+        company (str): Company named in the title and text.
+        js (bool): Render the paragraphs with a script after load instead
+            of in the HTML.
+
+    Returns:
+        str: HTML document.
+    """
+    prefix = "/js" if js else ""
+    nav = "".join(f'<a href="{prefix}/{page}">{page.title()}</a>' for page in PAGES)
+    texts = [
+        f"{name.title()} paragraph {i}: {company} builds reliable widgets "
+        f"for customers around the world."
+        for i in range(paragraphs)
+    ]
+    if js:
+        body = (
+            '<main id="app"></main><script>'
+            "window.addEventListener('load', () => setTimeout(() => {"
+            "const app = document.getElementById('app');"
+            f"for (const text of {json.dumps(texts)}) {{"
+            "const p = document.createElement('p');"
+            "p.textContent = text; app.appendChild(p);"
+            "}}, 50));</script>"
+        )
+    else:
+        body = "".join(f"<p>{text}</p>" for text in texts)
+    return (
+        f"<html><head><title>{company} {name.title()}</title></head>"
+        f"<body><nav>{nav}</nav><h1>{name.title()}</h1>{body}"
+        f'<footer><a href="mailto:hello@acme.test">Contact</a></footer>'
+        f"</body></html>"
+    )
+
+
+class _FixtureHandler(BaseHTTPRequestHandler):
+    paragraphs = 40
+    company = "Acme"
+
+    def do_GET(self):
+        parts = urlsplit(self.path)
+        name = parts.path.strip("/") or "home"
+        js = name == "js" or name.startswith("js/")
+        if js:
+            name = name[3:] or "home"
+        query = parse_qs(parts.query)
+        paragraphs = int(query.get("paragraphs", [self.paragraphs])[0])
+        payload = render_page(name, paragraphs, self.company, js).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FixtureSite:
+    """
+    Context manager running the fixture site on a random local port.
+
+    Attributes:
+        base_url (str): Root URL of the running site.
+        company (str): Company the site is about.
+    """
+
+    def __init__(self, paragraphs: int = 40, company: str = "Acme"):
+        handler = type(
+            "Handler",
+            (_FixtureHandler,),
+            {"paragraphs": paragraphs, "company": company},
+        )
+        self.company = company
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self.base_url = f"http://127.0.0.1:{self._server.server_address[1]}/"
+
+    def __enter__(self) -> "FixtureSite":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
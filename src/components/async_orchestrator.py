@@ -0,0 +1,459 @@
+import asyncio
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+from components.boilerplate_filter import BoilerplateFilter
+from components.content_budgeter import ContentBudgeter
+from core.content_budget import ContentBudget
+from core.page_snapshot import PageSnapshot
+from core.site_snapshot import SiteDiff
+from core.stage_graph import AsyncStageGraph, Stage, StageRun
+from core.tracer import Tracer
+from interfaces.i_async_openai_operations import IAsyncOpenAIOperations
+from interfaces.i_async_sales_orchestrator import IAsyncSalesBrochureOrchestrator
+from interfaces.i_async_scraper import IAsyncScraperProvider
+from interfaces.i_link_filter import ILinkFilter
+from interfaces.i_oneshot_prompt import IPrompt
+from interfaces.i_page_crawler import IAsyncPageCrawler
+from interfaces.i_site_snapshot_store import ISiteSnapshotStore
+from logs.logger_singleton import Logger
+from utils.url_utils import normalize_url
+
+
+class AsyncSalesBrochureOrchestrator(IAsyncSalesBrochureOrchestrator):
+    """
+    Orchestrates scraping and AI processing on an event loop.
+
+    The pipeline is a graph of stages run by AsyncStageGraph: each stage
+    declares the values it reads and produces, and starts as soon as its
+    inputs exist. Link selection and crawling fall back to the landing
+    page alone and budgeting to plain trimming, so those stages can fail or
+    time out without failing the request. Stages pass the request's pages
+    and links to each other explicitly, so one instance can serve many
+    concurrent tasks.
+
+    With a site store, each request is compared against the site's
+    previous snapshot: link selection is reused if the landing page's
+    links are unchanged, in map-reduce mode only the chunks of pages whose
+    text changed are summarised again, and the brochure is reused if its
+    contents and links are unchanged, so refreshing an unchanged site makes
+    no LLM calls.
+
+    Attributes:
+        playwright_scraper (IAsyncScraperProvider): Async web scraper.
+        prompt_provider (IPrompt): Interface for prompt generation.
+        openai_service (IAsyncOpenAIOperations): Async OpenAI operations.
+        page_crawler (Optional[IAsyncPageCrawler]): Fetches the selected
+            relevant pages concurrently. If None, only the landing page is used.
+        content_budgeter (Optional[ContentBudgeter]): Fits the contents to
+            the model's token budget, summarising chunks in parallel when
+            they are too large to trim. If None, contents are sent as is.
+        link_filter (Optional[ILinkFilter]): Narrows the landing page's
+            links before, or instead of, the LLM link-selection call.
+        boilerplate_filter (Optional[BoilerplateFilter]): Removes text
+            repeated across the landing and crawled pages before budgeting.
+        tracer (Tracer): Times the request and each stage as spans.
+        stage_timeouts (Dict[str, float]): Seconds each stage may take, by
+            stage name; stages not listed have no timeout.
+        site_store (Optional[ISiteSnapshotStore]): Stores each site's last
+            snapshot. If None, nothing is reused between requests.
+        reuse_site (bool): Reuse results from the previous snapshot. If
+            False, the snapshot is only replaced, like a cache refresh.
+    """
+
+    def __init__(
+        self,
+        playwright_scraper: IAsyncScraperProvider,
+        prompt_provider: IPrompt,
+        openai_service: IAsyncOpenAIOperations,
+        page_crawler: Optional[IAsyncPageCrawler] = None,
+        content_budgeter: Optional[ContentBudgeter] = None,
+        link_filter: Optional[ILinkFilter] = None,
+        boilerplate_filter: Optional[BoilerplateFilter] = None,
+        tracer: Optional[Tracer] = None,
+        stage_timeouts: Optional[Dict[str, float]] = None,
+        site_store: Optional[ISiteSnapshotStore] = None,
+        reuse_site: bool = True,
+        logger=None,
+    ):
+        self.playwright_scraper = playwright_scraper
+        self.prompt_provider = prompt_provider
+        self.openai_service = openai_service
+        self.page_crawler = page_crawler
+        self.content_budgeter = content_budgeter
+        self.link_filter = link_filter
+        self.boilerplate_filter = boilerplate_filter
+        self.tracer = tracer or Tracer()
+        self.stage_timeouts = stage_timeouts or {}
+        self.site_store = site_store
+        self.reuse_site = reuse_site
+        self.logger = logger or Logger(self.__class__.__name__)
+
+        stages, contents = self._stages()
+        inputs = (contents, "relevant_links", "company_name", "site")
+        self._graph = AsyncStageGraph(
+            [*stages, self._stage("generate", self._generate, inputs, ("brochure",))],
+            self.tracer,
+        )
+        self._stream_graph = AsyncStageGraph(
+            [
+                *stages,
+                self._stage(
+                    "generate", self._stream, (*inputs, "events"), ("brochure",)
+                ),
+            ],
+            self.tracer,
+        )
+
+    async def orchestrate(self, base_url: str) -> str:
+        """
+        Fetch content and links from a website, select relevant links,
+        and generate a company brochure.
+
+        Args:
+            base_url (str): The website URL.
+
+        Returns:
+            str: Generated company brochure.
+        """
+        site = self._diff(base_url)
+        with self.tracer.span("brochure", url=base_url) as request_span:
+            result = await self._graph.run(
+                {"base_url": base_url, "company_name": "HuggingFace", "site": site}
+            )
+            brochure = result.values["brochure"]
+            request_span.set(**site.to_dict())
+            self._store(site, result.runs)
+            return brochure
+
+    async def orchestrate_stream(self, base_url: str) -> AsyncIterator[dict]:
+        """
+        Run the pipeline and stream stage progress and brochure tokens.
+
+        Args:
+            base_url (str): The website URL.
+
+        Yields:
+            dict: ``{"type": "progress", "stage", "status", ...}`` events
+            as each stage starts and ends (``status`` is ``fallback`` if
+            the stage failed and its fallback was used), ``{"type":
+            "token", "text"}`` events while the brochure is generated, then
+            ``{"type": "done", "usage", "stages", "refresh"}`` with the
+            request's LLM calls, tokens and estimated cost, the stage
+            timings and critical path, and the pages changed and skipped
+            and LLM calls skipped since the site's previous snapshot.
+        """
+        site = self._diff(base_url)
+        with self.tracer.span("brochure", url=base_url) as request_span:
+            events: asyncio.Queue = asyncio.Queue()
+            run = asyncio.ensure_future(
+                self._stream_graph.run(
+                    {
+                        "base_url": base_url,
+                        "company_name": "HuggingFace",
+                        "site": site,
+                        "events": events,
+                    },
+                    lambda stage, outputs: events.put_nowait(
+                        self._progress(stage, outputs)
+                    ),
+                )
+            )
+            run.add_done_callback(lambda _: events.put_nowait(None))
+            try:
+                while (event := await events.get()) is not None:
+                    yield event
+                result = run.result()
+            finally:
+                run.cancel()
+
+            request_span.set(**site.to_dict())
+            self._store(site, result.runs)
+            yield {
+                "type": "done",
+                "usage": self.tracer.usage(request_span),
+                "stages": result.to_dict(),
+                "refresh": site.to_dict(),
+            }
+
+    def _stages(self) -> Tuple[List[Stage], str]:
+        """
+        Build the stages that lead up to generation.
+
+        Link selection only needs the landing page's links, so without a
+        crawler, budgeting the landing page's text runs alongside it.
+
+        Returns:
+            Tuple[List[Stage], str]: The stages, and the name of the value
+            holding the contents for the brochure prompt.
+        """
+        stages = [
+            self._stage(
+                "scrape",
+                self._scrape,
+                ("base_url", "site"),
+                ("snapshot", "landing_text"),
+            ),
+            self._stage(
+                "select_links",
+                self._select_links,
+                ("base_url", "snapshot", "site"),
+                ("relevant_links",),
+                fallback=self._without_links,
+            ),
+        ]
+        contents = "landing_text"
+        if self.page_crawler is not None:
+            stages.append(
+                self._stage(
+                    "crawl",
+                    self._crawl,
+                    ("snapshot", "relevant_links", "site"),
+                    ("site_text",),
+                    fallback=self._landing_only,
+                )
+            )
+            contents = "site_text"
+        if self.content_budgeter is not None:
+            stages.append(
+                self._stage(
+                    "budget",
+                    self._budget,
+                    (contents, "site"),
+                    ("budget", "contents"),
+                    fallback=self._trim,
+                )
+            )
+            contents = "contents"
+        return stages, contents
+
+    def _stage(self, name, run, inputs, outputs, fallback=None) -> Stage:
+        return Stage(
+            name, run, inputs, outputs, self.stage_timeouts.get(name), fallback
+        )
+
+    def _diff(self, base_url: str) -> SiteDiff:
+        """
+        Start comparing ``base_url`` against its previous snapshot.
+        """
+        key = normalize_url(base_url)
+        previous = None
+        if self.site_store is not None and self.reuse_site:
+            previous = self.site_store.get(key)
+        return SiteDiff(key, previous)
+
+    def _store(self, site: SiteDiff, runs: dict) -> None:
+        """
+        Log what ``site`` reused and store its snapshot, unless a stage
+        fell back or no brochure was completed: a degraded run must not
+        become the baseline of the next refresh.
+        """
+        if site.previous is not None:
+            self.logger.info(f"Refreshed {site.base_url}: {site.to_dict()}")
+        if self.site_store is None:
+            return
+        if not site.brochure_complete or any(
+            run.status != "ok" for run in runs.values()
+        ):
+            self.logger.warning(f"Not storing degraded snapshot of {site.base_url}")
+            return
+        self.site_store.save(site.current)
+
+    async def _scrape(self, base_url: str, site: SiteDiff) -> Tuple[PageSnapshot, str]:
+        """
+        Fetch content and links from a single page load.
+        """
+        snapshot = await self.playwright_scraper.fetch_page(base_url)
+        site.compare_pages({snapshot.url: snapshot.text})
+        return snapshot, snapshot.text
+
+    async def _select_links(
+        self, base_url: str, snapshot: PageSnapshot, site: SiteDiff
+    ) -> List[str]:
+        """
+        Ask the LLM which of the landing page's links are relevant, after
+        prefiltering them. The LLM call is skipped if the landing page's
+        links are unchanged since the previous snapshot, or if the
+        prefilter is confident or leaves nothing to choose from.
+        """
+        links = snapshot.links
+        reused = site.reuse_links(links)
+        if reused is not None:
+            self.tracer.current().set(reused=True)
+            return reused
+
+        if self.link_filter is not None:
+            selection = self.link_filter.filter(base_url, links)
+            self.tracer.current().set(candidates=len(selection.candidates))
+            if selection.confident:
+                return site.record_links(selection.selected)
+            if not selection.candidates:
+                return site.record_links([])
+            links = selection.candidates
+
+        return site.record_links(
+            await self.openai_service.select_relevant_links(base_url, links)
+        )
+
+    @staticmethod
+    def _without_links(
+        base_url: str, snapshot: PageSnapshot, site: SiteDiff
+    ) -> List[str]:
+        # Generate from the landing page alone
+        return []
+
+    async def _crawl(
+        self, snapshot: PageSnapshot, relevant_links: List[str], site: SiteDiff
+    ) -> str:
+        """
+        Fetch the relevant pages concurrently and combine their text with
+        the landing page, without the boilerplate they share.
+        """
+        self.tracer.current().set(links=len(relevant_links))
+        crawl = await self.page_crawler.crawl(relevant_links)
+        site.compare_pages({page.url: page.text for page in crawl.pages})
+        pages = [snapshot, *(page for page in crawl.pages if page.text)]
+        texts = [page.text for page in pages]
+        if self.boilerplate_filter is not None:
+            texts = self.boilerplate_filter.clean(texts)
+        return self._combine_contents(
+            texts[0],
+            [(page.url, text) for page, text in zip(pages[1:], texts[1:])],
+        )
+
+    @staticmethod
+    def _landing_only(
+        snapshot: PageSnapshot, relevant_links: List[str], site: SiteDiff
+    ) -> str:
+        return snapshot.text
+
+    async def _budget(self, contents: str, site: SiteDiff) -> Tuple[ContentBudget, str]:
+        """
+        Fit ``contents`` to the token budget, summarising if needed.
+        """
+        budget = self.content_budgeter.fit(contents)
+        self.tracer.current().set(mode=budget.mode, tokens_in=budget.tokens_in)
+        return budget, await self._fit_contents(budget, site)
+
+    def _trim(self, contents: str, site: SiteDiff) -> Tuple[ContentBudget, str]:
+        """
+        Trim ``contents`` to the budget without summarising.
+        """
+        budget = self.content_budgeter.fit(contents)
+        return budget, budget.text
+
+    async def _generate(
+        self,
+        contents: str,
+        relevant_links: List[str],
+        company_name: str,
+        site: SiteDiff,
+    ) -> str:
+        """
+        Generate the brochure, unless its inputs are unchanged since the
+        site's previous snapshot.
+        """
+        brochure = site.reuse_brochure(company_name, contents, relevant_links)
+        if brochure is not None:
+            return brochure
+        return site.record_brochure(
+            await self.openai_service.create_brochure(
+                company_name=company_name,
+                contents=contents,
+                relevent_links="\n".join(relevant_links),
+            )
+        )
+
+    async def _stream(
+        self,
+        contents: str,
+        relevant_links: List[str],
+        company_name: str,
+        site: SiteDiff,
+        events: asyncio.Queue,
+    ) -> str:
+        """
+        Stream the brochure, passing each piece of text on to ``events``.
+        A brochure reused from the previous snapshot is sent as one piece.
+        """
+        brochure = site.reuse_brochure(company_name, contents, relevant_links)
+        if brochure is not None:
+            events.put_nowait({"type": "token", "text": brochure})
+            return brochure
+
+        parts = []
+        async for text in self.openai_service.stream_brochure(
+            company_name=company_name,
+            contents=contents,
+            relevent_links="\n".join(relevant_links),
+        ):
+            parts.append(text)
+            events.put_nowait({"type": "token", "text": text})
+        return site.record_brochure("".join(parts))
+
+    async def _fit_contents(self, budget: ContentBudget, site: SiteDiff) -> str:
+        """
+        Return the trimmed contents, or in map-reduce mode the merged
+        summaries of each chunk, themselves trimmed to the budget. Chunks of
+        a page unchanged since the site's previous snapshot keep their
+        summary.
+        """
+        if not budget.chunks:
+            return budget.text
+
+        summaries = await asyncio.gather(
+            *(
+                self._summarize(page or site.base_url, chunk, site)
+                for page, chunk in zip(budget.chunk_pages, budget.chunks)
+            )
+        )
+        merged = "\n\n".join(summary for summary in summaries if summary)
+        if not merged:
+            # Every summary failed: fall back to the trimmed contents
+            return budget.text
+        return self.content_budgeter.fit(merged).text
+
+    async def _summarize(self, url: str, chunk: str, site: SiteDiff) -> str:
+        summary = site.reuse_summary(url, chunk)
+        if summary is None:
+            summary = await self.openai_service.summarize_content(chunk)
+            site.record_summary(url, chunk, summary)
+        return summary
+
+    @staticmethod
+    def _progress(run: StageRun, outputs: Optional[dict]) -> dict:
+        """
+        Describe a stage starting, or ending with ``outputs``, as a
+        progress event.
+        """
+        event = {"type": "progress", "stage": run.name, "status": "started"}
+        if outputs is None:
+            return event
+        event["status"] = "done" if run.status == "ok" else run.status
+        if run.error:
+            event["error"] = run.error
+        if "snapshot" in outputs:
+            event["links"] = len(outputs["snapshot"].links)
+        if "relevant_links" in outputs:
+            event["links"] = outputs["relevant_links"]
+        if "budget" in outputs:
+            event.update(outputs["budget"].to_dict())
+        return event
+
+    @staticmethod
+    def _combine_contents(landing: str, pages: List[Tuple[str, str]]) -> str:
+        """
+        Append the text of each crawled page, headed by its URL.
+
+        Args:
+            landing (str): Landing page text.
+            pages (List[Tuple[str, str]]): URL and text of each page fetched
+                from the relevant links.
+
+        Returns:
+            str: Combined page contents for the brochure prompt.
+        """
+        sections = [landing]
+        for url, text in pages:
+            if text:
+                sections.append(f"## {url}\n{text}")
+        return "\n\n".join(sections)
@@ -0,0 +1,168 @@
+import asyncio
+import csv
+import json
+import os
+import time
+from typing import AsyncIterator, Iterable, List, Set
+
+from interfaces.i_async_sales_orchestrator import IAsyncSalesBrochureOrchestrator
+from logs.log_context import request_context, request_id_var
+from logs.logger_singleton import Logger
+
+
+def read_urls(path: str) -> List[str]:
+    """
+    Read base URLs from a CSV, JSONL or plain-text file.
+
+    CSV files use their ``url`` column (or the first column when there is
+    no header named ``url``); JSONL lines are objects with a ``url`` key;
+    any other file is read as one URL per line. Blank lines and duplicates
+    are dropped, keeping the first occurrence.
+
+    Args:
+        path (str): Input file path.
+
+    Returns:
+        List[str]: URLs in file order.
+    """
+    urls = []
+    with open(path, newline="", encoding="utf-8") as f:
+        if path.endswith(".csv"):
+            rows = list(csv.reader(f))
+            header = [cell.strip().lower() for cell in rows[0]] if rows else []
+            if "url" in header:
+                column, rows = header.index("url"), rows[1:]
+            else:
+                column = 0
+            urls = [row[column] for row in rows if len(row) > column]
+        elif path.endswith(".jsonl"):
+            urls = [json.loads(line)["url"] for line in f if line.strip()]
+        else:
+            urls = list(f)
+
+    return list(dict.fromkeys(url.strip() for url in urls if url.strip()))
+
+
+def load_completed(path: str) -> Set[str]:
+    """
+    Return URLs already generated successfully in a JSONL results file.
+
+    Failed items are not included, so a resumed batch retries them.
+
+    Args:
+        path (str): Results file written by a previous run.
+
+    Returns:
+        Set[str]: URLs whose result has status ``ok``.
+    """
+    if not os.path.exists(path):
+        return set()
+
+    completed = set()
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                # A run killed mid-write can leave a truncated last line
+                continue
+            if record.get("status") == "ok":
+                completed.add(record["url"])
+    return completed
+
+
+class AsyncBatchRunner:
+    """
+    Generates brochures for many URLs with bounded concurrency and retries.
+
+    Every URL is generated by one shared, stateless orchestrator. Browser
+    pages and LLM calls are limited by the browser pool and the rate
+    limiter wired into it; ``max_concurrency`` caps how many URLs are in
+    progress at once so a large batch does not build up thousands of
+    waiting pipelines.
+
+    Attributes:
+        orchestrator (IAsyncSalesBrochureOrchestrator): Generates the
+            brochure for each URL.
+        max_concurrency (int): URLs processed at once.
+        retries (int): Extra attempts for a failed URL.
+        backoff (float): Base delay in seconds, doubled after each failure.
+    """
+
+    def __init__(
+        self,
+        orchestrator: IAsyncSalesBrochureOrchestrator,
+        max_concurrency: int = 4,
+        retries: int = 2,
+        backoff: float = 2.0,
+        logger=None,
+    ):
+        self.orchestrator = orchestrator
+        self.max_concurrency = max_concurrency
+        self.retries = retries
+        self.backoff = backoff
+        self.logger = logger or Logger(self.__class__.__name__)
+
+    async def run(self, urls: Iterable[str]) -> AsyncIterator[dict]:
+        """
+        Process ``urls`` and yield one result per URL as each finishes.
+
+        Results arrive in completion order, not input order. Each is a dict
+        with ``url``, ``status`` (``ok`` or ``error``), ``brochure``,
+        ``error``, ``attempts`` and ``elapsed``.
+
+        Args:
+            urls (Iterable[str]): Base URLs to process.
+
+        Yields:
+            dict: Result for one URL.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        # Items log under the batch's request id, suffixed with their index
+        batch_id = request_id_var.get()
+
+        async def bounded(index: int, url: str) -> dict:
+            item_id = f"{batch_id}:{index}" if batch_id else None
+            with request_context(item_id):
+                async with semaphore:
+                    return await self._process(url)
+
+        tasks = [
+            asyncio.ensure_future(bounded(index, url)) for index, url in enumerate(urls)
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # Stop outstanding work if the consumer goes away early
+            for task in tasks:
+                task.cancel()
+
+    async def _process(self, url: str) -> dict:
+        started = time.perf_counter()
+        error = None
+        for attempt in range(1, self.retries + 2):
+            try:
+                brochure = await self.orchestrator.orchestrate(url)
+                return self._result(url, "ok", brochure, None, attempt, started)
+
+            except Exception as e:
+                error = str(e)
+                self.logger.warning(
+                    f"Batch item {url} failed (attempt {attempt}): {error}"
+                )
+                if attempt <= self.retries:
+                    await asyncio.sleep(self.backoff * 2 ** (attempt - 1))
+
+        return self._result(url, "error", None, error, self.retries + 1, started)
+
+    @staticmethod
+    def _result(url, status, brochure, error, attempts, started) -> dict:
+        return {
+            "url": url,
+            "status": status,
+            "brochure": brochure,
+            "error": error,
+            "attempts": attempts,
+            "elapsed": round(time.perf_counter() - started, 3),
+        }
@@ -0,0 +1,88 @@
+import math
+import re
+from collections import Counter
+from typing import List, Optional
+
+from core.extraction_stats import ExtractionStats
+from logs.logger_singleton import Logger
+
+
+class BoilerplateFilter:
+    """
+    Removes text that repeats across pages of the same site.
+
+    Headers, footers, calls to action and legal notices that survive
+    main-content extraction usually appear on most pages of a site. Each
+    line (a paragraph, heading, list item or table row) is counted once
+    per page; lines found on at least ``min_pages`` pages and at least
+    ``min_share`` of all pages are dropped from every page, including the
+    landing page. Lines repeated on fewer pages are left for the content
+    budgeter to deduplicate.
+
+    Attributes:
+        min_pages (int): Pages a line must appear on to be boilerplate.
+        min_share (float): Share of pages a line must appear on.
+        stats (Optional[ExtractionStats]): Receives characters in and out
+            for each call.
+    """
+
+    def __init__(
+        self,
+        min_pages: int = 2,
+        min_share: float = 0.5,
+        stats: Optional[ExtractionStats] = None,
+        logger=None,
+    ):
+        self.min_pages = min_pages
+        self.min_share = min_share
+        self.stats = stats
+        self.logger = logger or Logger(self.__class__.__name__)
+
+    def clean(self, texts: List[str]) -> List[str]:
+        """
+        Drop the lines shared by enough of ``texts``.
+
+        Args:
+            texts (List[str]): Text of each page of one site, blocks
+                separated by blank lines.
+
+        Returns:
+            List[str]: The texts in the same order, without boilerplate.
+        """
+        if len(texts) < self.min_pages:
+            return texts
+
+        counts = Counter()
+        for text in texts:
+            counts.update({self._key(line) for line in text.splitlines()})
+        threshold = max(self.min_pages, math.ceil(self.min_share * len(texts)))
+        boilerplate = {
+            key for key, count in counts.items() if key and count >= threshold
+        }
+
+        cleaned = [self._strip(text, boilerplate) for text in texts]
+        chars_in = sum(len(text) for text in texts)
+        chars_out = sum(len(text) for text in cleaned)
+        if self.stats is not None:
+            self.stats.record("boilerplate", chars_in, chars_out)
+        self.logger.info(
+            f"Removed {len(boilerplate)} boilerplate lines from {len(texts)} pages: "
+            f"{chars_in} -> {chars_out} chars"
+        )
+        return cleaned
+
+    @staticmethod
+    def _key(line: str) -> str:
+        return re.sub(r"\W+", " ", line.lower()).strip()
+
+    def _strip(self, text: str, boilerplate: set) -> str:
+        blocks = []
+        for block in text.split("\n\n"):
+            lines = [
+                line
+                for line in block.splitlines()
+                if self._key(line) not in boilerplate
+            ]
+            if any(line.strip() for line in lines):
+                blocks.append("\n".join(lines))
+        return "\n\n".join(blocks)
@@ -0,0 +1,77 @@
+import asyncio
+import time
+
+from interfaces.i_async_sales_orchestrator import IAsyncSalesBrochureOrchestrator
+
+
+async def collect_brochure(
+    orchestrator: IAsyncSalesBrochureOrchestrator, base_url: str
+) -> dict:
+    """
+    Run the streaming pipeline to completion and time each stage.
+
+    Args:
+        orchestrator (IAsyncSalesBrochureOrchestrator): Pipeline to run.
+        base_url (str): The website URL.
+
+    Returns:
+        dict: ``result`` with the full brochure, ``stage_timings`` with
+        seconds spent in each stage, ``critical_path``, the chain of
+        stages that bounded the job's latency, and ``refresh``, what was
+        reused from the site's previous snapshot.
+    """
+    started = {}
+    timings = {}
+    parts = []
+    critical_path = []
+    refresh = {}
+
+    async for event in orchestrator.orchestrate_stream(base_url):
+        if event["type"] == "token":
+            parts.append(event["text"])
+        elif event["type"] == "progress":
+            if event["status"] == "started":
+                started[event["stage"]] = time.perf_counter()
+            elif event["stage"] in started:
+                timings[event["stage"]] = (
+                    time.perf_counter() - started.pop(event["stage"])
+                )
+        elif event["type"] == "done":
+            stages = event.get("stages", {})
+            critical_path = [step["stage"] for step in stages.get("critical_path", [])]
+            refresh = event.get("refresh", {})
+
+    return {
+        "result": "".join(parts),
+        "stage_timings": timings,
+        "critical_path": critical_path,
+        "refresh": refresh,
+    }
+
+
+def run_brochure_on_loop(
+    orchestrator: IAsyncSalesBrochureOrchestrator,
+    loop: asyncio.AbstractEventLoop,
+    base_url: str,
+) -> dict:
+    """
+    Run ``collect_brochure`` on ``loop``, running in another thread, and
+    wait for its result.
+
+    Lets job worker threads run brochures on the application's event loop,
+    where its loop-bound clients, rate limiter and single-flight registry
+    live, instead of building their own.
+
+    Args:
+        orchestrator (IAsyncSalesBrochureOrchestrator): Pipeline to run.
+        loop (asyncio.AbstractEventLoop): The loop the orchestrator's
+            dependencies are bound to.
+        base_url (str): The website URL.
+
+    Returns:
+        dict: The same keys as ``collect_brochure``.
+    """
+    future = asyncio.run_coroutine_threadsafe(
+        collect_brochure(orchestrator, base_url), loop
+    )
+    return future.result()
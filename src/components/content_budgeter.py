@@ -0,0 +1,287 @@
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from core.content_budget import ContentBudget
+from logs.logger_singleton import Logger
+from utils.token_estimate import count_tokens, split_tokens
+
+# Tokens of page content sent with the brochure prompt, per model. Smaller
+# windows leave room for the prompt and completion; larger ones are capped
+# to keep cost per brochure predictable.
+MODEL_CONTENT_BUDGETS: Dict[str, int] = {
+    "gpt-4": 6000,
+    "gpt-4-turbo": 12000,
+    "gpt-4o": 12000,
+    "gpt-4o-mini": 12000,
+    "gpt-3.5-turbo": 12000,
+}
+DEFAULT_CONTENT_BUDGET = 6000
+
+KEYWORDS = (
+    "about",
+    "mission",
+    "vision",
+    "founded",
+    "company",
+    "customer",
+    "client",
+    "product",
+    "platform",
+    "solution",
+    "service",
+    "team",
+    "culture",
+    "values",
+    "career",
+    "job",
+    "hiring",
+    "employee",
+    "headquarter",
+    "invest",
+)
+BOILERPLATE = (
+    "cookie",
+    "privacy",
+    "copyright",
+    "©",
+    "all rights reserved",
+    "terms of",
+    "subscribe",
+    "newsletter",
+    "sign in",
+    "log in",
+    "javascript",
+)
+
+# Page headers added by the orchestrator; page text may have its own
+# markdown headings
+PAGE_HEADER = re.compile(r"^## https?://")
+
+
+@dataclass
+class _Paragraph:
+    index: int
+    section: int
+    text: str
+    tokens: int
+    score: float = 0.0
+
+
+class ContentBudgeter:
+    """
+    Fits scraped page contents into a token budget before prompting.
+
+    Paragraphs are deduplicated across pages and ranked by how useful they
+    are likely to be for a brochure (company, product, customer and career
+    topics score higher; cookie banners and legal text lower). The best
+    paragraphs are kept up to the budget, in their original order; a
+    paragraph longer than the budget or a chunk is split into pieces that
+    are ranked on their own. If the deduplicated content exceeds
+    ``map_reduce_ratio`` times the budget, trimming would drop too much, so
+    the content is also split into chunks for the caller to summarise in
+    parallel before the brochure is written. Chunks are cut page by page,
+    so a page that changes leaves the other pages' chunks, and their
+    summaries, as they were.
+
+    Attributes:
+        token_budget (int): Maximum tokens of content in the prompt.
+        model (str): Model whose tokenizer is used for counting.
+        map_reduce_ratio (float): Content-to-budget ratio above which
+            chunks are produced for summarisation.
+        chunk_tokens (int): Maximum tokens per summarisation chunk.
+        max_chunks (int): Maximum chunks, bounding the summarisation cost.
+    """
+
+    def __init__(
+        self,
+        token_budget: int = DEFAULT_CONTENT_BUDGET,
+        model: str = "gpt-4",
+        map_reduce_ratio: float = 2.0,
+        chunk_tokens: int = 3000,
+        max_chunks: int = 8,
+        logger=None,
+    ):
+        self.token_budget = token_budget
+        self.model = model
+        self.map_reduce_ratio = map_reduce_ratio
+        self.chunk_tokens = chunk_tokens
+        self.max_chunks = max_chunks
+        self.logger = logger or Logger(self.__class__.__name__)
+
+    @staticmethod
+    def budget_for(model: str, override: Optional[int] = None) -> int:
+        """
+        Return the content budget for ``model``, unless overridden.
+        """
+        return override or MODEL_CONTENT_BUDGETS.get(model, DEFAULT_CONTENT_BUDGET)
+
+    def fit(self, contents: str) -> ContentBudget:
+        """
+        Deduplicate, rank and trim ``contents`` to the token budget.
+
+        Args:
+            contents (str): Page texts separated by blank lines, with
+                ``## <url>`` headers starting each crawled page.
+
+        Returns:
+            ContentBudget: Trimmed text, chunks for map-reduce if needed,
+            and token and paragraph counts.
+        """
+        headers, paragraphs = self._parse(contents)
+        unique = self._dedupe(paragraphs)
+        duplicates = len(paragraphs) - len(unique)
+
+        header_tokens = sum(count_tokens(h, self.model) for h in headers.values())
+        budget = max(self.token_budget - header_tokens, 0)
+        unique = self._split(unique, min(budget, self.chunk_tokens))
+        for paragraph in unique:
+            paragraph.score = self._score(paragraph)
+        kept = self._select(unique, budget)
+        text = self._render(kept, headers)
+
+        unique_tokens = sum(p.tokens for p in unique)
+        chunks: List[Tuple[str, str]] = []
+        if unique_tokens > self.token_budget * self.map_reduce_ratio:
+            chunks = self._chunk(unique, headers)
+
+        result = ContentBudget(
+            text=text,
+            chunks=[chunk for _, chunk in chunks],
+            chunk_pages=[page for page, _ in chunks],
+            tokens_in=count_tokens(contents, self.model),
+            tokens_out=count_tokens(text, self.model),
+            paragraphs_in=len(paragraphs),
+            paragraphs_out=len(kept),
+            duplicates=duplicates,
+        )
+        self.logger.info(f"Content budget ({self.token_budget}): {result.to_dict()}")
+        return result
+
+    def _parse(self, contents: str):
+        headers: Dict[int, str] = {}
+        paragraphs: List[_Paragraph] = []
+        section = 0
+        for block in contents.split("\n\n"):
+            if PAGE_HEADER.match(block):
+                header, _, block = block.partition("\n")
+                section += 1
+                headers[section] = header
+            block = block.strip()
+            if not block:
+                continue
+            paragraphs.append(
+                _Paragraph(
+                    index=len(paragraphs),
+                    section=section,
+                    text=block,
+                    tokens=count_tokens(block, self.model),
+                )
+            )
+        return headers, paragraphs
+
+    @staticmethod
+    def _dedupe(paragraphs: List[_Paragraph]) -> List[_Paragraph]:
+        # Shared headers, footers and banners repeat on every crawled page
+        seen = set()
+        unique = []
+        for paragraph in paragraphs:
+            key = re.sub(r"\W+", " ", paragraph.text.lower()).strip()
+            if key and key not in seen:
+                seen.add(key)
+                unique.append(paragraph)
+        return unique
+
+    def _split(self, paragraphs: List[_Paragraph], max_tokens: int) -> List[_Paragraph]:
+        # A paragraph larger than the budget would never be selected
+        if max_tokens <= 0:
+            return paragraphs
+        pieces = []
+        offset = 0
+        for paragraph in paragraphs:
+            if paragraph.tokens <= max_tokens:
+                paragraph.index += offset
+                pieces.append(paragraph)
+                continue
+            texts = split_tokens(paragraph.text, max_tokens, self.model)
+            for number, text in enumerate(texts):
+                pieces.append(
+                    _Paragraph(
+                        index=paragraph.index + offset + number,
+                        section=paragraph.section,
+                        text=text,
+                        tokens=count_tokens(text, self.model),
+                    )
+                )
+            offset += len(texts) - 1
+        return pieces
+
+    @staticmethod
+    def _score(paragraph: _Paragraph) -> float:
+        text = paragraph.text.lower()
+        words = len(text.split())
+
+        score = 1.0 / (1 + 0.05 * paragraph.index)
+        if paragraph.section == 0:
+            score *= 1.2  # landing page
+        score += min(sum(0.25 for k in KEYWORDS if k in text), 1.0)
+        if any(b in text for b in BOILERPLATE):
+            score *= 0.2
+        if words < 8:
+            score *= 0.5
+        return score
+
+    @staticmethod
+    def _select(paragraphs: List[_Paragraph], budget: int) -> List[_Paragraph]:
+        selected = []
+        used = 0
+        for paragraph in sorted(paragraphs, key=lambda p: p.score, reverse=True):
+            if used + paragraph.tokens <= budget:
+                selected.append(paragraph)
+                used += paragraph.tokens
+        return sorted(selected, key=lambda p: p.index)
+
+    @staticmethod
+    def _render(paragraphs: List[_Paragraph], headers: Dict[int, str]) -> str:
+        blocks = []
+        section = 0
+        for paragraph in paragraphs:
+            if paragraph.section != section and paragraph.section in headers:
+                blocks.append(f"{headers[paragraph.section]}\n{paragraph.text}")
+            else:
+                blocks.append(paragraph.text)
+            section = paragraph.section
+        return "\n\n".join(blocks)
+
+    def _chunk(
+        self, paragraphs: List[_Paragraph], headers: Dict[int, str]
+    ) -> List[Tuple[str, str]]:
+        """
+        Pack each page's paragraphs, in order, into chunks of at most
+        ``chunk_tokens``, pages in order, up to ``max_chunks`` in all.
+
+        Returns:
+            List[Tuple[str, str]]: Page URL (empty for the landing page)
+            and text of each chunk.
+        """
+        pages: Dict[int, List[_Paragraph]] = {}
+        for paragraph in paragraphs:
+            pages.setdefault(paragraph.section, []).append(paragraph)
+
+        chunks: List[Tuple[str, str]] = []
+        capacity = self.chunk_tokens * self.max_chunks
+        for section, page in pages.items():
+            # Rank within the page only, so other pages do not change it
+            page = self._select(page, capacity)
+            url = headers[section][3:] if section in headers else ""
+            chunk: List[_Paragraph] = []
+            used = 0
+            for paragraph in page:
+                if chunk and used + paragraph.tokens > self.chunk_tokens:
+                    chunks.append((url, self._render(chunk, headers)))
+                    chunk, used = [], 0
+                chunk.append(paragraph)
+                used += paragraph.tokens
+            if chunk:
+                chunks.append((url, self._render(chunk, headers)))
+        return chunks[: self.max_chunks]
@@ -0,0 +1,228 @@
+import queue
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, List, Optional
+
+from core.job import Job, JobStatus
+from interfaces.i_job_store import IJobStore
+from logs.log_context import request_context
+from logs.logger_singleton import Logger
+
+_STOP = object()
+
+
+class JobQueueFullError(RuntimeError):
+    """Raised when a job is submitted while the queue is at capacity."""
+
+
+class JobQueue:
+    """
+    Bounded in-process queue of brochure jobs served by a worker pool.
+
+    Worker threads pull jobs from the queue and run ``job_fn(base_url)``,
+    either in the thread itself (``executor="thread"``) or in a process
+    pool of the same size (``executor="process"``). ``job_fn`` must return
+    a dict with ``result`` and ``stage_timings``, and may add a
+    ``critical_path`` and ``refresh``; in process mode it must be
+    picklable. Finished jobs
+    are kept in the store for ``result_ttl`` seconds.
+
+    Attributes:
+        workers (int): Number of concurrent jobs.
+        max_queue (int): Jobs allowed to wait before submissions are refused.
+        result_ttl (float): Seconds finished jobs remain retrievable.
+        executor (str): ``"thread"`` or ``"process"``.
+    """
+
+    def __init__(
+        self,
+        job_fn: Callable[[str], dict],
+        store: IJobStore,
+        workers: int = 2,
+        max_queue: int = 100,
+        result_ttl: float = 3600.0,
+        executor: str = "thread",
+        logger=None,
+    ):
+        """
+        Initialize the queue. Workers start on ``start()``.
+
+        Args:
+            job_fn (Callable): Runs the pipeline for one base URL.
+            store (IJobStore): Where job state and results are kept.
+            workers (int): Number of concurrent jobs.
+            max_queue (int): Maximum number of waiting jobs.
+            result_ttl (float): Seconds finished jobs remain retrievable.
+            executor (str): ``"thread"`` or ``"process"``.
+            logger (Logger, optional): A logger instance. If None, a default
+                logger is created using the class name.
+        """
+        if executor not in ("thread", "process"):
+            raise ValueError(f"Unknown job executor: {executor}")
+
+        self.job_fn = job_fn
+        self.store = store
+        self.workers = workers
+        self.max_queue = max_queue
+        self.result_ttl = result_ttl
+        self.executor = executor
+        self.logger = logger or Logger(self.__class__.__name__)
+
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        self._threads: List[threading.Thread] = []
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._stopping = False
+
+        self._stats_lock = threading.Lock()
+        self._running = 0
+        self._succeeded = 0
+        self._failed = 0
+
+    def start(self) -> None:
+        """
+        Start the worker threads (and process pool in process mode).
+        """
+        if self._threads:
+            return
+        self._stopping = False
+        if self.executor == "process":
+            self._process_pool = ProcessPoolExecutor(max_workers=self.workers)
+        for index in range(self.workers):
+            thread = threading.Thread(
+                target=self._worker_loop, name=f"job-worker-{index}", daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+        self.logger.info(
+            f"Job queue started with {self.workers} {self.executor} workers"
+        )
+
+    def stop(self) -> None:
+        """
+        Let running jobs finish, then stop the workers.
+
+        Jobs still waiting in the queue are failed rather than run, and
+        new submissions are refused.
+        """
+        self._stopping = True
+        self._cancel_queued()
+        for _ in self._threads:
+            self._queue.put(_STOP)
+        for thread in self._threads:
+            thread.join()
+        self._threads.clear()
+        # Jobs submitted while the first pass ran
+        self._cancel_queued()
+        if self._process_pool is not None:
+            self._process_pool.shutdown()
+            self._process_pool = None
+        self.logger.info("Job queue stopped")
+
+    def submit(self, base_url: str) -> Job:
+        """
+        Queue a brochure job and return it immediately.
+
+        Args:
+            base_url (str): Website to generate a brochure for.
+
+        Returns:
+            Job: The queued job.
+
+        Raises:
+            JobQueueFullError: If ``max_queue`` jobs are already waiting,
+                or the queue is stopping.
+        """
+        if self._stopping:
+            raise JobQueueFullError("Job queue is stopped")
+        job = Job(base_url=base_url)
+        self.store.save(job)
+        try:
+            self._queue.put_nowait(job)
+        except queue.Full:
+            job.status = JobStatus.FAILED
+            job.error = "Job queue is full"
+            job.expires_at = time.time()
+            self.store.save(job)
+            raise JobQueueFullError("Job queue is full")
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """
+        Return the job with ``job_id``, or None if unknown or expired.
+        """
+        return self.store.get(job_id)
+
+    def stats(self) -> dict:
+        """
+        Return queue depth and job counters.
+        """
+        with self._stats_lock:
+            return {
+                "workers": self.workers,
+                "executor": self.executor,
+                "queued": self._queue.qsize(),
+                "running": self._running,
+                "succeeded": self._succeeded,
+                "failed": self._failed,
+            }
+
+    def _worker_loop(self) -> None:
+        while True:
+            job = self._queue.get()
+            if job is _STOP:
+                break
+            # Log lines of the job carry its id
+            with request_context(job.id):
+                self._run(job)
+            self.store.purge_expired()
+
+    def _run(self, job: Job) -> None:
+        job.status = JobStatus.RUNNING
+        job.started_at = time.time()
+        job.stage_timings["queued"] = job.started_at - job.created_at
+        self.store.save(job)
+
+        with self._stats_lock:
+            self._running += 1
+        try:
+            if self._process_pool is not None:
+                output = self._process_pool.submit(self.job_fn, job.base_url).result()
+            else:
+                output = self.job_fn(job.base_url)
+
+            job.stage_timings.update(output["stage_timings"])
+            job.critical_path = output.get("critical_path", [])
+            job.refresh = output.get("refresh", {})
+            job.result = output["result"]
+            job.status = JobStatus.SUCCEEDED
+        except Exception as e:
+            self.logger.error(f"Job {job.id} failed: {e}")
+            job.error = str(e)
+            job.status = JobStatus.FAILED
+        finally:
+            job.finished_at = time.time()
+            job.expires_at = job.finished_at + self.result_ttl
+            self.store.save(job)
+            with self._stats_lock:
+                self._running -= 1
+                if job.status == JobStatus.SUCCEEDED:
+                    self._succeeded += 1
+                else:
+                    self._failed += 1
+
+    def _cancel_queued(self) -> None:
+        while True:
+            try:
+                job = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            if job is _STOP:
+                continue
+            job.status = JobStatus.FAILED
+            job.error = "Job queue stopped before the job started"
+            job.finished_at = time.time()
+            job.expires_at = job.finished_at + self.result_ttl
+            self.store.save(job)
+            with self._stats_lock:
+                self._failed += 1
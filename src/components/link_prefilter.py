@@ -0,0 +1,199 @@
+import re
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urljoin, urlsplit
+
+from core.link_selection import LinkSelection
+from interfaces.i_link_filter import ILinkFilter
+from logs.logger_singleton import Logger
+from utils.url_utils import normalize_url
+
+# Paths that never belong in a brochure: legal pages, accounts, listings,
+# individual posts and static files
+DEFAULT_DENY_PATTERNS = (
+    r"/(privacy|terms|legal|cookies?|gdpr|imprint|disclaimer|accessibility)\b",
+    r"/(login|log-in|signin|sign-in|signup|sign-up|register|account|cart|checkout)",
+    r"/(search|feed|rss|sitemap|wp-admin|wp-json|cdn-cgi)\b",
+    r"/(tag|tags|category|categories|author|archive)/",
+    r"/(blog|news|posts?|articles?|insights)/.+",
+    r"/page/\d+",
+    r"\.(pdf|jpe?g|png|gif|svg|webp|zip|xml|css|js|ico|mp4)$",
+)
+
+# Pages kept even under a denied path, e.g. ``/blog/careers``
+DEFAULT_ALLOW_PATTERNS = (
+    r"/(about|company|careers?|jobs|team|customers?|mission|culture)(/|$)",
+)
+
+# Path keywords and how strongly they suggest brochure material
+KEYWORD_SCORES: Dict[str, float] = {
+    "about": 5,
+    "careers": 5,
+    "career": 5,
+    "company": 4,
+    "jobs": 4,
+    "customers": 4,
+    "customer-stories": 4,
+    "case-studies": 3,
+    "team": 3,
+    "leadership": 3,
+    "mission": 3,
+    "culture": 3,
+    "values": 2,
+    "products": 3,
+    "product": 3,
+    "solutions": 2,
+    "platform": 2,
+    "enterprise": 2,
+    "pricing": 2,
+    "investors": 2,
+    "press": 2,
+    "partners": 2,
+    "blog": 1,
+    "news": 1,
+    "contact": 1,
+}
+
+# Languages sites commonly prefix paths with, optionally with a region
+# (``/en-us``, ``/pt_br``, ``/zh-hans``); other two-letter segments such
+# as ``/ai`` or ``/go`` are real paths
+LOCALES = (
+    "ar|bg|cs|da|de|el|en|es|et|fa|fi|fr|he|hi|hr|hu|id|it|ja|ko|lt|lv|ms|"
+    "nb|nl|no|pl|pt|ro|ru|sk|sl|sr|sv|th|tr|uk|vi|zh"
+)
+LOCALE_PREFIX = re.compile(rf"^/({LOCALES})([-_]([a-z]{{2}}|hans|hant))?(?=/|$)")
+INDEX_SUFFIX = re.compile(r"/index\.\w+$|\.(html?|php|aspx?)$")
+
+
+class LinkPrefilter(ILinkFilter):
+    """
+    Deterministic link filter run before the LLM link-selection call.
+
+    Links are resolved against the page, canonicalised with
+    ``normalize_url`` (dropping fragments and tracking parameters) and
+    restricted to the page's site. Variants of the same page (query
+    strings, locale prefixes, ``index.html`` and ``.html`` suffixes) are
+    collapsed to the shortest URL. Deny patterns drop legal pages,
+    listings, posts and files; an allow pattern only keeps a page whose
+    allowed part comes after the denied one, so ``/blog/careers`` is kept
+    but ``/about/privacy`` is not. The rest
+    are scored by path keywords and depth, and the top ``max_candidates``
+    are passed to the LLM.
+
+    With ``skip_llm`` enabled, if at least ``min_confident`` links score
+    ``confident_score`` or more, they are selected without the LLM.
+
+    Attributes:
+        max_candidates (int): Links passed to the LLM at most.
+        deny_patterns (List[str]): Regexes of paths to drop.
+        allow_patterns (List[str]): Regexes of pages kept under a denied
+            path.
+        skip_llm (bool): Select confident links without the LLM.
+        confident_score (float): Score a link needs to count as confident.
+        min_confident (int): Confident links needed to skip the LLM.
+        max_selected (int): Links selected at most when skipping the LLM.
+    """
+
+    def __init__(
+        self,
+        max_candidates: int = 25,
+        deny_patterns: Optional[Iterable[str]] = None,
+        allow_patterns: Optional[Iterable[str]] = None,
+        skip_llm: bool = False,
+        confident_score: float = 4.0,
+        min_confident: int = 3,
+        max_selected: int = 8,
+        logger=None,
+    ):
+        self.max_candidates = max_candidates
+        self.deny_patterns = list(deny_patterns or DEFAULT_DENY_PATTERNS)
+        self.allow_patterns = list(allow_patterns or DEFAULT_ALLOW_PATTERNS)
+        self.skip_llm = skip_llm
+        self.confident_score = confident_score
+        self.min_confident = min_confident
+        self.max_selected = max_selected
+        self.logger = logger or Logger(self.__class__.__name__)
+
+        self._deny = [re.compile(p, re.IGNORECASE) for p in self.deny_patterns]
+        self._allow = [re.compile(p, re.IGNORECASE) for p in self.allow_patterns]
+
+    def filter(self, base_url: str, links: List[str]) -> LinkSelection:
+        """
+        Canonicalise, filter and rank ``links`` found on ``base_url``.
+
+        Args:
+            base_url (str): Page the links were found on.
+            links (List[str]): Links as extracted from the page.
+
+        Returns:
+            LinkSelection: Ranked candidates, plus links selected outright
+            when ``skip_llm`` is enabled and the heuristic is confident.
+        """
+        base = normalize_url(base_url)
+        site = self._site(base)
+        selection = LinkSelection(total=len(links))
+
+        variants: Dict[str, str] = {}
+        for link in links:
+            url = normalize_url(urljoin(base_url, link))
+            parts = urlsplit(url)
+            if (
+                parts.scheme not in ("http", "https")
+                or self._site(url) != site
+                or url == base
+                or self._denied(parts.path)
+            ):
+                selection.denied += 1
+                continue
+
+            key = self._variant_key(parts.netloc, parts.path)
+            if key in variants:
+                selection.duplicates += 1
+                if len(url) < len(variants[key]):
+                    variants[key] = url
+                continue
+            variants[key] = url
+
+        scored: List[Tuple[float, str]] = sorted(
+            ((self._score(urlsplit(url).path), url) for url in variants.values()),
+            key=lambda item: (-item[0], len(item[1]), item[1]),
+        )
+        selection.candidates = [url for _, url in scored[: self.max_candidates]]
+
+        if self.skip_llm:
+            confident = [url for score, url in scored if score >= self.confident_score]
+            if len(confident) >= self.min_confident:
+                selection.selected = confident[: self.max_selected]
+
+        self.logger.info(f"Link prefilter for {base_url}: {selection.to_dict()}")
+        return selection
+
+    @staticmethod
+    def _site(url: str) -> str:
+        host = urlsplit(url).hostname or ""
+        return host[4:] if host.startswith("www.") else host
+
+    def _denied(self, path: str) -> bool:
+        matches = [pattern.search(path) for pattern in self._deny]
+        denied = [match.start() for match in matches if match]
+        if not denied:
+            return False
+        after = max(denied) + 1
+        return not any(pattern.search(path, after) for pattern in self._allow)
+
+    @staticmethod
+    def _variant_key(host: str, path: str) -> str:
+        path = LOCALE_PREFIX.sub("", path.lower())
+        path = INDEX_SUFFIX.sub("", path).rstrip("/")
+        host = host[4:] if host.startswith("www.") else host
+        return f"{host}{path or '/'}"
+
+    @staticmethod
+    def _score(path: str) -> float:
+        segments = [s for s in path.lower().split("/") if s]
+        score = 0.0
+        for depth, segment in enumerate(segments):
+            words = [segment, *re.split(r"[-_.]", segment)]
+            best = max(KEYWORD_SCORES.get(word, 0) for word in words)
+            # Keywords near the root matter most
+            score += best / (depth + 1)
+        return score - 1.5 * max(len(segments) - 1, 0)
@@ -1,22 +1,52 @@
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
+from components.content_budgeter import ContentBudgeter
+from core.brochure_request import BrochureRequest
+from core.page_snapshot import PageSnapshot
+from core.site_snapshot import SiteDiff
+from core.stage_graph import Stage, StageGraph
+from core.tracer import Tracer
+from interfaces.i_link_filter import ILinkFilter
 from interfaces.i_oneshot_prompt import IPrompt
 from interfaces.i_openai_operations import IOpenAIOperations
 from interfaces.i_sales_orchestrator import ISalesBrochureOrchestrator
 from interfaces.i_scraper import IScraperProvider
+from interfaces.i_site_snapshot_store import ISiteSnapshotStore
+from logs.logger_singleton import Logger
+from utils.url_utils import normalize_url
 
 
 class SalesBrochureOrchestrator(ISalesBrochureOrchestrator):
     """
     Orchestrates scraping and AI processing using interface-based dependencies.
 
+    The pipeline is a StageGraph: link selection only needs the landing
+    page's links, so it runs alongside budgeting the page's text, and falls
+    back to the landing page alone if it fails or times out.
+
+    With a site store, each run is compared against the site's previous
+    snapshot: the link selection is reused if the landing page's links are
+    unchanged, and the brochure if its contents and links are unchanged,
+    so refreshing an unchanged site makes no LLM calls.
+
+    Holds no per-request state: each call works on its own BrochureRequest,
+    so one instance can serve many threads at once.
+
     Attributes:
         playwright_scraper (IScraperProvider): Interface for web scraping.
         prompt_provider (IPrompt): Interface for prompt generation.
         openai_service (IOpenAIOperations): Interface for OpenAI operations.
-        content (Optional[str]): Scraped content.
-        base_url (Optional[str]): Base URL to scrape.
-        links (Optional[List[str]]): All links fetched from the website.
+        content_budgeter (Optional[ContentBudgeter]): Trims the content to
+            the model's token budget. If None, content is sent as is.
+        link_filter (Optional[ILinkFilter]): Narrows the links before, or
+            instead of, the LLM link-selection call.
+        tracer (Tracer): Times the request and each stage as spans.
+        stage_timeouts (Dict[str, float]): Seconds each stage may take, by
+            stage name; stages not listed have no timeout.
+        site_store (Optional[ISiteSnapshotStore]): Stores each site's last
+            snapshot. If None, nothing is reused between runs.
+        reuse_site (bool): Reuse results from the previous snapshot. If
+            False, the snapshot is only replaced, like a cache refresh.
     """
 
     def __init__(
@@ -24,14 +54,66 @@ class SalesBrochureOrchestrator(ISalesBrochureOrchestrator):
         playwright_scraper: IScraperProvider,
         prompt_provider: IPrompt,
         openai_service: IOpenAIOperations,
+        content_budgeter: Optional[ContentBudgeter] = None,
+        link_filter: Optional[ILinkFilter] = None,
+        tracer: Optional[Tracer] = None,
+        stage_timeouts: Optional[Dict[str, float]] = None,
+        site_store: Optional[ISiteSnapshotStore] = None,
+        reuse_site: bool = True,
+        logger=None,
     ):
         self.playwright_scraper = playwright_scraper
         self.prompt_provider = prompt_provider
         self.openai_service = openai_service
+        self.content_budgeter = content_budgeter
+        self.link_filter = link_filter
+        self.tracer = tracer or Tracer()
+        self.stage_timeouts = stage_timeouts or {}
+        self.site_store = site_store
+        self.reuse_site = reuse_site
+        self.logger = logger or Logger(self.__class__.__name__)
 
-        self.content: Optional[str] = None
-        self.base_url: Optional[str] = None
-        self.links: Optional[List[str]] = None
+        timeout = self.stage_timeouts.get
+        stages = [
+            Stage(
+                "scrape",
+                self._scrape,
+                ("base_url", "site"),
+                ("snapshot", "landing_text"),
+                timeout("scrape"),
+            ),
+            Stage(
+                "select_links",
+                self._select_links,
+                ("base_url", "snapshot", "site"),
+                ("relevant_links",),
+                timeout("select_links"),
+                # Generate from the landing page alone
+                fallback=lambda base_url, snapshot, site: [],
+            ),
+        ]
+        self._contents = "landing_text"
+        if self.content_budgeter is not None:
+            stages.append(
+                Stage(
+                    "budget",
+                    lambda text: self.content_budgeter.fit(text).text,
+                    ("landing_text",),
+                    ("contents",),
+                    timeout("budget"),
+                )
+            )
+            self._contents = "contents"
+        stages.append(
+            Stage(
+                "generate",
+                self._generate,
+                (self._contents, "relevant_links", "company_name", "site"),
+                ("brochure",),
+                timeout("generate"),
+            )
+        )
+        self._graph = StageGraph(stages, self.tracer)
 
     def orchestrate(self, base_url: str) -> str:
         """
@@ -44,22 +126,123 @@ class SalesBrochureOrchestrator(ISalesBrochureOrchestrator):
         Returns:
             str: Generated company brochure.
         """
-        self.base_url = base_url
-        self.playwright_scraper.base_url = base_url
-
-        # Fetch content and links
-        self.content = self.playwright_scraper.fetch_content()
-        self.links = self.playwright_scraper.fetch_links()
-
-        # Select relevant links
-        relevant_links = self.openai_service.select_relevant_links(base_url, self.links)
-        links_text = "\n".join(relevant_links)
-
-        # Generate company brochure
-        brochure = self.openai_service.create_brochure(
-            company_name="HuggingFace",
-            contents=self.content,
-            relevent_links=links_text,
+        return self.run(BrochureRequest(base_url=base_url)).brochure
+
+    def run(self, request: BrochureRequest) -> BrochureRequest:
+        """
+        Run every stage for ``request``, filling in its results.
+
+        All per-request data lives on ``request``, so concurrent calls on
+        one orchestrator never see each other's pages or links.
+
+        Args:
+            request (BrochureRequest): The request to generate for.
+
+        Returns:
+            BrochureRequest: The same request, with the landing page,
+            relevant links, contents, brochure, stage timings and what was
+            reused from the site's previous snapshot set.
+        """
+        site = self._diff(request.base_url)
+        with self.tracer.span("brochure", url=request.base_url) as request_span:
+            result = self._graph.run(
+                {
+                    "base_url": request.base_url,
+                    "company_name": request.company_name,
+                    "site": site,
+                }
+            )
+            request_span.set(**site.to_dict())
+            self._store(site, result.runs)
+
+        values = result.values
+        request.snapshot = values["snapshot"]
+        request.relevant_links = values["relevant_links"]
+        request.contents = values[self._contents]
+        request.brochure = values["brochure"]
+        request.stages = result.to_dict()
+        request.refresh = site.to_dict()
+        return request
+
+    def _diff(self, base_url: str) -> SiteDiff:
+        """
+        Start comparing ``base_url`` against its previous snapshot.
+        """
+        key = normalize_url(base_url)
+        previous = None
+        if self.site_store is not None and self.reuse_site:
+            previous = self.site_store.get(key)
+        return SiteDiff(key, previous)
+
+    def _store(self, site: SiteDiff, runs: dict) -> None:
+        """
+        Log what ``site`` reused and store its snapshot, unless a stage
+        fell back or no brochure was completed: a degraded run must not
+        become the baseline of the next refresh.
+        """
+        if site.previous is not None:
+            self.logger.info(f"Refreshed {site.base_url}: {site.to_dict()}")
+        if self.site_store is None:
+            return
+        if not site.brochure_complete or any(
+            run.status != "ok" for run in runs.values()
+        ):
+            self.logger.warning(f"Not storing degraded snapshot of {site.base_url}")
+            return
+        self.site_store.save(site.current)
+
+    def _scrape(self, base_url: str, site: SiteDiff) -> Tuple[PageSnapshot, str]:
+        """
+        Fetch content and links from a single page load.
+        """
+        snapshot = self.playwright_scraper.fetch_page(base_url)
+        site.compare_pages({snapshot.url: snapshot.text})
+        return snapshot, snapshot.text
+
+    def _generate(
+        self,
+        contents: str,
+        relevant_links: List[str],
+        company_name: str,
+        site: SiteDiff,
+    ) -> str:
+        """
+        Generate the brochure, unless its inputs are unchanged since the
+        site's previous snapshot.
+        """
+        brochure = site.reuse_brochure(company_name, contents, relevant_links)
+        if brochure is not None:
+            return brochure
+        return site.record_brochure(
+            self.openai_service.create_brochure(
+                company_name=company_name,
+                contents=contents,
+                relevent_links="\n".join(relevant_links),
+            )
         )
 
-        return brochure
+    def _select_links(
+        self, base_url: str, snapshot: PageSnapshot, site: SiteDiff
+    ) -> List[str]:
+        """
+        Ask the LLM which links are relevant, after prefiltering them. The
+        LLM call is skipped if the landing page's links are unchanged since
+        the previous snapshot, or if the prefilter is confident or leaves
+        nothing to choose from.
+        """
+        links = snapshot.links
+        reused = site.reuse_links(links)
+        if reused is not None:
+            return reused
+
+        if self.link_filter is not None:
+            selection = self.link_filter.filter(base_url, links)
+            if selection.confident:
+                return site.record_links(selection.selected)
+            if not selection.candidates:
+                return site.record_links([])
+            links = selection.candidates
+
+        return site.record_links(
+            self.openai_service.select_relevant_links(base_url, links)
+        )
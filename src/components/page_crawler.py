@@ -0,0 +1,132 @@
+import asyncio
+import time
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+
+from core.crawl_result import CrawlResult
+from core.page_snapshot import PageSnapshot
+from interfaces.i_async_scraper import IAsyncScraperProvider
+from interfaces.i_page_crawler import IAsyncPageCrawler
+from logs.logger_singleton import Logger
+
+
+class AsyncPageCrawler(IAsyncPageCrawler):
+    """
+    Fetches several pages concurrently with bounded parallelism.
+
+    All pages start at once and are limited only by a global and a
+    per-domain concurrency cap, so total time tracks the slowest page
+    rather than the sum of pages. Each page has its own timeout, and the
+    whole crawl has a time budget after which unfinished pages are
+    cancelled and the pages fetched so far are returned.
+
+    Attributes:
+        scraper (IAsyncScraperProvider): Scraper used to load each page.
+        max_concurrency (int): Pages fetched at once across all domains.
+        per_domain_concurrency (int): Pages fetched at once per domain.
+        page_timeout (float): Seconds allowed per page.
+        total_budget (float): Seconds allowed for the whole crawl.
+        max_pages (int): Maximum number of pages crawled per call.
+    """
+
+    def __init__(
+        self,
+        scraper: IAsyncScraperProvider,
+        max_concurrency: int = 8,
+        per_domain_concurrency: int = 4,
+        page_timeout: float = 15.0,
+        total_budget: float = 20.0,
+        max_pages: int = 10,
+        logger=None,
+    ):
+        """
+        Initialize the crawler.
+
+        Args:
+            scraper (IAsyncScraperProvider): Scraper used to load each page.
+            max_concurrency (int): Global concurrency limit.
+            per_domain_concurrency (int): Concurrency limit per domain.
+            page_timeout (float): Seconds allowed per page.
+            total_budget (float): Seconds allowed for the whole crawl.
+            max_pages (int): Maximum number of pages crawled per call.
+            logger (Logger, optional): A logger instance. If None, a default
+                logger is created using the class name.
+        """
+        self.scraper = scraper
+        self.max_concurrency = max_concurrency
+        self.per_domain_concurrency = per_domain_concurrency
+        self.page_timeout = page_timeout
+        self.total_budget = total_budget
+        self.max_pages = max_pages
+        self.logger = logger or Logger(self.__class__.__name__)
+
+        self._global_limit: Optional[asyncio.Semaphore] = None
+        self._domain_limits: Dict[str, asyncio.Semaphore] = {}
+
+    async def crawl(self, urls: List[str]) -> CrawlResult:
+        """
+        Fetch ``urls`` concurrently and return whatever finished in time.
+
+        Args:
+            urls (List[str]): Pages to fetch. Duplicates are ignored and at
+                most ``max_pages`` are crawled.
+
+        Returns:
+            CrawlResult: Fetched pages plus failed and timed-out URLs.
+        """
+        start = time.perf_counter()
+        result = CrawlResult()
+
+        unique = list(dict.fromkeys(urls))[: self.max_pages]
+        if not unique:
+            return result
+
+        if self._global_limit is None:
+            self._global_limit = asyncio.Semaphore(self.max_concurrency)
+
+        self.logger.info(f"Crawling {len(unique)} pages")
+        tasks = {asyncio.ensure_future(self._fetch(url)): url for url in unique}
+        done, pending = await asyncio.wait(tasks, timeout=self.total_budget)
+
+        # Budget exhausted: cancel stragglers and keep what finished
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+            self.logger.warning(
+                f"Crawl budget of {self.total_budget}s exhausted; "
+                f"{len(pending)} pages skipped"
+            )
+
+        for task, url in tasks.items():
+            if task in pending:
+                result.timed_out.append(url)
+            elif isinstance(task.exception(), asyncio.TimeoutError):
+                result.timed_out.append(url)
+            elif task.exception() is not None:
+                self.logger.error(f"Error crawling {url}: {task.exception()}")
+                result.failed.append(url)
+            elif task.result().text or task.result().links:
+                result.pages.append(task.result())
+            else:
+                result.failed.append(url)
+
+        result.elapsed = time.perf_counter() - start
+        self.logger.info(
+            f"Crawled {len(result.pages)}/{len(unique)} pages "
+            f"in {result.elapsed:.2f}s"
+        )
+        return result
+
+    async def _fetch(self, url: str) -> PageSnapshot:
+        """
+        Fetch one page under the global and per-domain limits.
+        """
+        domain = urlparse(url).netloc
+        domain_limit = self._domain_limits.setdefault(
+            domain, asyncio.Semaphore(self.per_domain_concurrency)
+        )
+        async with self._global_limit, domain_limit:
+            return await asyncio.wait_for(
+                self.scraper.fetch_page(url), timeout=self.page_timeout
+            )
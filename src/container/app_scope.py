@@ -0,0 +1,98 @@
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+import httpx
+
+from components.boilerplate_filter import BoilerplateFilter
+from components.content_budgeter import ContentBudgeter
+from components.link_prefilter import LinkPrefilter
+from core.circuit_breaker import CircuitBreaker
+from core.extraction_stats import ExtractionStats
+from core.llm_usage_stats import LLMUsageStats
+from core.load_profile import LOAD_PROFILES, LoadProfile
+from core.model_route import ModelRoute
+from core.rate_limiter import LLMRateLimiter
+from core.scrape_stats import ScrapeStats
+from core.single_flight import AsyncSingleFlight
+from core.tracer import Tracer
+from infrastructure.http_fetcher import HttpPageFetcher
+from infrastructure.http_revalidator import HttpRevalidator
+from infrastructure.resilient_ai_client import AsyncResilientAIClient
+from interfaces.i_html_extractor import IHtmlExtractor
+from interfaces.i_ai_client import IAIClient
+from interfaces.i_async_ai_client import IAsyncAIClient
+from interfaces.i_async_browser_pool import IAsyncBrowserPool
+from interfaces.i_cassette import ICassette
+from interfaces.i_oneshot_prompt import IPrompt
+from interfaces.i_page_cache import IPageCache
+from interfaces.i_response_cache import IResponseCache
+from interfaces.i_site_snapshot_store import ISiteSnapshotStore
+
+
+@dataclass
+class AppScope:
+    """
+    Dependencies created once at startup and shared by every request.
+
+    None of these hold per-request state: the OpenAI clients of every LLM
+    operation (brochure, link selection, summaries) share one HTTP
+    connection pool for sync and one for async calls, and the caches,
+    limiter, circuit breakers and single-flight registries are designed
+    for concurrent use. ``SalesBrochureContainer`` builds the scraper,
+    service and orchestrator on top of them; those are stateless too, so
+    one orchestrator per set of cache flags can serve every request.
+
+    The async members are bound to the event loop that uses them first,
+    so a scope must not be shared between event loops.
+    """
+
+    ai_client: IAIClient
+    async_ai_client: IAsyncAIClient
+    prompt_provider: IPrompt
+    revalidator: HttpRevalidator
+    http_client: httpx.Client
+    async_http_client: httpx.AsyncClient
+    link_ai_client: Optional[IAIClient] = None
+    async_link_ai_client: Optional[IAsyncAIClient] = None
+    async_summary_ai_client: Optional[IAsyncAIClient] = None
+    model_routes: Dict[str, ModelRoute] = field(default_factory=dict)
+    stage_timeouts: Dict[str, float] = field(default_factory=dict)
+    browser_pool: Optional[IAsyncBrowserPool] = None
+    page_cache: Optional[IPageCache] = None
+    response_cache: Optional[IResponseCache] = None
+    site_store: Optional[ISiteSnapshotStore] = None
+    cassette: Optional[ICassette] = None
+    llm_flight: Optional[AsyncSingleFlight] = None
+    llm_limiter: Optional[LLMRateLimiter] = None
+    llm_breakers: Dict[str, CircuitBreaker] = field(default_factory=dict)
+    llm_resilience: Dict[str, AsyncResilientAIClient] = field(default_factory=dict)
+    llm_usage: Optional[LLMUsageStats] = None
+    content_budgeter: Optional[ContentBudgeter] = None
+    link_filter: Optional[LinkPrefilter] = None
+    load_profile: LoadProfile = LOAD_PROFILES["full"]
+    scrape_stats: Optional[ScrapeStats] = None
+    http_fetcher: Optional[HttpPageFetcher] = None
+    html_extractor: Optional[IHtmlExtractor] = None
+    extraction_stats: Optional[ExtractionStats] = None
+    boilerplate_filter: Optional[BoilerplateFilter] = None
+    tracer: Tracer = field(default_factory=Tracer)
+
+    def llm_resilience_stats(self) -> dict:
+        """
+        Return retry, hedge and breaker stats per operation and model.
+        """
+        stats: Dict[str, dict] = {}
+        for name, client in self.llm_resilience.items():
+            operation, _, model = name.partition(":")
+            stats.setdefault(operation, {})[model] = client.stats()
+        return stats
+
+    async def aclose(self) -> None:
+        """
+        Close the shared HTTP connection pools and flush exported spans.
+
+        The browser pool is owned and closed by whoever started it.
+        """
+        self.http_client.close()
+        await self.async_http_client.aclose()
+        self.tracer.close()
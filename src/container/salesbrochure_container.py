@@ -1,34 +1,981 @@
+import asyncio
+import dataclasses
+import os
+from functools import partial
+from typing import Dict, Optional, Tuple
+
+import httpx
+from openai import DefaultAsyncHttpxClient, DefaultHttpxClient
+
+from components.async_orchestrator import AsyncSalesBrochureOrchestrator
+from components.batch_runner import AsyncBatchRunner
+from components.boilerplate_filter import BoilerplateFilter
+from components.brochure_job import collect_brochure, run_brochure_on_loop
+from components.content_budgeter import ContentBudgeter
+from components.job_queue import JobQueue
+from components.link_prefilter import (
+    DEFAULT_ALLOW_PATTERNS,
+    DEFAULT_DENY_PATTERNS,
+    LinkPrefilter,
+)
 from components.orchestrator import SalesBrochureOrchestrator
+from components.page_crawler import AsyncPageCrawler
+from container.app_scope import AppScope
+from core.cassette_entry import CassetteMode
+from core.circuit_breaker import CircuitBreaker
+from core.extraction_stats import ExtractionStats
+from core.load_profile import LOAD_PROFILES, LoadProfile
+from core.metrics import MetricsRegistry
+from core.llm_usage_stats import LLMUsageStats
+from core.model_route import (
+    BROCHURE,
+    DEFAULT_MODEL_ROUTES,
+    SELECT_LINKS,
+    SUMMARY,
+    ModelRoute,
+)
+from core.rate_limiter import LLMRateLimiter
+from core.retry_policy import RetryPolicy
+from core.scrape_stats import ScrapeStats
+from core.single_flight import AsyncSingleFlight
+from core.tracer import Tracer
+from infrastructure.async_browser_pool import AsyncPlaywrightBrowserPool
+from infrastructure.async_openai_client import AsyncOpenAIClientWrapper
+from infrastructure.async_openai_service import AsyncOpenAIService
+from infrastructure.async_playwright_scraper import AsyncPlaywrightWebScraper
+from infrastructure.browser_pool import PlaywrightBrowserPool
+from infrastructure.cached_ai_client import AsyncCachedAIClient, CachedAIClient
+from infrastructure.cached_scraper import (
+    AsyncCachedScraperProvider,
+    CachedScraperProvider,
+)
+from infrastructure.cassette import JsonlCassette
+from infrastructure.cassette_ai_client import AsyncCassetteAIClient, CassetteAIClient
+from infrastructure.cassette_scraper import (
+    AsyncCassetteScraperProvider,
+    CassetteScraperProvider,
+)
 from infrastructure.dotenv import DotEnvLoader
+from infrastructure.fallback_ai_client import AsyncFallbackAIClient, FallbackAIClient
+from infrastructure.http_fetcher import HttpPageFetcher
+from infrastructure.html_extractor import (
+    EXTRACTORS,
+    BeautifulSoupExtractor,
+    InPageExtractor,
+    LxmlExtractor,
+    ReadabilityExtractor,
+    SelectolaxExtractor,
+)
+from infrastructure.http_revalidator import HttpRevalidator
+from infrastructure.job_store import MemoryJobStore, SqliteJobStore
 from infrastructure.openai_client import OpenAIClientWrapper
 from infrastructure.openai_provider import OpenAIApiKeyProvider
 from infrastructure.openai_service import OpenAIService
+from infrastructure.page_cache import MemoryPageCache, SqlitePageCache, TieredPageCache
 from infrastructure.playwright_scraper import PlaywrightWebScraper
 from infrastructure.prompt import PromptProvider
+from infrastructure.rate_limited_ai_client import AsyncRateLimitedAIClient
+from infrastructure.resilient_ai_client import (
+    AsyncResilientAIClient,
+    ResilientAIClient,
+)
+from infrastructure.response_cache import (
+    MemoryResponseCache,
+    SqliteResponseCache,
+    TieredResponseCache,
+)
+from infrastructure.single_flight_ai_client import AsyncSingleFlightAIClient
+from infrastructure.site_snapshot_store import (
+    MemorySiteSnapshotStore,
+    SqliteSiteSnapshotStore,
+)
+from infrastructure.span_exporter import OtlpJsonFileExporter
+from infrastructure.traced_ai_client import AsyncTracedAIClient, TracedAIClient
+from interfaces.i_ai_client import IAIClient
+from interfaces.i_async_ai_client import IAsyncAIClient
+from interfaces.i_async_browser_pool import IAsyncBrowserPool
+from interfaces.i_async_sales_orchestrator import IAsyncSalesBrochureOrchestrator
+from interfaces.i_browser_pool import IBrowserPool
+from interfaces.i_cassette import ICassette
+from interfaces.i_html_extractor import IHtmlExtractor
+from interfaces.i_page_cache import IPageCache
+from interfaces.i_response_cache import IResponseCache
 from interfaces.i_sales_orchestrator import ISalesBrochureOrchestrator
+from interfaces.i_site_snapshot_store import ISiteSnapshotStore
 
 
 class SalesBrochureContainer:
-    """Factory to wire all dependencies and return an orchestrator instance."""
+    """
+    Factory to wire all dependencies and return an orchestrator instance.
+
+    App-scoped dependencies (clients, connection pools, prompt provider,
+    browser pool, caches, limiters) are built once by ``create_app_scope``;
+    ``create_async_orchestrator`` then builds a stateless orchestrator on
+    top of them that can serve many requests at once.
+    """
+
+    @staticmethod
+    def create_browser_pool() -> IBrowserPool:
+        """
+        Build a browser pool configured from environment variables.
+
+        Reads ``BROWSER_POOL_SIZE``, ``BROWSER_POOL_MAX_PAGES``,
+        ``BROWSER_POOL_MAX_QUEUE``, ``BROWSER_POOL_ACQUIRE_TIMEOUT`` and
+        ``BROWSER_POOL_TASK_TIMEOUT``. The caller owns the pool and must
+        ``start()`` and ``close()`` it.
+        """
+        return PlaywrightBrowserPool(
+            size=int(os.getenv("BROWSER_POOL_SIZE", "2")),
+            max_pages_per_browser=int(os.getenv("BROWSER_POOL_MAX_PAGES", "100")),
+            max_queue=int(os.getenv("BROWSER_POOL_MAX_QUEUE", "32")),
+            acquire_timeout=float(os.getenv("BROWSER_POOL_ACQUIRE_TIMEOUT", "30")),
+            task_timeout=float(os.getenv("BROWSER_POOL_TASK_TIMEOUT", "120")),
+        )
+
+    @staticmethod
+    def create_async_browser_pool() -> IAsyncBrowserPool:
+        """
+        Build an async browser pool configured from environment variables.
+
+        Reads the same variables as ``create_browser_pool`` plus
+        ``BROWSER_POOL_PAGES_PER_BROWSER``. The caller owns the pool and must
+        ``await start()`` and ``await close()`` it.
+        """
+        return AsyncPlaywrightBrowserPool(
+            size=int(os.getenv("BROWSER_POOL_SIZE", "2")),
+            pages_per_browser=int(os.getenv("BROWSER_POOL_PAGES_PER_BROWSER", "4")),
+            max_pages_per_browser=int(os.getenv("BROWSER_POOL_MAX_PAGES", "100")),
+            max_queue=int(os.getenv("BROWSER_POOL_MAX_QUEUE", "32")),
+            acquire_timeout=float(os.getenv("BROWSER_POOL_ACQUIRE_TIMEOUT", "30")),
+        )
+
+    @staticmethod
+    def create_page_cache() -> IPageCache:
+        """
+        Build the scraped-page cache configured from environment variables.
+
+        ``PAGE_CACHE_MAX_BYTES`` sizes the in-memory LRU tier. If
+        ``PAGE_CACHE_PATH`` is set, an SQLite tier holding up to
+        ``PAGE_CACHE_MAX_ENTRIES`` pages is added behind it.
+        """
+        memory = MemoryPageCache(
+            max_bytes=int(os.getenv("PAGE_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+        )
+        disk_path = os.getenv("PAGE_CACHE_PATH")
+        disk = (
+            SqlitePageCache(
+                disk_path,
+                max_entries=int(os.getenv("PAGE_CACHE_MAX_ENTRIES", "10000")),
+            )
+            if disk_path
+            else None
+        )
+        return TieredPageCache(memory, disk)
+
+    @staticmethod
+    def create_response_cache() -> IResponseCache:
+        """
+        Build the LLM response cache configured from environment variables.
+
+        ``LLM_CACHE_TTL``, ``LLM_CACHE_MAX_ENTRIES`` and ``LLM_CACHE_MAX_BYTES``
+        size the in-memory LRU tier. If ``LLM_CACHE_PATH`` is set, a durable
+        SQLite tier with the same TTL is added behind it.
+        """
+        ttl = float(os.getenv("LLM_CACHE_TTL", "86400"))
+        memory = MemoryResponseCache(
+            ttl=ttl,
+            max_entries=int(os.getenv("LLM_CACHE_MAX_ENTRIES", "1000")),
+            max_bytes=int(os.getenv("LLM_CACHE_MAX_BYTES", str(32 * 1024 * 1024))),
+        )
+        disk_path = os.getenv("LLM_CACHE_PATH")
+        disk = SqliteResponseCache(disk_path, ttl=ttl) if disk_path else None
+        return TieredResponseCache(memory, disk)
+
+    @staticmethod
+    def create_site_snapshot_store() -> ISiteSnapshotStore:
+        """
+        Build the per-site snapshot store used for incremental refreshes.
+
+        Snapshots are kept in memory unless ``SITE_SNAPSHOT_PATH`` names an
+        SQLite file, which lets scheduled refreshes compare against the
+        previous run's snapshot.
+        """
+        path = os.getenv("SITE_SNAPSHOT_PATH")
+        return SqliteSiteSnapshotStore(path) if path else MemorySiteSnapshotStore()
+
+    @staticmethod
+    def create_cassette() -> Optional[ICassette]:
+        """
+        Build the scraper and LLM cassette configured from environment
+        variables, or None when ``CASSETTE_MODE`` is unset or ``off``.
+
+        ``CASSETTE_MODE=record`` saves every page load and LLM call to
+        ``CASSETTE_PATH`` (gzip JSON lines when it ends in ``.gz``);
+        ``replay`` serves them instead of the browser and the OpenAI API,
+        after ``CASSETTE_LATENCY`` times the recorded duration (0 by
+        default). Replay misses fail unless ``CASSETTE_STRICT=0``, which
+        calls the real provider and adds its answer to the cassette.
+        Replay still needs an ``OPENAI_API_KEY`` of the right format, but
+        no request is sent with it.
+        """
+        mode = os.getenv("CASSETTE_MODE", CassetteMode.OFF)
+        if mode == CassetteMode.OFF:
+            return None
+        if mode not in (CassetteMode.RECORD, CassetteMode.REPLAY):
+            raise ValueError(f"Unknown CASSETTE_MODE: {mode}")
+        return JsonlCassette(
+            os.getenv("CASSETTE_PATH", "cassette.jsonl.gz"),
+            mode=mode,
+            strict=os.getenv("CASSETTE_STRICT", "1") == "1",
+            latency_scale=float(os.getenv("CASSETTE_LATENCY", "0")),
+        )
+
+    @staticmethod
+    def create_llm_rate_limiter() -> LLMRateLimiter:
+        """
+        Build the shared LLM limiter configured from environment variables.
+
+        ``LLM_MAX_CONCURRENCY`` caps calls in flight; ``LLM_REQUESTS_PER_MINUTE``
+        and ``LLM_TOKENS_PER_MINUTE`` enable rate limits when set.
+        """
+        rpm = os.getenv("LLM_REQUESTS_PER_MINUTE")
+        tpm = os.getenv("LLM_TOKENS_PER_MINUTE")
+        return LLMRateLimiter(
+            max_concurrency=int(os.getenv("LLM_MAX_CONCURRENCY", "8")),
+            requests_per_minute=float(rpm) if rpm else None,
+            tokens_per_minute=float(tpm) if tpm else None,
+        )
+
+    @staticmethod
+    def create_retry_policy() -> RetryPolicy:
+        """
+        Build the LLM retry policy configured from environment variables.
+
+        ``LLM_TIMEOUT`` bounds one attempt and ``LLM_DEADLINE`` the whole
+        call; ``LLM_MAX_ATTEMPTS``, ``LLM_BACKOFF_BASE`` and
+        ``LLM_BACKOFF_MAX`` shape the retries. ``LLM_HEDGE=1`` enables
+        hedged requests after the recent ``LLM_HEDGE_QUANTILE`` latency.
+        """
+        return RetryPolicy(
+            max_attempts=int(os.getenv("LLM_MAX_ATTEMPTS", "3")),
+            attempt_timeout=float(os.getenv("LLM_TIMEOUT", "60")),
+            deadline=float(os.getenv("LLM_DEADLINE", "120")),
+            base_delay=float(os.getenv("LLM_BACKOFF_BASE", "0.5")),
+            max_delay=float(os.getenv("LLM_BACKOFF_MAX", "20")),
+            hedge=os.getenv("LLM_HEDGE", "0") == "1",
+            hedge_quantile=float(os.getenv("LLM_HEDGE_QUANTILE", "0.95")),
+            hedge_min_delay=float(os.getenv("LLM_HEDGE_MIN_DELAY", "1")),
+        )
+
+    @staticmethod
+    def create_stage_timeouts() -> Dict[str, float]:
+        """
+        Read per-stage pipeline timeouts from environment variables.
+
+        ``STAGE_TIMEOUT_<STAGE>`` gives the seconds a stage may take, for
+        ``SCRAPE``, ``SELECT_LINKS``, ``CRAWL``, ``BUDGET`` and
+        ``GENERATE``. Link selection, crawling and budgeting fall back to
+        the landing page or plain trimming when they time out; the other
+        stages fail the request. Unset stages have no timeout.
+        """
+        timeouts = {}
+        for stage in ("scrape", "select_links", "crawl", "budget", "generate"):
+            value = os.getenv(f"STAGE_TIMEOUT_{stage.upper()}")
+            if value:
+                timeouts[stage] = float(value)
+        return timeouts
+
+    @staticmethod
+    def create_circuit_breaker() -> CircuitBreaker:
+        """
+        Build the LLM circuit breaker configured from environment variables.
+
+        ``LLM_BREAKER_FAILURES`` consecutive provider failures open it for
+        ``LLM_BREAKER_RESET`` seconds.
+        """
+        return CircuitBreaker(
+            failure_threshold=int(os.getenv("LLM_BREAKER_FAILURES", "5")),
+            reset_timeout=float(os.getenv("LLM_BREAKER_RESET", "30")),
+        )
+
+    @staticmethod
+    def create_batch_runner(scope: AppScope) -> AsyncBatchRunner:
+        """
+        Build a batch runner whose URLs share the given app scope.
+
+        ``BATCH_CONCURRENCY`` caps URLs in progress at once; ``BATCH_RETRIES``
+        and ``BATCH_BACKOFF`` control per-URL retries.
+        """
+        return AsyncBatchRunner(
+            SalesBrochureContainer.create_async_orchestrator(scope=scope),
+            max_concurrency=int(os.getenv("BATCH_CONCURRENCY", "4")),
+            retries=int(os.getenv("BATCH_RETRIES", "2")),
+            backoff=float(os.getenv("BATCH_BACKOFF", "2")),
+        )
+
+    @staticmethod
+    def create_job_queue(
+        scope: Optional[AppScope] = None,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+    ) -> JobQueue:
+        """
+        Build the brochure job queue configured from environment variables.
+
+        ``JOB_WORKERS``, ``JOB_QUEUE_SIZE``, ``JOB_RESULT_TTL`` and
+        ``JOB_EXECUTOR`` (``thread`` or ``process``) size the worker pool.
+        Results are kept in memory unless ``JOB_STORE_PATH`` names an SQLite
+        file.
+
+        In thread mode, jobs run on ``loop``, the application's event loop,
+        with an orchestrator on its ``scope``: they share its clients and
+        connection pools, caches, site store, LLM rate limiter, single-flight
+        registry, circuit breakers, usage stats, tracer and cassette, and
+        the worker threads only bound how many jobs run at once. Worker
+        processes cannot share any of these, so process mode builds and
+        closes a private scope per job (see ``run_brochure_job``).
+
+        Raises:
+            ValueError: In thread mode, if ``scope`` or ``loop`` is missing.
+        """
+        executor = os.getenv("JOB_EXECUTOR", "thread")
+        store_path = os.getenv("JOB_STORE_PATH")
+        job_fn = SalesBrochureContainer.run_brochure_job
+        if executor == "thread":
+            if scope is None or loop is None:
+                raise ValueError("Thread job workers need the app scope and loop")
+            job_fn = partial(
+                run_brochure_on_loop,
+                SalesBrochureContainer.create_async_orchestrator(scope=scope),
+                loop,
+            )
+
+        return JobQueue(
+            job_fn,
+            SqliteJobStore(store_path) if store_path else MemoryJobStore(),
+            workers=int(os.getenv("JOB_WORKERS", "2")),
+            max_queue=int(os.getenv("JOB_QUEUE_SIZE", "100")),
+            result_ttl=float(os.getenv("JOB_RESULT_TTL", "3600")),
+            executor=executor,
+        )
+
+    @staticmethod
+    def run_brochure_job(base_url: str) -> dict:
+        """
+        Generate one brochure in a job worker process.
+
+        The process cannot use the server's scope, so the job builds a
+        private one on its own event loop and closes it when done: it runs
+        uncached, regenerates the site from scratch, and its metrics and
+        circuit breakers stay in the worker process.
+
+        Returns:
+            dict: ``result``, ``stage_timings``, ``critical_path`` and
+            ``refresh`` for the job.
+        """
+
+        async def run() -> dict:
+            scope = SalesBrochureContainer.create_app_scope()
+            try:
+                orchestrator = SalesBrochureContainer.create_async_orchestrator(
+                    scope=scope
+                )
+                return await collect_brochure(orchestrator, base_url)
+            finally:
+                await scope.aclose()
+
+        return asyncio.run(run())
+
+    @staticmethod
+    def _page_cache_ttl() -> float:
+        return float(os.getenv("PAGE_CACHE_TTL", "3600"))
+
+    @staticmethod
+    def _link_json_mode(scope: AppScope, link_ai_client) -> bool:
+        # Without its own client, link selection uses the brochure route's
+        route = scope.model_routes.get(SELECT_LINKS)
+        return link_ai_client is not None and route is not None and route.json_mode
+
+    @staticmethod
+    def create_content_budgeter(model: str) -> ContentBudgeter:
+        """
+        Build the content budgeter for ``model`` from environment variables.
+
+        ``CONTENT_TOKEN_BUDGET`` overrides the per-model default budget;
+        ``CONTENT_MAP_REDUCE_RATIO``, ``CONTENT_CHUNK_TOKENS`` and
+        ``CONTENT_MAX_CHUNKS`` control when and how content is summarised
+        in chunks.
+        """
+        override = os.getenv("CONTENT_TOKEN_BUDGET")
+        return ContentBudgeter(
+            token_budget=ContentBudgeter.budget_for(
+                model, int(override) if override else None
+            ),
+            model=model,
+            map_reduce_ratio=float(os.getenv("CONTENT_MAP_REDUCE_RATIO", "2")),
+            chunk_tokens=int(os.getenv("CONTENT_CHUNK_TOKENS", "3000")),
+            max_chunks=int(os.getenv("CONTENT_MAX_CHUNKS", "8")),
+        )
 
     @staticmethod
-    def create_orchestrator(base_url: str) -> ISalesBrochureOrchestrator:
+    def create_link_prefilter() -> LinkPrefilter:
+        """
+        Build the link prefilter configured from environment variables.
+
+        ``LINK_PREFILTER_MAX_CANDIDATES`` caps links sent to the LLM.
+        ``LINK_PREFILTER_DENY`` and ``LINK_PREFILTER_ALLOW`` add
+        comma-separated path regexes to the defaults. Setting
+        ``LINK_PREFILTER_SKIP_LLM=1`` selects links without the LLM when at
+        least ``LINK_PREFILTER_MIN_CONFIDENT`` score
+        ``LINK_PREFILTER_CONFIDENT_SCORE`` or more.
+        """
+
+        def patterns(name: str) -> list:
+            return [p.strip() for p in os.getenv(name, "").split(",") if p.strip()]
+
+        return LinkPrefilter(
+            max_candidates=int(os.getenv("LINK_PREFILTER_MAX_CANDIDATES", "25")),
+            deny_patterns=[*DEFAULT_DENY_PATTERNS, *patterns("LINK_PREFILTER_DENY")],
+            allow_patterns=[
+                *DEFAULT_ALLOW_PATTERNS,
+                *patterns("LINK_PREFILTER_ALLOW"),
+            ],
+            skip_llm=os.getenv("LINK_PREFILTER_SKIP_LLM", "0") == "1",
+            confident_score=float(os.getenv("LINK_PREFILTER_CONFIDENT_SCORE", "4")),
+            min_confident=int(os.getenv("LINK_PREFILTER_MIN_CONFIDENT", "3")),
+        )
+
+    @staticmethod
+    def create_load_profile() -> LoadProfile:
+        """
+        Select the scraper load profile from environment variables.
+
+        ``SCRAPER_LOAD_PROFILE`` names one of ``full``, ``fast`` (default) or
+        ``http``. ``SCRAPER_READY_SELECTOR``, ``SCRAPER_SETTLE_MS`` and
+        ``SCRAPER_BLOCK_DOMAINS`` (comma-separated, added to the profile's
+        list) adjust it.
+        """
+        name = os.getenv("SCRAPER_LOAD_PROFILE", "fast")
+        if name not in LOAD_PROFILES:
+            raise ValueError(f"Unknown SCRAPER_LOAD_PROFILE: {name}")
+        profile = LOAD_PROFILES[name]
+
+        extra_domains = [
+            d.strip() for d in os.getenv("SCRAPER_BLOCK_DOMAINS", "").split(",")
+        ]
+        return dataclasses.replace(
+            profile,
+            ready_selector=os.getenv("SCRAPER_READY_SELECTOR")
+            or profile.ready_selector,
+            settle_ms=int(os.getenv("SCRAPER_SETTLE_MS", str(profile.settle_ms))),
+            block_domains=profile.block_domains
+            + tuple(d for d in extra_domains if d),
+        )
+
+    @staticmethod
+    def create_html_extractor(
+        stats: Optional[ExtractionStats] = None,
+    ) -> IHtmlExtractor:
+        """
+        Build the page extractor selected by ``HTML_EXTRACTOR``.
+
+        ``readability`` (requires lxml) keeps only the main content of each
+        page, with headings and lists, and reports its character ratio to
+        ``stats``. ``paragraphs`` extracts every paragraph with the fastest
+        installed backend (selectolax, then lxml, then BeautifulSoup);
+        ``bs4``, ``lxml`` and ``selectolax`` force one, and ``in_page``
+        extracts inside the browser and parses HTTP-fetched pages with the
+        ``paragraphs`` backend. ``auto`` (default) is ``readability`` when
+        lxml is installed and ``paragraphs`` otherwise.
+        """
+        name = os.getenv("HTML_EXTRACTOR", "auto")
+        if name in ("auto", "readability"):
+            try:
+                return ReadabilityExtractor(stats=stats)
+            except ImportError:
+                if name == "readability":
+                    raise
+            name = "paragraphs"
+        if name in ("paragraphs", "in_page"):
+            backend = SalesBrochureContainer._fastest_html_extractor()
+            return InPageExtractor(fallback=backend) if name == "in_page" else backend
+
+        if name not in EXTRACTORS:
+            raise ValueError(f"Unknown HTML_EXTRACTOR: {name}")
+        return EXTRACTORS[name]()
+
+    @staticmethod
+    def _fastest_html_extractor() -> IHtmlExtractor:
+        for backend in (SelectolaxExtractor, LxmlExtractor):
+            try:
+                return backend()
+            except ImportError:
+                continue
+        return BeautifulSoupExtractor()
+
+    @staticmethod
+    def create_boilerplate_filter(
+        stats: Optional[ExtractionStats] = None,
+    ) -> Optional[BoilerplateFilter]:
+        """
+        Build the cross-page boilerplate filter, unless disabled with
+        ``BOILERPLATE_FILTER=0``. ``BOILERPLATE_MIN_PAGES`` and
+        ``BOILERPLATE_MIN_SHARE`` set how widely a line must repeat.
+        """
+        if os.getenv("BOILERPLATE_FILTER", "1") != "1":
+            return None
+        return BoilerplateFilter(
+            min_pages=int(os.getenv("BOILERPLATE_MIN_PAGES", "2")),
+            min_share=float(os.getenv("BOILERPLATE_MIN_SHARE", "0.5")),
+            stats=stats,
+        )
+
+    @staticmethod
+    def create_tracer() -> Tracer:
+        """
+        Build a tracer with a new metrics registry.
+
+        Spans are also written as OTLP/JSON lines to ``TRACE_EXPORT_FILE``
+        when it is set, for an OpenTelemetry collector's ``otlpjsonfile``
+        receiver or offline inspection.
+        """
+        path = os.getenv("TRACE_EXPORT_FILE")
+        return Tracer(
+            metrics=MetricsRegistry(),
+            exporter=OtlpJsonFileExporter.for_path(path) if path else None,
+        )
+
+    @staticmethod
+    def create_model_routes() -> Dict[str, ModelRoute]:
+        """
+        Build the per-operation model routes from environment variables.
+
+        ``LLM_MODELS_SELECT_LINKS``, ``LLM_MODELS_BROCHURE`` and
+        ``LLM_MODELS_SUMMARY`` each take a comma-separated list of models,
+        primary first and then fallbacks. ``LLM_JSON_MODE=0`` turns off JSON
+        mode for link selection, for models that do not support it.
+        """
+        json_mode = os.getenv("LLM_JSON_MODE", "1") == "1"
+        routes = {}
+        for operation, route in DEFAULT_MODEL_ROUTES.items():
+            models = os.getenv(f"LLM_MODELS_{operation.upper()}")
+            if models:
+                route = dataclasses.replace(
+                    route,
+                    models=tuple(m.strip() for m in models.split(",") if m.strip()),
+                )
+            if route.json_mode and not json_mode:
+                route = dataclasses.replace(route, json_mode=False)
+            routes[operation] = route
+        return routes
+
+    @staticmethod
+    def create_app_scope(
+        browser_pool: Optional[IAsyncBrowserPool] = None,
+        page_cache: Optional[IPageCache] = None,
+        response_cache: Optional[IResponseCache] = None,
+        llm_flight: Optional[AsyncSingleFlight] = None,
+        llm_limiter: Optional[LLMRateLimiter] = None,
+        tracer: Optional[Tracer] = None,
+        llm_breakers: Optional[Dict[str, CircuitBreaker]] = None,
+        llm_usage: Optional[LLMUsageStats] = None,
+        site_store: Optional[ISiteSnapshotStore] = None,
+        cassette: Optional[ICassette] = None,
+    ) -> AppScope:
+        """
+        Build the dependencies shared by every request of an application.
+
+        Loads the environment and validates the API key once, and creates
+        the OpenAI clients on shared HTTP connection pools sized by
+        ``OPENAI_MAX_CONNECTIONS`` and ``OPENAI_MAX_KEEPALIVE``, so requests
+        reuse warm connections instead of paying new TLS handshakes.
+
+        Each LLM operation gets its own clients for its model route (see
+        ``create_model_routes``): every model retries failed calls within a
+        deadline behind its own circuit breaker (from ``llm_breakers``,
+        which is filled in as needed), and the operation falls back to the
+        next model once one has failed. The async clients are wrapped with
+        the rate limiter and single-flight registry when given. Calls that
+        reach the API are traced for latency, token usage and cost per
+        operation, and the shared components' stats are registered as
+        metrics, unless an existing ``tracer`` is passed in. Without a
+        ``cassette``, one is opened from the environment (see
+        ``create_cassette``). The caller should ``await scope.aclose()``.
+        """
+        owns_tracer = tracer is None
+        cassette = cassette or SalesBrochureContainer.create_cassette()
+        tracer = tracer or SalesBrochureContainer.create_tracer()
+        key_provider = OpenAIApiKeyProvider(DotEnvLoader())
+        limits = httpx.Limits(
+            max_connections=int(os.getenv("OPENAI_MAX_CONNECTIONS", "100")),
+            max_keepalive_connections=int(os.getenv("OPENAI_MAX_KEEPALIVE", "20")),
+        )
+        http_client = DefaultHttpxClient(limits=limits)
+        async_http_client = DefaultAsyncHttpxClient(limits=limits)
+        llm_breakers = {} if llm_breakers is None else llm_breakers
+        llm_usage = llm_usage or LLMUsageStats()
+        llm_resilience: Dict[str, AsyncResilientAIClient] = {}
+        model_routes = SalesBrochureContainer.create_model_routes()
+
+        build = partial(
+            SalesBrochureContainer._create_routed_ai_clients,
+            key_provider=key_provider,
+            http_client=http_client,
+            async_http_client=async_http_client,
+            retry_policy=SalesBrochureContainer.create_retry_policy(),
+            llm_breakers=llm_breakers,
+            llm_limiter=llm_limiter,
+            llm_flight=llm_flight,
+            tracer=tracer,
+            llm_usage=llm_usage,
+            llm_resilience=llm_resilience,
+            cassette=cassette,
+        )
+        ai_client, async_ai_client = build(model_routes[BROCHURE])
+        link_ai_client, async_link_ai_client = build(model_routes[SELECT_LINKS])
+        _, async_summary_ai_client = build(model_routes[SUMMARY])
+
+        extraction_stats = ExtractionStats()
+        scope = AppScope(
+            ai_client=ai_client,
+            async_ai_client=async_ai_client,
+            link_ai_client=link_ai_client,
+            async_link_ai_client=async_link_ai_client,
+            async_summary_ai_client=async_summary_ai_client,
+            model_routes=model_routes,
+            stage_timeouts=SalesBrochureContainer.create_stage_timeouts(),
+            prompt_provider=PromptProvider(),
+            revalidator=HttpRevalidator(),
+            http_client=http_client,
+            async_http_client=async_http_client,
+            browser_pool=browser_pool,
+            page_cache=page_cache,
+            response_cache=response_cache,
+            site_store=site_store,
+            cassette=cassette,
+            llm_flight=llm_flight,
+            llm_limiter=llm_limiter,
+            llm_breakers=llm_breakers,
+            llm_resilience=llm_resilience,
+            llm_usage=llm_usage,
+            content_budgeter=SalesBrochureContainer.create_content_budgeter(
+                async_ai_client.model
+            ),
+            link_filter=SalesBrochureContainer.create_link_prefilter(),
+            load_profile=SalesBrochureContainer.create_load_profile(),
+            scrape_stats=ScrapeStats(),
+            http_fetcher=HttpPageFetcher(),
+            html_extractor=SalesBrochureContainer.create_html_extractor(
+                extraction_stats
+            ),
+            extraction_stats=extraction_stats,
+            boilerplate_filter=SalesBrochureContainer.create_boilerplate_filter(
+                extraction_stats
+            ),
+            tracer=tracer,
+        )
+        if owns_tracer:
+            SalesBrochureContainer._register_collectors(scope)
+        return scope
+
+    @staticmethod
+    def _create_routed_ai_clients(
+        route: ModelRoute,
+        key_provider: OpenAIApiKeyProvider,
+        http_client: httpx.Client,
+        async_http_client: httpx.AsyncClient,
+        retry_policy: RetryPolicy,
+        llm_breakers: Dict[str, CircuitBreaker],
+        llm_limiter: Optional[LLMRateLimiter],
+        llm_flight: Optional[AsyncSingleFlight],
+        tracer: Tracer,
+        llm_usage: LLMUsageStats,
+        llm_resilience: Dict[str, AsyncResilientAIClient],
+        cassette: Optional[ICassette] = None,
+    ) -> Tuple[IAIClient, IAsyncAIClient]:
+        """
+        Build the sync and async client chains serving one model route.
+
+        A ``cassette`` wraps the OpenAI clients innermost, so replayed calls
+        still go through tracing, limits, retries and fallbacks.
+        """
+        # Retries are done by the resilient clients, not the OpenAI library
+        options = {
+            "timeout": retry_policy.attempt_timeout,
+            "max_retries": 0,
+            "json_mode": route.json_mode,
+        }
+        traced = {"operation": route.operation, "usage_stats": llm_usage}
+
+        sync_clients, async_clients = [], []
+        for model in route.models:
+            breaker = llm_breakers.setdefault(
+                model, SalesBrochureContainer.create_circuit_breaker()
+            )
+            sync_client = OpenAIClientWrapper(
+                key_provider, model, http_client=http_client, **options
+            )
+            async_client = AsyncOpenAIClientWrapper(
+                key_provider, model, http_client=async_http_client, **options
+            )
+            if cassette is not None:
+                sync_client = CassetteAIClient(sync_client, cassette)
+                async_client = AsyncCassetteAIClient(async_client, cassette)
+
+            sync_clients.append(
+                ResilientAIClient(
+                    TracedAIClient(sync_client, tracer, **traced),
+                    retry_policy,
+                    breaker,
+                )
+            )
+
+            async_client = AsyncTracedAIClient(async_client, tracer, **traced)
+            if llm_limiter is not None:
+                # Innermost, so only calls that reach the API are counted
+                async_client = AsyncRateLimitedAIClient(async_client, llm_limiter)
+            # Outside the limiter, so backoff waits do not hold a call slot
+            async_client = AsyncResilientAIClient(async_client, retry_policy, breaker)
+            llm_resilience[f"{route.operation}:{model}"] = async_client
+            async_clients.append(async_client)
+
+        ai_client = FallbackAIClient(sync_clients, route.operation, llm_usage)
+        async_ai_client = AsyncFallbackAIClient(
+            async_clients, route.operation, llm_usage
+        )
+        if llm_flight is not None:
+            async_ai_client = AsyncSingleFlightAIClient(async_ai_client, llm_flight)
+        return ai_client, async_ai_client
+
+    @staticmethod
+    def _register_collectors(scope: AppScope) -> None:
+        components = {
+            "browser_pool": scope.browser_pool,
+            "page_cache": scope.page_cache,
+            "llm_cache": scope.response_cache,
+            "site_store": scope.site_store,
+            "cassette": scope.cassette,
+            "llm_limiter": scope.llm_limiter,
+            "llm_flight": scope.llm_flight,
+            "scraper": scope.scrape_stats,
+            "extraction": scope.extraction_stats,
+        }
+        for name, component in components.items():
+            if component is not None:
+                scope.tracer.metrics.register_collector(name, component.stats)
+        # Keyed by operation and model, which become labels
+        if scope.llm_usage is not None:
+            scope.tracer.metrics.register_collector(
+                "llm_usage", scope.llm_usage.stats, labels=("operation", "model")
+            )
+        scope.tracer.metrics.register_collector(
+            "llm_resilience",
+            scope.llm_resilience_stats,
+            labels=("operation", "model"),
+        )
+
+    @staticmethod
+    def create_orchestrator(
+        browser_pool: Optional[IBrowserPool] = None,
+        page_cache: Optional[IPageCache] = None,
+        response_cache: Optional[IResponseCache] = None,
+        cache_bypass: bool = False,
+        cache_refresh: bool = False,
+        scope: Optional[AppScope] = None,
+        site_store: Optional[ISiteSnapshotStore] = None,
+    ) -> ISalesBrochureOrchestrator:
+        """
+        Build a sync orchestrator.
+
+        The orchestrator is stateless, so one instance can serve any number
+        of URLs and threads; only the cache flags are fixed per instance.
+        With ``scope``, the shared client, prompt provider and caches are
+        reused; otherwise a private scope is built from the given resources.
+        The cache flags apply to the site store too: ``cache_bypass``
+        neither reads nor writes snapshots, and ``cache_refresh`` only
+        writes them. The scope's cassette sits behind the caches and the
+        site store, so record with them empty to capture every call.
+        """
+        if scope is None:
+            scope = SalesBrochureContainer.create_app_scope(
+                page_cache=page_cache,
+                response_cache=response_cache,
+                site_store=site_store,
+            )
+
         # Infrastructure
-        env_loader = DotEnvLoader()
-        key_provider = OpenAIApiKeyProvider(env_loader)
-        ai_client = OpenAIClientWrapper(key_provider)
+        def cached(ai_client, json_mode=False, json_reply=False):
+            if scope.response_cache is None:
+                return ai_client
+            return CachedAIClient(
+                ai_client,
+                scope.response_cache,
+                bypass=cache_bypass,
+                refresh=cache_refresh,
+                json_mode=json_mode,
+                json_reply=json_reply,
+            )
 
-        # Scraper and prompt
-        scraper = PlaywrightWebScraper(base_url=base_url)
-        prompt_provider = PromptProvider()
+        # Scraper
+        scraper = PlaywrightWebScraper(
+            browser_pool=browser_pool,
+            load_profile=scope.load_profile,
+            stats=scope.scrape_stats,
+            http_fetcher=scope.http_fetcher,
+            extractor=scope.html_extractor,
+            tracer=scope.tracer,
+        )
+        if scope.cassette is not None:
+            scraper = CassetteScraperProvider(scraper, scope.cassette)
+        if scope.page_cache is not None:
+            scraper = CachedScraperProvider(
+                scraper,
+                scope.page_cache,
+                ttl=SalesBrochureContainer._page_cache_ttl(),
+                revalidator=scope.revalidator,
+            )
 
         # OpenAI service
-        openai_service = OpenAIService(ai_client, prompt_provider)
+        openai_service = OpenAIService(
+            cached(scope.ai_client),
+            scope.prompt_provider,
+            link_ai_client=cached(
+                scope.link_ai_client or scope.ai_client,
+                json_mode=SalesBrochureContainer._link_json_mode(
+                    scope, scope.link_ai_client
+                ),
+                json_reply=True,
+            ),
+        )
 
         # Orchestrator
         orchestrator: ISalesBrochureOrchestrator = SalesBrochureOrchestrator(
             playwright_scraper=scraper,
-            prompt_provider=prompt_provider,
+            prompt_provider=scope.prompt_provider,
             openai_service=openai_service,
+            content_budgeter=scope.content_budgeter,
+            link_filter=scope.link_filter,
+            tracer=scope.tracer,
+            stage_timeouts=scope.stage_timeouts,
+            site_store=None if cache_bypass else scope.site_store,
+            reuse_site=not cache_refresh,
+        )
+        return orchestrator
+
+    @staticmethod
+    def create_async_orchestrator(
+        browser_pool: Optional[IAsyncBrowserPool] = None,
+        page_cache: Optional[IPageCache] = None,
+        response_cache: Optional[IResponseCache] = None,
+        cache_bypass: bool = False,
+        cache_refresh: bool = False,
+        llm_flight: Optional[AsyncSingleFlight] = None,
+        llm_limiter: Optional[LLMRateLimiter] = None,
+        scope: Optional[AppScope] = None,
+        tracer: Optional[Tracer] = None,
+        llm_breakers: Optional[Dict[str, CircuitBreaker]] = None,
+        llm_usage: Optional[LLMUsageStats] = None,
+        site_store: Optional[ISiteSnapshotStore] = None,
+        cassette: Optional[ICassette] = None,
+    ) -> IAsyncSalesBrochureOrchestrator:
+        """
+        Build an async orchestrator.
+
+        The orchestrator is stateless, so one instance can serve any number
+        of URLs and tasks; only the cache flags are fixed per instance.
+        With ``scope``, the shared client, prompt provider, browser pool and
+        caches are reused; otherwise a private scope is built from the given
+        resources. The cache flags apply to the site store too:
+        ``cache_bypass`` neither reads nor writes snapshots, and
+        ``cache_refresh`` only writes them. The scope's cassette sits
+        behind the caches and the site store, so record with them empty to
+        capture every call.
+        """
+        if scope is None:
+            scope = SalesBrochureContainer.create_app_scope(
+                browser_pool=browser_pool,
+                page_cache=page_cache,
+                response_cache=response_cache,
+                llm_flight=llm_flight,
+                llm_limiter=llm_limiter,
+                tracer=tracer,
+                llm_breakers=llm_breakers,
+                llm_usage=llm_usage,
+                site_store=site_store,
+                cassette=cassette,
+            )
+
+        # Infrastructure
+        def cached(ai_client, json_mode=False, json_reply=False):
+            if scope.response_cache is None:
+                return ai_client
+            return AsyncCachedAIClient(
+                ai_client,
+                scope.response_cache,
+                bypass=cache_bypass,
+                refresh=cache_refresh,
+                json_mode=json_mode,
+                json_reply=json_reply,
+            )
+
+        # Scraper
+        scraper = AsyncPlaywrightWebScraper(
+            browser_pool=scope.browser_pool,
+            load_profile=scope.load_profile,
+            stats=scope.scrape_stats,
+            http_fetcher=scope.http_fetcher,
+            extractor=scope.html_extractor,
+            tracer=scope.tracer,
+        )
+        if scope.cassette is not None:
+            scraper = AsyncCassetteScraperProvider(scraper, scope.cassette)
+        if scope.page_cache is not None:
+            scraper = AsyncCachedScraperProvider(
+                scraper,
+                scope.page_cache,
+                ttl=SalesBrochureContainer._page_cache_ttl(),
+                revalidator=scope.revalidator,
+            )
+
+        # Concurrent crawl of the selected relevant pages
+        page_crawler = AsyncPageCrawler(
+            scraper,
+            max_concurrency=int(os.getenv("CRAWL_MAX_CONCURRENCY", "8")),
+            per_domain_concurrency=int(os.getenv("CRAWL_PER_DOMAIN_CONCURRENCY", "4")),
+            page_timeout=float(os.getenv("CRAWL_PAGE_TIMEOUT", "15")),
+            total_budget=float(os.getenv("CRAWL_TOTAL_BUDGET", "20")),
+            max_pages=int(os.getenv("CRAWL_MAX_PAGES", "10")),
+        )
+
+        # OpenAI service
+        openai_service = AsyncOpenAIService(
+            cached(scope.async_ai_client),
+            scope.prompt_provider,
+            link_ai_client=cached(
+                scope.async_link_ai_client or scope.async_ai_client,
+                json_mode=SalesBrochureContainer._link_json_mode(
+                    scope, scope.async_link_ai_client
+                ),
+                json_reply=True,
+            ),
+            summary_ai_client=cached(
+                scope.async_summary_ai_client or scope.async_ai_client
+            ),
+        )
+
+        # Orchestrator
+        orchestrator: IAsyncSalesBrochureOrchestrator = (
+            AsyncSalesBrochureOrchestrator(
+                playwright_scraper=scraper,
+                prompt_provider=scope.prompt_provider,
+                openai_service=openai_service,
+                page_crawler=page_crawler,
+                content_budgeter=scope.content_budgeter,
+                link_filter=scope.link_filter,
+                boilerplate_filter=scope.boilerplate_filter,
+                tracer=scope.tracer,
+                stage_timeouts=scope.stage_timeouts,
+                site_store=None if cache_bypass else scope.site_store,
+                reuse_site=not cache_refresh,
+            )
         )
         return orchestrator
@@ -0,0 +1,35 @@
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from core.page_snapshot import PageSnapshot
+
+
+@dataclass
+class BrochureRequest:
+    """
+    Everything one brochure generation reads and produces.
+
+    Orchestrators create one per call and pass it from stage to stage, so
+    the orchestrator, scraper and service instances hold no request data
+    and can serve many threads or tasks at once.
+
+    Attributes:
+        base_url (str): The website URL.
+        company_name (str): Company the brochure is written for.
+        snapshot (Optional[PageSnapshot]): Landing page, once scraped.
+        relevant_links (List[str]): Links chosen for the brochure.
+        contents (str): Page text sent to the brochure prompt.
+        brochure (str): Generated brochure.
+        stages (dict): Stage timings, fallbacks and the critical path.
+        refresh (dict): Pages changed and skipped, and LLM calls skipped by
+            reusing the site's previous snapshot.
+    """
+
+    base_url: str
+    company_name: str = "HuggingFace"
+    snapshot: Optional[PageSnapshot] = None
+    relevant_links: List[str] = field(default_factory=list)
+    contents: str = ""
+    brochure: str = ""
+    stages: dict = field(default_factory=dict)
+    refresh: dict = field(default_factory=dict)
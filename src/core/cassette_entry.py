@@ -0,0 +1,37 @@
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+
+class CassetteMode:
+    """
+    What a cassette does with provider calls.
+    """
+
+    OFF = "off"
+    RECORD = "record"
+    REPLAY = "replay"
+
+
+@dataclass
+class CassetteEntry:
+    """
+    One recorded provider interaction.
+
+    Attributes:
+        kind (str): ``page``, ``chat`` or ``stream``.
+        key (str): Normalised URL for pages, request hash for LLM calls.
+        payload (Any): JSON-serialisable response: the page snapshot, the
+            chat completion, or the list of streamed chunks.
+        elapsed (float): Seconds the real call took.
+        recorded_at (float): Unix time the call was recorded.
+    """
+
+    kind: str
+    key: str
+    payload: Any
+    elapsed: float = 0.0
+    recorded_at: float = field(default_factory=time.time)
+
+    def to_dict(self) -> dict:
+        return asdict(self)
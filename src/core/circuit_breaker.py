@@ -0,0 +1,118 @@
+import threading
+import time
+
+
+class CircuitOpenError(RuntimeError):
+    """
+    Raised instead of calling a provider the circuit breaker considers down.
+    """
+
+
+class CircuitBreaker:
+    """
+    Thread-safe circuit breaker shared by the sync and async clients of one
+    provider.
+
+    ``closed``: calls go through, and ``failure_threshold`` consecutive
+    failures open the circuit. ``open``: calls fail fast with
+    ``CircuitOpenError`` for ``reset_timeout`` seconds. ``half_open``: up to
+    ``half_open_calls`` trial calls go through; a success closes the
+    circuit again and a failure reopens it. Callers must ``release()`` a
+    trial that ends without either, or the circuit stays half open and
+    rejects every call.
+
+    Attributes:
+        failure_threshold (int): Consecutive failures that open the circuit.
+        reset_timeout (float): Seconds the circuit stays open.
+        half_open_calls (int): Trial calls allowed while half open.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        half_open_calls: int = 1,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_calls = half_open_calls
+
+        self._lock = threading.Lock()
+        self._state = "closed"
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trials = 0
+        self.opened = 0
+        self.rejected = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state()
+
+    def allow(self) -> None:
+        """
+        Admit one call, or raise if the circuit is open.
+
+        Raises:
+            CircuitOpenError: If the provider is considered down.
+        """
+        with self._lock:
+            state = self._current_state()
+            if state == "closed":
+                return
+            if state == "half_open" and self._trials < self.half_open_calls:
+                self._trials += 1
+                return
+            self.rejected += 1
+            retry_in = max(0.0, self._opened_at + self.reset_timeout - time.monotonic())
+        raise CircuitOpenError(f"LLM circuit open, retry in {retry_in:.1f}s")
+
+    def release(self) -> None:
+        """
+        Give back a half-open trial that ended without a verdict on the
+        provider, for example because the call was cancelled.
+        """
+        with self._lock:
+            if self._state == "half_open" and self._trials > 0:
+                self._trials -= 1
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._state = "closed"
+            self._failures = 0
+            self._trials = 0
+
+    def record_failure(self) -> None:
+        with self._lock:
+            state = self._current_state()
+            self._failures += 1
+            if state == "half_open" or self._failures >= self.failure_threshold:
+                if state != "open":
+                    self.opened += 1
+                self._state = "open"
+                self._opened_at = time.monotonic()
+                self._trials = 0
+
+    def stats(self) -> dict:
+        """
+        Return the state, consecutive failures and how often calls were
+        rejected.
+        """
+        with self._lock:
+            return {
+                "state": self._current_state(),
+                "open": self._current_state() == "open",
+                "consecutive_failures": self._failures,
+                "opened": self.opened,
+                "rejected": self.rejected,
+            }
+
+    def _current_state(self) -> str:
+        if (
+            self._state == "open"
+            and time.monotonic() - self._opened_at >= self.reset_timeout
+        ):
+            self._state = "half_open"
+            self._trials = 0
+        return self._state
@@ -0,0 +1,47 @@
+from dataclasses import dataclass, field
+from typing import List
+
+
+@dataclass
+class ContentBudget:
+    """
+    Page contents fitted to a model's token budget.
+
+    Attributes:
+        text (str): Deduplicated content trimmed to the budget, in page order.
+        chunks (List[str]): Chunks to summarise separately when the content
+            is too large to trim without losing most of it; empty otherwise.
+            A chunk never spans two pages.
+        chunk_pages (List[str]): URL of the page each chunk comes from, or
+            an empty string for the landing page.
+        tokens_in (int): Tokens in the original content.
+        tokens_out (int): Tokens in ``text``.
+        paragraphs_in (int): Paragraphs in the original content.
+        paragraphs_out (int): Paragraphs kept in ``text``.
+        duplicates (int): Repeated paragraphs dropped.
+    """
+
+    text: str
+    chunks: List[str] = field(default_factory=list)
+    chunk_pages: List[str] = field(default_factory=list)
+    tokens_in: int = 0
+    tokens_out: int = 0
+    paragraphs_in: int = 0
+    paragraphs_out: int = 0
+    duplicates: int = 0
+
+    @property
+    def mode(self) -> str:
+        """``map_reduce`` if ``chunks`` must be summarised, else ``trim``."""
+        return "map_reduce" if self.chunks else "trim"
+
+    def to_dict(self) -> dict:
+        return {
+            "mode": self.mode,
+            "tokens_in": self.tokens_in,
+            "tokens_out": self.tokens_out,
+            "paragraphs_in": self.paragraphs_in,
+            "paragraphs_out": self.paragraphs_out,
+            "duplicates": self.duplicates,
+            "chunks": len(self.chunks),
+        }
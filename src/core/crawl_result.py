@@ -0,0 +1,28 @@
+from dataclasses import dataclass, field
+from typing import List
+
+from core.page_snapshot import PageSnapshot
+
+
+@dataclass
+class CrawlResult:
+    """
+    Outcome of crawling a set of pages concurrently.
+
+    Attributes:
+        pages (List[PageSnapshot]): Pages fetched successfully, in request order.
+        failed (List[str]): URLs that raised an error.
+        timed_out (List[str]): URLs that hit the per-page timeout or were
+            still running when the total budget ran out.
+        elapsed (float): Wall-clock seconds spent crawling.
+    """
+
+    pages: List[PageSnapshot] = field(default_factory=list)
+    failed: List[str] = field(default_factory=list)
+    timed_out: List[str] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def partial(self) -> bool:
+        """True if any requested page is missing from ``pages``."""
+        return bool(self.failed or self.timed_out)
@@ -0,0 +1,51 @@
+import threading
+from collections import defaultdict
+from typing import Dict
+
+
+class ExtractionStats:
+    """
+    Thread-safe character counters for the content-cleaning stages.
+
+    Each stage (main-content extraction, cross-site boilerplate removal)
+    records the characters it received and the characters it kept, so the
+    reduction in prompt size can be tracked per stage.
+    """
+
+    FIELDS = ("runs", "chars_in", "chars_out")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Dict[str, int]] = defaultdict(
+            lambda: dict.fromkeys(self.FIELDS, 0)
+        )
+
+    def record(self, stage: str, chars_in: int, chars_out: int) -> None:
+        """
+        Add one run of ``stage``.
+
+        Args:
+            stage (str): Stage name.
+            chars_in (int): Characters of text the stage received.
+            chars_out (int): Characters of text the stage kept.
+        """
+        with self._lock:
+            counters = self._counters[stage]
+            counters["runs"] += 1
+            counters["chars_in"] += chars_in
+            counters["chars_out"] += chars_out
+
+    def stats(self) -> dict:
+        """
+        Return counters and the out/in character ratio per stage.
+        """
+        with self._lock:
+            return {
+                stage: {
+                    **counters,
+                    "ratio": round(
+                        counters["chars_out"] / (counters["chars_in"] or 1), 3
+                    ),
+                }
+                for stage, counters in self._counters.items()
+            }
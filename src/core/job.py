@@ -0,0 +1,53 @@
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional
+
+
+class JobStatus:
+    """
+    Lifecycle states of a brochure job.
+    """
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+@dataclass
+class Job:
+    """
+    A brochure job tracked by the job queue.
+
+    Attributes:
+        base_url (str): Website the brochure is generated for.
+        id (str): Unique job identifier.
+        status (str): One of the JobStatus values.
+        created_at (float): Unix time the job was submitted.
+        started_at (Optional[float]): Unix time a worker picked the job up.
+        finished_at (Optional[float]): Unix time the job finished.
+        stage_timings (Dict[str, float]): Seconds spent in each pipeline stage.
+        critical_path (List[str]): Stages that bounded the job's latency.
+        refresh (Dict[str, Any]): Pages changed and skipped, and LLM calls
+            skipped by reusing the site's previous snapshot.
+        result (Optional[str]): Generated brochure on success.
+        error (Optional[str]): Error message on failure.
+        expires_at (Optional[float]): Unix time after which the job is purged.
+    """
+
+    base_url: str
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    status: str = JobStatus.QUEUED
+    created_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    stage_timings: Dict[str, float] = field(default_factory=dict)
+    critical_path: List[str] = field(default_factory=list)
+    refresh: Dict[str, Any] = field(default_factory=dict)
+    result: Optional[str] = None
+    error: Optional[str] = None
+    expires_at: Optional[float] = None
+
+    def to_dict(self) -> dict:
+        return asdict(self)
@@ -0,0 +1,38 @@
+from dataclasses import dataclass, field
+from typing import List
+
+
+@dataclass
+class LinkSelection:
+    """
+    Outcome of prefiltering a page's links before LLM link selection.
+
+    Attributes:
+        candidates (List[str]): Canonical links worth showing the LLM, best
+            first.
+        selected (List[str]): Links chosen without the LLM because the
+            heuristic was confident; empty if the LLM should decide.
+        total (int): Links found on the page.
+        duplicates (int): Links collapsed as variants of another link.
+        denied (int): Links dropped by the deny patterns or as off-site.
+    """
+
+    candidates: List[str] = field(default_factory=list)
+    selected: List[str] = field(default_factory=list)
+    total: int = 0
+    duplicates: int = 0
+    denied: int = 0
+
+    @property
+    def confident(self) -> bool:
+        """True if ``selected`` can be used without asking the LLM."""
+        return bool(self.selected)
+
+    def to_dict(self) -> dict:
+        return {
+            "total": self.total,
+            "duplicates": self.duplicates,
+            "denied": self.denied,
+            "candidates": len(self.candidates),
+            "skipped_llm": self.confident,
+        }
@@ -0,0 +1,77 @@
+import threading
+from collections import defaultdict
+from typing import Dict, Tuple
+
+
+class LLMUsageStats:
+    """
+    Thread-safe LLM call counters, kept per operation and model.
+
+    For each operation (link selection, brochure, summary) and model it
+    counts calls, failures, fallbacks to the next model, tokens, estimated
+    cost and time spent, so the model split can be tuned on latency and
+    cost.
+    """
+
+    FIELDS = ("calls", "errors", "fallbacks", "prompt_tokens", "completion_tokens")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: Dict[Tuple[str, str], Dict[str, float]] = defaultdict(
+            lambda: dict.fromkeys(self.FIELDS + ("cost_usd", "seconds"), 0)
+        )
+
+    def record(
+        self,
+        operation: str,
+        model: str,
+        seconds: float,
+        prompt_tokens: int = 0,
+        completion_tokens: int = 0,
+        cost: float = 0.0,
+        error: bool = False,
+    ) -> None:
+        """
+        Add one call that reached the API.
+
+        Args:
+            operation (str): Operation the call served.
+            model (str): Model that was called.
+            seconds (float): Time the call took.
+            prompt_tokens (int): Prompt tokens used.
+            completion_tokens (int): Completion tokens used.
+            cost (float): Estimated cost in USD.
+            error (bool): True if the call failed.
+        """
+        with self._lock:
+            counters = self._counters[(operation, model)]
+            counters["calls"] += 1
+            counters["errors"] += int(error)
+            counters["prompt_tokens"] += prompt_tokens
+            counters["completion_tokens"] += completion_tokens
+            counters["cost_usd"] += cost
+            counters["seconds"] += seconds
+
+    def record_fallback(self, operation: str, model: str) -> None:
+        """
+        Count a call of ``operation`` that gave up on ``model`` for the next.
+        """
+        with self._lock:
+            self._counters[(operation, model)]["fallbacks"] += 1
+
+    def stats(self) -> dict:
+        """
+        Return counters, average latency and cost per call for each
+        operation and model.
+        """
+        with self._lock:
+            result: Dict[str, dict] = {}
+            for (operation, model), counters in self._counters.items():
+                calls = counters["calls"] or 1
+                result.setdefault(operation, {})[model] = {
+                    **{name: int(counters[name]) for name in self.FIELDS},
+                    "cost_usd": round(counters["cost_usd"], 6),
+                    "avg_seconds": round(counters["seconds"] / calls, 3),
+                    "avg_cost_usd": round(counters["cost_usd"] / calls, 6),
+                }
+            return result
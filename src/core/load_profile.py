@@ -0,0 +1,100 @@
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+# Third-party hosts that only serve analytics, ads and chat widgets
+TRACKER_DOMAINS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "googlesyndication.com",
+    "doubleclick.net",
+    "facebook.net",
+    "connect.facebook.com",
+    "hotjar.com",
+    "segment.io",
+    "segment.com",
+    "mixpanel.com",
+    "hubspot.com",
+    "hs-scripts.com",
+    "intercom.io",
+    "intercomcdn.com",
+    "clarity.ms",
+    "ads.linkedin.com",
+    "ads-twitter.com",
+    "optimizely.com",
+    "fullstory.com",
+)
+
+
+@dataclass(frozen=True)
+class LoadProfile:
+    """
+    How the scraper loads a page: what to block and when it is ready.
+
+    Attributes:
+        name (str): Profile name, used as the stats key.
+        wait_until (str): Playwright readiness event for ``page.goto``;
+            ``networkidle`` waits for the network to go quiet afterwards.
+        ready_selector (Optional[str]): CSS selector to wait for before
+            reading the page, if any.
+        settle_ms (int): Extra wait after readiness for late rendering.
+        block_resource_types (Tuple[str, ...]): Playwright resource types
+            aborted instead of downloaded.
+        block_domains (Tuple[str, ...]): Hosts whose requests, including
+            those to their subdomains, are aborted.
+        http_first (bool): Try a plain HTTP fetch before the browser.
+        min_text_chars (int): Text a page needs to be used without falling
+            back: from an HTTP fetch to a browser render, and from a
+            profile that does not render fully to the ``full`` profile.
+    """
+
+    name: str
+    wait_until: str = "domcontentloaded"
+    ready_selector: Optional[str] = None
+    settle_ms: int = 500
+    block_resource_types: Tuple[str, ...] = ()
+    block_domains: Tuple[str, ...] = ()
+    http_first: bool = False
+    min_text_chars: int = 200
+
+    @property
+    def blocks_requests(self) -> bool:
+        """True if the profile needs request routing."""
+        return bool(self.block_resource_types or self.block_domains)
+
+    @property
+    def renders_fully(self) -> bool:
+        """True if nothing is blocked and the page is read at network idle."""
+        return self.wait_until == "networkidle" and not self.blocks_requests
+
+    def should_block(self, resource_type: str, url: str) -> bool:
+        """
+        Return True if a request of ``resource_type`` to ``url`` is blocked.
+        """
+        if resource_type in self.block_resource_types:
+            return True
+        host = urlsplit(url).hostname or ""
+        return any(
+            host == domain or host.endswith(f".{domain}")
+            for domain in self.block_domains
+        )
+
+
+LOAD_PROFILES: Dict[str, LoadProfile] = {
+    # Previous behaviour: everything loads, wait for network idle
+    "full": LoadProfile(name="full", wait_until="networkidle", settle_ms=0),
+    # DOM ready plus a short settle, without media, fonts or trackers;
+    # pages left with too little text are rendered again with "full"
+    "fast": LoadProfile(
+        name="fast",
+        block_resource_types=("image", "media", "font", "stylesheet"),
+        block_domains=TRACKER_DOMAINS,
+    ),
+    # Plain HTTP first; JavaScript-only pages fall back to "fast"
+    "http": LoadProfile(
+        name="http",
+        block_resource_types=("image", "media", "font", "stylesheet"),
+        block_domains=TRACKER_DOMAINS,
+        http_first=True,
+    ),
+}
@@ -0,0 +1,212 @@
+import math
+import re
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+# Seconds; spans from sub-millisecond cache hits to minute-long generations
+DEFAULT_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 40, 60, 120)
+
+
+def _labels(labels: Dict[str, str]) -> LabelKey:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _render_labels(key: LabelKey, extra: Iterable[Tuple[str, str]] = ()) -> str:
+    pairs = [*key, *extra]
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in pairs) + "}"
+
+
+def _number(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """
+    Monotonic counter with labels.
+    """
+
+    def __init__(self, name: str, help_text: str):
+        self.name = name
+        self.help = help_text
+        self._lock = threading.Lock()
+        self._values: Dict[LabelKey, float] = {}
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = _labels(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for key, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{_render_labels(key)} {_number(value)}")
+        return lines
+
+
+class Histogram:
+    """
+    Cumulative histogram with labels, in Prometheus bucket layout.
+    """
+
+    def __init__(
+        self, name: str, help_text: str, buckets: Iterable[float] = DEFAULT_BUCKETS
+    ):
+        self.name = name
+        self.help = help_text
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        self._lock = threading.Lock()
+        # Label set -> [bucket counts..., sum, count]
+        self._values: Dict[LabelKey, List[float]] = {}
+
+    def observe(self, value: float, **labels) -> None:
+        key = _labels(labels)
+        with self._lock:
+            series = self._values.get(key)
+            if series is None:
+                series = self._values[key] = [0] * (len(self.buckets) + 2)
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[index] += 1
+            series[-2] += value
+            series[-1] += 1
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            for key, series in sorted(self._values.items()):
+                for bound, count in zip(self.buckets, series):
+                    labels = _render_labels(key, [("le", _number(bound))])
+                    lines.append(f"{self.name}_bucket{labels} {count}")
+                labels = _render_labels(key)
+                lines.append(f"{self.name}_sum{labels} {_number(series[-2])}")
+                lines.append(f"{self.name}_count{labels} {series[-1]}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    Process-wide metrics rendered in the Prometheus text format.
+
+    Counters and histograms are updated as work happens. Components that
+    already keep ``stats()`` dicts (caches, pools, limiters) are registered
+    as collectors instead, and their numeric values are exported as gauges
+    when the metrics are rendered, with a ``hit_rate`` gauge added wherever
+    ``hits`` and ``misses`` are reported. Stats keyed by open-ended names,
+    such as models or operations, map those keys to labels so metric
+    names stay fixed.
+
+    Attributes:
+        prefix (str): Prepended to every metric name.
+    """
+
+    def __init__(self, prefix: str = "brochure"):
+        self.prefix = prefix
+        self._lock = threading.Lock()
+        self._metrics: Dict[str, object] = {}
+        self._collectors: Dict[str, Tuple[Callable[[], dict], Tuple[str, ...]]] = {}
+
+    def counter(self, name: str, help_text: str) -> Counter:
+        """
+        Return the counter ``name``, creating it on first use.
+        """
+        return self._get(name, lambda full: Counter(full, help_text))
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str,
+        buckets: Optional[Iterable[float]] = None,
+    ) -> Histogram:
+        """
+        Return the histogram ``name``, creating it on first use.
+        """
+        return self._get(
+            name, lambda full: Histogram(full, help_text, buckets or DEFAULT_BUCKETS)
+        )
+
+    def register_collector(
+        self, name: str, stats: Callable[[], dict], labels: Sequence[str] = ()
+    ) -> None:
+        """
+        Export the numeric values returned by ``stats`` as ``<prefix>_<name>_*``
+        gauges on every render. Nested dicts extend the metric name, except
+        the outermost ``len(labels)`` levels, whose keys become the values
+        of those labels; e.g. with ``labels=("operation", "model")``,
+        ``{"brochure": {"gpt-4o": {"calls": 3}}}`` is exported as
+        ``<prefix>_<name>_calls{operation="brochure",model="gpt-4o"} 3``.
+        """
+        with self._lock:
+            self._collectors[name] = (stats, tuple(labels))
+
+    def render(self) -> str:
+        """
+        Return every metric in the Prometheus text exposition format.
+        """
+        with self._lock:
+            metrics = list(self._metrics.values())
+            collectors = list(self._collectors.items())
+
+        lines: List[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+
+        gauges: Dict[str, List[Tuple[LabelKey, float]]] = {}
+        for name, (stats, labels) in collectors:
+            try:
+                values = stats()
+            except Exception as e:
+                lines.append(f"# collector {name} failed: {e}")
+                continue
+            for metric, key, value in self._flatten(
+                f"{self.prefix}_{name}", values, labels
+            ):
+                gauges.setdefault(metric, []).append((key, value))
+        for metric, samples in gauges.items():
+            lines.append(f"# TYPE {metric} gauge")
+            for key, value in samples:
+                lines.append(f"{metric}{_render_labels(key)} {_number(value)}")
+        return "\n".join(lines) + "\n"
+
+    def _get(self, name: str, factory):
+        full = f"{self.prefix}_{name}"
+        with self._lock:
+            if full not in self._metrics:
+                self._metrics[full] = factory(full)
+            return self._metrics[full]
+
+    @classmethod
+    def _flatten(
+        cls,
+        name: str,
+        values: dict,
+        labels: Tuple[str, ...] = (),
+        key: LabelKey = (),
+    ):
+        for field, value in values.items():
+            if labels and isinstance(value, dict):
+                labelled = (*key, (labels[0], str(field)))
+                yield from cls._flatten(name, value, labels[1:], labelled)
+                continue
+            metric = re.sub(r"[^a-zA-Z0-9_]", "_", f"{name}_{field}")
+            if isinstance(value, dict):
+                yield from cls._flatten(metric, value, key=key)
+            elif isinstance(value, bool):
+                yield metric, key, int(value)
+            elif isinstance(value, (int, float)):
+                yield metric, key, value
+
+        if "hits" in values and "misses" in values and "hit_rate" not in values:
+            lookups = values["hits"] + values["misses"]
+            rate = values["hits"] / lookups if lookups else 0.0
+            yield f"{name}_hit_rate", key, rate
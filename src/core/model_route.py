@@ -0,0 +1,40 @@
+from dataclasses import dataclass
+from typing import Dict, Tuple
+
+# LLM operations of the brochure pipeline
+SELECT_LINKS = "select_links"
+BROCHURE = "brochure"
+SUMMARY = "summary"
+
+
+@dataclass(frozen=True)
+class ModelRoute:
+    """
+    Which models serve one LLM operation.
+
+    The first model is used while it works; the others are tried in order
+    when a call to it fails or times out. Fallbacks for the brochure
+    should have at least the primary's context window, since the content
+    budget is sized for the primary.
+
+    Attributes:
+        operation (str): Operation name, used as the stats key.
+        models (Tuple[str, ...]): Primary model followed by fallbacks.
+        json_mode (bool): Request JSON output from the API.
+    """
+
+    operation: str
+    models: Tuple[str, ...]
+    json_mode: bool = False
+
+    @property
+    def primary(self) -> str:
+        return self.models[0]
+
+
+DEFAULT_MODEL_ROUTES: Dict[str, ModelRoute] = {
+    # Short JSON classification: a small fast model is enough
+    SELECT_LINKS: ModelRoute(SELECT_LINKS, ("gpt-4o-mini", "gpt-4o"), json_mode=True),
+    BROCHURE: ModelRoute(BROCHURE, ("gpt-4", "gpt-4o")),
+    SUMMARY: ModelRoute(SUMMARY, ("gpt-4o-mini", "gpt-4o")),
+}
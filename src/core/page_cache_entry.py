@@ -0,0 +1,82 @@
+import hashlib
+import time
+from dataclasses import asdict, dataclass, field
+from typing import List, Optional
+
+from core.page_snapshot import PageSnapshot
+
+
+@dataclass
+class PageCacheEntry:
+    """
+    Extracted data of a scraped page as stored in the page cache.
+
+    Attributes:
+        url (str): Normalised URL the entry is keyed by.
+        text (str): Extracted text content.
+        links (List[str]): Extracted internal links.
+        html_digest (str): SHA-256 of the rendered HTML.
+        etag (Optional[str]): ETag validator for conditional revalidation.
+        last_modified (Optional[str]): Last-Modified validator.
+        stored_at (float): Unix time the entry was written or revalidated.
+        ttl (float): Seconds the entry stays fresh after ``stored_at``.
+    """
+
+    url: str
+    text: str = ""
+    links: List[str] = field(default_factory=list)
+    html_digest: str = ""
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    stored_at: float = field(default_factory=time.time)
+    ttl: float = 3600.0
+
+    @classmethod
+    def from_snapshot(
+        cls, key: str, snapshot: PageSnapshot, ttl: float
+    ) -> "PageCacheEntry":
+        """
+        Build an entry from a freshly rendered page.
+        """
+        return cls(
+            url=key,
+            text=snapshot.text,
+            links=list(snapshot.links),
+            html_digest=hashlib.sha256(snapshot.html.encode("utf-8")).hexdigest(),
+            etag=snapshot.etag,
+            last_modified=snapshot.last_modified,
+            ttl=ttl,
+        )
+
+    def to_snapshot(self, url: str) -> PageSnapshot:
+        """
+        Rebuild a page snapshot from the entry. Raw HTML is not cached.
+        """
+        return PageSnapshot(
+            url=url,
+            text=self.text,
+            links=list(self.links),
+            etag=self.etag,
+            last_modified=self.last_modified,
+        )
+
+    @property
+    def expires_at(self) -> float:
+        return self.stored_at + self.ttl
+
+    def is_fresh(self, now: Optional[float] = None) -> bool:
+        return (now or time.time()) < self.expires_at
+
+    @property
+    def can_revalidate(self) -> bool:
+        return bool(self.etag or self.last_modified)
+
+    @property
+    def size_bytes(self) -> int:
+        """Approximate memory footprint used for the byte budget."""
+        return len(self.text.encode("utf-8")) + sum(
+            len(link) for link in self.links
+        )
+
+    def to_dict(self) -> dict:
+        return asdict(self)
@@ -0,0 +1,24 @@
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+
+@dataclass
+class PageSnapshot:
+    """
+    Result of a single page load: raw HTML plus everything parsed from it.
+
+    Attributes:
+        url (str): The URL that was loaded.
+        html (str): Fully rendered HTML of the page.
+        text (str): Text paragraphs extracted from the page.
+        links (List[str]): Unique same-domain absolute URLs found on the page.
+        etag (Optional[str]): ETag response header, if the server sent one.
+        last_modified (Optional[str]): Last-Modified response header, if sent.
+    """
+
+    url: str
+    html: str = ""
+    text: str = ""
+    links: List[str] = field(default_factory=list)
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
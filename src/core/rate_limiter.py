@@ -0,0 +1,124 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import Optional
+
+
+class AsyncTokenBucket:
+    """
+    Token bucket refilled continuously at ``per_minute`` tokens per minute.
+
+    Callers wait in arrival order until enough tokens are available.
+    Requests larger than the bucket are capped at its capacity so they
+    can still proceed.
+    """
+
+    def __init__(self, per_minute: float, capacity: Optional[float] = None):
+        self.rate = per_minute / 60.0
+        self.capacity = capacity or per_minute
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock: Optional[asyncio.Lock] = None
+
+    async def acquire(self, amount: float = 1.0) -> None:
+        """
+        Wait until ``amount`` tokens are available and take them.
+        """
+        amount = min(amount, self.capacity)
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._tokens >= amount:
+                    self._tokens -= amount
+                    return
+                await asyncio.sleep((amount - self._tokens) / self.rate)
+
+    def adjust(self, delta: float) -> None:
+        """
+        Take ``delta`` extra tokens (or return them if negative), e.g. once
+        the real cost of a request is known.
+        """
+        self._refill()
+        self._tokens = min(self.capacity, self._tokens - delta)
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+
+class LLMRateLimiter:
+    """
+    Shared limits for LLM calls: concurrency, requests and tokens per minute.
+
+    Attributes:
+        max_concurrency (int): LLM calls allowed in flight at once.
+        requests_per_minute (Optional[float]): Request rate limit, if any.
+        tokens_per_minute (Optional[float]): Token rate limit, if any.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 8,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+    ):
+        self.max_concurrency = max_concurrency
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._requests = (
+            AsyncTokenBucket(requests_per_minute) if requests_per_minute else None
+        )
+        self._tokens = (
+            AsyncTokenBucket(tokens_per_minute) if tokens_per_minute else None
+        )
+        self.calls = 0
+        self.tokens_used = 0
+        self.wait_total = 0.0
+
+    @asynccontextmanager
+    async def slot(self, estimated_tokens: int):
+        """
+        Hold one LLM call slot once all limits allow it.
+
+        Args:
+            estimated_tokens (int): Expected tokens for the call.
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        waited = time.perf_counter()
+        async with self._semaphore:
+            if self._requests is not None:
+                await self._requests.acquire()
+            if self._tokens is not None:
+                await self._tokens.acquire(estimated_tokens)
+            self.wait_total += time.perf_counter() - waited
+            self.calls += 1
+            yield
+
+    def record_usage(self, estimated_tokens: int, actual_tokens: int) -> None:
+        """
+        Correct the token bucket once the real token usage is known.
+        """
+        self.tokens_used += actual_tokens
+        if self._tokens is not None:
+            self._tokens.adjust(actual_tokens - estimated_tokens)
+
+    def stats(self) -> dict:
+        """
+        Return configured limits and call, token and wait counters.
+        """
+        return {
+            "max_concurrency": self.max_concurrency,
+            "requests_per_minute": self.requests_per_minute,
+            "tokens_per_minute": self.tokens_per_minute,
+            "calls": self.calls,
+            "tokens_used": self.tokens_used,
+            "wait_avg_seconds": self.wait_total / self.calls if self.calls else 0.0,
+        }
@@ -0,0 +1,78 @@
+import random
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Deadlines and backoff for calls to an unreliable provider.
+
+    Attributes:
+        max_attempts (int): Attempts per call, including the first.
+        attempt_timeout (float): Seconds one attempt may take.
+        deadline (float): Seconds the call may take across all attempts
+            and waits; no retry is started that could not finish in time.
+        base_delay (float): Backoff before the first retry.
+        max_delay (float): Upper bound for one backoff.
+        hedge (bool): Send a second request when the first is slower than
+            the recent ``hedge_quantile`` latency, and take the first reply.
+        hedge_quantile (float): Latency quantile that triggers a hedge.
+        hedge_min_delay (float): Never hedge sooner than this.
+    """
+
+    max_attempts: int = 3
+    attempt_timeout: float = 60.0
+    deadline: float = 120.0
+    base_delay: float = 0.5
+    max_delay: float = 20.0
+    hedge: bool = False
+    hedge_quantile: float = 0.95
+    hedge_min_delay: float = 1.0
+
+    def backoff(self, retry: int, retry_after: Optional[float] = None) -> float:
+        """
+        Return the wait before retry number ``retry`` (1-based).
+
+        Uses exponential backoff with full jitter, so clients that failed
+        together do not retry together, but never waits less than the
+        server's ``retry_after``.
+        """
+        ceiling = min(self.max_delay, self.base_delay * 2 ** (retry - 1))
+        delay = random.uniform(0, ceiling)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
+
+
+class LatencyWindow:
+    """
+    Thread-safe window of the most recent call latencies, used to pick the
+    hedging delay.
+
+    Attributes:
+        size (int): Latencies kept.
+        min_samples (int): Latencies needed before ``quantile`` answers.
+    """
+
+    def __init__(self, size: int = 200, min_samples: int = 20):
+        self.size = size
+        self.min_samples = min_samples
+        self._lock = threading.Lock()
+        self._samples: deque = deque(maxlen=size)
+
+    def observe(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Return the ``q`` quantile of the window, or None with too few samples.
+        """
+        with self._lock:
+            if len(self._samples) < self.min_samples:
+                return None
+            ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
@@ -0,0 +1,80 @@
+import threading
+from collections import defaultdict
+from typing import Dict
+
+
+class ScrapeStats:
+    """
+    Thread-safe page-load counters, kept per load profile.
+
+    For each profile it counts pages loaded over plain HTTP and in the
+    browser, HTTP pages that fell back to a browser render, renders that
+    fell back to the ``full`` profile, blocked requests, bytes transferred
+    and time spent. Browser byte counts are taken from response
+    ``Content-Length`` headers, so they are a lower bound for chunked
+    responses.
+    """
+
+    FIELDS = (
+        "pages",
+        "http",
+        "browser",
+        "fallbacks",
+        "full_renders",
+        "blocked",
+        "bytes",
+    )
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Dict[str, float]] = defaultdict(
+            lambda: dict.fromkeys(self.FIELDS + ("seconds",), 0)
+        )
+
+    def record(
+        self,
+        profile: str,
+        method: str,
+        seconds: float,
+        transferred: int = 0,
+        blocked: int = 0,
+        fallback: bool = False,
+        full_render: bool = False,
+    ) -> None:
+        """
+        Add one page load.
+
+        Args:
+            profile (str): Load profile name.
+            method (str): ``http`` or ``browser``, whichever produced the page.
+            seconds (float): Wall-clock time including any fallback.
+            transferred (int): Bytes downloaded for the page.
+            blocked (int): Requests aborted by the profile.
+            fallback (bool): True if an HTTP fetch fell back to the browser.
+            full_render (bool): True if the profile's render fell back to
+                the ``full`` profile.
+        """
+        with self._lock:
+            counters = self._counters[profile]
+            counters["pages"] += 1
+            counters[method] += 1
+            counters["fallbacks"] += int(fallback)
+            counters["full_renders"] += int(full_render)
+            counters["blocked"] += blocked
+            counters["bytes"] += transferred
+            counters["seconds"] += seconds
+
+    def stats(self) -> dict:
+        """
+        Return counters, average load time and bytes per profile.
+        """
+        with self._lock:
+            result = {}
+            for profile, counters in self._counters.items():
+                pages = counters["pages"] or 1
+                result[profile] = {
+                    **{name: int(counters[name]) for name in self.FIELDS},
+                    "avg_seconds": round(counters["seconds"] / pages, 3),
+                    "avg_bytes": int(counters["bytes"] / pages),
+                }
+            return result
@@ -0,0 +1,74 @@
+import asyncio
+from typing import Awaitable, Callable, Dict, TypeVar
+
+T = TypeVar("T")
+
+
+class _Call:
+    """
+    An in-flight call and the number of callers waiting on it.
+    """
+
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.waiters = 0
+
+
+class AsyncSingleFlight:
+    """
+    Coalesces concurrent calls that share a key into one execution.
+
+    The first caller for a key starts the work; callers arriving while it
+    runs wait on the same task and receive the same result or exception.
+    If every waiter is cancelled, the shared task is cancelled too. Once
+    the task finishes the key is released, so later calls run again.
+    """
+
+    def __init__(self):
+        self._calls: Dict[str, _Call] = {}
+        self.started = 0
+        self.coalesced = 0
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run ``fn()`` once per key among concurrent callers.
+
+        Args:
+            key (str): Identity of the work, e.g. a normalised URL.
+            fn (Callable): Zero-argument coroutine function doing the work.
+
+        Returns:
+            The result of the shared call.
+        """
+        call = self._calls.get(key)
+        if call is None:
+            call = _Call(asyncio.ensure_future(fn()))
+            self._calls[key] = call
+            call.task.add_done_callback(lambda _: self._release(key, call))
+            self.started += 1
+        else:
+            self.coalesced += 1
+
+        call.waiters += 1
+        try:
+            # Shield so one waiter's cancellation does not cancel the others
+            return await asyncio.shield(call.task)
+        finally:
+            call.waiters -= 1
+            if call.waiters == 0 and not call.task.done():
+                call.task.cancel()
+                self._release(key, call)
+
+    def stats(self) -> dict:
+        """
+        Return counters of started and coalesced calls.
+        """
+        return {
+            "in_flight": len(self._calls),
+            "started": self.started,
+            "coalesced": self.coalesced,
+        }
+
+    def _release(self, key: str, call: _Call) -> None:
+        if self._calls.get(key) is call:
+            del self._calls[key]
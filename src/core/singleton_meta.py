@@ -8,7 +8,8 @@ class SingletonMeta(ABCMeta):
 
     Ensures that for each unique 'name' (or class name by default),
     only one instance of the class is created. Thread-safe to avoid
-    race conditions in multi-threaded environments.
+    race conditions in multi-threaded environments; existing instances
+    are returned without taking the lock.
     """
 
     _instance = {}  # Stores instances keyed by name
@@ -18,6 +19,11 @@ class SingletonMeta(ABCMeta):
         # Determine unique key: keyword 'name', first positional arg, or class name
         name = kwds.get("name") or (args[0] if args else cls.__name__)
 
+        # Fast path: dict reads are atomic, and instances are never removed
+        instance = cls._instance.get(name)
+        if instance is not None:
+            return instance
+
         with cls._lock:
             # Create instance only if not already present
             if name not in cls._instance:
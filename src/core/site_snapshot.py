@@ -0,0 +1,185 @@
+import hashlib
+import json
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List, Optional
+
+
+def text_digest(*parts: str) -> str:
+    """
+    Return a SHA-256 hex digest identifying ``parts`` in order.
+    """
+    payload = json.dumps(parts, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def summary_key(url: str, chunk: str) -> str:
+    """
+    Return the key of ``chunk``'s summary: its page URL and text digest.
+    """
+    return f"{url}#{text_digest(chunk)}"
+
+
+@dataclass
+class SiteSnapshot:
+    """
+    What the last brochure generation for a site read and produced.
+
+    Stored per site so the next generation can tell what changed and
+    reuse the LLM results whose inputs did not.
+
+    Attributes:
+        base_url (str): Normalised site URL the snapshot is keyed by.
+        pages (Dict[str, str]): Text digest of every page read, by URL.
+        links (List[str]): Sorted, deduplicated links of the landing page.
+        relevant_links (List[str]): Links selected from ``links``.
+        summaries (Dict[str, str]): Summary of each map-reduce chunk, by
+            ``summary_key`` of its page URL and text.
+        brochure (str): Generated brochure.
+        brochure_inputs (str): Digest of the company name, contents and
+            relevant links the brochure was generated from.
+        stored_at (float): Unix time the snapshot was taken.
+    """
+
+    base_url: str
+    pages: Dict[str, str] = field(default_factory=dict)
+    links: List[str] = field(default_factory=list)
+    relevant_links: List[str] = field(default_factory=list)
+    summaries: Dict[str, str] = field(default_factory=dict)
+    brochure: str = ""
+    brochure_inputs: str = ""
+    stored_at: float = field(default_factory=time.time)
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+@dataclass
+class SiteDiff:
+    """
+    One generation's comparison of a site against its previous snapshot.
+
+    Pipeline stages ask it for results they can reuse and record what they
+    produce, building ``current``, the snapshot to store for the next
+    generation. A result is reused only when its inputs are unchanged:
+    the selected links when the landing page's link set is the same, a
+    chunk summary when the same page's chunk text is the same, and the
+    brochure when its contents and links are the same. Each stage records
+    into its own fields, so stages running in parallel threads do not race.
+
+    Attributes:
+        base_url (str): Normalised site URL.
+        previous (Optional[SiteSnapshot]): Snapshot of the last
+            generation, or None to reuse nothing.
+        current (SiteSnapshot): Snapshot being built by this generation.
+        pages_changed (int): Pages that are new or whose text changed.
+        pages_skipped (int): Pages whose text is unchanged.
+        links_reused (bool): Link selection was skipped.
+        summaries_reused (int): Chunk summaries taken from ``previous``.
+        brochure_reused (bool): Brochure generation was skipped.
+        brochure_complete (bool): A brochure was generated, or reused,
+            without error; only then is ``current`` worth storing.
+    """
+
+    base_url: str
+    previous: Optional[SiteSnapshot] = None
+    current: SiteSnapshot = field(init=False)
+    pages_changed: int = 0
+    pages_skipped: int = 0
+    links_reused: bool = False
+    summaries_reused: int = 0
+    brochure_reused: bool = False
+    brochure_complete: bool = False
+
+    def __post_init__(self):
+        self.current = SiteSnapshot(base_url=self.base_url)
+
+    def compare_pages(self, pages: Dict[str, str]) -> None:
+        """
+        Record the text of ``pages``, by URL, and count which changed.
+        """
+        previous = self.previous.pages if self.previous else {}
+        for url, text in pages.items():
+            digest = text_digest(text)
+            self.current.pages[url] = digest
+            if previous.get(url) == digest:
+                self.pages_skipped += 1
+            else:
+                self.pages_changed += 1
+
+    def reuse_links(self, links: List[str]) -> Optional[List[str]]:
+        """
+        Record the landing page's ``links`` and return the previously
+        selected links if the link set is unchanged, else None.
+        """
+        self.current.links = sorted(set(links))
+        if self.previous is None or self.previous.links != self.current.links:
+            return None
+        self.links_reused = True
+        return self.record_links(self.previous.relevant_links)
+
+    def record_links(self, relevant_links: List[str]) -> List[str]:
+        self.current.relevant_links = list(relevant_links)
+        return relevant_links
+
+    def reuse_summary(self, url: str, chunk: str) -> Optional[str]:
+        """
+        Return the previous summary of ``chunk`` of the page at ``url`` if
+        its text is unchanged.
+        """
+        key = summary_key(url, chunk)
+        summary = self.previous.summaries.get(key) if self.previous else None
+        if summary:
+            self.summaries_reused += 1
+            self.current.summaries[key] = summary
+        return summary
+
+    def record_summary(self, url: str, chunk: str, summary: str) -> None:
+        if summary:
+            self.current.summaries[summary_key(url, chunk)] = summary
+
+    def reuse_brochure(
+        self, company_name: str, contents: str, relevant_links: List[str]
+    ) -> Optional[str]:
+        """
+        Record the brochure's inputs and return the previous brochure if
+        they are unchanged, else None.
+        """
+        self.current.brochure_inputs = text_digest(
+            company_name, contents, *relevant_links
+        )
+        previous = self.previous
+        if (
+            previous is None
+            or not previous.brochure
+            or previous.brochure_inputs != self.current.brochure_inputs
+        ):
+            return None
+        self.brochure_reused = True
+        return self.record_brochure(previous.brochure)
+
+    def record_brochure(self, brochure: str) -> str:
+        """
+        Record a brochure that was generated, or reused, in full.
+        """
+        self.current.brochure = brochure
+        self.brochure_complete = True
+        return brochure
+
+    @property
+    def llm_calls_skipped(self) -> int:
+        """LLM calls avoided, counting link selection as one call."""
+        return (
+            int(self.links_reused) + self.summaries_reused + int(self.brochure_reused)
+        )
+
+    def to_dict(self) -> dict:
+        return {
+            "previous": self.previous is not None,
+            "pages_changed": self.pages_changed,
+            "pages_skipped": self.pages_skipped,
+            "llm_calls_skipped": self.llm_calls_skipped,
+            "links_reused": self.links_reused,
+            "summaries_reused": self.summaries_reused,
+            "brochure_reused": self.brochure_reused,
+        }
@@ -0,0 +1,96 @@
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+
+@dataclass
+class Span:
+    """
+    One timed unit of work: a request, a pipeline stage, a page load or an
+    LLM call. Spans of one request share a ``trace_id`` and point to their
+    parent.
+
+    Attributes:
+        name (str): What was done, e.g. ``scrape`` or ``llm.chat``.
+        trace_id (str): 32 hex characters shared by the request's spans.
+        span_id (str): 16 hex characters identifying this span.
+        parent (Optional[Span]): Enclosing span, None for the request.
+        attributes (Dict[str, Any]): Details such as URLs and token counts.
+        start_ns (int): Wall-clock start in Unix nanoseconds.
+        end_ns (int): Wall-clock end in Unix nanoseconds, 0 while open.
+        error (Optional[str]): Exception that ended the span, if any.
+    """
+
+    name: str
+    trace_id: str
+    span_id: str
+    parent: Optional["Span"] = None
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    start_ns: int = field(default_factory=time.time_ns)
+    end_ns: int = 0
+    error: Optional[str] = None
+    _started: float = field(default_factory=time.perf_counter, repr=False)
+    _duration: float = field(default=0.0, repr=False)
+
+    @property
+    def root(self) -> "Span":
+        span = self
+        while span.parent is not None:
+            span = span.parent
+        return span
+
+    @property
+    def duration(self) -> float:
+        """
+        Seconds from start to end, or until now while the span is open.
+        """
+        if self.end_ns:
+            return self._duration
+        return time.perf_counter() - self._started
+
+    def set(self, **attributes) -> None:
+        self.attributes.update(attributes)
+
+    def add(self, key: str, amount: float) -> None:
+        """
+        Add ``amount`` to the numeric attribute ``key``.
+        """
+        self.attributes[key] = self.attributes.get(key, 0) + amount
+
+    def end(self) -> None:
+        self._duration = time.perf_counter() - self._started
+        self.end_ns = self.start_ns + int(self._duration * 1e9)
+
+    def to_otlp(self) -> dict:
+        """
+        Return the span in the OTLP/JSON encoding used by OpenTelemetry
+        collectors.
+        """
+        span = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": 1,  # SPAN_KIND_INTERNAL
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns),
+            "attributes": [
+                {"key": key, "value": _otlp_value(value)}
+                for key, value in self.attributes.items()
+            ],
+            "status": (
+                {"code": 2, "message": self.error} if self.error else {"code": 1}
+            ),
+        }
+        if self.parent is not None:
+            span["parentSpanId"] = self.parent.span_id
+        return span
+
+
+def _otlp_value(value: Any) -> dict:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
@@ -0,0 +1,411 @@
+import asyncio
+import contextvars
+import inspect
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from core.tracer import Tracer
+from logs.logger_singleton import Logger
+
+
+@dataclass(frozen=True)
+class Stage:
+    """
+    One step of a stage graph.
+
+    A stage starts as soon as all of its inputs exist, so stages that do
+    not depend on each other run at the same time.
+
+    Attributes:
+        name (str): Stage name, also used as its span name.
+        run (Callable): Called with the values of ``inputs``, in order. In
+            an AsyncStageGraph it may return an awaitable.
+        inputs (Tuple[str, ...]): Values the stage needs.
+        outputs (Tuple[str, ...]): Values the stage produces. With more
+            than one, ``run`` returns a tuple of them in this order.
+        timeout (Optional[float]): Seconds the stage may take. None waits
+            for as long as it runs.
+        fallback (Optional[Callable]): Called like ``run`` when it fails or
+            times out, and its result used instead. Without one, the
+            stage's error, or a TimeoutError, is raised from the graph
+            as is, so callers can handle it by type.
+    """
+
+    name: str
+    run: Callable
+    inputs: Tuple[str, ...] = ()
+    outputs: Tuple[str, ...] = ()
+    timeout: Optional[float] = None
+    fallback: Optional[Callable] = None
+
+
+@dataclass
+class StageRun:
+    """
+    Timing and outcome of one stage, in seconds since the graph started.
+
+    Attributes:
+        name (str): Stage name.
+        started (float): When the stage started.
+        finished (float): When its outputs, or its fallback's, were ready.
+        status (str): ``ok``, or ``fallback`` if the fallback was used.
+        error (Optional[str]): Why the stage fell back, if it did.
+    """
+
+    name: str
+    started: float
+    finished: float = 0.0
+    status: str = "ok"
+    error: Optional[str] = None
+
+    @property
+    def seconds(self) -> float:
+        return self.finished - self.started
+
+
+# Called with a stage's run and None when it starts, then with its outputs
+# when it ends; ``run.status`` tells whether the fallback was used
+StageListener = Callable[[StageRun, Optional[Dict[str, Any]]], None]
+
+
+@dataclass
+class StageGraphResult:
+    """
+    Values produced by a stage graph run and how long each stage took.
+
+    Attributes:
+        values (Dict[str, Any]): Initial values plus every stage output.
+        runs (Dict[str, StageRun]): Stage timings, in start order.
+        critical_path (List[str]): Chain of dependent stages that bounded
+            the run's latency, first to last.
+        seconds (float): Wall time of the whole run.
+    """
+
+    values: Dict[str, Any]
+    runs: Dict[str, StageRun] = field(default_factory=dict)
+    critical_path: List[str] = field(default_factory=list)
+    seconds: float = 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "seconds": round(self.seconds, 3),
+            "critical_path": [
+                {"stage": name, "seconds": round(self.runs[name].seconds, 3)}
+                for name in self.critical_path
+            ],
+            "stages": {
+                name: {
+                    "started": round(run.started, 3),
+                    "seconds": round(run.seconds, 3),
+                    "status": run.status,
+                    **({"error": run.error} if run.error else {}),
+                }
+                for name, run in self.runs.items()
+            },
+        }
+
+
+class _StageGraphPolicy:
+    """
+    Validation, scheduling and critical-path logic shared by the sync and
+    async executors.
+    """
+
+    def __init__(self, stages: Sequence[Stage], tracer: Optional[Tracer], logger):
+        self.stages = list(stages)
+        self.tracer = tracer or Tracer()
+        self.logger = logger or Logger(self.__class__.__name__)
+
+        self._producers: Dict[str, str] = {}
+        for stage in self.stages:
+            for output in stage.outputs:
+                if output in self._producers:
+                    raise ValueError(
+                        f"{output!r} is produced by both "
+                        f"{self._producers[output]} and {stage.name}"
+                    )
+                self._producers[output] = stage.name
+        self._by_name = {stage.name: stage for stage in self.stages}
+        if len(self._by_name) != len(self.stages):
+            raise ValueError("Stage names must be unique")
+
+    def _check(self, values: Dict[str, Any]) -> None:
+        """
+        Raise ValueError unless every stage can run from ``values``.
+        """
+        available = set(values)
+        remaining = list(self.stages)
+        while remaining:
+            ready = [s for s in remaining if available.issuperset(s.inputs)]
+            if not ready:
+                missing = {s.name: sorted(set(s.inputs) - available) for s in remaining}
+                raise ValueError(f"Stages can never start, missing inputs: {missing}")
+            for stage in ready:
+                remaining.remove(stage)
+                available.update(stage.outputs)
+
+    @staticmethod
+    def _ready(waiting: List[Stage], values: Dict[str, Any]) -> List[Stage]:
+        ready = [stage for stage in waiting if all(i in values for i in stage.inputs)]
+        for stage in ready:
+            waiting.remove(stage)
+        return ready
+
+    @staticmethod
+    def _args(stage: Stage, values: Dict[str, Any]) -> list:
+        return [values[name] for name in stage.inputs]
+
+    @staticmethod
+    def _outputs(stage: Stage, result: Any) -> Dict[str, Any]:
+        if len(stage.outputs) == 1:
+            return {stage.outputs[0]: result}
+        if not stage.outputs:
+            return {}
+        return dict(zip(stage.outputs, result))
+
+    def _fall_back(self, stage: Stage, run: StageRun, error: BaseException) -> None:
+        if stage.fallback is None:
+            self.logger.error(f"Stage {stage.name} failed: {error!r}")
+            raise error
+        run.status = "fallback"
+        run.error = f"{type(error).__name__}: {error}"
+        self.logger.warning(f"Stage {stage.name} fell back after {run.error}")
+
+    @staticmethod
+    def _notify(listener, run: StageRun, outputs: Optional[dict]) -> None:
+        if listener is not None:
+            listener(run, outputs)
+
+    def _critical_path(self, runs: Dict[str, StageRun]) -> List[str]:
+        """
+        Walk back from the stage that finished last, each time to the
+        input producer that finished last, i.e. the one it waited for.
+        """
+        if not runs:
+            return []
+        stage = self._by_name[max(runs.values(), key=lambda r: r.finished).name]
+        path = [stage.name]
+        while True:
+            producers = [
+                self._producers[i] for i in stage.inputs if i in self._producers
+            ]
+            if not producers:
+                return path[::-1]
+            stage = self._by_name[max(producers, key=lambda n: runs[n].finished)]
+            path.append(stage.name)
+
+    def _result(
+        self, values: Dict[str, Any], runs: Dict[str, StageRun], seconds: float
+    ) -> StageGraphResult:
+        result = StageGraphResult(values, runs, self._critical_path(runs), seconds)
+        path = " > ".join(
+            f"{name} {runs[name].seconds:.2f}s" for name in result.critical_path
+        )
+        self.logger.info(f"Stages took {seconds:.2f}s, critical path: {path}")
+        span = self.tracer.current()
+        if span is not None:
+            span.set(critical_path=" > ".join(result.critical_path))
+        return result
+
+
+class StageGraph(_StageGraphPolicy):
+    """
+    Runs a graph of blocking stages on worker threads.
+
+    Each stage runs in its own span, with the caller's tracing and logging
+    context. A stage that times out is abandoned rather than stopped: its
+    thread finishes in the background and its result is discarded.
+    """
+
+    def __init__(
+        self,
+        stages: Sequence[Stage],
+        tracer: Optional[Tracer] = None,
+        max_workers: Optional[int] = None,
+        logger=None,
+    ):
+        """
+        Args:
+            stages (Sequence[Stage]): The stages; order does not matter.
+            tracer (Tracer, optional): Records each stage as a span.
+            max_workers (int, optional): Stages run at once. Defaults to the
+                number of stages.
+            logger (Logger, optional): Logger instance.
+        """
+        super().__init__(stages, tracer, logger)
+        self.max_workers = max_workers or max(1, len(self.stages))
+
+    def run(
+        self, values: Dict[str, Any], listener: Optional[StageListener] = None
+    ) -> StageGraphResult:
+        """
+        Run every stage once its inputs are available.
+
+        Args:
+            values (Dict[str, Any]): Initial values, e.g. the request URL.
+            listener (StageListener, optional): Told when stages start,
+                finish or fall back.
+
+        Returns:
+            StageGraphResult: All values, stage timings and critical path.
+
+        Raises:
+            Exception: The error of a stage without a fallback.
+        """
+        values = dict(values)
+        self._check(values)
+        started = time.perf_counter()
+        runs: Dict[str, StageRun] = {}
+        waiting = list(self.stages)
+        pending = {}
+        pool = ThreadPoolExecutor(self.max_workers, thread_name_prefix="stage")
+        try:
+            while waiting or pending:
+                for stage in self._ready(waiting, values):
+                    run = StageRun(stage.name, time.perf_counter() - started)
+                    runs[stage.name] = run
+                    self._notify(listener, run, None)
+                    # Each worker gets its own copy of the caller's context
+                    context = contextvars.copy_context()
+                    future = pool.submit(
+                        context.run, self._run_stage, stage, self._args(stage, values)
+                    )
+                    deadline = (
+                        time.monotonic() + stage.timeout if stage.timeout else None
+                    )
+                    pending[future] = (stage, deadline)
+
+                deadlines = [d for _, d in pending.values() if d is not None]
+                timeout = (
+                    max(0.0, min(deadlines) - time.monotonic()) if deadlines else None
+                )
+                done, _ = wait(pending, timeout, return_when=FIRST_COMPLETED)
+
+                for future in list(pending):
+                    stage, deadline = pending[future]
+                    if future in done:
+                        error = future.exception()
+                    elif deadline is not None and time.monotonic() >= deadline:
+                        error = TimeoutError(f"Timed out after {stage.timeout}s")
+                    else:
+                        continue
+                    del pending[future]
+                    run = runs[stage.name]
+                    args = self._args(stage, values)
+                    if error is None:
+                        result = future.result()
+                    else:
+                        self._fall_back(stage, run, error)
+                        result = stage.fallback(*args)
+                    outputs = self._outputs(stage, result)
+                    values.update(outputs)
+                    run.finished = time.perf_counter() - started
+                    self._notify(listener, run, outputs)
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+        return self._result(values, runs, time.perf_counter() - started)
+
+    def _run_stage(self, stage: Stage, args: list) -> Any:
+        with self.tracer.span(stage.name):
+            return stage.run(*args)
+
+
+class AsyncStageGraph(_StageGraphPolicy):
+    """
+    Runs a graph of stages as concurrent tasks on the event loop.
+
+    Stages may be coroutine functions or plain functions; a timed-out
+    stage is cancelled. If a stage fails without a fallback, the stages
+    still running are cancelled too.
+    """
+
+    def __init__(
+        self,
+        stages: Sequence[Stage],
+        tracer: Optional[Tracer] = None,
+        logger=None,
+    ):
+        """
+        Args:
+            stages (Sequence[Stage]): The stages; order does not matter.
+            tracer (Tracer, optional): Records each stage as a span.
+            logger (Logger, optional): Logger instance.
+        """
+        super().__init__(stages, tracer, logger)
+
+    async def run(
+        self, values: Dict[str, Any], listener: Optional[StageListener] = None
+    ) -> StageGraphResult:
+        """
+        Run every stage once its inputs are available.
+
+        Args:
+            values (Dict[str, Any]): Initial values, e.g. the request URL.
+            listener (StageListener, optional): Told when stages start,
+                finish or fall back.
+
+        Returns:
+            StageGraphResult: All values, stage timings and critical path.
+
+        Raises:
+            Exception: The error of a stage without a fallback.
+        """
+        values = dict(values)
+        self._check(values)
+        started = time.perf_counter()
+        runs: Dict[str, StageRun] = {}
+        waiting = list(self.stages)
+        pending: Dict[asyncio.Future, Stage] = {}
+        try:
+            while waiting or pending:
+                for stage in self._ready(waiting, values):
+                    run = StageRun(stage.name, time.perf_counter() - started)
+                    runs[stage.name] = run
+                    self._notify(listener, run, None)
+                    task = asyncio.ensure_future(
+                        self._run_stage(stage, run, self._args(stage, values))
+                    )
+                    pending[task] = stage
+
+                done, _ = await asyncio.wait(pending, return_when=FIRST_COMPLETED)
+                for task in done:
+                    stage = pending.pop(task)
+                    run = runs[stage.name]
+                    outputs = self._outputs(stage, task.result())
+                    values.update(outputs)
+                    run.finished = time.perf_counter() - started
+                    self._notify(listener, run, outputs)
+        finally:
+            for task in pending:
+                task.cancel()
+
+        return self._result(values, runs, time.perf_counter() - started)
+
+    async def _run_stage(self, stage: Stage, run: StageRun, args: list) -> Any:
+        with self.tracer.span(stage.name):
+            # Not wait_for: a TimeoutError raised by the stage itself must
+            # not be mistaken for the stage timing out
+            task = asyncio.ensure_future(self._call(stage.run, args))
+            try:
+                done, _ = await asyncio.wait({task}, timeout=stage.timeout)
+            finally:
+                # Timed out, or the graph is being cancelled
+                task.cancel()
+            if not done:
+                error = TimeoutError(f"Timed out after {stage.timeout}s")
+            elif task.exception() is None:
+                return task.result()
+            else:
+                error = task.exception()
+            self._fall_back(stage, run, error)
+            return await self._call(stage.fallback, args)
+
+    @staticmethod
+    async def _call(fn: Callable, args: Iterable) -> Any:
+        result = fn(*args)
+        if inspect.isawaitable(result):
+            result = await result
+        return result
@@ -0,0 +1,204 @@
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+from core.metrics import MetricsRegistry
+from core.span import Span
+from interfaces.i_span_exporter import ISpanExporter
+from logs.log_context import request_id_var
+from logs.logger_singleton import Logger
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+# Buckets for per-request cost in USD
+COST_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1)
+TOKEN_BUCKETS = (500, 1000, 2500, 5000, 10000, 20000, 40000, 80000)
+
+
+class Tracer:
+    """
+    Times spans of work and turns them into metrics and traces.
+
+    ``span(name)`` opens a child of the current span (tracked in a context
+    variable, so it follows asyncio tasks and worker threads) or a new
+    trace when there is none. Every finished span is observed in the
+    ``span_seconds`` histogram by name and handed to the exporter if one
+    is configured. LLM token usage and cost are added to counters and
+    accumulated on the request's root span, which reports the request
+    total when it ends.
+
+    A tracer without metrics or exporter only times spans, so components
+    can always use one.
+
+    Attributes:
+        metrics (Optional[MetricsRegistry]): Receives span and LLM metrics.
+        exporter (Optional[ISpanExporter]): Receives finished spans.
+    """
+
+    def __init__(
+        self,
+        metrics: Optional[MetricsRegistry] = None,
+        exporter: Optional[ISpanExporter] = None,
+        logger=None,
+    ):
+        self.metrics = metrics
+        self.exporter = exporter
+        self.logger = logger or Logger(self.__class__.__name__)
+
+        if metrics is not None:
+            self._span_seconds = metrics.histogram(
+                "span_seconds", "Duration of pipeline spans by name."
+            )
+            self._span_errors = metrics.counter(
+                "span_errors_total", "Spans that ended with an exception."
+            )
+            self._llm_calls = metrics.counter(
+                "llm_calls_total", "LLM API calls by operation and model."
+            )
+            self._llm_seconds = metrics.histogram(
+                "llm_call_seconds", "LLM API call duration by operation and model."
+            )
+            self._llm_tokens = metrics.counter(
+                "llm_tokens_total", "LLM tokens by operation, model and kind."
+            )
+            self._llm_cost = metrics.counter(
+                "llm_cost_usd_total",
+                "Estimated LLM cost in USD by operation and model.",
+            )
+            self._request_cost = metrics.histogram(
+                "request_cost_usd", "Estimated LLM cost per request.", COST_BUCKETS
+            )
+            self._request_tokens = metrics.histogram(
+                "request_tokens", "LLM tokens per request.", TOKEN_BUCKETS
+            )
+
+    @staticmethod
+    def current() -> Optional[Span]:
+        """
+        Return the innermost open span of the running context.
+        """
+        return _current_span.get()
+
+    @contextmanager
+    def span(self, name: str, **attributes) -> Iterator[Span]:
+        """
+        Time the enclosed block as a span named ``name``.
+
+        Args:
+            name (str): Span name, also the metric label.
+            **attributes: Initial span attributes.
+
+        Yields:
+            Span: The open span, for adding attributes.
+        """
+        parent = _current_span.get()
+        span = Span(
+            name=name,
+            trace_id=parent.trace_id if parent else uuid.uuid4().hex,
+            span_id=uuid.uuid4().hex[:16],
+            parent=parent,
+            attributes=attributes,
+        )
+        if parent is None and request_id_var.get():
+            span.set(request_id=request_id_var.get())
+
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            try:
+                _current_span.reset(token)
+            except ValueError:
+                # Async generator closed from another context
+                pass
+            span.end()
+            self._finish(span)
+
+    def record_llm_usage(
+        self,
+        model: str,
+        prompt_tokens: int,
+        completion_tokens: int,
+        cost: float,
+        operation: Optional[str] = None,
+    ) -> None:
+        """
+        Count one LLM call and add its usage to the current request.
+        """
+        operation = operation or "-"
+        span = _current_span.get()
+        if span is not None:
+            root = span.root
+            root.add("llm.calls", 1)
+            root.add("llm.prompt_tokens", prompt_tokens)
+            root.add("llm.completion_tokens", completion_tokens)
+            root.add("llm.cost_usd", cost)
+            root.add(f"llm.{operation}.calls", 1)
+            root.add(f"llm.{operation}.cost_usd", cost)
+
+        if self.metrics is not None:
+            labels = {"model": model, "operation": operation}
+            self._llm_calls.inc(**labels)
+            self._llm_tokens.inc(prompt_tokens, kind="prompt", **labels)
+            self._llm_tokens.inc(completion_tokens, kind="completion", **labels)
+            self._llm_cost.inc(cost, **labels)
+
+    def close(self) -> None:
+        """
+        Flush and close the exporter.
+        """
+        if self.exporter is not None:
+            self.exporter.close()
+
+    def _finish(self, span: Span) -> None:
+        if self.metrics is not None:
+            self._span_seconds.observe(span.duration, span=span.name)
+            if span.error:
+                self._span_errors.inc(span=span.name)
+            if span.name.startswith("llm."):
+                self._llm_seconds.observe(
+                    span.duration,
+                    model=span.attributes.get("model", "-"),
+                    operation=span.attributes.get("operation", "-"),
+                )
+        if self.exporter is not None:
+            self.exporter.export(span)
+        if span.parent is None:
+            self._finish_request(span)
+
+    def _finish_request(self, span: Span) -> None:
+        usage = self.usage(span)
+        if self.metrics is not None and usage["calls"]:
+            self._request_cost.observe(usage["cost_usd"])
+            self._request_tokens.observe(
+                usage["prompt_tokens"] + usage["completion_tokens"]
+            )
+        self.logger.info(
+            f"Trace {span.trace_id} {span.name} took {span.duration:.2f}s "
+            f"{'(failed) ' if span.error else ''}llm_usage={usage}"
+        )
+
+    @staticmethod
+    def usage(span: Span) -> dict:
+        """
+        Return the LLM calls, tokens and cost accumulated on ``span``'s
+        request so far, with calls and cost per operation.
+        """
+        attributes = span.root.attributes
+        operations = {}
+        for key, value in attributes.items():
+            parts = key.split(".")
+            if len(parts) == 3 and parts[0] == "llm":
+                operation = operations.setdefault(parts[1], {})
+                operation[parts[2]] = round(value, 6)
+        return {
+            "calls": int(attributes.get("llm.calls", 0)),
+            "prompt_tokens": int(attributes.get("llm.prompt_tokens", 0)),
+            "completion_tokens": int(attributes.get("llm.completion_tokens", 0)),
+            "cost_usd": round(attributes.get("llm.cost_usd", 0.0), 6),
+            "operations": operations,
+        }
@@ -0,0 +1,239 @@
+import asyncio
+import time
+from typing import Awaitable, Callable, List, Optional, TypeVar
+
+from playwright.async_api import async_playwright
+
+from interfaces.i_async_browser_pool import IAsyncBrowserPool
+from interfaces.i_browser_pool import BrowserPoolExhaustedError
+from logs.logger_singleton import Logger
+
+T = TypeVar("T")
+
+
+class _BrowserSlot:
+    """
+    One pooled browser and its page counters.
+    """
+
+    def __init__(self):
+        self.browser = None
+        self.active = 0
+        self.served = 0
+        self.retiring = False
+        self.lock = asyncio.Lock()
+
+
+class AsyncPlaywrightBrowserPool(IAsyncBrowserPool):
+    """
+    Pool of long-lived headless Chromium browsers for async callers.
+
+    Each browser serves up to ``pages_per_browser`` concurrent pages, each
+    in its own browser context. A browser is retired after
+    ``max_pages_per_browser`` pages or when it crashes; it is closed once
+    its last in-flight page finishes and a fresh one takes its slot.
+    At most ``max_queue`` callers may wait for a page; beyond that, or
+    after ``acquire_timeout``, callers get BrowserPoolExhaustedError.
+
+    Attributes:
+        size (int): Number of browsers.
+        pages_per_browser (int): Concurrent pages per browser.
+        max_pages_per_browser (int): Pages served before a browser restarts.
+        max_queue (int): Callers allowed to wait for a page.
+        acquire_timeout (float): Default seconds to wait for a page.
+    """
+
+    def __init__(
+        self,
+        size: int = 2,
+        pages_per_browser: int = 4,
+        max_pages_per_browser: int = 100,
+        max_queue: int = 32,
+        acquire_timeout: float = 30.0,
+        logger=None,
+    ):
+        """
+        Initialize pool configuration. Browsers launch lazily after ``start()``.
+
+        Args:
+            size (int): Number of pooled browsers.
+            pages_per_browser (int): Concurrent pages allowed per browser.
+            max_pages_per_browser (int): Recycle a browser after this many pages.
+            max_queue (int): Maximum number of callers waiting for a page.
+            acquire_timeout (float): Default seconds to wait for a page.
+            logger (Logger, optional): A logger instance. If None, a default
+                logger is created using the class name.
+        """
+        self.size = size
+        self.pages_per_browser = pages_per_browser
+        self.max_pages_per_browser = max_pages_per_browser
+        self.max_queue = max_queue
+        self.acquire_timeout = acquire_timeout
+        self.logger = logger or Logger(self.__class__.__name__)
+
+        self._playwright = None
+        self._slots: List[_BrowserSlot] = []
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+        self._waiting = 0
+        self._busy = 0
+        self._tasks = 0
+        self._failures = 0
+        self._recycles = 0
+        self._rejected = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+
+    @property
+    def capacity(self) -> int:
+        """Total number of pages the pool serves concurrently."""
+        return self.size * self.pages_per_browser
+
+    async def start(self) -> None:
+        """
+        Start the Playwright driver. Browsers launch on first use.
+        """
+        if self._playwright is not None:
+            return
+        self._playwright = await async_playwright().start()
+        self._slots = [_BrowserSlot() for _ in range(self.size)]
+        self._semaphore = asyncio.Semaphore(self.capacity)
+        self.logger.info(
+            f"Async browser pool started: {self.size} browsers x "
+            f"{self.pages_per_browser} pages"
+        )
+
+    async def close(self) -> None:
+        """
+        Close every browser and stop the Playwright driver.
+        """
+        if self._playwright is None:
+            return
+        for slot in self._slots:
+            await self._safe_close(slot)
+        self._slots = []
+        await self._playwright.stop()
+        self._playwright = None
+        self.logger.info("Async browser pool closed")
+
+    async def run(
+        self, task: Callable[..., Awaitable[T]], timeout: Optional[float] = None
+    ) -> T:
+        """
+        Await ``task(page)`` on a fresh page in an isolated browser context.
+
+        Args:
+            task (Callable): Coroutine function receiving a Playwright page.
+            timeout (float, optional): Seconds to wait for a free page.
+                Defaults to ``acquire_timeout``.
+
+        Returns:
+            The value returned by ``task``.
+
+        Raises:
+            RuntimeError: If the pool has not been started.
+            BrowserPoolExhaustedError: If too many callers are already waiting
+                or no page frees up before the timeout.
+        """
+        if self._playwright is None:
+            raise RuntimeError("Browser pool is not started")
+
+        if self._waiting >= self.max_queue and self._semaphore.locked():
+            self._rejected += 1
+            raise BrowserPoolExhaustedError("Browser pool queue is full")
+
+        enqueued_at = time.perf_counter()
+        self._waiting += 1
+        try:
+            await asyncio.wait_for(
+                self._semaphore.acquire(),
+                timeout=self.acquire_timeout if timeout is None else timeout,
+            )
+        except asyncio.TimeoutError:
+            self._rejected += 1
+            raise BrowserPoolExhaustedError("Timed out waiting for a browser page")
+        finally:
+            self._waiting -= 1
+
+        waited = time.perf_counter() - enqueued_at
+        self._tasks += 1
+        self._busy += 1
+        self._wait_total += waited
+        self._wait_max = max(self._wait_max, waited)
+
+        slot = min(self._slots, key=lambda s: s.active)
+        slot.active += 1
+        try:
+            browser = await self._ensure_browser(slot)
+            context = await browser.new_context()
+            try:
+                page = await context.new_page()
+                return await task(page)
+            finally:
+                await context.close()
+        except Exception:
+            self._failures += 1
+            if slot.browser is not None and not slot.browser.is_connected():
+                self.logger.warning("Browser crashed, recycling")
+                self._retire(slot)
+            raise
+        finally:
+            slot.active -= 1
+            slot.served += 1
+            self._busy -= 1
+            self._semaphore.release()
+
+            if slot.served >= self.max_pages_per_browser:
+                self._retire(slot)
+            if slot.retiring and slot.active == 0:
+                await self._safe_close(slot)
+
+    def stats(self) -> dict:
+        """
+        Return pool metrics.
+
+        Returns:
+            dict: Capacity, busy pages, utilisation, waiting callers, task and
+            recycle counters, and average/maximum wait in seconds.
+        """
+        return {
+            "size": self.size,
+            "capacity": self.capacity,
+            "busy": self._busy,
+            "utilisation": self._busy / self.capacity if self.capacity else 0.0,
+            "queued": self._waiting,
+            "tasks": self._tasks,
+            "failures": self._failures,
+            "rejected": self._rejected,
+            "recycles": self._recycles,
+            "wait_avg_seconds": self._wait_total / self._tasks if self._tasks else 0.0,
+            "wait_max_seconds": self._wait_max,
+        }
+
+    async def _ensure_browser(self, slot: _BrowserSlot):
+        """
+        Launch the slot's browser if it is missing or disconnected.
+        """
+        async with slot.lock:
+            if slot.browser is None or not slot.browser.is_connected():
+                slot.browser = await self._playwright.chromium.launch(headless=True)
+        return slot.browser
+
+    def _retire(self, slot: _BrowserSlot) -> None:
+        """
+        Replace ``slot`` with a fresh one; the old browser closes once idle.
+        """
+        if slot.retiring:
+            return
+        slot.retiring = True
+        self._recycles += 1
+        self._slots[self._slots.index(slot)] = _BrowserSlot()
+
+    async def _safe_close(self, slot: _BrowserSlot) -> None:
+        browser, slot.browser = slot.browser, None
+        if browser is None:
+            return
+        try:
+            await browser.close()
+        except Exception as e:
+            self.logger.error(f"Error closing browser: {e}")
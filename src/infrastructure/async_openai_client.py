@@ -0,0 +1,106 @@
+from typing import AsyncIterator, Optional
+
+import httpx
+from openai import AsyncOpenAI
+
+from interfaces.i_api_key_provider import IApiKeyProvider
+from interfaces.i_async_ai_client import IAsyncAIClient
+
+
+class AsyncOpenAIClientWrapper(IAsyncAIClient):
+    """
+    Concrete wrapper for the OpenAI Python library's async client.
+
+    Attributes:
+        key_provider (str): API key obtained from IApiKeyProvider.
+        client (AsyncOpenAI): Async OpenAI client instance.
+        model (str): Model name to use for chat completions.
+        json_mode (bool): Whether completions are requested as JSON objects.
+    """
+
+    def __init__(
+        self,
+        key_provider: IApiKeyProvider,
+        model: str = "gpt-4",
+        http_client: Optional[httpx.AsyncClient] = None,
+        timeout: Optional[float] = None,
+        max_retries: Optional[int] = None,
+        json_mode: bool = False,
+    ):
+        """
+        Initialize async OpenAI client wrapper.
+
+        Args:
+            key_provider (IApiKeyProvider): Interface to obtain OpenAI API key.
+            model (str, optional): Name of the OpenAI model.
+            http_client (optional): Shared HTTP client whose connection pool
+                is reused across wrappers. Defaults to a private client.
+            timeout (float, optional): Seconds one request may take.
+                Defaults to the OpenAI library's timeout.
+            max_retries (int, optional): Retries done by the OpenAI library.
+                Set to 0 when a ResilientAIClient handles retries.
+            json_mode (bool, optional): Ask the API for a JSON object
+                reply; the prompt must mention JSON.
+        """
+        self.key_provider = key_provider.get_api_key()
+        options = {}
+        if timeout is not None:
+            options["timeout"] = timeout
+        if max_retries is not None:
+            options["max_retries"] = max_retries
+        self.client = AsyncOpenAI(
+            api_key=self.key_provider, http_client=http_client, **options
+        )
+        self.model = model
+        self.json_mode = json_mode
+
+    async def chat_completions_create(self, system: str, user: str) -> str:
+        """
+        Calls OpenAI chat completion API without blocking the event loop.
+
+        Args:
+            system (str): System prompt.
+            user (str): User prompt.
+
+        Returns:
+            str: Content of the AI response.
+        """
+        response = await self.client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": system},
+                {"role": "user", "content": user},
+            ],
+            **self._response_format(),
+        )
+        return response
+
+    async def chat_completions_stream(
+        self, system: str, user: str
+    ) -> AsyncIterator[str]:
+        """
+        Calls OpenAI chat completion API with ``stream=True``.
+
+        Args:
+            system (str): System prompt.
+            user (str): User prompt.
+
+        Yields:
+            str: Content deltas as they arrive.
+        """
+        stream = await self.client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": system},
+                {"role": "user", "content": user},
+            ],
+            stream=True,
+        )
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+    def _response_format(self) -> dict:
+        if not self.json_mode:
+            return {}
+        return {"response_format": {"type": "json_object"}}
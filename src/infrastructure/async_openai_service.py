@@ -0,0 +1,241 @@
+import json
+from typing import AsyncIterator, List, Optional
+
+from openai import OpenAIError
+
+from interfaces.i_async_ai_client import IAsyncAIClient
+from interfaces.i_async_openai_operations import IAsyncOpenAIOperations
+from interfaces.i_oneshot_prompt import IPrompt
+from logs.logger_singleton import Logger
+from utils.token_estimate import count_tokens
+
+
+class AsyncOpenAIService(IAsyncOpenAIOperations):
+    """
+    Async service class for interacting with an AI client.
+
+    Attributes:
+        ai_client (IAsyncAIClient): Abstract async AI client, used for the
+            brochure.
+        link_ai_client (IAsyncAIClient): AI client used for link selection.
+        summary_ai_client (IAsyncAIClient): AI client used for content
+            summaries.
+        prompt_provider (IPrompt): Provides system and user prompts.
+        logger (Logger): Logger instance for info and error messages.
+
+    Prompts and token counts are kept per call, never on the instance, so
+    one service can serve concurrent requests; request totals are summed
+    on the request's trace.
+    """
+
+    def __init__(
+        self,
+        ai_client: IAsyncAIClient,
+        prompt_provider: IPrompt,
+        logger=None,
+        link_ai_client: Optional[IAsyncAIClient] = None,
+        summary_ai_client: Optional[IAsyncAIClient] = None,
+    ):
+        """
+        Initialize AsyncOpenAIService with AI client and prompt provider.
+
+        Args:
+            ai_client (IAsyncAIClient): Abstract async AI client.
+            prompt_provider (IPrompt): Provider for system and user prompts.
+            logger (Logger, optional): Logger instance. Defaults to Logger singleton.
+            link_ai_client (IAsyncAIClient, optional): Client for link
+                selection, typically a smaller, faster model. Defaults to
+                ``ai_client``.
+            summary_ai_client (IAsyncAIClient, optional): Client for content
+                summaries. Defaults to ``ai_client``.
+        """
+        self.prompt_provider = prompt_provider
+
+        self.system_prompt = self.prompt_provider.system_prompt()
+        self.brochure_system_prompt = self.prompt_provider.brochure_system_prompt()
+
+        self.summary_system_prompt = self.prompt_provider.summary_system_prompt()
+
+        self.ai_client = ai_client
+        self.link_ai_client = link_ai_client or ai_client
+        self.summary_ai_client = summary_ai_client or ai_client
+        self.logger = logger or Logger(self.__class__.__name__)
+
+    async def select_relevant_links(self, base_url: str, links: list) -> List[str]:
+        """
+        Send prompts to AI client and extract relevant links.
+
+        Args:
+            base_url (str): Website base URL.
+            links (List[str]): List of URLs to filter.
+
+        Returns:
+            List[str]: Relevant links extracted from AI response.
+
+        Raises:
+            Exception: If the request fails or the reply is not valid JSON,
+            so the caller can tell a failed selection from an empty one.
+        """
+        user_prompt = self.prompt_provider.user_prompt(base_url, links)
+        try:
+            self.logger.info("Sending relevent links request to OpenAI API...")
+            response = await self.link_ai_client.chat_completions_create(
+                system=self.system_prompt,
+                user=user_prompt,
+            )
+            self.logger.info("Received response to relevant link from OpenAI API.")
+            self._record_usage("select_links", user_prompt, response)
+
+            content = response.choices[0].message.content
+            self.logger.debug(f"Raw response content: {str(content)[:200]}")
+
+            data = json.loads(content)
+            links = [link["url"] for link in data.get("links", [])]
+
+            self.logger.info("Extracted relevant links")
+            return links
+
+        except json.JSONDecodeError as e:
+            self.logger.error(f"JSON decoding error: {e}")
+            raise
+
+        except OpenAIError as oe:
+            self.logger.error(f"OpenAI API error: {oe}")
+            raise
+
+        except Exception as e:
+            self.logger.error(f"Error during OpenAI API call: {e}")
+            raise
+
+    async def create_brochure(
+        self, company_name: str, contents: str, relevent_links: list
+    ) -> str:
+        """
+        Generate a company brochure via AI client.
+
+        Args:
+            company_name (str): Name of the company.
+            contents (str): Website contents.
+            relevant_links (List[str]): Relevant URLs to include.
+
+        Returns:
+            str: Generated company brochure text.
+
+        Raises:
+            Exception: If the request fails, so a failed generation is
+            never mistaken for a brochure.
+        """
+        brochure_user_prompt = self.prompt_provider.brochure_user_prompt(
+            company_name, contents, relevent_links
+        )
+        try:
+            self.logger.info("Sending brochure request to OpenAI API...")
+            response = await self.ai_client.chat_completions_create(
+                system=self.brochure_system_prompt,
+                user=brochure_user_prompt,
+            )
+            self.logger.info("Received brochure response from OpenAI API.")
+            self._record_usage("brochure", brochure_user_prompt, response)
+
+            content = response.choices[0].message.content
+            self.logger.debug(f"Raw response content: {str(content)[:200]}")
+
+            return content
+
+        except OpenAIError as oe:
+            self.logger.error(f"OpenAI API error: {oe}")
+            raise
+
+        except Exception as e:
+            self.logger.error(f"Unexpected error: {e}")
+            raise
+
+    async def stream_brochure(
+        self, company_name: str, contents: str, relevent_links: list
+    ) -> AsyncIterator[str]:
+        """
+        Generate a company brochure and yield it as it is written.
+
+        Args:
+            company_name (str): Name of the company.
+            contents (str): Website contents.
+            relevant_links (List[str]): Relevant URLs to include.
+
+        Yields:
+            str: Brochure text deltas.
+
+        Raises:
+            Exception: If the request fails, even after some text was
+            yielded, so callers never take a cut-off brochure as complete.
+        """
+        brochure_user_prompt = self.prompt_provider.brochure_user_prompt(
+            company_name, contents, relevent_links
+        )
+        try:
+            self.logger.info("Streaming brochure request to OpenAI API...")
+            parts = []
+            async for chunk in self.ai_client.chat_completions_stream(
+                system=self.brochure_system_prompt,
+                user=brochure_user_prompt,
+            ):
+                parts.append(chunk)
+                yield chunk
+            self.logger.info("Brochure stream from OpenAI API completed.")
+            self._record_usage("brochure", brochure_user_prompt, text="".join(parts))
+
+        except OpenAIError as oe:
+            self.logger.error(f"OpenAI API error: {oe}")
+            raise
+
+        except Exception as e:
+            self.logger.error(f"Unexpected error: {e}")
+            raise
+
+    async def summarize_content(self, contents: str) -> str:
+        """
+        Condense one chunk of website content into brochure notes.
+
+        Args:
+            contents (str): Part of the website contents.
+
+        Returns:
+            str: Summary notes, or an empty string if the request fails.
+        """
+        summary_user_prompt = self.prompt_provider.summary_user_prompt(contents)
+        try:
+            self.logger.info("Sending content summary request to OpenAI API...")
+            response = await self.summary_ai_client.chat_completions_create(
+                system=self.summary_system_prompt,
+                user=summary_user_prompt,
+            )
+            self._record_usage("summary", summary_user_prompt, response)
+            return response.choices[0].message.content or ""
+
+        except OpenAIError as oe:
+            self.logger.error(f"OpenAI API error: {oe}")
+            return ""
+
+        except Exception as e:
+            self.logger.error(f"Unexpected error: {e}")
+            return ""
+
+    def _record_usage(self, operation: str, user: str, response=None, text=None):
+        """
+        Log one call's token usage with its input size.
+
+        Uses the usage reported by the API when available; streamed
+        responses carry none, so their tokens are counted locally.
+        """
+        reported = getattr(response, "usage", None)
+        if reported is not None:
+            prompt_tokens = reported.prompt_tokens
+            completion_tokens = reported.completion_tokens
+        else:
+            model = self.ai_client.model
+            prompt_tokens = count_tokens(user, model)
+            completion_tokens = count_tokens(text or "", model)
+
+        self.logger.info(
+            f"Token usage for {operation}: prompt={prompt_tokens} "
+            f"completion={completion_tokens} input_chars={len(user)}"
+        )
@@ -0,0 +1,295 @@
+import asyncio
+import time
+from typing import Dict, List, Optional, Tuple, Union
+
+from playwright.async_api import async_playwright
+
+from core.load_profile import LOAD_PROFILES, LoadProfile
+from core.page_snapshot import PageSnapshot
+from core.scrape_stats import ScrapeStats
+from core.tracer import Tracer
+from infrastructure.html_extractor import BeautifulSoupExtractor
+from infrastructure.http_fetcher import HttpPageFetcher
+from interfaces.i_async_browser_pool import IAsyncBrowserPool
+from interfaces.i_async_scraper import IAsyncScraperProvider
+from interfaces.i_browser_pool import BrowserPoolExhaustedError
+from interfaces.i_html_extractor import IHtmlExtractor
+from logs.logger_singleton import Logger
+
+
+class AsyncPlaywrightWebScraper(IAsyncScraperProvider):
+    """
+    Playwright scraper built on ``playwright.async_api``.
+
+    Same behaviour as PlaywrightWebScraper, but page loads are awaited so
+    many scrapes can share one event loop. With a browser pool, pages are
+    rendered on shared long-lived browsers. The HTTP fast path runs in a
+    worker thread.
+    """
+
+    def __init__(
+        self,
+        timeout: int = 10000,
+        logger=None,
+        browser_pool: Optional[IAsyncBrowserPool] = None,
+        load_profile: Optional[LoadProfile] = None,
+        stats: Optional[ScrapeStats] = None,
+        http_fetcher: Optional[HttpPageFetcher] = None,
+        extractor: Optional[IHtmlExtractor] = None,
+        tracer: Optional[Tracer] = None,
+    ):
+        """
+        Initialize scraper configuration.
+
+        Args:
+            timeout (int): Timeout in milliseconds.
+            logger (Logger, optional): A logger instance. If None, a default
+                logger is created using the class name.
+            browser_pool (IAsyncBrowserPool, optional): Shared browser pool.
+                If None, a private browser is launched per page load.
+            load_profile (LoadProfile, optional): How pages are loaded.
+                Defaults to the ``full`` profile.
+            stats (ScrapeStats, optional): Collector for load timings and
+                bytes.
+            http_fetcher (HttpPageFetcher, optional): Client for the HTTP
+                fast path. Created on demand for profiles that use it.
+            extractor (IHtmlExtractor, optional): Parses loaded pages.
+                Defaults to BeautifulSoupExtractor.
+            tracer (Tracer, optional): Records page loads as spans.
+        """
+        self.timeout = timeout
+        self.browser_pool = browser_pool
+        self.logger = logger or Logger(self.__class__.__name__)
+        self.extractor = extractor or BeautifulSoupExtractor(logger=self.logger)
+        self.load_profile = load_profile or LOAD_PROFILES["full"]
+        self.stats = stats
+        self.http_fetcher = http_fetcher
+        self.tracer = tracer or Tracer(logger=self.logger)
+        if self.load_profile.http_first and self.http_fetcher is None:
+            self.http_fetcher = HttpPageFetcher(logger=self.logger)
+
+    async def fetch_page(self, url: str) -> PageSnapshot:
+        """
+        Load ``url`` and parse its text and links.
+
+        A page the load profile leaves with too little text is rendered
+        again with the ``full`` profile.
+
+        Args:
+            url (str): The page to load.
+
+        Returns:
+            PageSnapshot: Rendered HTML, text content and internal links.
+        """
+        self.logger.info(f"Capturing page snapshot: {url}")
+        with self.tracer.span(
+            "scrape.page", url=url, profile=self.load_profile.name
+        ) as span:
+            started = time.perf_counter()
+            fallback = False
+            if self.load_profile.http_first:
+                with self.tracer.span("scrape.http"):
+                    html, headers, transferred = await asyncio.to_thread(
+                        self.http_fetcher.fetch, url
+                    )
+                snapshot = self._parse(url, html, headers)
+                if len(snapshot.text) >= self.load_profile.min_text_chars:
+                    span.set(method="http", bytes=transferred)
+                    self._record("http", started, transferred)
+                    return snapshot
+                self.logger.info(f"Too little text over HTTP, rendering: {url}")
+                fallback = True
+
+            metrics = {"bytes": 0, "blocked": 0}
+            with self.tracer.span("scrape.render"):
+                html, headers = await self._render(url, self.load_profile, metrics)
+            snapshot = self._parse(url, html, headers)
+            full_render = (
+                not self.load_profile.renders_fully
+                and len(snapshot.text) < self.load_profile.min_text_chars
+            )
+            if full_render:
+                # Blocked stylesheets or an early read can leave the page empty
+                self.logger.info(f"Too little text rendered, rendering fully: {url}")
+                full = LOAD_PROFILES["full"]
+                with self.tracer.span("scrape.render", profile=full.name):
+                    html, headers = await self._render(url, full, metrics)
+                rendered = self._parse(url, html, headers)
+                if len(rendered.text) >= len(snapshot.text):
+                    snapshot = rendered
+            span.set(
+                method="browser", fallback=fallback, full_render=full_render, **metrics
+            )
+            self._record(
+                "browser",
+                started,
+                metrics["bytes"],
+                metrics["blocked"],
+                fallback,
+                full_render,
+            )
+            return snapshot
+
+    async def fetch_links(self, url: str) -> List[str]:
+        """
+        Extract all valid internal links from a webpage.
+
+        Args:
+            url (str): The page to load.
+
+        Returns:
+            List[str]: A list of unique internal URLs found on the page.
+        """
+        return list((await self.fetch_page(url)).links)
+
+    async def fetch_content(self, url: str) -> str:
+        """
+        Extract all main text content from the webpage.
+
+        Args:
+            url (str): The page to load.
+
+        Returns:
+            str: Text paragraphs extracted from the page.
+        """
+        return (await self.fetch_page(url)).text
+
+    def _parse(
+        self, url: str, content: Union[str, dict], headers: Dict[str, str]
+    ) -> PageSnapshot:
+        with self.tracer.span("scrape.parse") as span:
+            if isinstance(content, dict):
+                # Extracted inside the page by the extractor's page_script
+                snapshot = self.extractor.extract_page_data(url, content)
+            else:
+                snapshot = self.extractor.extract(url, content)
+            span.set(text_chars=len(snapshot.text), links=len(snapshot.links))
+        snapshot.etag = headers.get("etag")
+        snapshot.last_modified = headers.get("last-modified")
+        return snapshot
+
+    def _record(
+        self,
+        method,
+        started,
+        transferred=0,
+        blocked=0,
+        fallback=False,
+        full_render=False,
+    ):
+        if self.stats is not None:
+            self.stats.record(
+                self.load_profile.name,
+                method,
+                time.perf_counter() - started,
+                transferred=transferred,
+                blocked=blocked,
+                fallback=fallback,
+                full_render=full_render,
+            )
+
+    async def _render(
+        self, url: str, profile: LoadProfile, metrics: dict
+    ) -> Tuple[Union[str, dict], Dict[str, str]]:
+        """
+        Render ``url`` in headless Chromium and return its HTML.
+
+        Args:
+            url (str): The page to load.
+            profile (LoadProfile): What to block and when the page is ready.
+            metrics (dict): Receives ``bytes`` and ``blocked`` counts.
+
+        Returns:
+            Tuple[Union[str, dict], Dict[str, str]]: Rendered HTML, or the
+            extractor's in-page result, and the main response headers;
+            empty values on failure.
+        """
+        try:
+            if self.browser_pool is not None:
+                return await self.browser_pool.run(
+                    lambda page: self._load(page, url, profile, metrics)
+                )
+
+            async with async_playwright() as p:
+                # Launch headless Chromium
+                browser = await p.chromium.launch(headless=True)
+                try:
+                    return await self._load(
+                        await browser.new_page(), url, profile, metrics
+                    )
+                finally:
+                    await browser.close()
+        except BrowserPoolExhaustedError:
+            # Let backpressure reach the caller instead of an empty page
+            raise
+        except Exception as e:
+            self.logger.error(f"Error rendering page: {e}")
+            return "", {}
+
+    async def _load(
+        self, page, url: str, profile: LoadProfile, metrics: dict
+    ) -> Tuple[Union[str, dict], Dict[str, str]]:
+        """
+        Navigate ``page`` to ``url`` and return the rendered HTML.
+
+        Requests are blocked and readiness is decided by ``profile``.
+
+        Args:
+            page (Page): Playwright page to navigate.
+            url (str): The page to load.
+            profile (LoadProfile): What to block and when the page is ready.
+            metrics (dict): Receives ``bytes`` and ``blocked`` counts.
+
+        Returns:
+            Tuple[Union[str, dict], Dict[str, str]]: Rendered HTML, or the
+            extractor's in-page result, and the main response headers;
+            empty values on timeout.
+        """
+        if profile.blocks_requests:
+            await page.route("**/*", lambda route: self._route(route, profile, metrics))
+        page.on("response", lambda response: self._count_bytes(response, metrics))
+
+        try:
+            if profile.wait_until == "networkidle":
+                # Go to the URL and wait until network is idle
+                response = await page.goto(url, timeout=self.timeout)
+                await page.wait_for_load_state("networkidle")
+            else:
+                response = await page.goto(
+                    url, wait_until=profile.wait_until, timeout=self.timeout
+                )
+        except Exception as e:
+            self.logger.error(f"Timeout loading page: {url} | {e}")
+            return "", {}
+
+        if profile.ready_selector:
+            try:
+                await page.wait_for_selector(
+                    profile.ready_selector, timeout=self.timeout
+                )
+            except Exception as e:
+                self.logger.warning(f"Ready selector not found on {url} | {e}")
+        if profile.settle_ms:
+            # Give late client-side rendering a moment to finish
+            await page.wait_for_timeout(profile.settle_ms)
+
+        headers = response.headers if response is not None else {}
+        if self.extractor.page_script:
+            return await page.evaluate(self.extractor.page_script), headers
+
+        # Get rendered HTML
+        return await page.content(), headers
+
+    async def _route(self, route, profile: LoadProfile, metrics: dict) -> None:
+        request = route.request
+        if profile.should_block(request.resource_type, request.url):
+            metrics["blocked"] += 1
+            await route.abort()
+        else:
+            await route.continue_()
+
+    @staticmethod
+    def _count_bytes(response, metrics: dict) -> None:
+        length = response.headers.get("content-length")
+        if length and length.isdigit():
+            metrics["bytes"] += int(length)
@@ -0,0 +1,293 @@
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Callable, List, Optional, TypeVar
+
+from playwright.sync_api import sync_playwright
+
+from interfaces.i_browser_pool import BrowserPoolExhaustedError, IBrowserPool
+from logs.logger_singleton import Logger
+
+T = TypeVar("T")
+
+_STOP = object()
+
+
+class PlaywrightBrowserPool(IBrowserPool):
+    """
+    Pool of long-lived headless Chromium browsers shared across requests.
+
+    Playwright's sync API is bound to the thread that started it, so each
+    slot is a worker thread owning one browser. Callers submit page tasks
+    through a bounded queue; every task gets its own browser context, so
+    cookies and storage never leak between requests. A browser is
+    recycled after ``max_pages_per_browser`` pages or when it crashes.
+    If every worker thread exits, for example because Playwright failed to
+    start, waiting callers get an error instead of blocking forever.
+
+    It serves the sync ``PlaywrightWebScraper`` built by
+    ``create_orchestrator`` for threaded callers such as the benchmarks;
+    the API and batch runner use ``AsyncPlaywrightBrowserPool``.
+
+    Attributes:
+        size (int): Number of browsers (and worker threads).
+        max_pages_per_browser (int): Pages served before a browser restarts.
+        max_queue (int): Pending tasks allowed before callers are refused.
+        acquire_timeout (float): Default seconds to wait for a queue slot.
+        task_timeout (float): Seconds a caller waits for its task to finish.
+    """
+
+    def __init__(
+        self,
+        size: int = 2,
+        max_pages_per_browser: int = 100,
+        max_queue: int = 32,
+        acquire_timeout: float = 30.0,
+        task_timeout: float = 120.0,
+        logger=None,
+    ):
+        """
+        Initialize pool configuration. Browsers launch on ``start()``.
+
+        Args:
+            size (int): Number of pooled browsers.
+            max_pages_per_browser (int): Recycle a browser after this many pages.
+            max_queue (int): Maximum number of tasks waiting for a browser.
+            acquire_timeout (float): Default seconds to wait when the queue is full.
+            task_timeout (float): Seconds to wait for a queued task's result.
+            logger (Logger, optional): A logger instance. If None, a default
+                logger is created using the class name.
+        """
+        self.size = size
+        self.max_pages_per_browser = max_pages_per_browser
+        self.max_queue = max_queue
+        self.acquire_timeout = acquire_timeout
+        self.task_timeout = task_timeout
+        self.logger = logger or Logger(self.__class__.__name__)
+
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        self._workers: List[threading.Thread] = []
+        self._started = False
+        self._closing = False
+
+        self._stats_lock = threading.Lock()
+        self._alive = 0
+        self._busy = 0
+        self._tasks = 0
+        self._failures = 0
+        self._recycles = 0
+        self._rejected = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+
+    def start(self) -> None:
+        """
+        Start one worker thread (and browser) per pool slot.
+        """
+        if self._started:
+            return
+        self._started = True
+        self._closing = False
+        with self._stats_lock:
+            self._alive = self.size
+        for index in range(self.size):
+            worker = threading.Thread(
+                target=self._worker_loop, name=f"browser-pool-{index}", daemon=True
+            )
+            worker.start()
+            self._workers.append(worker)
+        self.logger.info(f"Browser pool started with {self.size} browsers")
+
+    def close(self) -> None:
+        """
+        Stop all workers and close their browsers.
+        """
+        if not self._started:
+            return
+        self._closing = True
+        self._fail_pending("Browser pool is closed")
+        for _ in self._workers:
+            try:
+                self._queue.put(_STOP, timeout=self.acquire_timeout)
+            except queue.Full:
+                self.logger.warning("Browser pool queue full while closing")
+                break
+        for worker in self._workers:
+            worker.join(timeout=30)
+        self._workers.clear()
+        self._started = False
+        self.logger.info("Browser pool closed")
+
+    def run(self, task: Callable[..., T], timeout: Optional[float] = None) -> T:
+        """
+        Run ``task(page)`` on a fresh page in an isolated browser context.
+
+        Args:
+            task (Callable): Callable receiving a Playwright page.
+            timeout (float, optional): Seconds to wait for room in the queue.
+                Defaults to ``acquire_timeout``.
+
+        Returns:
+            The value returned by ``task``.
+
+        Raises:
+            RuntimeError: If the pool has not been started, is closing, or
+                has no worker left.
+            BrowserPoolExhaustedError: If the queue stays full until timeout.
+            TimeoutError: If the task does not finish within ``task_timeout``.
+        """
+        if not self._started or self._closing:
+            raise RuntimeError("Browser pool is not started")
+        with self._stats_lock:
+            if not self._alive:
+                raise RuntimeError("Browser pool has no running workers")
+
+        future: Future = Future()
+        try:
+            self._queue.put(
+                (task, future, time.perf_counter()),
+                timeout=self.acquire_timeout if timeout is None else timeout,
+            )
+        except queue.Full:
+            with self._stats_lock:
+                self._rejected += 1
+            raise BrowserPoolExhaustedError("Browser pool is exhausted")
+
+        try:
+            return future.result(timeout=self.task_timeout)
+        except FutureTimeoutError:
+            # Drops the task if no worker has picked it up yet
+            future.cancel()
+            raise TimeoutError(f"Browser task timed out after {self.task_timeout}s")
+
+    def stats(self) -> dict:
+        """
+        Return pool metrics.
+
+        Returns:
+            dict: Size, busy slots, utilisation, queue depth, task and
+            recycle counters, and average/maximum queue wait in seconds.
+        """
+        with self._stats_lock:
+            return {
+                "size": self.size,
+                "alive": self._alive,
+                "busy": self._busy,
+                "utilisation": self._busy / self.size if self.size else 0.0,
+                "queued": self._queue.qsize(),
+                "tasks": self._tasks,
+                "failures": self._failures,
+                "rejected": self._rejected,
+                "recycles": self._recycles,
+                "wait_avg_seconds": (
+                    self._wait_total / self._tasks if self._tasks else 0.0
+                ),
+                "wait_max_seconds": self._wait_max,
+            }
+
+    def _worker_loop(self) -> None:
+        """
+        Serve tasks until stopped; the last worker to exit fails the tasks
+        still queued, so their callers do not wait for nothing.
+        """
+        reason = "Browser pool is closed"
+        try:
+            self._serve()
+        except Exception as e:
+            reason = f"Browser pool worker exited: {e}"
+            self.logger.error(reason)
+        finally:
+            with self._stats_lock:
+                self._alive -= 1
+                last = self._alive == 0
+            if last:
+                self._fail_pending(reason)
+
+    def _serve(self) -> None:
+        """
+        Own one Playwright instance and serve queued tasks until stopped.
+        """
+        with sync_playwright() as p:
+            browser = None
+            pages_served = 0
+
+            while True:
+                job = self._queue.get()
+                if job is _STOP:
+                    break
+
+                task, future, enqueued_at = job
+                waited = time.perf_counter() - enqueued_at
+                with self._stats_lock:
+                    self._busy += 1
+                    self._tasks += 1
+                    self._wait_total += waited
+                    self._wait_max = max(self._wait_max, waited)
+
+                if not future.set_running_or_notify_cancel():
+                    with self._stats_lock:
+                        self._busy -= 1
+                    continue
+
+                try:
+                    if browser is None or not browser.is_connected():
+                        browser = p.chromium.launch(headless=True)
+                        pages_served = 0
+
+                    context = browser.new_context()
+                    try:
+                        page = context.new_page()
+                        result = task(page)
+                    finally:
+                        context.close()
+                except Exception as e:
+                    with self._stats_lock:
+                        self._failures += 1
+                    future.set_exception(e)
+                    if browser is not None and not browser.is_connected():
+                        self.logger.warning("Browser crashed, recycling")
+                        self._retire(browser)
+                        browser = None
+                else:
+                    future.set_result(result)
+                finally:
+                    pages_served += 1
+                    with self._stats_lock:
+                        self._busy -= 1
+
+                if browser is not None and pages_served >= self.max_pages_per_browser:
+                    self.logger.info(f"Recycling browser after {pages_served} pages")
+                    self._retire(browser)
+                    browser = None
+
+            if browser is not None:
+                self._safe_close(browser)
+
+    def _fail_pending(self, reason: str) -> None:
+        while True:
+            try:
+                job = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            if job is _STOP:
+                continue
+            _, future, _ = job
+            if future.set_running_or_notify_cancel():
+                future.set_exception(RuntimeError(reason))
+
+    def _retire(self, browser) -> None:
+        """
+        Close a browser and count it as recycled; the caller drops its
+        reference so the next task launches a fresh one.
+        """
+        self._safe_close(browser)
+        with self._stats_lock:
+            self._recycles += 1
+
+    def _safe_close(self, browser) -> None:
+        try:
+            browser.close()
+        except Exception as e:
+            self.logger.error(f"Error closing browser: {e}")
@@ -0,0 +1,201 @@
+import json
+import time
+from typing import AsyncIterator
+
+from openai.types.chat import ChatCompletion
+
+from interfaces.i_ai_client import IAIClient
+from interfaces.i_async_ai_client import IAsyncAIClient
+from interfaces.i_response_cache import IResponseCache
+from logs.logger_singleton import Logger
+from utils.request_hash import chat_request_key
+
+
+class _ResponseCachePolicy:
+    """
+    Key, read and write logic shared by the sync and async decorators.
+
+    ``bypass`` skips the cache entirely. ``refresh`` skips the read but
+    stores the new response, replacing any cached one. ``json_mode`` is
+    part of the key, since it changes what the API returns, and with
+    ``json_reply`` replies that are not valid JSON are never stored, so a
+    malformed answer is retried instead of replayed.
+    """
+
+    def __init__(
+        self,
+        ai_client,
+        cache: IResponseCache,
+        bypass: bool,
+        refresh: bool,
+        json_mode: bool,
+        json_reply: bool,
+        logger,
+    ):
+        self.ai_client = ai_client
+        self.cache = cache
+        self.bypass = bypass
+        self.refresh = refresh
+        self.json_mode = json_mode
+        self.json_reply = json_reply
+        self.logger = logger or Logger(self.__class__.__name__)
+
+    @property
+    def model(self) -> str:
+        return self.ai_client.model
+
+    def _key(self, system: str, user: str) -> str:
+        return chat_request_key(self.model, system, user, json_mode=self.json_mode)
+
+    def _read(self, key: str):
+        if self.bypass or self.refresh:
+            return None
+        payload = self.cache.get(key)
+        if payload is None:
+            return None
+        self.logger.info(f"LLM response cache hit: {key[:12]}")
+        return ChatCompletion.model_validate_json(payload)
+
+    def _write_text(self, key: str, content: str) -> None:
+        """
+        Store streamed output as a regular chat completion.
+        """
+        self._write(
+            key,
+            ChatCompletion.model_validate(
+                {
+                    "id": f"stream-{key[:12]}",
+                    "object": "chat.completion",
+                    "created": int(time.time()),
+                    "model": self.model,
+                    "choices": [
+                        {
+                            "index": 0,
+                            "finish_reason": "stop",
+                            "message": {"role": "assistant", "content": content},
+                        }
+                    ],
+                }
+            ),
+        )
+
+    def _write(self, key: str, response) -> None:
+        if self.bypass:
+            return
+        if self.json_reply:
+            try:
+                json.loads(response.choices[0].message.content or "")
+            except ValueError:
+                self.logger.warning(f"Not caching malformed JSON reply: {key[:12]}")
+                return
+        try:
+            self.cache.set(key, response.model_dump_json())
+        except Exception as e:
+            self.logger.error(f"Could not cache LLM response: {e}")
+
+
+class CachedAIClient(_ResponseCachePolicy, IAIClient):
+    """
+    Response cache in front of a synchronous AI client.
+    """
+
+    def __init__(
+        self,
+        ai_client: IAIClient,
+        cache: IResponseCache,
+        bypass: bool = False,
+        refresh: bool = False,
+        json_mode: bool = False,
+        json_reply: bool = False,
+        logger=None,
+    ):
+        """
+        Wrap ``ai_client`` with a response cache.
+
+        Args:
+            ai_client (IAIClient): Client used on cache misses.
+            cache (IResponseCache): Response store.
+            bypass (bool): Neither read nor write the cache.
+            refresh (bool): Ignore cached responses but store the new one.
+            json_mode (bool): ``ai_client`` requests JSON objects from the API.
+            json_reply (bool): Only cache replies that parse as JSON.
+            logger (Logger, optional): A logger instance. If None, a default
+                logger is created using the class name.
+        """
+        super().__init__(
+            ai_client, cache, bypass, refresh, json_mode, json_reply, logger
+        )
+
+    def chat_completions_create(self, system: str, user: str) -> str:
+        key = self._key(system, user)
+        cached = self._read(key)
+        if cached is not None:
+            return cached
+
+        response = self.ai_client.chat_completions_create(system=system, user=user)
+        self._write(key, response)
+        return response
+
+
+class AsyncCachedAIClient(_ResponseCachePolicy, IAsyncAIClient):
+    """
+    Response cache in front of an async AI client.
+    """
+
+    def __init__(
+        self,
+        ai_client: IAsyncAIClient,
+        cache: IResponseCache,
+        bypass: bool = False,
+        refresh: bool = False,
+        json_mode: bool = False,
+        json_reply: bool = False,
+        logger=None,
+    ):
+        """
+        Wrap ``ai_client`` with a response cache.
+
+        Args:
+            ai_client (IAsyncAIClient): Client used on cache misses.
+            cache (IResponseCache): Response store.
+            bypass (bool): Neither read nor write the cache.
+            refresh (bool): Ignore cached responses but store the new one.
+            json_mode (bool): ``ai_client`` requests JSON objects from the API.
+            json_reply (bool): Only cache replies that parse as JSON.
+            logger (Logger, optional): A logger instance. If None, a default
+                logger is created using the class name.
+        """
+        super().__init__(
+            ai_client, cache, bypass, refresh, json_mode, json_reply, logger
+        )
+
+    async def chat_completions_create(self, system: str, user: str) -> str:
+        key = self._key(system, user)
+        cached = self._read(key)
+        if cached is not None:
+            return cached
+
+        response = await self.ai_client.chat_completions_create(
+            system=system, user=user
+        )
+        self._write(key, response)
+        return response
+
+    async def chat_completions_stream(
+        self, system: str, user: str
+    ) -> AsyncIterator[str]:
+        key = self._key(system, user)
+        cached = self._read(key)
+        if cached is not None:
+            yield cached.choices[0].message.content
+            return
+
+        parts = []
+        async for chunk in self.ai_client.chat_completions_stream(
+            system=system, user=user
+        ):
+            parts.append(chunk)
+            yield chunk
+
+        # Only complete streams are cached
+        self._write_text(key, "".join(parts))
@@ -0,0 +1,195 @@
+import asyncio
+import threading
+import time
+from dataclasses import replace
+from typing import List, Optional, Tuple
+
+from core.page_cache_entry import PageCacheEntry
+from core.page_snapshot import PageSnapshot
+from infrastructure.http_revalidator import HttpRevalidator
+from interfaces.i_async_scraper import IAsyncScraperProvider
+from interfaces.i_page_cache import IPageCache
+from interfaces.i_scraper import IScraperProvider
+from logs.logger_singleton import Logger
+from utils.url_utils import normalize_url
+
+
+class _PageCachePolicy:
+    """
+    Lookup, store and counter logic shared by the sync and async decorators.
+
+    A fresh entry is served directly. A stale entry with validators is
+    revalidated with a conditional HTTP request and, if unchanged, served
+    with a renewed TTL. Everything else is rendered by the wrapped scraper.
+    """
+
+    def __init__(
+        self,
+        cache: IPageCache,
+        ttl: float,
+        revalidator: Optional[HttpRevalidator],
+        logger,
+    ):
+        self.cache = cache
+        self.ttl = ttl
+        self.revalidator = revalidator
+        self.logger = logger or Logger(self.__class__.__name__)
+
+        self._counter_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+
+    def _cached(self, key: str) -> Tuple[Optional[PageCacheEntry], bool]:
+        """
+        Return ``(entry, fresh)``. A stale entry is only returned when it
+        can be revalidated.
+        """
+        entry = self.cache.get(key)
+        if entry is None:
+            return None, False
+        if entry.is_fresh():
+            self._count("hits")
+            self.logger.info(f"Page cache hit: {key}")
+            return entry, True
+        if entry.can_revalidate and self.revalidator is not None:
+            return entry, False
+        return None, False
+
+    def _renew(self, key: str, entry: PageCacheEntry) -> PageCacheEntry:
+        renewed = replace(entry, stored_at=time.time())
+        self.cache.set(key, renewed)
+        self._count("revalidated")
+        self.logger.info(f"Page cache revalidated: {key}")
+        return renewed
+
+    def _store(self, key: str, snapshot: PageSnapshot) -> None:
+        self._count("misses")
+        # In-page extraction leaves html empty, so check the parsed data
+        if snapshot.text or snapshot.links:
+            self.cache.set(key, PageCacheEntry.from_snapshot(key, snapshot, self.ttl))
+
+    def _count(self, name: str) -> None:
+        with self._counter_lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def stats(self) -> dict:
+        """
+        Return decorator counters together with the cache's own stats.
+        """
+        with self._counter_lock:
+            lookups = self.hits + self.misses + self.revalidated
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "revalidated": self.revalidated,
+                "hit_rate": (
+                    (self.hits + self.revalidated) / lookups if lookups else 0.0
+                ),
+                "cache": self.cache.stats(),
+            }
+
+
+class CachedScraperProvider(_PageCachePolicy, IScraperProvider):
+    """
+    Page cache in front of a synchronous scraper.
+    """
+
+    def __init__(
+        self,
+        scraper: IScraperProvider,
+        cache: IPageCache,
+        ttl: float = 3600.0,
+        revalidator: Optional[HttpRevalidator] = None,
+        logger=None,
+    ):
+        """
+        Wrap ``scraper`` with a page cache.
+
+        Args:
+            scraper (IScraperProvider): Scraper used on cache misses.
+            cache (IPageCache): Page store.
+            ttl (float): Seconds a stored page stays fresh.
+            revalidator (HttpRevalidator, optional): Conditional-request checker
+                for stale entries. If None, stale entries are re-rendered.
+            logger (Logger, optional): A logger instance. If None, a default
+                logger is created using the class name.
+        """
+        super().__init__(cache, ttl, revalidator, logger)
+        self.scraper = scraper
+
+    def fetch_page(self, url: str) -> PageSnapshot:
+        key = normalize_url(url)
+
+        entry, fresh = self._cached(key)
+        if fresh:
+            return entry.to_snapshot(url)
+
+        if entry is not None and self.revalidator.is_unchanged(
+            url, entry.etag, entry.last_modified
+        ):
+            return self._renew(key, entry).to_snapshot(url)
+
+        snapshot = self.scraper.fetch_page(url)
+        self._store(key, snapshot)
+        return snapshot
+
+    def fetch_links(self, url: str) -> List[str]:
+        return list(self.fetch_page(url).links)
+
+    def fetch_content(self, url: str) -> str:
+        return self.fetch_page(url).text
+
+
+class AsyncCachedScraperProvider(_PageCachePolicy, IAsyncScraperProvider):
+    """
+    Page cache in front of an async scraper.
+
+    Revalidation requests run in a worker thread so they never block the
+    event loop.
+    """
+
+    def __init__(
+        self,
+        scraper: IAsyncScraperProvider,
+        cache: IPageCache,
+        ttl: float = 3600.0,
+        revalidator: Optional[HttpRevalidator] = None,
+        logger=None,
+    ):
+        """
+        Wrap ``scraper`` with a page cache.
+
+        Args:
+            scraper (IAsyncScraperProvider): Scraper used on cache misses.
+            cache (IPageCache): Page store.
+            ttl (float): Seconds a stored page stays fresh.
+            revalidator (HttpRevalidator, optional): Conditional-request checker
+                for stale entries. If None, stale entries are re-rendered.
+            logger (Logger, optional): A logger instance. If None, a default
+                logger is created using the class name.
+        """
+        super().__init__(cache, ttl, revalidator, logger)
+        self.scraper = scraper
+
+    async def fetch_page(self, url: str) -> PageSnapshot:
+        key = normalize_url(url)
+
+        entry, fresh = self._cached(key)
+        if fresh:
+            return entry.to_snapshot(url)
+
+        if entry is not None and await asyncio.to_thread(
+            self.revalidator.is_unchanged, url, entry.etag, entry.last_modified
+        ):
+            return self._renew(key, entry).to_snapshot(url)
+
+        snapshot = await self.scraper.fetch_page(url)
+        self._store(key, snapshot)
+        return snapshot
+
+    async def fetch_links(self, url: str) -> List[str]:
+        return list((await self.fetch_page(url)).links)
+
+    async def fetch_content(self, url: str) -> str:
+        return (await self.fetch_page(url)).text
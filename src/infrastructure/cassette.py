@@ -0,0 +1,132 @@
+import gzip
+import json
+import os
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+from core.cassette_entry import CassetteEntry, CassetteMode
+from interfaces.i_cassette import CassetteMissError, ICassette
+from logs.logger_singleton import Logger
+
+
+class JsonlCassette(ICassette):
+    """
+    Cassette stored as one JSON line per interaction, gzip-compressed when
+    the path ends in ``.gz``.
+
+    Recording appends each interaction as soon as it completes, so an
+    interrupted run keeps what it recorded; when a call is recorded more
+    than once, the last recording is replayed. Gzip members can be
+    concatenated, so appending to a compressed cassette stays cheap.
+
+    Attributes:
+        path (str): Cassette file.
+        mode (str): One of the CassetteMode values.
+        strict (bool): In replay, raise CassetteMissError on a miss
+            instead of calling the real provider and recording its answer.
+        latency_scale (float): Share of each call's recorded duration to
+            wait before replaying it; 0 replays at once.
+    """
+
+    def __init__(
+        self,
+        path: str = "cassette.jsonl.gz",
+        mode: str = CassetteMode.REPLAY,
+        strict: bool = True,
+        latency_scale: float = 0.0,
+        logger=None,
+    ):
+        """
+        Open the cassette, loading its recordings for replay.
+
+        Args:
+            path (str): Cassette file; created when recording.
+            mode (str): ``record`` or ``replay``.
+            strict (bool): Fail replay misses instead of falling through.
+            latency_scale (float): Multiplier of recorded durations.
+            logger (Logger, optional): A logger instance. If None, a default
+                logger is created using the class name.
+        """
+        self.path = path
+        self.mode = mode
+        self.strict = strict
+        self.latency_scale = latency_scale
+        self.logger = logger or Logger(self.__class__.__name__)
+
+        self._entries: Dict[Tuple[str, str], CassetteEntry] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.recorded = 0
+
+        if mode == CassetteMode.REPLAY:
+            self._load()
+
+    def lookup(self, kind: str, key: str) -> Optional[CassetteEntry]:
+        if self.mode != CassetteMode.REPLAY:
+            return None
+        with self._lock:
+            entry = self._entries.get((kind, key))
+            if entry is not None:
+                self.hits += 1
+                return entry
+            self.misses += 1
+
+        if self.strict:
+            raise CassetteMissError(kind, key)
+        self.logger.warning(f"Cassette miss, calling the provider: {kind} {key}")
+        return None
+
+    def record(self, kind: str, key: str, payload: Any, elapsed: float) -> None:
+        # Replay misses that fell through are recorded for the next run
+        if self.mode == CassetteMode.REPLAY and self.strict:
+            return
+        if self.mode not in (CassetteMode.RECORD, CassetteMode.REPLAY):
+            return
+
+        entry = CassetteEntry(kind, key, payload, elapsed)
+        line = json.dumps(entry.to_dict(), ensure_ascii=False) + "\n"
+        with self._lock:
+            self._entries[(kind, key)] = entry
+            try:
+                with self._open("at") as f:
+                    f.write(line)
+            except OSError as e:
+                self.logger.error(f"Could not write cassette {self.path}: {e}")
+                return
+            self.recorded += 1
+
+    def latency(self, entry: CassetteEntry) -> float:
+        return entry.elapsed * self.latency_scale
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "mode": self.mode,
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "recorded": self.recorded,
+            }
+
+    def _open(self, mode: str):
+        if self.path.endswith(".gz"):
+            return gzip.open(self.path, mode, encoding="utf-8")
+        return open(self.path, mode, encoding="utf-8")
+
+    def _load(self) -> None:
+        if not os.path.exists(self.path):
+            self.logger.warning(f"Cassette {self.path} does not exist")
+            return
+        try:
+            with self._open("rt") as f:
+                for line in f:
+                    try:
+                        entry = CassetteEntry(**json.loads(line))
+                    except (TypeError, ValueError):
+                        # A run killed mid-write can leave a truncated line
+                        continue
+                    self._entries[(entry.kind, entry.key)] = entry
+        except (OSError, EOFError) as e:
+            self.logger.error(f"Could not read all of cassette {self.path}: {e}")
+        self.logger.info(f"Loaded {len(self._entries)} recordings from {self.path}")
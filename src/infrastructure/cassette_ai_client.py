@@ -0,0 +1,143 @@
+import asyncio
+import time
+from typing import AsyncIterator, Optional
+
+from openai.types.chat import ChatCompletion
+
+from core.cassette_entry import CassetteEntry
+from interfaces.i_ai_client import IAIClient
+from interfaces.i_async_ai_client import IAsyncAIClient
+from interfaces.i_cassette import ICassette
+from logs.logger_singleton import Logger
+from utils.request_hash import chat_request_key
+
+CHAT = "chat"
+STREAM = "stream"
+
+
+class _CassetteAIPolicy:
+    """
+    Key, replay and record logic shared by the sync and async decorators.
+
+    Requests are keyed like the response cache, by model and prompts.
+    Chat completions are recorded whole; streams as their list of chunks,
+    so replay keeps the chunk boundaries the orchestrator saw.
+    """
+
+    def __init__(self, ai_client, cassette: ICassette, logger):
+        self.ai_client = ai_client
+        self.cassette = cassette
+        self.logger = logger or Logger(self.__class__.__name__)
+
+    @property
+    def model(self) -> str:
+        return self.ai_client.model
+
+    def _key(self, system: str, user: str) -> str:
+        return chat_request_key(self.model, system, user)
+
+    def _replayed(self, kind: str, key: str) -> Optional[CassetteEntry]:
+        return self.cassette.lookup(kind, key)
+
+    @staticmethod
+    def _completion(entry: CassetteEntry):
+        return ChatCompletion.model_validate(entry.payload)
+
+    def _record(self, key: str, response, elapsed: float) -> None:
+        try:
+            payload = response.model_dump(mode="json")
+        except Exception as e:
+            self.logger.error(f"Could not record LLM response: {e}")
+            return
+        self.cassette.record(CHAT, key, payload, elapsed)
+
+    def stats(self) -> dict:
+        return self.cassette.stats()
+
+
+class CassetteAIClient(_CassetteAIPolicy, IAIClient):
+    """
+    Records or replays a synchronous AI client's completions.
+    """
+
+    def __init__(self, ai_client: IAIClient, cassette: ICassette, logger=None):
+        """
+        Wrap ``ai_client`` with a cassette.
+
+        Args:
+            ai_client (IAIClient): Client recorded, or called on replay
+                misses that fall through.
+            cassette (ICassette): Recorded interactions.
+            logger (Logger, optional): A logger instance. If None, a default
+                logger is created using the class name.
+        """
+        super().__init__(ai_client, cassette, logger)
+
+    def chat_completions_create(self, system: str, user: str) -> str:
+        key = self._key(system, user)
+        entry = self._replayed(CHAT, key)
+        if entry is not None:
+            time.sleep(self.cassette.latency(entry))
+            return self._completion(entry)
+
+        start = time.perf_counter()
+        response = self.ai_client.chat_completions_create(system=system, user=user)
+        self._record(key, response, time.perf_counter() - start)
+        return response
+
+
+class AsyncCassetteAIClient(_CassetteAIPolicy, IAsyncAIClient):
+    """
+    Records or replays an async AI client's completions and streams.
+    """
+
+    def __init__(self, ai_client: IAsyncAIClient, cassette: ICassette, logger=None):
+        """
+        Wrap ``ai_client`` with a cassette.
+
+        Args:
+            ai_client (IAsyncAIClient): Client recorded, or called on replay
+                misses that fall through.
+            cassette (ICassette): Recorded interactions.
+            logger (Logger, optional): A logger instance. If None, a default
+                logger is created using the class name.
+        """
+        super().__init__(ai_client, cassette, logger)
+
+    async def chat_completions_create(self, system: str, user: str) -> str:
+        key = self._key(system, user)
+        entry = self._replayed(CHAT, key)
+        if entry is not None:
+            await asyncio.sleep(self.cassette.latency(entry))
+            return self._completion(entry)
+
+        start = time.perf_counter()
+        response = await self.ai_client.chat_completions_create(
+            system=system, user=user
+        )
+        self._record(key, response, time.perf_counter() - start)
+        return response
+
+    async def chat_completions_stream(
+        self, system: str, user: str
+    ) -> AsyncIterator[str]:
+        key = self._key(system, user)
+        entry = self._replayed(STREAM, key)
+        if entry is not None:
+            # Spread the recorded duration over the chunks
+            delay = self.cassette.latency(entry) / max(len(entry.payload), 1)
+            for chunk in entry.payload:
+                await asyncio.sleep(delay)
+                yield chunk
+            return
+
+        start = time.perf_counter()
+        chunks = []
+        async for chunk in self.ai_client.chat_completions_stream(
+            system=system, user=user
+        ):
+            chunks.append(chunk)
+            yield chunk
+
+        # Only complete streams are recorded
+        self.cassette.record(STREAM, key, chunks, time.perf_counter() - start)
@@ -0,0 +1,115 @@
+import asyncio
+import time
+from dataclasses import asdict
+from typing import List, Optional
+
+from core.cassette_entry import CassetteEntry
+from core.page_snapshot import PageSnapshot
+from interfaces.i_async_scraper import IAsyncScraperProvider
+from interfaces.i_cassette import ICassette
+from interfaces.i_scraper import IScraperProvider
+from logs.logger_singleton import Logger
+from utils.url_utils import normalize_url
+
+PAGE = "page"
+
+
+class _CassetteScraperPolicy:
+    """
+    Key, replay and record logic shared by the sync and async decorators.
+
+    Pages are keyed by normalised URL, and the whole snapshot is recorded:
+    rendered HTML together with the extracted text, links and validators.
+    """
+
+    def __init__(self, scraper, cassette: ICassette, logger):
+        self.scraper = scraper
+        self.cassette = cassette
+        self.logger = logger or Logger(self.__class__.__name__)
+
+    def _replayed(self, url: str) -> Optional[CassetteEntry]:
+        return self.cassette.lookup(PAGE, normalize_url(url))
+
+    @staticmethod
+    def _snapshot(url: str, entry: CassetteEntry) -> PageSnapshot:
+        return PageSnapshot(**{**entry.payload, "url": url})
+
+    def _record(self, url: str, snapshot: PageSnapshot, elapsed: float) -> None:
+        self.cassette.record(PAGE, normalize_url(url), asdict(snapshot), elapsed)
+
+    def stats(self) -> dict:
+        return self.cassette.stats()
+
+
+class CassetteScraperProvider(_CassetteScraperPolicy, IScraperProvider):
+    """
+    Records or replays a synchronous scraper's page loads.
+    """
+
+    def __init__(self, scraper: IScraperProvider, cassette: ICassette, logger=None):
+        """
+        Wrap ``scraper`` with a cassette.
+
+        Args:
+            scraper (IScraperProvider): Scraper recorded, or called on
+                replay misses that fall through.
+            cassette (ICassette): Recorded interactions.
+            logger (Logger, optional): A logger instance. If None, a default
+                logger is created using the class name.
+        """
+        super().__init__(scraper, cassette, logger)
+
+    def fetch_page(self, url: str) -> PageSnapshot:
+        entry = self._replayed(url)
+        if entry is not None:
+            time.sleep(self.cassette.latency(entry))
+            return self._snapshot(url, entry)
+
+        start = time.perf_counter()
+        snapshot = self.scraper.fetch_page(url)
+        self._record(url, snapshot, time.perf_counter() - start)
+        return snapshot
+
+    def fetch_links(self, url: str) -> List[str]:
+        return list(self.fetch_page(url).links)
+
+    def fetch_content(self, url: str) -> str:
+        return self.fetch_page(url).text
+
+
+class AsyncCassetteScraperProvider(_CassetteScraperPolicy, IAsyncScraperProvider):
+    """
+    Records or replays an async scraper's page loads.
+    """
+
+    def __init__(
+        self, scraper: IAsyncScraperProvider, cassette: ICassette, logger=None
+    ):
+        """
+        Wrap ``scraper`` with a cassette.
+
+        Args:
+            scraper (IAsyncScraperProvider): Scraper recorded, or called on
+                replay misses that fall through.
+            cassette (ICassette): Recorded interactions.
+            logger (Logger, optional): A logger instance. If None, a default
+                logger is created using the class name.
+        """
+        super().__init__(scraper, cassette, logger)
+
+    async def fetch_page(self, url: str) -> PageSnapshot:
+        entry = self._replayed(url)
+        if entry is not None:
+            await asyncio.sleep(self.cassette.latency(entry))
+            return self._snapshot(url, entry)
+
+        start = time.perf_counter()
+        snapshot = await self.scraper.fetch_page(url)
+        self._record(url, snapshot, time.perf_counter() - start)
+        return snapshot
+
+    async def fetch_links(self, url: str) -> List[str]:
+        return list((await self.fetch_page(url)).links)
+
+    async def fetch_content(self, url: str) -> str:
+        return (await self.fetch_page(url)).text
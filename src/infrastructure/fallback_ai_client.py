@@ -0,0 +1,123 @@
+from typing import AsyncIterator, List, Optional
+
+from core.llm_usage_stats import LLMUsageStats
+from interfaces.i_ai_client import IAIClient
+from interfaces.i_async_ai_client import IAsyncAIClient
+from logs.logger_singleton import Logger
+
+
+class _FallbackPolicy:
+    """
+    Client order and fallback bookkeeping shared by the sync and async
+    decorators.
+    """
+
+    def __init__(
+        self,
+        ai_clients: list,
+        operation: str,
+        usage_stats: Optional[LLMUsageStats],
+        logger,
+    ):
+        """
+        Try ``ai_clients`` in order for every call.
+
+        Args:
+            ai_clients (list): One client per model, primary first. Each
+                should do its own retries, so falling back only happens
+                once a model has failed for good.
+            operation (str): Operation served, used in logs and stats.
+            usage_stats (LLMUsageStats, optional): Counts fallbacks.
+            logger (Logger, optional): Logger instance.
+        """
+        if not ai_clients:
+            raise ValueError("At least one AI client is required")
+        self.ai_clients = ai_clients
+        self.operation = operation
+        self.usage_stats = usage_stats
+        self.logger = logger or Logger(self.__class__.__name__)
+
+    @property
+    def model(self) -> str:
+        return self.ai_clients[0].model
+
+    def _fallback(self, ai_client, error: Exception) -> None:
+        self.logger.warning(
+            f"{self.operation} on {ai_client.model} failed "
+            f"({type(error).__name__}: {error}), falling back"
+        )
+        if self.usage_stats is not None:
+            self.usage_stats.record_fallback(self.operation, ai_client.model)
+
+
+class FallbackAIClient(_FallbackPolicy, IAIClient):
+    """
+    Calls the next model in line when a call to the current one fails.
+
+    ``model`` reports the primary model, so response cache keys and
+    content budgets do not depend on which model answered.
+    """
+
+    def __init__(
+        self,
+        ai_clients: List[IAIClient],
+        operation: str,
+        usage_stats: Optional[LLMUsageStats] = None,
+        logger=None,
+    ):
+        super().__init__(ai_clients, operation, usage_stats, logger)
+
+    def chat_completions_create(self, system: str, user: str) -> str:
+        for ai_client in self.ai_clients[:-1]:
+            try:
+                return ai_client.chat_completions_create(system=system, user=user)
+            except Exception as e:
+                self._fallback(ai_client, e)
+        return self.ai_clients[-1].chat_completions_create(system=system, user=user)
+
+
+class AsyncFallbackAIClient(_FallbackPolicy, IAsyncAIClient):
+    """
+    Async counterpart of FallbackAIClient. Streams fall back only until
+    their first chunk has been yielded.
+    """
+
+    def __init__(
+        self,
+        ai_clients: List[IAsyncAIClient],
+        operation: str,
+        usage_stats: Optional[LLMUsageStats] = None,
+        logger=None,
+    ):
+        super().__init__(ai_clients, operation, usage_stats, logger)
+
+    async def chat_completions_create(self, system: str, user: str) -> str:
+        for ai_client in self.ai_clients[:-1]:
+            try:
+                return await ai_client.chat_completions_create(system=system, user=user)
+            except Exception as e:
+                self._fallback(ai_client, e)
+        return await self.ai_clients[-1].chat_completions_create(
+            system=system, user=user
+        )
+
+    async def chat_completions_stream(
+        self, system: str, user: str
+    ) -> AsyncIterator[str]:
+        for ai_client in self.ai_clients:
+            stream = ai_client.chat_completions_stream(system=system, user=user)
+            try:
+                first = await stream.__anext__()
+            except StopAsyncIteration:
+                return
+            except Exception as e:
+                await stream.aclose()
+                if ai_client is self.ai_clients[-1]:
+                    raise
+                self._fallback(ai_client, e)
+                continue
+
+            yield first
+            async for chunk in stream:
+                yield chunk
+            return
@@ -0,0 +1,436 @@
+import re
+from abc import abstractmethod
+from typing import Iterable, List, Optional
+from urllib.parse import urljoin, urlparse
+
+from bs4 import BeautifulSoup
+
+from core.extraction_stats import ExtractionStats
+from core.page_snapshot import PageSnapshot
+from interfaces.i_html_extractor import IHtmlExtractor
+from logs.logger_singleton import Logger
+
+try:
+    import lxml.etree
+    import lxml.html
+except ImportError:  # optional fast backend
+    lxml = None
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # optional fast backend
+    LexborHTMLParser = None
+
+# Collects link targets and paragraph text inside the page, so only the
+# extracted data crosses the browser boundary instead of the whole HTML
+PAGE_EXTRACT_SCRIPT = """
+() => {
+    const text = (element) => {
+        const walker = document.createTreeWalker(element, NodeFilter.SHOW_TEXT);
+        const parts = [];
+        while (walker.nextNode()) parts.push(walker.currentNode.nodeValue.trim());
+        return parts.join("");
+    };
+    return {
+        links: Array.from(
+            document.querySelectorAll("a[href]"), (a) => a.getAttribute("href")
+        ),
+        paragraphs: Array.from(document.querySelectorAll("p"), text),
+    };
+}
+"""
+
+
+class _BaseExtractor(IHtmlExtractor):
+    """
+    Link filtering and snapshot assembly shared by every backend, so all
+    extractors keep the same links and join text the same way.
+    """
+
+    def __init__(self, logger=None):
+        """
+        Initialize the extractor.
+
+        Args:
+            logger (Logger, optional): A logger instance. If None, a default
+                logger is created using the class name.
+        """
+        self.logger = logger or Logger(self.__class__.__name__)
+
+    def extract_page_data(self, url: str, data: dict) -> PageSnapshot:
+        """
+        Build a snapshot from the links and paragraphs collected in the page.
+
+        Args:
+            url (str): The URL that was loaded.
+            data (dict): ``links`` and ``paragraphs`` from ``page_script``.
+
+        Returns:
+            PageSnapshot: Parsed snapshot of the page, without HTML.
+        """
+        return self._snapshot(
+            url, data.get("links", []), data.get("paragraphs", [])
+        )
+
+    def _snapshot(
+        self, url: str, hrefs: Iterable[str], paragraphs: Iterable[str]
+    ) -> PageSnapshot:
+        links = set()
+        base_domain = urlparse(url).netloc
+        skipped = 0
+
+        for href in hrefs:
+            href = (href or "").strip()
+
+            # Skip empty, mailto, tel, and anchor links
+            if not href or href.startswith(("mailto:", "tel:", "#")):
+                skipped += 1
+                continue
+
+            # Convert relative to absolute
+            absolute = urljoin(url, href)
+
+            # Keep only same-domain absolute URLs
+            if urlparse(absolute).netloc == base_domain:
+                links.add(absolute)
+
+        if skipped:
+            self.logger.debug(f"Skipped {skipped} empty, mailto, tel or anchor links")
+
+        text = "\n\n".join(p for p in paragraphs if p)
+        return PageSnapshot(url=url, text=text, links=list(links))
+
+    @staticmethod
+    def _strip_join(strings: Iterable[str]) -> str:
+        # Same text as BeautifulSoup's get_text(strip=True)
+        return "".join(s.strip() for s in strings)
+
+
+class _HtmlExtractor(_BaseExtractor):
+    """
+    Base for backends that parse HTML in Python, each implementing
+    ``_parse``.
+    """
+
+    def extract(self, url: str, html: str) -> PageSnapshot:
+        """
+        Parse the HTML once and extract both internal links and paragraphs.
+
+        Args:
+            url (str): The URL the HTML was loaded from.
+            html (str): Rendered HTML.
+
+        Returns:
+            PageSnapshot: Parsed snapshot of the page.
+        """
+        if not html:
+            return PageSnapshot(url=url)
+
+        try:
+            hrefs, paragraphs = self._parse(html)
+        except Exception as e:
+            self.logger.error(f"Error parsing page: {e}")
+            hrefs, paragraphs = [], []
+
+        snapshot = self._snapshot(url, hrefs, paragraphs)
+        snapshot.html = html
+        return snapshot
+
+    @abstractmethod
+    def _parse(self, html: str):
+        """
+        Return the ``href`` values and paragraph texts of ``html``.
+        """
+        pass
+
+
+class BeautifulSoupExtractor(_HtmlExtractor):
+    """
+    Extracts internal links and paragraph text with BeautifulSoup.
+
+    Pure Python and always available; the reference for the fast backends.
+    """
+
+    def _parse(self, html: str):
+        soup = BeautifulSoup(html, "html.parser")
+        hrefs = [tag["href"] for tag in soup.find_all("a", href=True)]
+        paragraphs = [
+            self._strip_join(p_tag.strings) for p_tag in soup.find_all("p")
+        ]
+        return hrefs, paragraphs
+
+
+class LxmlExtractor(_HtmlExtractor):
+    """
+    Extracts links and paragraphs with lxml's C parser in one tree walk.
+    """
+
+    def __init__(self, logger=None):
+        if lxml is None:
+            raise ImportError("LxmlExtractor requires the 'lxml' package")
+        super().__init__(logger)
+
+    def _parse(self, html: str):
+        hrefs = []
+        paragraphs = []
+        for element in lxml.html.document_fromstring(html).iter("a", "p"):
+            if element.tag == "a":
+                href = element.get("href")
+                if href is not None:
+                    hrefs.append(href)
+            else:
+                paragraphs.append(self._strip_join(element.itertext()))
+        return hrefs, paragraphs
+
+
+class SelectolaxExtractor(_HtmlExtractor):
+    """
+    Extracts links and paragraphs with selectolax's lexbor parser.
+
+    Usually the fastest backend with the smallest memory footprint.
+    """
+
+    def __init__(self, logger=None):
+        if LexborHTMLParser is None:
+            raise ImportError("SelectolaxExtractor requires the 'selectolax' package")
+        super().__init__(logger)
+
+    def _parse(self, html: str):
+        tree = LexborHTMLParser(html)
+        hrefs = [node.attributes.get("href") for node in tree.css("a[href]")]
+        paragraphs = [
+            node.text(deep=True, separator="", strip=True) for node in tree.css("p")
+        ]
+        return hrefs, paragraphs
+
+
+class InPageExtractor(_BaseExtractor):
+    """
+    Extracts links and paragraphs inside the browser with one
+    ``page.evaluate`` call, so the page's HTML is never serialised and
+    sent to Python. HTML fetched without a browser is parsed by
+    ``fallback`` instead.
+
+    Snapshots built in the page carry no HTML.
+    """
+
+    page_script = PAGE_EXTRACT_SCRIPT
+
+    def __init__(self, fallback: Optional[IHtmlExtractor] = None, logger=None):
+        super().__init__(logger)
+        self.fallback = fallback or BeautifulSoupExtractor(logger=self.logger)
+
+    def extract(self, url: str, html: str) -> PageSnapshot:
+        return self.fallback.extract(url, html)
+
+
+class ReadabilityExtractor(_HtmlExtractor):
+    """
+    Extracts the main content of a page, readability-style, keeping its
+    headings and lists.
+
+    Scripts, forms, navigation, footers, asides and elements whose class or
+    id looks like chrome (menus, cookie banners, share bars) are removed.
+    Every text block is then scored from its length and commas, less the
+    share of its text inside links, and its score is added to all of its
+    ancestors. The content root is found by descending from the body while
+    a single child holds at least ``root_share`` of the score, so a landing
+    page made of many sections (hero, feature cards, customers) is kept
+    whole while an article loses the wrappers around it. The root is
+    rendered compactly: headings as ``#`` lines, list items as ``- ``
+    lines and tables one row per line. Links are still collected from the
+    whole page.
+
+    Built on lxml; text lengths, link text and scores are computed in one
+    bottom-up pass over the tree.
+
+    Attributes:
+        min_block_chars (int): Shortest block that counts towards scoring.
+        max_link_density (float): Blocks with a larger share of link text
+            are dropped as navigation.
+        root_share (float): Share of the score a child must hold for the
+            content root to descend into it.
+        stats (Optional[ExtractionStats]): Receives characters of visible
+            text in and main content out for each page.
+    """
+
+    HIDDEN_TAGS = ("script", "style", "noscript", "template")
+    STRIP_TAGS = (
+        "svg",
+        "canvas",
+        "iframe",
+        "form",
+        "button",
+        "select",
+        "nav",
+        "footer",
+        "aside",
+        "dialog",
+    )
+    SCORED_TAGS = ("p", "li", "h2", "h3", "pre", "blockquote", "td", "dd")
+    HEADING_TAGS = ("h1", "h2", "h3", "h4", "h5", "h6")
+    TEXT_TAGS = ("p", "blockquote", "pre", "dd", "dt", "figcaption")
+    KEEP_TAGS = ("html", "body", "main", "article")
+    NEGATIVE = re.compile(
+        r"cookie|consent|gdpr|banner|masthead|site-header|navbar|menu|breadcrumb"
+        r"|footer|sidebar|widget|social|share|subscribe|newsletter|signup"
+        r"|modal|popup|overlay|advert|promo|sponsor|comment|related|skip",
+        re.IGNORECASE,
+    )
+    POSITIVE = re.compile(
+        r"article|content|main|post|entry|story|text|about|hero", re.IGNORECASE
+    )
+
+    def __init__(
+        self,
+        min_block_chars: int = 25,
+        max_link_density: float = 0.5,
+        root_share: float = 0.95,
+        stats: Optional[ExtractionStats] = None,
+        logger=None,
+    ):
+        if lxml is None:
+            raise ImportError("ReadabilityExtractor requires the 'lxml' package")
+        super().__init__(logger)
+        self.min_block_chars = min_block_chars
+        self.max_link_density = max_link_density
+        self.root_share = root_share
+        self.stats = stats
+
+    def _parse(self, html: str):
+        doc = lxml.html.document_fromstring(html)
+        hrefs = [a.get("href") for a in doc.iter("a") if a.get("href") is not None]
+        body = doc.find("body")
+        if body is None:
+            body = doc
+
+        self._drop(body.iter(*self.HIDDEN_TAGS))
+        chars_in = len(self._text(body))
+        self._strip(body)
+
+        chars, link_chars, scores = self._measure(body)
+        blocks: List[str] = []
+        self._render(self._content_root(body, scores), blocks, chars, link_chars)
+
+        chars_out = sum(len(block) for block in blocks)
+        if self.stats is not None:
+            self.stats.record("main_content", chars_in, chars_out)
+        self.logger.debug(f"Main content kept {chars_out} of {chars_in} chars")
+        return hrefs, blocks
+
+    def _strip(self, body) -> None:
+        self._drop(body.iter(*self.STRIP_TAGS))
+        chrome = []
+        for element in body.xpath("descendant-or-self::*[@id or @class]"):
+            names = f"{element.get('id') or ''} {element.get('class') or ''}"
+            if (
+                element.tag not in self.KEEP_TAGS
+                and self.NEGATIVE.search(names)
+                and not self.POSITIVE.search(names)
+            ):
+                chrome.append(element)
+        self._drop(chrome)
+
+    @staticmethod
+    def _drop(elements) -> None:
+        # drop_tree keeps the text that follows the element
+        for element in list(elements):
+            if element.getparent() is not None:
+                element.drop_tree()
+
+    def _measure(self, body):
+        """
+        Return text characters, link text characters and content score of
+        every element, children before parents so each is summed once.
+        """
+        chars, link_chars, scores = {}, {}, {}
+        for element in reversed(list(body.iter(lxml.etree.Element))):
+            length = len((element.text or "").strip())
+            links = 0
+            score = 0.0
+            for child in element:
+                length += len((child.tail or "").strip())
+                if child in chars:
+                    length += chars[child]
+                    links += link_chars[child]
+                    score += scores[child]
+            if element.tag == "a":
+                links = length
+            if element.tag in self.SCORED_TAGS and length >= self.min_block_chars:
+                commas = element.text_content().count(",")
+                block = 1 + commas + min(length // 100, 3)
+                score += block * (1 - min(links / length, 1.0))
+            chars[element] = length
+            link_chars[element] = links
+            scores[element] = score
+        return chars, link_chars, scores
+
+    def _content_root(self, body, scores: dict):
+        root = body
+        while True:
+            children = [child for child in root if child in scores]
+            total = scores.get(root, 0.0)
+            if not children or not total:
+                return root
+            best = max(children, key=scores.get)
+            if scores[best] < total * self.root_share:
+                return root
+            root = best
+
+    def _render(self, node, blocks: List[str], chars: dict, link_chars: dict) -> None:
+        name = node.tag
+        if name in self.HEADING_TAGS:
+            text = self._text(node)
+            if text:
+                blocks.append(f"{'#' * int(name[1])} {text}")
+        elif name in ("ul", "ol"):
+            if self._density(node, chars, link_chars) > self.max_link_density:
+                return
+            items = [self._text(li) for li in node.iterchildren("li")]
+            items = [f"- {item}" for item in items if item]
+            if items:
+                blocks.append("\n".join(items))
+        elif name == "table":
+            rows = [
+                " | ".join(self._text(cell) for cell in row.iter("th", "td"))
+                for row in node.iter("tr")
+            ]
+            rows = [row for row in rows if row.strip(" |")]
+            if rows:
+                blocks.append("\n".join(rows))
+        elif name in self.TEXT_TAGS:
+            text = self._text(node)
+            if text and self._density(node, chars, link_chars) <= self.max_link_density:
+                blocks.append(text)
+        else:
+            # Loose text in layout containers; comments are skipped
+            self._loose(node.text, blocks)
+            for child in node:
+                if isinstance(child.tag, str):
+                    self._render(child, blocks, chars, link_chars)
+                self._loose(child.tail, blocks)
+
+    def _loose(self, text: Optional[str], blocks: List[str]) -> None:
+        text = " ".join((text or "").split())
+        if len(text) >= self.min_block_chars:
+            blocks.append(text)
+
+    @staticmethod
+    def _density(element, chars: dict, link_chars: dict) -> float:
+        length = chars.get(element, 0)
+        if not length:
+            return 0.0
+        return min(link_chars[element] / length, 1.0)
+
+    @staticmethod
+    def _text(element) -> str:
+        return " ".join(element.text_content().split())
+
+
+EXTRACTORS = {
+    "bs4": BeautifulSoupExtractor,
+    "lxml": LxmlExtractor,
+    "selectolax": SelectolaxExtractor,
+    "in_page": InPageExtractor,
+    "readability": ReadabilityExtractor,
+}
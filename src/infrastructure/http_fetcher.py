@@ -0,0 +1,63 @@
+import urllib.request
+from typing import Dict, Tuple
+
+from logs.logger_singleton import Logger
+
+
+class HttpPageFetcher:
+    """
+    Fetches a page's HTML with a plain HTTP GET, without a browser.
+
+    Much cheaper than a render for server-rendered pages; pages that need
+    JavaScript come back with little or no text, and callers are expected
+    to fall back to a browser render for those.
+    """
+
+    USER_AGENT = (
+        "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/124.0 Safari/537.36"
+    )
+
+    def __init__(
+        self, timeout: float = 5.0, max_bytes: int = 5 * 1024 * 1024, logger=None
+    ):
+        """
+        Initialize the fetcher.
+
+        Args:
+            timeout (float): Seconds allowed for the request.
+            max_bytes (int): Largest body read; longer pages are truncated.
+            logger (Logger, optional): A logger instance. If None, a default
+                logger is created using the class name.
+        """
+        self.timeout = timeout
+        self.max_bytes = max_bytes
+        self.logger = logger or Logger(self.__class__.__name__)
+
+    def fetch(self, url: str) -> Tuple[str, Dict[str, str], int]:
+        """
+        GET ``url`` and return its HTML.
+
+        Args:
+            url (str): Page URL.
+
+        Returns:
+            Tuple[str, Dict[str, str], int]: HTML, lower-cased response
+            headers and bytes read; empty values on error or if the
+            response is not HTML.
+        """
+        request = urllib.request.Request(
+            url,
+            headers={"User-Agent": self.USER_AGENT, "Accept": "text/html"},
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                headers = {k.lower(): v for k, v in response.headers.items()}
+                if "html" not in headers.get("content-type", ""):
+                    return "", headers, 0
+                body = response.read(self.max_bytes)
+                charset = response.headers.get_content_charset() or "utf-8"
+                return body.decode(charset, errors="replace"), headers, len(body)
+        except Exception as e:
+            self.logger.warning(f"HTTP fetch failed for {url}: {e}")
+            return "", {}, 0
@@ -0,0 +1,60 @@
+import urllib.error
+import urllib.request
+from typing import Optional
+
+from logs.logger_singleton import Logger
+
+
+class HttpRevalidator:
+    """
+    Checks with a conditional HTTP GET whether a page is unchanged.
+
+    Sends ``If-None-Match`` / ``If-Modified-Since`` and treats a
+    ``304 Not Modified`` answer as proof that the cached page is still
+    valid, which avoids a full browser render.
+    """
+
+    def __init__(self, timeout: float = 3.0, logger=None):
+        """
+        Initialize the revalidator.
+
+        Args:
+            timeout (float): Seconds allowed for the conditional request.
+            logger (Logger, optional): A logger instance. If None, a default
+                logger is created using the class name.
+        """
+        self.timeout = timeout
+        self.logger = logger or Logger(self.__class__.__name__)
+
+    def is_unchanged(
+        self, url: str, etag: Optional[str], last_modified: Optional[str]
+    ) -> bool:
+        """
+        Return True if the server confirms the page has not changed.
+
+        Args:
+            url (str): Page URL.
+            etag (Optional[str]): Stored ETag.
+            last_modified (Optional[str]): Stored Last-Modified value.
+
+        Returns:
+            bool: True on ``304 Not Modified``; False otherwise or on error.
+        """
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        if not headers:
+            return False
+
+        request = urllib.request.Request(url, headers=headers, method="GET")
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                return response.status == 304
+        except urllib.error.HTTPError as e:
+            # urllib surfaces 304 as an HTTPError
+            return e.code == 304
+        except Exception as e:
+            self.logger.warning(f"Revalidation failed for {url}: {e}")
+            return False
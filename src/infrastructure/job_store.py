@@ -0,0 +1,91 @@
+import json
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+
+from core.job import Job
+from interfaces.i_job_store import IJobStore
+
+
+class MemoryJobStore(IJobStore):
+    """
+    In-process job store. Finished jobs disappear once they expire.
+    """
+
+    def __init__(self):
+        self._jobs: Dict[str, Job] = {}
+        self._lock = threading.Lock()
+
+    def save(self, job: Job) -> None:
+        with self._lock:
+            self._jobs[job.id] = job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is not None and job.expires_at and job.expires_at <= time.time():
+                del self._jobs[job_id]
+                return None
+            return job
+
+    def purge_expired(self) -> int:
+        now = time.time()
+        with self._lock:
+            expired = [
+                job_id
+                for job_id, job in self._jobs.items()
+                if job.expires_at and job.expires_at <= now
+            ]
+            for job_id in expired:
+                del self._jobs[job_id]
+        return len(expired)
+
+
+class SqliteJobStore(IJobStore):
+    """
+    Job store backed by a single SQLite file, so results survive restarts.
+    """
+
+    def __init__(self, path: str = "jobs.sqlite3"):
+        """
+        Initialize the store and create its table if needed.
+
+        Args:
+            path (str): SQLite database file.
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            "id TEXT PRIMARY KEY, payload TEXT NOT NULL, expires_at REAL)"
+        )
+        self._conn.commit()
+
+    def save(self, job: Job) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO jobs (id, payload, expires_at) "
+                "VALUES (?, ?, ?)",
+                (job.id, json.dumps(job.to_dict()), job.expires_at),
+            )
+            self._conn.commit()
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload FROM jobs WHERE id = ? "
+                "AND (expires_at IS NULL OR expires_at > ?)",
+                (job_id, time.time()),
+            ).fetchone()
+        return Job(**json.loads(row[0])) if row else None
+
+    def purge_expired(self) -> int:
+        with self._lock:
+            removed = self._conn.execute(
+                "DELETE FROM jobs WHERE expires_at IS NOT NULL AND expires_at <= ?",
+                (time.time(),),
+            ).rowcount
+            self._conn.commit()
+        return removed
@@ -1,3 +1,6 @@
+from typing import Optional
+
+import httpx
 from openai import OpenAI
 
 from interfaces.i_ai_client import IAIClient
@@ -12,19 +15,44 @@ class OpenAIClientWrapper(IAIClient):
         key_provider (str): API key obtained from IApiKeyProvider.
         client (OpenAI): OpenAI client instance.
         model (str): Model name to use for chat completions.
+        json_mode (bool): Whether completions are requested as JSON objects.
     """
 
-    def __init__(self, key_provider: IApiKeyProvider, model: str = "gpt-4"):
+    def __init__(
+        self,
+        key_provider: IApiKeyProvider,
+        model: str = "gpt-4",
+        http_client: Optional[httpx.Client] = None,
+        timeout: Optional[float] = None,
+        max_retries: Optional[int] = None,
+        json_mode: bool = False,
+    ):
         """
         Initialize OpenAI client wrapper.
 
         Args:
             key_provider (IApiKeyProvider): Interface to obtain OpenAI API key.
             model (str, optional): Name of the OpenAI model.
+            http_client (optional): Shared HTTP client whose connection pool
+                is reused across wrappers. Defaults to a private client.
+            timeout (float, optional): Seconds one request may take.
+                Defaults to the OpenAI library's timeout.
+            max_retries (int, optional): Retries done by the OpenAI library.
+                Set to 0 when a ResilientAIClient handles retries.
+            json_mode (bool, optional): Ask the API for a JSON object
+                reply; the prompt must mention JSON.
         """
         self.key_provider = key_provider.get_api_key()
-        self.client = OpenAI(api_key=self.key_provider)
+        options = {}
+        if timeout is not None:
+            options["timeout"] = timeout
+        if max_retries is not None:
+            options["max_retries"] = max_retries
+        self.client = OpenAI(
+            api_key=self.key_provider, http_client=http_client, **options
+        )
         self.model = model
+        self.json_mode = json_mode
 
     def chat_completions_create(self, system: str, user: str) -> str:
         """
@@ -43,5 +71,11 @@ class OpenAIClientWrapper(IAIClient):
                 {"role": "system", "content": system},
                 {"role": "user", "content": user},
             ],
+            **self._response_format(),
         )
         return response
+
+    def _response_format(self) -> dict:
+        if not self.json_mode:
+            return {}
+        return {"response_format": {"type": "json_object"}}
@@ -1,5 +1,5 @@
 import json
-from typing import List
+from typing import List, Optional
 
 from openai import OpenAIError
 
@@ -13,11 +13,13 @@ class OpenAIService(IOpenAIOperations):
     """
     Service class for interacting with an AI client.
 
+    Prompts are built per call and never stored, so one instance can serve
+    concurrent requests.
+
     Attributes:
-        ai_client (IAIClient): Abstract AI client.
+        ai_client (IAIClient): Abstract AI client, used for the brochure.
+        link_ai_client (IAIClient): AI client used for link selection.
         prompt_provider (IPrompt): Provides system and user prompts.
-        client (OpenAI): OpenAI client instance.
-        model (str): OpenAI model to use.
         logger (Logger): Logger instance for info and error messages.
     """
 
@@ -26,6 +28,7 @@ class OpenAIService(IOpenAIOperations):
         ai_client: IAIClient,
         prompt_provider: IPrompt,
         logger=None,
+        link_ai_client: Optional[IAIClient] = None,
     ):
         """
         Initialize OpenAIService with AI client and prompt provider.
@@ -34,17 +37,16 @@ class OpenAIService(IOpenAIOperations):
             ai_client (IAIClient): Abstract AI client.
             prompt_provider (IPrompt): Provider for system and user prompts.
             logger (Logger, optional): Logger instance. Defaults to Logger singleton.
+            link_ai_client (IAIClient, optional): Client for link selection,
+                typically a smaller, faster model. Defaults to ``ai_client``.
         """
         self.prompt_provider = prompt_provider
 
         self.system_prompt = self.prompt_provider.system_prompt()
         self.brochure_system_prompt = self.prompt_provider.brochure_system_prompt()
 
-        self.user_prompt: str = ""
-        self.brochure_user_prompt: str = ""
-
         self.ai_client = ai_client
-        self.model = "gpt-4"
+        self.link_ai_client = link_ai_client or ai_client
 
         self.logger = logger or Logger(self.__class__.__name__)
 
@@ -58,20 +60,24 @@ class OpenAIService(IOpenAIOperations):
 
         Returns:
             List[str]: Relevant links extracted from AI response.
+
+        Raises:
+            Exception: If the request fails or the reply is not valid JSON,
+            so the caller can tell a failed selection from an empty one.
         """
-        self.user_prompt = self.prompt_provider.user_prompt(base_url, links)
+        user_prompt = self.prompt_provider.user_prompt(base_url, links)
         try:
             self.logger.info("Sending relevent links request to OpenAI API...")
             # Create chat completion request
-            response = self.ai_client.chat_completions_create(
+            response = self.link_ai_client.chat_completions_create(
                 system=self.system_prompt,
-                user=self.user_prompt,
+                user=user_prompt,
             )
             self.logger.info("Received response to relevant link from OpenAI API.")
 
             # Extract the raw content from the first choice
             content = response.choices[0].message.content
-            self.logger.debug(f"Raw response content: {content}")
+            self.logger.debug(f"Raw response content: {str(content)[:200]}")
 
             # Convert JSON response to Python dict and extract links
             data = json.loads(content)
@@ -84,17 +90,17 @@ class OpenAIService(IOpenAIOperations):
         except json.JSONDecodeError as e:
             # Handle invalid JSON returned from the AI
             self.logger.error(f"JSON decoding error: {e}")
-            return []
+            raise
 
         except OpenAIError as oe:
             # Handle OpenAI API error
             self.logger.error(f"OpenAI API error: {oe}")
-            return "Error: Failed to generate brochure due to API issue."
+            raise
 
         except Exception as e:
             # Handle any other unexpected errors
             self.logger.error(f"Error during OpenAI API call: {e}")
-            return []
+            raise
 
     def create_brochure(
         self, company_name: str, contents: str, relevent_links: list
@@ -109,8 +115,12 @@ class OpenAIService(IOpenAIOperations):
 
         Returns:
             str: Generated company brochure text.
+
+        Raises:
+            Exception: If the request fails, so a failed generation is
+            never mistaken for a brochure.
         """
-        self.brochure_user_prompt = self.prompt_provider.brochure_user_prompt(
+        brochure_user_prompt = self.prompt_provider.brochure_user_prompt(
             company_name, contents, relevent_links
         )
         try:
@@ -118,22 +128,22 @@ class OpenAIService(IOpenAIOperations):
             # Create chat completion request
             response = self.ai_client.chat_completions_create(
                 system=self.brochure_system_prompt,
-                user=self.brochure_user_prompt,
+                user=brochure_user_prompt,
             )
             self.logger.info("Received brochure response from OpenAI API.")
 
             # Extract the raw content from the first choice
             content = response.choices[0].message.content
-            self.logger.debug(f"Raw response content: {content}")
+            self.logger.debug(f"Raw response content: {str(content)[:200]}")
 
             return content
 
         except OpenAIError as oe:
             # OpenAI API error
             self.logger.error(f"OpenAI API error: {oe}")
-            return "Error: Failed to generate brochure due to API issue."
+            raise
 
         except Exception as e:
             # Handle any other unexpected errors
             self.logger.error(f"Unexpected error: {e}")
-            return "Error: An unexpected error occurred while generating the brochure."
+            raise
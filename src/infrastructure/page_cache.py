@@ -0,0 +1,190 @@
+import json
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+from core.page_cache_entry import PageCacheEntry
+from interfaces.i_page_cache import IPageCache
+from logs.logger_singleton import Logger
+
+
+class MemoryPageCache(IPageCache):
+    """
+    In-process LRU page cache bounded by an approximate byte budget.
+
+    Stale entries are kept until evicted so they can be revalidated
+    instead of re-rendered.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, logger=None):
+        """
+        Initialize the memory tier.
+
+        Args:
+            max_bytes (int): Byte budget for stored text and links.
+            logger (Logger, optional): A logger instance. If None, a default
+                logger is created using the class name.
+        """
+        self.max_bytes = max_bytes
+        self.logger = logger or Logger(self.__class__.__name__)
+
+        self._entries: "OrderedDict[str, PageCacheEntry]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[PageCacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def set(self, key: str, entry: PageCacheEntry) -> None:
+        size = entry.size_bytes
+        if size > self.max_bytes:
+            self.logger.warning(f"Page too large to cache in memory: {key}")
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous.size_bytes
+
+            self._entries[key] = entry
+            self._bytes += size
+
+            # Evict least recently used entries until within budget
+            while self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.size_bytes
+                self.evictions += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+class SqlitePageCache(IPageCache):
+    """
+    On-disk page cache backed by a single SQLite file.
+
+    Keeps at most ``max_entries`` rows; the least recently stored rows are
+    evicted first.
+    """
+
+    def __init__(
+        self, path: str = "page_cache.sqlite3", max_entries: int = 10000, logger=None
+    ):
+        """
+        Initialize the disk tier and create its table if needed.
+
+        Args:
+            path (str): SQLite database file.
+            max_entries (int): Maximum number of stored pages.
+            logger (Logger, optional): A logger instance. If None, a default
+                logger is created using the class name.
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.logger = logger or Logger(self.__class__.__name__)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS pages ("
+            "key TEXT PRIMARY KEY, payload TEXT NOT NULL, stored_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[PageCacheEntry]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload FROM pages WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+
+        try:
+            return PageCacheEntry(**json.loads(row[0]))
+        except (TypeError, ValueError) as e:
+            self.logger.error(f"Corrupt page cache row for {key}: {e}")
+            return None
+
+    def set(self, key: str, entry: PageCacheEntry) -> None:
+        payload = json.dumps(entry.to_dict())
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO pages (key, payload, stored_at) "
+                "VALUES (?, ?, ?)",
+                (key, payload, entry.stored_at),
+            )
+            evicted = self._conn.execute(
+                "DELETE FROM pages WHERE key IN ("
+                "SELECT key FROM pages ORDER BY stored_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            ).rowcount
+            self._conn.commit()
+            self.evictions += max(evicted, 0)
+
+    def stats(self) -> dict:
+        with self._lock:
+            (entries,) = self._conn.execute("SELECT COUNT(*) FROM pages").fetchone()
+            return {
+                "entries": entries,
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+class TieredPageCache(IPageCache):
+    """
+    Memory tier in front of an optional disk tier.
+
+    Disk hits are promoted into memory; writes go to both tiers.
+    """
+
+    def __init__(self, memory: IPageCache, disk: Optional[IPageCache] = None):
+        self.memory = memory
+        self.disk = disk
+
+    def get(self, key: str) -> Optional[PageCacheEntry]:
+        entry = self.memory.get(key)
+        if entry is None and self.disk is not None:
+            entry = self.disk.get(key)
+            if entry is not None:
+                self.memory.set(key, entry)
+        return entry
+
+    def set(self, key: str, entry: PageCacheEntry) -> None:
+        self.memory.set(key, entry)
+        if self.disk is not None:
+            self.disk.set(key, entry)
+
+    def stats(self) -> dict:
+        stats = {"memory": self.memory.stats()}
+        if self.disk is not None:
+            stats["disk"] = self.disk.stats()
+        return stats
@@ -1,9 +1,16 @@
-from typing import List, Optional
-from urllib.parse import urljoin, urlparse
+import time
+from typing import Dict, List, Optional, Tuple, Union
 
-from bs4 import BeautifulSoup
 from playwright.sync_api import Browser, sync_playwright
 
+from core.load_profile import LOAD_PROFILES, LoadProfile
+from core.page_snapshot import PageSnapshot
+from core.scrape_stats import ScrapeStats
+from core.tracer import Tracer
+from infrastructure.html_extractor import BeautifulSoupExtractor
+from infrastructure.http_fetcher import HttpPageFetcher
+from interfaces.i_browser_pool import BrowserPoolExhaustedError, IBrowserPool
+from interfaces.i_html_extractor import IHtmlExtractor
 from interfaces.i_scraper import IScraperProvider
 from logs.logger_singleton import Logger
 
@@ -16,116 +23,275 @@ class PlaywrightWebScraper(IScraperProvider):
     - Handle dynamic JavaScript-rendered pages
     - Extract internal links
     - Extract main text content
+
+    ``fetch_page`` loads and parses a page once and returns its text and
+    links together as a snapshot. The scraper keeps no per-page state, so
+    one instance can scrape for many threads at once. When a browser pool
+    is given, pages are rendered on a shared long-lived browser instead of
+    launching Chromium for every call.
+
+    The load profile decides which requests are blocked, when a page counts
+    as loaded, and whether a plain HTTP fetch is tried first; HTTP pages with
+    too little text fall back to a browser render.
     """
 
-    def __init__(self, timeout: int = 10000, base_url=str, logger=None):
+    def __init__(
+        self,
+        timeout: int = 10000,
+        logger=None,
+        browser_pool: Optional[IBrowserPool] = None,
+        load_profile: Optional[LoadProfile] = None,
+        stats: Optional[ScrapeStats] = None,
+        http_fetcher: Optional[HttpPageFetcher] = None,
+        extractor: Optional[IHtmlExtractor] = None,
+        tracer: Optional[Tracer] = None,
+    ):
         """
         Initialize scraper configuration.
 
         Args:
             Timeout in milliseconds
-            Base URL for link extraction
             logger (Logger, optional): A logger instance. If None, a default logger is created using the class name.
+            browser_pool (IBrowserPool, optional): Shared browser pool. If None,
+                a private browser is launched per page load.
+            load_profile (LoadProfile, optional): How pages are loaded.
+                Defaults to the ``full`` profile.
+            stats (ScrapeStats, optional): Collector for load timings and bytes.
+            http_fetcher (HttpPageFetcher, optional): Client for the HTTP fast
+                path. Created on demand for profiles that use it.
+            extractor (IHtmlExtractor, optional): Parses loaded pages. Defaults
+                to BeautifulSoupExtractor.
+            tracer (Tracer, optional): Records page loads as spans.
         """
         self.timeout = timeout
+        self.browser_pool = browser_pool
         self._playwright = None
         self._browser: Browser | None = None
         self.logger = logger or Logger(self.__class__.__name__)
-        self.base_url = base_url
-        self.links: List[str] = []
-        self.content: Optional[str] = None
+        self.extractor = extractor or BeautifulSoupExtractor(logger=self.logger)
+        self.load_profile = load_profile or LOAD_PROFILES["full"]
+        self.stats = stats
+        self.http_fetcher = http_fetcher
+        self.tracer = tracer or Tracer(logger=self.logger)
+        if self.load_profile.http_first and self.http_fetcher is None:
+            self.http_fetcher = HttpPageFetcher(logger=self.logger)
 
-    def fetch_links(self) -> List[str]:
+    def fetch_page(self, url: str) -> PageSnapshot:
         """
-        Extract all valid internal links from a webpage.
+        Load ``url`` and parse its text and links.
+
+        A page the load profile leaves with too little text is rendered
+        again with the ``full`` profile.
+
+        Args:
+            url (str): The page to load.
 
         Returns:
-            List[str]: A list of unique internal URLs found on the page.
+            PageSnapshot: Rendered HTML, text content and internal links.
         """
-        links = set()
-        self.logger.info(f"Fetching links from: {self.base_url}")
+        self.logger.info(f"Capturing page snapshot: {url}")
+        with self.tracer.span(
+            "scrape.page", url=url, profile=self.load_profile.name
+        ) as span:
+            started = time.perf_counter()
+            fallback = False
+            if self.load_profile.http_first:
+                with self.tracer.span("scrape.http"):
+                    html, headers, transferred = self.http_fetcher.fetch(url)
+                snapshot = self._parse(url, html, headers)
+                if len(snapshot.text) >= self.load_profile.min_text_chars:
+                    span.set(method="http", bytes=transferred)
+                    self._record("http", started, transferred)
+                    return snapshot
+                self.logger.info(f"Too little text over HTTP, rendering: {url}")
+                fallback = True
 
-        try:
-            with sync_playwright() as p:
-                # Launch headless Chromium
-                browser = p.chromium.launch(headless=True)
-                page = browser.new_page()
+            metrics = {"bytes": 0, "blocked": 0}
+            with self.tracer.span("scrape.render"):
+                html, headers = self._render(url, self.load_profile, metrics)
+            snapshot = self._parse(url, html, headers)
+            full_render = (
+                not self.load_profile.renders_fully
+                and len(snapshot.text) < self.load_profile.min_text_chars
+            )
+            if full_render:
+                # Blocked stylesheets or an early read can leave the page empty
+                self.logger.info(f"Too little text rendered, rendering fully: {url}")
+                full = LOAD_PROFILES["full"]
+                with self.tracer.span("scrape.render", profile=full.name):
+                    html, headers = self._render(url, full, metrics)
+                rendered = self._parse(url, html, headers)
+                if len(rendered.text) >= len(snapshot.text):
+                    snapshot = rendered
+            span.set(
+                method="browser", fallback=fallback, full_render=full_render, **metrics
+            )
+            self._record(
+                "browser",
+                started,
+                metrics["bytes"],
+                metrics["blocked"],
+                fallback,
+                full_render,
+            )
+            return snapshot
 
-                try:
-                    # Go to the base URL and wait until network is idle
-                    page.goto(self.base_url, timeout=self.timeout)
-                    page.wait_for_load_state("networkidle")
-                except Exception as e:
-                    self.logger.error(f"Timeout loading page: {self.base_url} | {e}")
-                    return []
+    def fetch_links(self, url: str) -> List[str]:
+        """
+        Extract all valid internal links from a webpage.
 
-                # Get fully rendered HTML
-                html = page.content()
-                soup = BeautifulSoup(html, "html.parser")
+        Args:
+            url (str): The page to load.
 
-                base_domain = urlparse(self.base_url).netloc
+        Returns:
+            List[str]: A list of unique internal URLs found on the page.
+        """
+        return list(self.fetch_page(url).links)
 
-                for tag in soup.find_all("a", href=True):
-                    href = tag["href"].strip()
+    def fetch_content(self, url: str) -> str:
+        """
+        Extract all main text content from the webpage.
 
-                    # Skip empty, mailto, tel, and anchor links
-                    if not href or href.startswith(("mailto:", "tel:", "#")):
-                        self.logger.warning(f"Skipping invalid link: {href}")
-                        continue
+        Args:
+            url (str): The page to load.
 
-                    # Convert relative to absolute
-                    absolute = urljoin(self.base_url, href)
-                    parsed = urlparse(absolute)
+        Returns:
+            str: Text paragraphs extracted from the page.
+        """
+        return self.fetch_page(url).text
 
-                    # Keep only same-domain absolute URLs
-                    if parsed.netloc == base_domain:
-                        links.add(absolute)
+    def _parse(
+        self, url: str, content: Union[str, dict], headers: Dict[str, str]
+    ) -> PageSnapshot:
+        with self.tracer.span("scrape.parse") as span:
+            if isinstance(content, dict):
+                # Extracted inside the page by the extractor's page_script
+                snapshot = self.extractor.extract_page_data(url, content)
+            else:
+                snapshot = self.extractor.extract(url, content)
+            span.set(text_chars=len(snapshot.text), links=len(snapshot.links))
+        snapshot.etag = headers.get("etag")
+        snapshot.last_modified = headers.get("last-modified")
+        return snapshot
 
-                browser.close()
-        except Exception as e:
-            self.logger.error(f"Error fetching links: {e}")
+    def _record(
+        self,
+        method,
+        started,
+        transferred=0,
+        blocked=0,
+        fallback=False,
+        full_render=False,
+    ):
+        if self.stats is not None:
+            self.stats.record(
+                self.load_profile.name,
+                method,
+                time.perf_counter() - started,
+                transferred=transferred,
+                blocked=blocked,
+                fallback=fallback,
+                full_render=full_render,
+            )
 
-        self.links = list(links)
-        return list(links)
-
-    def fetch_content(self) -> str:
+    def _render(
+        self, url: str, profile: LoadProfile, metrics: dict
+    ) -> Tuple[Union[str, dict], Dict[str, str]]:
         """
-        Extract all main text content from the webpage.
+        Render ``url`` in headless Chromium and return its HTML.
+
+        Args:
+            url (str): The page to load.
+            profile (LoadProfile): What to block and when the page is ready.
+            metrics (dict): Receives ``bytes`` and ``blocked`` counts.
 
         Returns:
-            str: Text paragraphs extracted from the page.
+            Tuple[Union[str, dict], Dict[str, str]]: Rendered HTML, or the
+            extractor's in-page result, and the main response headers;
+            empty values on failure.
         """
-        paragraphs = []
-        self.logger.info(f"Fetching content from: {self.base_url}")
-
         try:
+            if self.browser_pool is not None:
+                return self.browser_pool.run(
+                    lambda page: self._load(page, url, profile, metrics)
+                )
+
             with sync_playwright() as p:
                 # Launch headless Chromium
                 browser = p.chromium.launch(headless=True)
-                page = browser.new_page()
-
                 try:
-                    # Go to the base URL and wait for network idle
-                    page.goto(self.base_url, timeout=self.timeout)
-                    page.wait_for_load_state("networkidle")
-                except Exception as e:
-                    self.logger.error(f"Timeout loading page: {self.base_url} | {e}")
-                    return []
-
-                # Get fully rendered HTML
-                html = page.content()
-                soup = BeautifulSoup(html, "html.parser")
-
-                # Close the browser
-                browser.close()
-
-                for p_tag in soup.find_all("p"):
-                    text = p_tag.get_text(strip=True)
-                    if text:
-                        paragraphs.append(text)
-                    else:
-                        self.logger.warning("Found empty paragraph tag, skipping.")
+                    return self._load(browser.new_page(), url, profile, metrics)
+                finally:
+                    browser.close()
+        except BrowserPoolExhaustedError:
+            # Let backpressure reach the caller instead of an empty page
+            raise
+        except Exception as e:
+            self.logger.error(f"Error rendering page: {e}")
+            return "", {}
+
+    def _load(
+        self, page, url: str, profile: LoadProfile, metrics: dict
+    ) -> Tuple[Union[str, dict], Dict[str, str]]:
+        """
+        Navigate ``page`` to ``url`` and return the rendered HTML.
+
+        Requests are blocked and readiness is decided by ``profile``.
+
+        Args:
+            page (Page): Playwright page to navigate.
+            url (str): The page to load.
+            profile (LoadProfile): What to block and when the page is ready.
+            metrics (dict): Receives ``bytes`` and ``blocked`` counts.
+
+        Returns:
+            Tuple[Union[str, dict], Dict[str, str]]: Rendered HTML, or the
+            extractor's in-page result, and the main response headers;
+            empty values on timeout.
+        """
+        if profile.blocks_requests:
+            page.route("**/*", lambda route: self._route(route, profile, metrics))
+        page.on("response", lambda response: self._count_bytes(response, metrics))
+
+        try:
+            if profile.wait_until == "networkidle":
+                # Go to the URL and wait until network is idle
+                response = page.goto(url, timeout=self.timeout)
+                page.wait_for_load_state("networkidle")
+            else:
+                response = page.goto(
+                    url, wait_until=profile.wait_until, timeout=self.timeout
+                )
         except Exception as e:
-            self.logger.error(f"Error fetching content: {e}")
-        self.content = "\n\n".join(paragraphs)
-        return self.content
+            self.logger.error(f"Timeout loading page: {url} | {e}")
+            return "", {}
+
+        if profile.ready_selector:
+            try:
+                page.wait_for_selector(profile.ready_selector, timeout=self.timeout)
+            except Exception as e:
+                self.logger.warning(f"Ready selector not found on {url} | {e}")
+        if profile.settle_ms:
+            # Give late client-side rendering a moment to finish
+            page.wait_for_timeout(profile.settle_ms)
+
+        headers = response.headers if response is not None else {}
+        if self.extractor.page_script:
+            return page.evaluate(self.extractor.page_script), headers
+
+        # Get rendered HTML
+        return page.content(), headers
+
+    def _route(self, route, profile: LoadProfile, metrics: dict) -> None:
+        request = route.request
+        if profile.should_block(request.resource_type, request.url):
+            metrics["blocked"] += 1
+            route.abort()
+        else:
+            route.continue_()
+
+    @staticmethod
+    def _count_bytes(response, metrics: dict) -> None:
+        length = response.headers.get("content-length")
+        if length and length.isdigit():
+            metrics["bytes"] += int(length)
@@ -87,3 +87,30 @@ class PromptProvider(IPrompt):
         Here are the other relevant pages / links: {links}
         Use this information to build a short brochure of the company in markdown without code blocks."""
         return user_prompt
+
+    def summary_system_prompt(self) -> str:
+        """
+        Get the system prompt for summarising one chunk of website content.
+
+        Returns:
+            str: The summary system prompt string.
+        """
+        summary_system_prompt = """
+        You are an assistant that condenses part of a company's website into notes for a brochure writer.
+        Keep concrete facts: what the company does, products, customers, culture, careers, locations and figures.
+        Drop navigation, legal and marketing filler. Respond with concise markdown bullet points.
+        """
+        return summary_system_prompt
+
+    def summary_user_prompt(self, contents: str) -> str:
+        """
+        Get the user prompt for summarising one chunk of website content.
+
+        Returns:
+            str: The summary user prompt string.
+        """
+        user_prompt = f"""
+        Here is part of the contents of a company website:
+        {contents}
+        Summarise the facts that would be useful in a company brochure."""
+        return user_prompt
@@ -0,0 +1,59 @@
+from typing import AsyncIterator
+
+from core.rate_limiter import LLMRateLimiter
+from interfaces.i_async_ai_client import IAsyncAIClient
+from utils.token_estimate import estimate_tokens
+
+
+class AsyncRateLimitedAIClient(IAsyncAIClient):
+    """
+    Applies shared concurrency and rate limits to an async AI client.
+
+    Each call reserves an estimate of its prompt plus ``completion_reserve``
+    tokens; once the response reports real usage, the difference is
+    settled with the limiter.
+    """
+
+    def __init__(
+        self,
+        ai_client: IAsyncAIClient,
+        limiter: LLMRateLimiter,
+        completion_reserve: int = 500,
+    ):
+        """
+        Wrap ``ai_client`` with rate limiting.
+
+        Args:
+            ai_client (IAsyncAIClient): Client that performs the call.
+            limiter (LLMRateLimiter): Limits shared by all callers.
+            completion_reserve (int): Tokens reserved for the completion.
+        """
+        self.ai_client = ai_client
+        self.limiter = limiter
+        self.completion_reserve = completion_reserve
+
+    @property
+    def model(self) -> str:
+        return self.ai_client.model
+
+    async def chat_completions_create(self, system: str, user: str) -> str:
+        estimated = estimate_tokens(system, user) + self.completion_reserve
+        async with self.limiter.slot(estimated):
+            response = await self.ai_client.chat_completions_create(
+                system=system, user=user
+            )
+
+        usage = getattr(response, "usage", None)
+        if usage is not None and usage.total_tokens:
+            self.limiter.record_usage(estimated, usage.total_tokens)
+        return response
+
+    async def chat_completions_stream(
+        self, system: str, user: str
+    ) -> AsyncIterator[str]:
+        estimated = estimate_tokens(system, user) + self.completion_reserve
+        async with self.limiter.slot(estimated):
+            async for chunk in self.ai_client.chat_completions_stream(
+                system=system, user=user
+            ):
+                yield chunk
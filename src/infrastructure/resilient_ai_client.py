@@ -0,0 +1,328 @@
+import asyncio
+import threading
+import time
+from typing import AsyncIterator, Optional, Tuple
+
+from openai import APIConnectionError, APIStatusError
+
+from core.circuit_breaker import CircuitBreaker
+from core.retry_policy import LatencyWindow, RetryPolicy
+from interfaces.i_ai_client import IAIClient
+from interfaces.i_async_ai_client import IAsyncAIClient
+from logs.logger_singleton import Logger
+from utils.rate_limit_headers import retry_after_seconds
+
+# Statuses worth retrying; 429 is the provider pacing us, not failing
+RETRY_STATUSES = {408, 409, 429, 500, 502, 503, 504}
+
+
+class _ResiliencePolicy:
+    """
+    Error classification, retry decisions and counters shared by the sync
+    and async decorators.
+    """
+
+    COUNTERS = (
+        "calls",
+        "attempts",
+        "retries",
+        "failures",
+        "timeouts",
+        "rate_limited",
+        "deadline_exceeded",
+        "hedges",
+        "hedge_wins",
+    )
+
+    def __init__(
+        self,
+        ai_client,
+        policy: Optional[RetryPolicy],
+        breaker: Optional[CircuitBreaker],
+        logger,
+    ):
+        self.ai_client = ai_client
+        self.policy = policy or RetryPolicy()
+        self.breaker = breaker or CircuitBreaker()
+        self.latency = LatencyWindow()
+        self.logger = logger or Logger(self.__class__.__name__)
+        self._lock = threading.Lock()
+        self._counts = dict.fromkeys(self.COUNTERS, 0)
+
+    @property
+    def model(self) -> str:
+        return self.ai_client.model
+
+    def stats(self) -> dict:
+        """
+        Return attempt, retry and hedge counters, the recent p95 latency and
+        the circuit breaker state.
+        """
+        with self._lock:
+            counts = dict(self._counts)
+        return {
+            **counts,
+            "latency_p95_seconds": self.latency.quantile(0.95) or 0.0,
+            "breaker": self.breaker.stats(),
+        }
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self._counts[name] += amount
+
+    def _succeeded(self, seconds: float) -> None:
+        self.breaker.record_success()
+        self.latency.observe(seconds)
+
+    def _retry_delay(self, error: Exception, retry: int, deadline: float):
+        """
+        Record a failed attempt and decide whether to retry it.
+
+        Args:
+            error (Exception): What the attempt raised.
+            retry (int): Number of the retry that would follow (1-based).
+            deadline (float): ``time.monotonic()`` by which the call must end.
+
+        Returns:
+            Optional[float]: Seconds to wait before retrying, or None if the
+            error should be raised.
+        """
+        retryable, provider_failure = self._classify(error)
+        if provider_failure:
+            self._count("failures")
+            self.breaker.record_failure()
+        else:
+            # The provider answered, so it is up even if the request failed
+            self.breaker.record_success()
+
+        if not retryable or retry >= self.policy.max_attempts:
+            return None
+        retry_after = retry_after_seconds(
+            getattr(getattr(error, "response", None), "headers", None)
+        )
+        delay = self.policy.backoff(retry, retry_after)
+        if time.monotonic() + delay >= deadline:
+            self._count("deadline_exceeded")
+            self.logger.warning(
+                f"LLM call not retried, {delay:.1f}s backoff would pass its "
+                f"deadline: {error}"
+            )
+            return None
+
+        self._count("retries")
+        self.logger.warning(
+            f"LLM call failed ({type(error).__name__}: {error}), retry {retry} "
+            f"in {delay:.2f}s"
+        )
+        return delay
+
+    def _classify(self, error: Exception) -> Tuple[bool, bool]:
+        """
+        Return whether ``error`` is worth retrying and whether it means the
+        provider is degraded.
+        """
+        if isinstance(error, (TimeoutError, asyncio.TimeoutError)):
+            self._count("timeouts")
+            return True, True
+        if isinstance(error, APIConnectionError):
+            # Includes APITimeoutError raised by the HTTP client
+            return True, True
+        if isinstance(error, APIStatusError):
+            if error.status_code == 429:
+                self._count("rate_limited")
+                # An exhausted quota does not recover by waiting
+                return getattr(error, "code", None) != "insufficient_quota", False
+            return error.status_code in RETRY_STATUSES, error.status_code >= 500
+        return False, False
+
+    def _attempt_timeout(self, deadline: float) -> float:
+        return max(0.0, min(self.policy.attempt_timeout, deadline - time.monotonic()))
+
+
+class ResilientAIClient(_ResiliencePolicy, IAIClient):
+    """
+    Adds retries with jittered exponential backoff, an overall deadline and
+    a circuit breaker to an AI client.
+
+    The per-attempt timeout is enforced by the wrapped client's HTTP
+    timeout, which should be set to ``policy.attempt_timeout``; this
+    client stops retrying once the next attempt could not finish before
+    the deadline. Hedging needs concurrent attempts and is only done by
+    AsyncResilientAIClient.
+    """
+
+    def __init__(
+        self,
+        ai_client: IAIClient,
+        policy: Optional[RetryPolicy] = None,
+        breaker: Optional[CircuitBreaker] = None,
+        logger=None,
+    ):
+        """
+        Wrap ``ai_client`` with retries and a circuit breaker.
+
+        Args:
+            ai_client (IAIClient): Client that performs the call.
+            policy (RetryPolicy, optional): Deadlines and backoff.
+            breaker (CircuitBreaker, optional): Breaker shared by every
+                client of the same provider.
+            logger (Logger, optional): Logger instance.
+        """
+        super().__init__(ai_client, policy, breaker, logger)
+
+    def chat_completions_create(self, system: str, user: str) -> str:
+        self._count("calls")
+        deadline = time.monotonic() + self.policy.deadline
+        retry = 0
+        while True:
+            retry += 1
+            self.breaker.allow()
+            self._count("attempts")
+            started = time.monotonic()
+            try:
+                response = self.ai_client.chat_completions_create(
+                    system=system, user=user
+                )
+            except Exception as e:
+                delay = self._retry_delay(e, retry, deadline)
+                if delay is None:
+                    raise
+                time.sleep(delay)
+                continue
+            except BaseException:
+                self.breaker.release()
+                raise
+            self._succeeded(time.monotonic() - started)
+            return response
+
+
+class AsyncResilientAIClient(_ResiliencePolicy, IAsyncAIClient):
+    """
+    Async counterpart of ResilientAIClient, which also enforces the
+    per-attempt timeout itself and can hedge slow requests.
+
+    With ``policy.hedge`` set, an attempt still running after the recent
+    p95 latency gets a duplicate request, and whichever replies first
+    wins; the other is cancelled. This cuts tail latency for about 5% more
+    calls. Streams are retried until their first chunk arrives, but are
+    never hedged.
+    """
+
+    def __init__(
+        self,
+        ai_client: IAsyncAIClient,
+        policy: Optional[RetryPolicy] = None,
+        breaker: Optional[CircuitBreaker] = None,
+        logger=None,
+    ):
+        """
+        Wrap ``ai_client`` with deadlines, retries, hedging and a circuit
+        breaker.
+
+        Args:
+            ai_client (IAsyncAIClient): Client that performs the call.
+            policy (RetryPolicy, optional): Deadlines, backoff and hedging.
+            breaker (CircuitBreaker, optional): Breaker shared by every
+                client of the same provider.
+            logger (Logger, optional): Logger instance.
+        """
+        super().__init__(ai_client, policy, breaker, logger)
+
+    async def chat_completions_create(self, system: str, user: str) -> str:
+        self._count("calls")
+        deadline = time.monotonic() + self.policy.deadline
+        retry = 0
+        while True:
+            retry += 1
+            self.breaker.allow()
+            self._count("attempts")
+            started = time.monotonic()
+            try:
+                response = await asyncio.wait_for(
+                    self._attempt(system, user), self._attempt_timeout(deadline)
+                )
+            except Exception as e:
+                delay = self._retry_delay(e, retry, deadline)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+                continue
+            except BaseException:
+                # Cancelled by a stage timeout or a client disconnect: no
+                # verdict on the provider, so free the half-open trial
+                self.breaker.release()
+                raise
+            self._succeeded(time.monotonic() - started)
+            return response
+
+    async def chat_completions_stream(
+        self, system: str, user: str
+    ) -> AsyncIterator[str]:
+        self._count("calls")
+        deadline = time.monotonic() + self.policy.deadline
+        retry = 0
+        while True:
+            retry += 1
+            self.breaker.allow()
+            self._count("attempts")
+            started = time.monotonic()
+            stream = self.ai_client.chat_completions_stream(system=system, user=user)
+            try:
+                first = await asyncio.wait_for(
+                    stream.__anext__(), self._attempt_timeout(deadline)
+                )
+            except StopAsyncIteration:
+                self._succeeded(time.monotonic() - started)
+                return
+            except Exception as e:
+                await stream.aclose()
+                delay = self._retry_delay(e, retry, deadline)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+                continue
+            except BaseException:
+                self.breaker.release()
+                raise
+            break
+
+        # Latency to the first chunk is what hedging and the breaker care about
+        self._succeeded(time.monotonic() - started)
+        yield first
+        async for chunk in stream:
+            yield chunk
+
+    async def _attempt(self, system: str, user: str):
+        hedge_after = self._hedge_delay()
+        call = self.ai_client.chat_completions_create
+        if hedge_after is None:
+            return await call(system=system, user=user)
+
+        primary = asyncio.ensure_future(call(system=system, user=user))
+        tasks = {primary}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=hedge_after)
+            if not done:
+                self._count("hedges")
+                tasks.add(asyncio.ensure_future(call(system=system, user=user)))
+            while True:
+                done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    tasks.discard(task)
+                    if task.exception() is None:
+                        if task is not primary:
+                            self._count("hedge_wins")
+                        return task.result()
+                    if not tasks:
+                        raise task.exception()
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def _hedge_delay(self) -> Optional[float]:
+        if not self.policy.hedge or self.breaker.state != "closed":
+            return None
+        p = self.latency.quantile(self.policy.hedge_quantile)
+        if p is None:
+            return None
+        return max(self.policy.hedge_min_delay, p)
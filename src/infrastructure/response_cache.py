@@ -0,0 +1,211 @@
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from interfaces.i_response_cache import IResponseCache
+
+
+def _hit_rate(hits: int, misses: int) -> float:
+    return hits / (hits + misses) if hits + misses else 0.0
+
+
+class MemoryResponseCache(IResponseCache):
+    """
+    In-process LRU cache of LLM responses with TTL and a byte budget.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 86400.0,
+        max_entries: int = 1000,
+        max_bytes: int = 32 * 1024 * 1024,
+    ):
+        """
+        Initialize the memory tier.
+
+        Args:
+            ttl (float): Seconds an entry stays valid.
+            max_entries (int): Maximum number of stored responses.
+            max_bytes (int): Maximum total payload size.
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        self._entries: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None or item[1] <= time.time():
+                if item is not None:
+                    self._remove(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return item[0]
+
+    def set(self, key: str, payload: str) -> None:
+        if len(payload) > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (payload, time.time() + self.ttl)
+            self._bytes += len(payload)
+
+            # Evict least recently used entries until within limits
+            while self._bytes > self.max_bytes or len(self._entries) > self.max_entries:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": _hit_rate(self.hits, self.misses),
+            }
+
+    def _remove(self, key: str) -> None:
+        payload, _ = self._entries.pop(key)
+        self._bytes -= len(payload)
+
+
+class SqliteResponseCache(IResponseCache):
+    """
+    Durable LLM response cache backed by a single SQLite file.
+    """
+
+    def __init__(
+        self,
+        path: str = "llm_cache.sqlite3",
+        ttl: float = 7 * 86400.0,
+        max_entries: int = 100000,
+    ):
+        """
+        Initialize the disk tier and create its table if needed.
+
+        Args:
+            path (str): SQLite database file.
+            ttl (float): Seconds an entry stays valid.
+            max_entries (int): Maximum number of stored responses.
+        """
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, payload TEXT NOT NULL, expires_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload FROM responses WHERE key = ? AND expires_at > ?",
+                (key, time.time()),
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return row[0]
+
+    def set(self, key: str, payload: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, payload, expires_at) "
+                "VALUES (?, ?, ?)",
+                (key, payload, time.time() + self.ttl),
+            )
+            evicted = self._conn.execute(
+                "DELETE FROM responses WHERE expires_at <= ? OR key IN ("
+                "SELECT key FROM responses ORDER BY expires_at DESC "
+                "LIMIT -1 OFFSET ?)",
+                (time.time(), self.max_entries),
+            ).rowcount
+            self._conn.commit()
+            self.evictions += max(evicted, 0)
+
+    def stats(self) -> dict:
+        with self._lock:
+            (entries,) = self._conn.execute(
+                "SELECT COUNT(*) FROM responses"
+            ).fetchone()
+            return {
+                "entries": entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": _hit_rate(self.hits, self.misses),
+            }
+
+
+class TieredResponseCache(IResponseCache):
+    """
+    Memory tier in front of an optional durable tier.
+
+    Durable hits are promoted into memory; writes go to both tiers.
+    """
+
+    def __init__(
+        self, memory: IResponseCache, disk: Optional[IResponseCache] = None
+    ):
+        self.memory = memory
+        self.disk = disk
+
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[str]:
+        payload = self.memory.get(key)
+        if payload is None and self.disk is not None:
+            payload = self.disk.get(key)
+            if payload is not None:
+                self.memory.set(key, payload)
+
+        with self._lock:
+            if payload is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return payload
+
+    def set(self, key: str, payload: str) -> None:
+        self.memory.set(key, payload)
+        if self.disk is not None:
+            self.disk.set(key, payload)
+
+    def stats(self) -> dict:
+        with self._lock:
+            stats = {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": _hit_rate(self.hits, self.misses),
+                "memory": self.memory.stats(),
+            }
+        if self.disk is not None:
+            stats["disk"] = self.disk.stats()
+        return stats
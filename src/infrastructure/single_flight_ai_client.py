@@ -0,0 +1,45 @@
+from typing import AsyncIterator
+
+from core.single_flight import AsyncSingleFlight
+from interfaces.i_async_ai_client import IAsyncAIClient
+from utils.request_hash import chat_request_key
+
+
+class AsyncSingleFlightAIClient(IAsyncAIClient):
+    """
+    Shares one in-flight LLM call between identical concurrent requests.
+
+    Requests are identified by the same model + prompt hash used by the
+    response cache, so concurrent duplicates cost a single API call.
+    """
+
+    def __init__(self, ai_client: IAsyncAIClient, flight: AsyncSingleFlight):
+        """
+        Wrap ``ai_client`` with request coalescing.
+
+        Args:
+            ai_client (IAsyncAIClient): Client that performs the call.
+            flight (AsyncSingleFlight): Shared coalescing registry.
+        """
+        self.ai_client = ai_client
+        self.flight = flight
+
+    @property
+    def model(self) -> str:
+        return self.ai_client.model
+
+    async def chat_completions_create(self, system: str, user: str) -> str:
+        key = chat_request_key(self.model, system, user)
+        return await self.flight.do(
+            key,
+            lambda: self.ai_client.chat_completions_create(system=system, user=user),
+        )
+
+    async def chat_completions_stream(
+        self, system: str, user: str
+    ) -> AsyncIterator[str]:
+        # Each listener needs its own token stream, so streams are not shared
+        async for chunk in self.ai_client.chat_completions_stream(
+            system=system, user=user
+        ):
+            yield chunk
@@ -0,0 +1,103 @@
+import json
+import sqlite3
+import threading
+from typing import Dict, Optional
+
+from core.site_snapshot import SiteSnapshot
+from interfaces.i_site_snapshot_store import ISiteSnapshotStore
+from logs.logger_singleton import Logger
+
+
+class MemorySiteSnapshotStore(ISiteSnapshotStore):
+    """
+    In-process site snapshot store, lost on restart.
+    """
+
+    def __init__(self):
+        self._snapshots: Dict[str, SiteSnapshot] = {}
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, base_url: str) -> Optional[SiteSnapshot]:
+        with self._lock:
+            snapshot = self._snapshots.get(base_url)
+            if snapshot is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return snapshot
+
+    def save(self, snapshot: SiteSnapshot) -> None:
+        with self._lock:
+            self._snapshots[snapshot.base_url] = snapshot
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "sites": len(self._snapshots),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+class SqliteSiteSnapshotStore(ISiteSnapshotStore):
+    """
+    Site snapshot store backed by a single SQLite file, so scheduled
+    refreshes can compare against the previous run's snapshot.
+    """
+
+    def __init__(self, path: str = "site_snapshots.sqlite3", logger=None):
+        """
+        Initialize the store and create its table if needed.
+
+        Args:
+            path (str): SQLite database file.
+            logger (Logger, optional): A logger instance. If None, a default
+                logger is created using the class name.
+        """
+        self.path = path
+        self.logger = logger or Logger(self.__class__.__name__)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS sites ("
+            "base_url TEXT PRIMARY KEY, payload TEXT NOT NULL, stored_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, base_url: str) -> Optional[SiteSnapshot]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload FROM sites WHERE base_url = ?", (base_url,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+
+        try:
+            return SiteSnapshot(**json.loads(row[0]))
+        except (TypeError, ValueError) as e:
+            self.logger.error(f"Corrupt site snapshot for {base_url}: {e}")
+            return None
+
+    def save(self, snapshot: SiteSnapshot) -> None:
+        payload = json.dumps(snapshot.to_dict())
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sites (base_url, payload, stored_at) "
+                "VALUES (?, ?, ?)",
+                (snapshot.base_url, payload, snapshot.stored_at),
+            )
+            self._conn.commit()
+
+    def stats(self) -> dict:
+        with self._lock:
+            (sites,) = self._conn.execute("SELECT COUNT(*) FROM sites").fetchone()
+            return {"sites": sites, "hits": self.hits, "misses": self.misses}
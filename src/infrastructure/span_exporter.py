@@ -0,0 +1,104 @@
+import json
+import queue
+import threading
+from typing import Dict
+
+from core.span import Span
+from interfaces.i_span_exporter import ISpanExporter
+from logs.logger_singleton import Logger
+
+_STOP = object()
+
+
+class OtlpJsonFileExporter(ISpanExporter):
+    """
+    Appends spans to a file in the OTLP/JSON file format, one
+    ``resourceSpans`` batch per line.
+
+    The format is what the OpenTelemetry Collector's ``otlpjsonfile``
+    receiver reads, so the file can stand in for a collector locally or be
+    shipped to one later. Spans are queued and written by a background
+    thread, so request handling never waits on the file. Use ``for_path``
+    to share one exporter, and one writer thread, per file.
+
+    Attributes:
+        path (str): File the spans are appended to.
+        service_name (str): ``service.name`` resource attribute.
+    """
+
+    _by_path: Dict[str, "OtlpJsonFileExporter"] = {}
+    _by_path_lock = threading.Lock()
+
+    def __init__(
+        self, path: str, service_name: str = "llm-sales-brochure", logger=None
+    ):
+        self.path = path
+        self.service_name = service_name
+        self.logger = logger or Logger(self.__class__.__name__)
+        self._closed = False
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread = threading.Thread(
+            target=self._write_loop, name="span-exporter", daemon=True
+        )
+        self._thread.start()
+
+    @classmethod
+    def for_path(cls, path: str, **kwargs) -> "OtlpJsonFileExporter":
+        """
+        Return the open exporter writing to ``path``, creating it if needed.
+        """
+        with cls._by_path_lock:
+            exporter = cls._by_path.get(path)
+            if exporter is None or exporter._closed:
+                exporter = cls._by_path[path] = cls(path, **kwargs)
+            return exporter
+
+    def export(self, span: Span) -> None:
+        if not self._closed:
+            self._queue.put(span)
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_STOP)
+        self._thread.join(timeout=5)
+
+    def _write_loop(self) -> None:
+        with open(self.path, "a", encoding="utf-8") as out:
+            while True:
+                batch = [self._queue.get()]
+                # Write everything already queued as one batch
+                while not self._queue.empty() and batch[-1] is not _STOP:
+                    batch.append(self._queue.get())
+                spans = [span for span in batch if span is not _STOP]
+                if spans:
+                    try:
+                        out.write(json.dumps(self._batch(spans)) + "\n")
+                        out.flush()
+                    except (OSError, TypeError, ValueError) as e:
+                        self.logger.error(f"Could not export spans: {e}")
+                if batch[-1] is _STOP:
+                    return
+
+    def _batch(self, spans) -> dict:
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": [
+                            {
+                                "key": "service.name",
+                                "value": {"stringValue": self.service_name},
+                            }
+                        ]
+                    },
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": "salesbrochure"},
+                            "spans": [span.to_otlp() for span in spans],
+                        }
+                    ],
+                }
+            ]
+        }
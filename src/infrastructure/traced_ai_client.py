@@ -0,0 +1,127 @@
+from contextlib import contextmanager
+from typing import AsyncIterator, Iterator, Optional, Tuple
+
+from core.llm_usage_stats import LLMUsageStats
+from core.span import Span
+from core.tracer import Tracer
+from interfaces.i_ai_client import IAIClient
+from interfaces.i_async_ai_client import IAsyncAIClient
+from utils.llm_cost import estimate_cost
+from utils.token_estimate import count_tokens
+
+
+class _LLMUsagePolicy:
+    """
+    Token and cost accounting shared by the sync and async decorators.
+    """
+
+    def __init__(
+        self,
+        ai_client,
+        tracer: Tracer,
+        operation: Optional[str] = None,
+        usage_stats: Optional[LLMUsageStats] = None,
+    ):
+        """
+        Wrap ``ai_client`` with tracing.
+
+        Args:
+            ai_client: Client that talks to the API.
+            tracer (Tracer): Receives spans and LLM usage.
+            operation (str, optional): Operation the client serves, added
+                to spans, metrics and ``usage_stats``.
+            usage_stats (LLMUsageStats, optional): Per-operation counters.
+        """
+        self.ai_client = ai_client
+        self.tracer = tracer
+        self.operation = operation
+        self.usage_stats = usage_stats
+
+    @property
+    def model(self) -> str:
+        return self.ai_client.model
+
+    @contextmanager
+    def _span(self, name: str) -> Iterator[Span]:
+        attributes = {"model": self.model}
+        if self.operation:
+            attributes["operation"] = self.operation
+        with self.tracer.span(name, **attributes) as span:
+            try:
+                yield span
+            except Exception:
+                if self.usage_stats is not None:
+                    self.usage_stats.record(
+                        self.operation or name, self.model, span.duration, error=True
+                    )
+                raise
+
+    def _usage(self, user: str, response=None, text=None) -> Tuple[int, int]:
+        # Streamed responses report no usage, so count their tokens locally
+        reported = getattr(response, "usage", None)
+        if reported is not None:
+            return reported.prompt_tokens, reported.completion_tokens
+        return count_tokens(user, self.model), count_tokens(text or "", self.model)
+
+    def _record(self, span: Span, prompt_tokens: int, completion_tokens: int) -> None:
+        cost = estimate_cost(self.model, prompt_tokens, completion_tokens)
+        span.set(
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            cost_usd=cost,
+        )
+        self.tracer.record_llm_usage(
+            self.model, prompt_tokens, completion_tokens, cost, self.operation
+        )
+        if self.usage_stats is not None:
+            self.usage_stats.record(
+                self.operation or span.name,
+                self.model,
+                span.duration,
+                prompt_tokens,
+                completion_tokens,
+                cost,
+            )
+
+
+class TracedAIClient(_LLMUsagePolicy, IAIClient):
+    """
+    Records a span, token usage and estimated cost for every LLM call.
+
+    Wraps the client that talks to the API, so cached and coalesced calls,
+    which cost nothing, are not counted.
+    """
+
+    def chat_completions_create(self, system: str, user: str) -> str:
+        with self._span("llm.chat") as span:
+            response = self.ai_client.chat_completions_create(system=system, user=user)
+            self._record(span, *self._usage(user, response))
+            return response
+
+
+class AsyncTracedAIClient(_LLMUsagePolicy, IAsyncAIClient):
+    """
+    Async counterpart of TracedAIClient.
+    """
+
+    async def chat_completions_create(self, system: str, user: str) -> str:
+        with self._span("llm.chat") as span:
+            response = await self.ai_client.chat_completions_create(
+                system=system, user=user
+            )
+            self._record(span, *self._usage(user, response))
+            return response
+
+    async def chat_completions_stream(
+        self, system: str, user: str
+    ) -> AsyncIterator[str]:
+        with self._span("llm.stream") as span:
+            parts = []
+            async for chunk in self.ai_client.chat_completions_stream(
+                system=system, user=user
+            ):
+                if not parts:
+                    span.set(time_to_first_token=span.duration)
+                parts.append(chunk)
+                yield chunk
+            self._record(span, *self._usage(user, text="".join(parts)))
@@ -0,0 +1,36 @@
+from abc import ABC, abstractmethod
+from typing import AsyncIterator
+
+
+class IAsyncAIClient(ABC):
+    """
+    Abstract interface for a non-blocking AI client.
+    """
+
+    @abstractmethod
+    async def chat_completions_create(self, system: str, user: str) -> str:
+        """
+        Sends a chat completion request to the AI backend without blocking.
+
+        Args:
+            system (str): System prompt.
+            user (str): User prompt.
+
+        Returns:
+            str: AI response content.
+        """
+        pass
+
+    @abstractmethod
+    def chat_completions_stream(self, system: str, user: str) -> AsyncIterator[str]:
+        """
+        Streams a chat completion as it is generated.
+
+        Args:
+            system (str): System prompt.
+            user (str): User prompt.
+
+        Returns:
+            AsyncIterator[str]: Content deltas in order.
+        """
+        pass
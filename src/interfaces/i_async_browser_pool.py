@@ -0,0 +1,41 @@
+from abc import ABC, abstractmethod
+from typing import Awaitable, Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class IAsyncBrowserPool(ABC):
+    """
+    Interface for a shared pool of long-lived browsers on an event loop.
+    """
+
+    @abstractmethod
+    async def start(self) -> None:
+        """Start the browser driver."""
+        pass
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Shut down all pooled browsers."""
+        pass
+
+    @abstractmethod
+    async def run(
+        self, task: Callable[..., Awaitable[T]], timeout: Optional[float] = None
+    ) -> T:
+        """
+        Await ``task(page)`` on an isolated page from the pool.
+
+        Args:
+            task (Callable): Coroutine function receiving a fresh page.
+            timeout (float, optional): Seconds to wait for a free slot.
+
+        Returns:
+            The value returned by ``task``.
+        """
+        pass
+
+    @abstractmethod
+    def stats(self) -> dict:
+        """Return pool wait time and utilisation metrics."""
+        pass
@@ -0,0 +1,25 @@
+from abc import ABC, abstractmethod
+from typing import AsyncIterator, List
+
+
+class IAsyncOpenAIOperations(ABC):
+
+    @abstractmethod
+    async def select_relevant_links(self, base_url: str, links: list) -> List[str]:
+        pass
+
+    @abstractmethod
+    async def create_brochure(
+        self, company_name: str, contents: str, relevent_links: list
+    ) -> str:
+        pass
+
+    @abstractmethod
+    def stream_brochure(
+        self, company_name: str, contents: str, relevent_links: list
+    ) -> AsyncIterator[str]:
+        pass
+
+    @abstractmethod
+    async def summarize_content(self, contents: str) -> str:
+        pass
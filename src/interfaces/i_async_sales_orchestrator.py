@@ -0,0 +1,37 @@
+from abc import ABC, abstractmethod
+from typing import AsyncIterator
+
+
+class IAsyncSalesBrochureOrchestrator(ABC):
+    """
+    Interface for orchestrating website scraping and AI processing
+    on an event loop.
+    """
+
+    @abstractmethod
+    async def orchestrate(self, base_url: str) -> str:
+        """
+        Fetch content and links from the website, select relevant links,
+        and generate a company brochure.
+
+        Args:
+            base_url (str): The website URL.
+
+        Returns:
+            str: Generated company brochure.
+        """
+        pass
+
+    @abstractmethod
+    def orchestrate_stream(self, base_url: str) -> AsyncIterator[dict]:
+        """
+        Run the same pipeline as ``orchestrate`` and stream its progress.
+
+        Args:
+            base_url (str): The website URL.
+
+        Returns:
+            AsyncIterator[dict]: ``progress`` events for each stage followed
+            by ``token`` events carrying brochure text as it is generated.
+        """
+        pass
@@ -0,0 +1,25 @@
+from abc import ABC, abstractmethod
+from typing import List
+
+from core.page_snapshot import PageSnapshot
+
+
+class IAsyncScraperProvider(ABC):
+    """
+    Async counterpart of IScraperProvider for use on an event loop.
+    """
+
+    @abstractmethod
+    async def fetch_page(self, url: str) -> PageSnapshot:
+        """Load any URL and return its HTML, text and links."""
+        pass
+
+    @abstractmethod
+    async def fetch_links(self, url: str) -> List[str]:
+        """Return a list of valid web links from the URL."""
+        pass
+
+    @abstractmethod
+    async def fetch_content(self, url: str) -> str:
+        """Return the page title and main content."""
+        pass
@@ -0,0 +1,43 @@
+from abc import ABC, abstractmethod
+from typing import Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class BrowserPoolExhaustedError(RuntimeError):
+    """Raised when no pool slot frees up before the caller's timeout."""
+
+
+class IBrowserPool(ABC):
+    """
+    Interface for a shared pool of long-lived browsers.
+    """
+
+    @abstractmethod
+    def start(self) -> None:
+        """Launch the pooled browsers."""
+        pass
+
+    @abstractmethod
+    def close(self) -> None:
+        """Shut down all pooled browsers."""
+        pass
+
+    @abstractmethod
+    def run(self, task: Callable[..., T], timeout: Optional[float] = None) -> T:
+        """
+        Run ``task(page)`` on an isolated page from the pool.
+
+        Args:
+            task (Callable): Callable receiving a fresh page.
+            timeout (float, optional): Seconds to wait for a free slot.
+
+        Returns:
+            The value returned by ``task``.
+        """
+        pass
+
+    @abstractmethod
+    def stats(self) -> dict:
+        """Return pool wait time and utilisation metrics."""
+        pass
@@ -0,0 +1,45 @@
+from abc import ABC, abstractmethod
+from typing import Any, Optional
+
+from core.cassette_entry import CassetteEntry
+
+
+class CassetteMissError(LookupError):
+    """
+    Raised when a strict replay finds no recording for a call.
+    """
+
+    def __init__(self, kind: str, key: str):
+        super().__init__(f"No recorded {kind} for {key}")
+        self.kind = kind
+        self.key = key
+
+
+class ICassette(ABC):
+    """
+    Interface for recorded scraper and LLM interactions, replayed in
+    place of the real providers.
+    """
+
+    @abstractmethod
+    def lookup(self, kind: str, key: str) -> Optional[CassetteEntry]:
+        """
+        Return the entry to replay, or None to call the real provider.
+        Raises CassetteMissError on a miss when replay is strict.
+        """
+        pass
+
+    @abstractmethod
+    def record(self, kind: str, key: str, payload: Any, elapsed: float) -> None:
+        """Store a real provider's response, if the cassette is recording."""
+        pass
+
+    @abstractmethod
+    def latency(self, entry: CassetteEntry) -> float:
+        """Return the seconds to wait before replaying ``entry``."""
+        pass
+
+    @abstractmethod
+    def stats(self) -> dict:
+        """Return hit, miss and recorded counters."""
+        pass
@@ -0,0 +1,46 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from core.page_snapshot import PageSnapshot
+
+
+class IHtmlExtractor(ABC):
+    """
+    Interface for turning a loaded page into a PageSnapshot.
+
+    Attributes:
+        page_script (Optional[str]): JavaScript run inside the browser page
+            instead of transferring its HTML. When set, scrapers pass the
+            script's result to ``extract_page_data``; ``extract`` is still
+            used for HTML fetched without a browser.
+    """
+
+    page_script: Optional[str] = None
+
+    @abstractmethod
+    def extract(self, url: str, html: str) -> PageSnapshot:
+        """
+        Parse ``html`` and extract internal links and paragraph text.
+
+        Args:
+            url (str): The URL the HTML was loaded from.
+            html (str): Page HTML.
+
+        Returns:
+            PageSnapshot: Parsed snapshot of the page.
+        """
+        pass
+
+    @abstractmethod
+    def extract_page_data(self, url: str, data: dict) -> PageSnapshot:
+        """
+        Build a snapshot from the result of ``page_script``.
+
+        Args:
+            url (str): The URL that was loaded.
+            data (dict): Value returned by ``page_script``.
+
+        Returns:
+            PageSnapshot: Parsed snapshot of the page.
+        """
+        pass
@@ -0,0 +1,25 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from core.job import Job
+
+
+class IJobStore(ABC):
+    """
+    Interface for persisting brochure jobs and their results.
+    """
+
+    @abstractmethod
+    def save(self, job: Job) -> None:
+        """Insert or update ``job``."""
+        pass
+
+    @abstractmethod
+    def get(self, job_id: str) -> Optional[Job]:
+        """Return the job with ``job_id`` unless missing or expired."""
+        pass
+
+    @abstractmethod
+    def purge_expired(self) -> int:
+        """Delete expired jobs and return how many were removed."""
+        pass
@@ -0,0 +1,25 @@
+from abc import ABC, abstractmethod
+from typing import List
+
+from core.link_selection import LinkSelection
+
+
+class ILinkFilter(ABC):
+    """
+    Interface for narrowing a page's links before LLM link selection.
+    """
+
+    @abstractmethod
+    def filter(self, base_url: str, links: List[str]) -> LinkSelection:
+        """
+        Canonicalise, filter and rank ``links`` found on ``base_url``.
+
+        Args:
+            base_url (str): Page the links were found on.
+            links (List[str]): Links as extracted from the page.
+
+        Returns:
+            LinkSelection: Ranked candidates, plus links selected outright
+            when the filter is confident.
+        """
+        pass
@@ -19,3 +19,11 @@ class IPrompt(ABC):
     @abstractmethod
     def brochure_user_prompt(company_name: str, contents: str, links: str) -> str:
         pass
+
+    @abstractmethod
+    def summary_system_prompt(self) -> str:
+        pass
+
+    @abstractmethod
+    def summary_user_prompt(self, contents: str) -> str:
+        pass
@@ -0,0 +1,25 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from core.page_cache_entry import PageCacheEntry
+
+
+class IPageCache(ABC):
+    """
+    Interface for a store of scraped pages keyed by normalised URL.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[PageCacheEntry]:
+        """Return the entry for ``key``, fresh or stale, or None."""
+        pass
+
+    @abstractmethod
+    def set(self, key: str, entry: PageCacheEntry) -> None:
+        """Store or replace the entry for ``key``."""
+        pass
+
+    @abstractmethod
+    def stats(self) -> dict:
+        """Return hit, miss and eviction counters."""
+        pass
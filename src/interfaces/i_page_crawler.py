@@ -0,0 +1,23 @@
+from abc import ABC, abstractmethod
+from typing import List
+
+from core.crawl_result import CrawlResult
+
+
+class IAsyncPageCrawler(ABC):
+    """
+    Interface for fetching several pages concurrently.
+    """
+
+    @abstractmethod
+    async def crawl(self, urls: List[str]) -> CrawlResult:
+        """
+        Fetch ``urls`` concurrently and return whatever finished in time.
+
+        Args:
+            urls (List[str]): Pages to fetch.
+
+        Returns:
+            CrawlResult: Fetched pages plus failed and timed-out URLs.
+        """
+        pass
@@ -0,0 +1,23 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+
+class IResponseCache(ABC):
+    """
+    Interface for a store of serialised LLM responses keyed by request hash.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[str]:
+        """Return the stored payload for ``key`` if present and not expired."""
+        pass
+
+    @abstractmethod
+    def set(self, key: str, payload: str) -> None:
+        """Store ``payload`` under ``key`` with the cache's TTL."""
+        pass
+
+    @abstractmethod
+    def stats(self) -> dict:
+        """Return hit, miss and eviction counters and the hit rate."""
+        pass
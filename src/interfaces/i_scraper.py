@@ -1,15 +1,26 @@
 from abc import ABC, abstractmethod
 from typing import List
 
+from core.page_snapshot import PageSnapshot
+
 
 class IScraperProvider(ABC):
+    """
+    Stateless page scraper: every call names the page it loads, so one
+    instance can serve concurrent requests.
+    """
+
+    @abstractmethod
+    def fetch_page(self, url: str) -> PageSnapshot:
+        """Load any URL and return its HTML, text and links."""
+        pass
 
     @abstractmethod
-    def fetch_links(self) -> List[str]:
-        """Return a list of valid web links from the base URL."""
+    def fetch_links(self, url: str) -> List[str]:
+        """Return a list of valid web links from the URL."""
         pass
 
     @abstractmethod
-    def fetch_content(self) -> str:
+    def fetch_content(self, url: str) -> str:
         """Return the page title and main content."""
         pass
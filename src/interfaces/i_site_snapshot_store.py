@@ -0,0 +1,25 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from core.site_snapshot import SiteSnapshot
+
+
+class ISiteSnapshotStore(ABC):
+    """
+    Interface for a store of per-site snapshots keyed by normalised URL.
+    """
+
+    @abstractmethod
+    def get(self, base_url: str) -> Optional[SiteSnapshot]:
+        """Return the last snapshot of ``base_url``, or None."""
+        pass
+
+    @abstractmethod
+    def save(self, snapshot: SiteSnapshot) -> None:
+        """Store ``snapshot``, replacing the previous one of its site."""
+        pass
+
+    @abstractmethod
+    def stats(self) -> dict:
+        """Return stored snapshot, hit and miss counters."""
+        pass
@@ -0,0 +1,23 @@
+from abc import ABC, abstractmethod
+
+from core.span import Span
+
+
+class ISpanExporter(ABC):
+    """
+    Destination for finished spans.
+    """
+
+    @abstractmethod
+    def export(self, span: Span) -> None:
+        """
+        Hand over a finished span. Must not block the caller on I/O.
+        """
+        pass
+
+    @abstractmethod
+    def close(self) -> None:
+        """
+        Flush pending spans and release resources.
+        """
+        pass
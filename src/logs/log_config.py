@@ -0,0 +1,238 @@
+import atexit
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+from logs.log_context import request_id_var
+
+TEXT_FORMAT = (
+    "%(asctime)s - %(name)s.%(funcName)s - %(levelname)s - "
+    "[%(request_id)s] %(message)s"
+)
+
+_lock = threading.Lock()
+_handlers: Optional[List[logging.Handler]] = None
+_filters: List[logging.Filter] = []
+_level = logging.DEBUG
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+class RequestIdFilter(logging.Filter):
+    """
+    Adds the current request id to every record as ``request_id``.
+
+    Must run in the thread that logs, before records are queued, since the
+    id is read from a context variable.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = request_id_var.get() or "-"
+        return True
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    Lets at most ``burst`` records per call site through every ``interval``
+    seconds, so a message logged in a loop cannot flood the log.
+
+    Records at ``max_level`` and above are never dropped. The first record
+    let through after a drop reports how many were suppressed.
+
+    Attributes:
+        burst (int): Records allowed per call site and interval.
+        interval (float): Window length in seconds.
+        max_level (int): Lowest level that is never rate limited.
+    """
+
+    def __init__(
+        self, burst: int, interval: float = 60.0, max_level: int = logging.ERROR
+    ):
+        super().__init__()
+        self.burst = burst
+        self.interval = interval
+        self.max_level = max_level
+        self._lock = threading.Lock()
+        # Call site -> [window start, records in window, suppressed]
+        self._sites: Dict[Tuple[str, int], list] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= self.max_level:
+            return True
+
+        now = time.monotonic()
+        with self._lock:
+            site = self._sites.setdefault((record.pathname, record.lineno), [now, 0, 0])
+            if now - site[0] >= self.interval:
+                site[0], site[1] = now, 0
+            if site[1] >= self.burst:
+                site[2] += 1
+                return False
+            site[1] += 1
+            suppressed, site[2] = site[2], 0
+
+        if suppressed:
+            record.msg = f"{record.getMessage()} ({suppressed} similar suppressed)"
+            record.args = None
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Formats records as one JSON object per line.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(
+                timespec="milliseconds"
+            ),
+            "level": record.levelname,
+            "logger": record.name,
+            "func": record.funcName,
+            "request_id": getattr(record, "request_id", "-"),
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            # Rendered in the logging thread by the queue handler
+            entry["exc"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class _QueueHandler(logging.handlers.QueueHandler):
+    """
+    Queue handler that leaves formatting to the listener thread.
+
+    The standard ``prepare`` formats and copies every record in the calling
+    thread; here only the message is merged and exceptions rendered, so
+    the caller pays little more than building the record.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def configure_logger(logger: logging.Logger) -> None:
+    """
+    Attach the shared handlers and filters to ``logger``.
+
+    Filters are attached to the logger rather than the handlers, so they
+    run once per record, in the thread that logs. The logger's level is
+    the lowest output level, so records no output wants are never built.
+    """
+    handlers = _shared_handlers()
+    logger.setLevel(_level)
+    for log_filter in _filters:
+        logger.addFilter(log_filter)
+    for handler in handlers:
+        logger.addHandler(handler)
+
+
+def _shared_handlers() -> List[logging.Handler]:
+    """
+    Return the handlers shared by every ``Logger``, creating them on first
+    use from environment variables:
+
+    - ``LOG_FORMAT``: ``text`` (default) or ``json``.
+    - ``LOG_FILE``: log file path (default ``logs.log``); empty disables it.
+    - ``LOG_FILE_LEVEL`` / ``LOG_CONSOLE_LEVEL``: ``DEBUG`` / ``INFO``.
+    - ``LOG_ROTATE``: ``size`` (``LOG_MAX_BYTES``) or ``time``
+      (``LOG_ROTATE_WHEN``), keeping ``LOG_BACKUP_COUNT`` files.
+    - ``LOG_RATE_LIMIT``: records per call site per ``LOG_RATE_INTERVAL``
+      seconds below ERROR; 0 (default) disables rate limiting.
+    - ``LOG_ASYNC=1``: loggers only enqueue records, and a background
+      listener thread formats and writes them. Leave it off when jobs run
+      in forked worker processes, which do not inherit the listener.
+
+    All loggers share these handlers, so the log file is opened once.
+    """
+    global _handlers, _filters, _level, _listener
+    with _lock:
+        if _handlers is not None:
+            return _handlers
+
+        formatter = (
+            JsonFormatter()
+            if os.getenv("LOG_FORMAT", "text") == "json"
+            else logging.Formatter(TEXT_FORMAT)
+        )
+        outputs: List[logging.Handler] = []
+
+        path = os.getenv("LOG_FILE", "logs.log")
+        if path:
+            file_handler = _file_handler(path)
+            file_handler.setLevel(os.getenv("LOG_FILE_LEVEL", "DEBUG").upper())
+            outputs.append(file_handler)
+
+        console_handler = logging.StreamHandler()
+        console_handler.setLevel(os.getenv("LOG_CONSOLE_LEVEL", "INFO").upper())
+        outputs.append(console_handler)
+
+        for handler in outputs:
+            handler.setFormatter(formatter)
+        _level = min(handler.level for handler in outputs)
+
+        if os.getenv("LOG_ASYNC", "0") == "1":
+            records: queue.SimpleQueue = queue.SimpleQueue()
+            _listener = logging.handlers.QueueListener(
+                records, *outputs, respect_handler_level=True
+            )
+            _listener.start()
+            atexit.register(shutdown_logging)
+            front: List[logging.Handler] = [_QueueHandler(records)]
+        else:
+            front = outputs
+
+        _filters = [RequestIdFilter()]
+        rate_limit = int(os.getenv("LOG_RATE_LIMIT", "0"))
+        if rate_limit > 0:
+            interval = float(os.getenv("LOG_RATE_INTERVAL", "60"))
+            _filters.insert(0, RateLimitFilter(rate_limit, interval))
+
+        _handlers = front
+        return _handlers
+
+
+def shutdown_logging() -> None:
+    """
+    Flush queued records and stop the background listener, if any.
+    """
+    global _listener
+    with _lock:
+        listener, _listener = _listener, None
+    if listener is not None:
+        listener.stop()
+
+
+def _file_handler(path: str) -> logging.Handler:
+    rotate = os.getenv("LOG_ROTATE", "")
+    backups = int(os.getenv("LOG_BACKUP_COUNT", "5"))
+    if rotate == "size":
+        return logging.handlers.RotatingFileHandler(
+            path,
+            maxBytes=int(os.getenv("LOG_MAX_BYTES", str(10 * 1024 * 1024))),
+            backupCount=backups,
+            encoding="utf-8",
+        )
+    if rotate == "time":
+        return logging.handlers.TimedRotatingFileHandler(
+            path,
+            when=os.getenv("LOG_ROTATE_WHEN", "midnight"),
+            backupCount=backups,
+            encoding="utf-8",
+        )
+    if rotate:
+        raise ValueError(f"Unknown LOG_ROTATE: {rotate}")
+    return logging.FileHandler(path, encoding="utf-8")
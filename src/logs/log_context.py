@@ -0,0 +1,34 @@
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+# Id of the request, job or batch item being processed. Context variables
+# follow asyncio tasks and ``asyncio.to_thread`` calls, so every log line
+# written while handling a request carries its id.
+request_id_var: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
+
+
+def new_request_id() -> str:
+    """
+    Return a short random request id.
+    """
+    return uuid.uuid4().hex[:16]
+
+
+@contextmanager
+def request_context(request_id: Optional[str] = None) -> Iterator[str]:
+    """
+    Tag log records written inside the block with ``request_id``.
+
+    Args:
+        request_id (str, optional): Id to use; a new one is generated if None.
+
+    Yields:
+        str: The request id in effect.
+    """
+    token = request_id_var.set(request_id or new_request_id())
+    try:
+        yield request_id_var.get()
+    finally:
+        request_id_var.reset(token)
@@ -0,0 +1,29 @@
+from typing import Dict, Tuple
+
+# USD per million prompt and completion tokens
+MODEL_PRICES: Dict[str, Tuple[float, float]] = {
+    "gpt-4": (30.0, 60.0),
+    "gpt-4-turbo": (10.0, 30.0),
+    "gpt-4o": (2.5, 10.0),
+    "gpt-4o-mini": (0.15, 0.6),
+    "gpt-3.5-turbo": (0.5, 1.5),
+}
+
+
+def estimate_cost(model: str, prompt_tokens: int, completion_tokens: int) -> float:
+    """
+    Estimate the price in USD of one call to ``model``.
+
+    Dated model names (``gpt-4o-2024-08-06``) use their base model's price;
+    unknown models cost 0.
+    """
+    prices = MODEL_PRICES.get(model)
+    if prices is None:
+        base = max(
+            (name for name in MODEL_PRICES if model.startswith(f"{name}-")),
+            key=len,
+            default=None,
+        )
+        prices = MODEL_PRICES.get(base, (0.0, 0.0))
+    prompt_price, completion_price = prices
+    return (prompt_tokens * prompt_price + completion_tokens * completion_price) / 1e6
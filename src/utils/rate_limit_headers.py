@@ -0,0 +1,68 @@
+import re
+import time
+from email.utils import parsedate_to_datetime
+from typing import Mapping, Optional
+
+# OpenAI reset durations look like "1s", "6m0s", "20ms" or "1h2m3.5s"
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_UNIT_SECONDS = {"h": 3600.0, "m": 60.0, "s": 1.0, "ms": 0.001}
+
+
+def parse_duration(value: str) -> Optional[float]:
+    """
+    Parse a Go-style duration such as ``6m0s`` into seconds.
+
+    Args:
+        value (str): Duration string.
+
+    Returns:
+        Optional[float]: Seconds, or None if ``value`` is not a duration.
+    """
+    value = value.strip()
+    parts = _DURATION_PART.findall(value)
+    if not parts or "".join(n + u for n, u in parts) != value:
+        return None
+    return sum(float(number) * _UNIT_SECONDS[unit] for number, unit in parts)
+
+
+def retry_after_seconds(headers: Optional[Mapping[str, str]]) -> Optional[float]:
+    """
+    Return how long the server asked the client to wait before retrying.
+
+    Reads ``retry-after-ms``, then ``retry-after`` (seconds or an HTTP
+    date), then the longer of OpenAI's ``x-ratelimit-reset-requests`` and
+    ``x-ratelimit-reset-tokens``.
+
+    Args:
+        headers (Optional[Mapping[str, str]]): Response headers; lookups
+            must be case-insensitive, as ``httpx.Headers`` are.
+
+    Returns:
+        Optional[float]: Seconds to wait, or None if no header says.
+    """
+    if not headers:
+        return None
+
+    value = headers.get("retry-after-ms")
+    if value:
+        try:
+            return max(0.0, float(value) / 1000)
+        except ValueError:
+            pass
+
+    value = headers.get("retry-after")
+    if value:
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            try:
+                return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+            except (TypeError, ValueError):
+                pass
+
+    resets = [
+        parse_duration(headers.get(name) or "")
+        for name in ("x-ratelimit-reset-requests", "x-ratelimit-reset-tokens")
+    ]
+    resets = [reset for reset in resets if reset is not None]
+    return max(resets) if resets else None
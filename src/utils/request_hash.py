@@ -0,0 +1,33 @@
+import hashlib
+import json
+
+
+def chat_request_key(model: str, system: str, user: str, **params) -> str:
+    """
+    Return a stable hash identifying a chat completion request.
+
+    Two requests with the same model, messages and parameters always get
+    the same key, regardless of parameter order.
+
+    Args:
+        model (str): Model name.
+        system (str): System prompt.
+        user (str): User prompt.
+        **params: Any other request parameters that affect the response.
+
+    Returns:
+        str: Hex SHA-256 digest.
+    """
+    payload = json.dumps(
+        {
+            "model": model,
+            "messages": [
+                {"role": "system", "content": system},
+                {"role": "user", "content": user},
+            ],
+            "params": params,
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
@@ -0,0 +1,95 @@
+from functools import lru_cache
+from typing import List, Optional
+
+try:
+    import tiktoken
+except ImportError:  # optional; falls back to the character heuristic
+    tiktoken = None
+
+
+def estimate_tokens(*texts: str) -> int:
+    """
+    Roughly estimate the token count of ``texts`` without a tokenizer.
+
+    Uses the common approximation of four characters per token.
+
+    Args:
+        *texts (str): Texts sent to the model.
+
+    Returns:
+        int: Estimated number of tokens.
+    """
+    return sum(len(text) for text in texts) // 4 + 1
+
+
+@lru_cache(maxsize=None)
+def _encoding(model: str):
+    if tiktoken is None:
+        return None
+    try:
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        # Encoding files not cached locally and cannot be downloaded
+        return None
+
+
+def count_tokens(text: str, model: Optional[str] = None) -> int:
+    """
+    Count the tokens ``text`` costs for ``model``.
+
+    Uses ``tiktoken`` when it is installed and its encoding files are
+    available locally (see ``TIKTOKEN_CACHE_DIR``), otherwise falls back
+    to ``estimate_tokens``. No network access is required.
+
+    Args:
+        text (str): Text to count.
+        model (str, optional): Model name. Defaults to ``gpt-4``.
+
+    Returns:
+        int: Number of tokens.
+    """
+    encoding = _encoding(model or "gpt-4")
+    if encoding is None:
+        return estimate_tokens(text)
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def split_tokens(text: str, max_tokens: int, model: Optional[str] = None) -> List[str]:
+    """
+    Split ``text`` into consecutive pieces of at most ``max_tokens`` tokens.
+
+    Pieces are cut on token boundaries when ``tiktoken`` is available and
+    on characters otherwise; each piece counts at most ``max_tokens`` with
+    ``count_tokens``.
+
+    Args:
+        text (str): Text to split.
+        max_tokens (int): Maximum tokens per piece.
+        model (str, optional): Model name. Defaults to ``gpt-4``.
+
+    Returns:
+        List[str]: The pieces, in order.
+    """
+    max_tokens = max(max_tokens, 1)
+    encoding = _encoding(model or "gpt-4")
+    if encoding is None:
+        # estimate_tokens adds one token to every piece
+        size = max(max_tokens - 1, 1) * 4
+        return [text[i : i + size] for i in range(0, len(text), size)]
+
+    tokens = encoding.encode(text, disallowed_special=())
+    pieces = []
+    start = 0
+    while start < len(tokens):
+        end = min(start + max_tokens, len(tokens))
+        piece = encoding.decode(tokens[start:end])
+        # A cut inside a multi-byte character can re-encode longer
+        while end - start > 1 and count_tokens(piece, model) > max_tokens:
+            end -= 1
+            piece = encoding.decode(tokens[start:end])
+        pieces.append(piece)
+        start = end
+    return pieces
@@ -0,0 +1,57 @@
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+TRACKING_PREFIXES = ("utm_",)
+
+TRACKING_PARAMS = {"gclid", "fbclid", "msclkid", "mc_cid", "mc_eid", "ref"}
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def normalize_url(url: str) -> str:
+    """
+    Return a canonical form of ``url`` suitable as a cache or dedupe key.
+
+    Lowercases scheme and host, drops default ports, fragments and
+    tracking query parameters, sorts the remaining parameters and removes
+    a trailing slash from non-root paths.
+
+    Args:
+        url (str): URL to normalise.
+
+    Returns:
+        str: Normalised URL.
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+
+    if parts.port and parts.port != DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+
+    path = parts.path or "/"
+    if len(path) > 1 and path.endswith("/"):
+        path = path.rstrip("/")
+
+    query = urlencode(
+        sorted(
+            (key, value)
+            for key, value in parse_qsl(parts.query, keep_blank_values=True)
+            if not is_tracking_param(key)
+        )
+    )
+
+    return urlunsplit((scheme, host, path, query, ""))
+
+
+def is_tracking_param(name: str) -> bool:
+    """
+    Return True if a query parameter only carries analytics tracking data.
+
+    Args:
+        name (str): Query parameter name.
+
+    Returns:
+        bool: Whether the parameter can be dropped without changing the page.
+    """
+    name = name.lower()
+    return name in TRACKING_PARAMS or name.startswith(TRACKING_PREFIXES)
@@ -0,0 +1,116 @@
+import json
+
+import pytest
+
+pytest.importorskip("fastapi")
+httpx = pytest.importorskip("httpx")
+pytest.importorskip("openai")
+pytest.importorskip("playwright")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+import sales_brochure_fastapi as api  # noqa: E402
+from components.async_orchestrator import (  # noqa: E402
+    AsyncSalesBrochureOrchestrator,
+)
+from core.page_snapshot import PageSnapshot  # noqa: E402
+from core.single_flight import AsyncSingleFlight  # noqa: E402
+from infrastructure.async_openai_client import AsyncOpenAIClientWrapper  # noqa: E402
+from infrastructure.async_openai_service import AsyncOpenAIService  # noqa: E402
+from infrastructure.prompt import PromptProvider  # noqa: E402
+
+BASE_URL = "https://acme.test/"
+ABOUT_URL = "https://acme.test/about"
+
+
+class FakeAsyncScraper:
+    async def fetch_page(self, url):
+        return PageSnapshot(
+            url=url, text=f"Acme builds warehouse robots. ({url})", links=[ABOUT_URL]
+        )
+
+    async def fetch_links(self, url):
+        return (await self.fetch_page(url)).links
+
+    async def fetch_content(self, url):
+        return (await self.fetch_page(url)).text
+
+
+class KeyProvider:
+    def get_api_key(self):
+        return "sk-test"
+
+
+class FakeOpenAIAPI:
+    """
+    Chat completions endpoint answering link selection with JSON and
+    anything else with a brochure.
+    """
+
+    def __init__(self):
+        self.requests = []
+
+    def __call__(self, request):
+        body = json.loads(request.content)
+        self.requests.append(body)
+        if "response_format" in body:
+            content = json.dumps({"links": [{"type": "about", "url": ABOUT_URL}]})
+        else:
+            content = "# Acme\n\nWarehouse robots."
+        return httpx.Response(
+            200,
+            json={
+                "id": "chatcmpl-test",
+                "object": "chat.completion",
+                "created": 0,
+                "model": body["model"],
+                "choices": [
+                    {
+                        "index": 0,
+                        "finish_reason": "stop",
+                        "message": {"role": "assistant", "content": content},
+                    }
+                ],
+            },
+        )
+
+
+@pytest.fixture
+def openai_api():
+    return FakeOpenAIAPI()
+
+
+@pytest.fixture
+def client(openai_api):
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(openai_api))
+
+    def ai_client(model, json_mode=False):
+        return AsyncOpenAIClientWrapper(
+            KeyProvider(), model, http_client=http_client, json_mode=json_mode
+        )
+
+    orchestrator = AsyncSalesBrochureOrchestrator(
+        FakeAsyncScraper(),
+        PromptProvider(),
+        AsyncOpenAIService(
+            ai_client("gpt-4"),
+            PromptProvider(),
+            link_ai_client=ai_client("gpt-4o-mini", json_mode=True),
+        ),
+    )
+    api.app.state.brochure_flight = AsyncSingleFlight()
+    api.app.state.orchestrators = {(False, False): orchestrator}
+    # No lifespan: the state above stands in for the app-scoped objects
+    return TestClient(api.app)
+
+
+def test_generate_runs_the_async_pipeline(client, openai_api):
+    response = client.post("/generate_prompt", json={"base_url": BASE_URL})
+
+    assert response.status_code == 200
+    assert response.json() == {"company_brochure": "# Acme\n\nWarehouse robots."}
+    select_links, brochure = openai_api.requests
+    assert select_links["model"] == "gpt-4o-mini"
+    assert select_links["response_format"] == {"type": "json_object"}
+    assert brochure["model"] == "gpt-4"
+    assert ABOUT_URL in brochure["messages"][1]["content"]
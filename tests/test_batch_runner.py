@@ -0,0 +1,154 @@
+import asyncio
+import json
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from components.batch_runner import AsyncBatchRunner, load_completed, read_urls
+from core.rate_limiter import AsyncTokenBucket, LLMRateLimiter
+from infrastructure.rate_limited_ai_client import AsyncRateLimitedAIClient
+
+
+class FlakyOrchestrator:
+    """
+    Fails each URL ``failures[url]`` times before generating its brochure,
+    and tracks how many URLs are in progress at once.
+    """
+
+    def __init__(self, failures=None):
+        self.failures = dict(failures or {})
+        self.active = 0
+        self.peak = 0
+
+    async def orchestrate(self, base_url):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(0.01)
+            if self.failures.get(base_url, 0):
+                self.failures[base_url] -= 1
+                raise RuntimeError("Scrape failed")
+            return f"# {base_url}"
+        finally:
+            self.active -= 1
+
+
+async def _results(runner, urls):
+    return {result["url"]: result async for result in runner.run(urls)}
+
+
+def test_batch_is_bounded_and_retries_failed_urls():
+    urls = [f"https://{name}.test/" for name in "abcdef"]
+    orchestrator = FlakyOrchestrator({urls[0]: 1, urls[1]: 5})
+    runner = AsyncBatchRunner(orchestrator, max_concurrency=2, retries=2, backoff=0)
+
+    results = asyncio.run(_results(runner, urls))
+
+    assert orchestrator.peak == 2
+    assert results[urls[0]]["status"] == "ok"
+    assert results[urls[0]]["attempts"] == 2
+    assert results[urls[1]] == {
+        **results[urls[1]],
+        "status": "error",
+        "brochure": None,
+        "error": "Scrape failed",
+        "attempts": 3,
+    }
+    assert results[urls[2]]["brochure"] == f"# {urls[2]}"
+
+
+def test_token_bucket_makes_callers_wait_for_refill():
+    bucket = AsyncTokenBucket(per_minute=600, capacity=1)
+
+    async def scenario():
+        started = time.perf_counter()
+        for _ in range(3):
+            await bucket.acquire()
+        return time.perf_counter() - started
+
+    assert asyncio.run(scenario()) >= 0.18
+
+
+def test_limiter_caps_concurrent_llm_calls():
+    limiter = LLMRateLimiter(max_concurrency=2)
+    active = peak = 0
+
+    async def call():
+        nonlocal active, peak
+        async with limiter.slot(estimated_tokens=10):
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+    async def scenario():
+        await asyncio.gather(*(call() for _ in range(5)))
+
+    asyncio.run(scenario())
+    assert peak == 2
+    assert limiter.stats()["calls"] == 5
+
+
+class UsageAIClient:
+    model = "test-model"
+
+    async def chat_completions_create(self, system, user):
+        return SimpleNamespace(usage=SimpleNamespace(total_tokens=40))
+
+
+def test_real_token_usage_settles_the_estimate():
+    limiter = LLMRateLimiter(tokens_per_minute=150)
+    client = AsyncRateLimitedAIClient(UsageAIClient(), limiter, completion_reserve=100)
+
+    async def scenario():
+        await client.chat_completions_create("system", "user")
+        started = time.perf_counter()
+        # Only fits in the bucket once the unused reserve is returned
+        await client.chat_completions_create("system", "user")
+        return time.perf_counter() - started
+
+    assert asyncio.run(scenario()) < 1
+    assert limiter.stats()["tokens_used"] == 80
+
+
+def test_url_files_are_read_in_order_without_duplicates(tmp_path):
+    csv_path = tmp_path / "urls.csv"
+    csv_path.write_text("name,url\nA,https://a.test/\nB,https://b.test/\n")
+    jsonl_path = tmp_path / "urls.jsonl"
+    jsonl_path.write_text('{"url": "https://a.test/"}\n\n{"url": "https://a.test/"}\n')
+    txt_path = tmp_path / "urls.txt"
+    txt_path.write_text("https://b.test/\n\nhttps://a.test/\n")
+
+    assert read_urls(str(csv_path)) == ["https://a.test/", "https://b.test/"]
+    assert read_urls(str(jsonl_path)) == ["https://a.test/"]
+    assert read_urls(str(txt_path)) == ["https://b.test/", "https://a.test/"]
+
+
+def test_resume_skips_only_completed_urls(tmp_path):
+    path = tmp_path / "results.jsonl"
+    lines = [
+        json.dumps({"url": "https://a.test/", "status": "ok"}),
+        json.dumps({"url": "https://b.test/", "status": "error"}),
+        '{"url": "https://c.te',
+    ]
+    path.write_text("\n".join(lines))
+
+    assert load_completed(str(path)) == {"https://a.test/"}
+    assert load_completed(str(tmp_path / "missing.jsonl")) == set()
+
+
+def test_batch_endpoint_rejects_oversized_batches(monkeypatch):
+    pytest.importorskip("fastapi")
+    pytest.importorskip("httpx")
+    pytest.importorskip("playwright")
+    from fastapi.testclient import TestClient
+
+    import sales_brochure_fastapi as api
+
+    monkeypatch.setenv("BATCH_MAX_URLS", "2")
+    urls = [f"https://{name}.test/" for name in "abc"]
+
+    response = TestClient(api.app).post("/batch", json={"urls": urls})
+
+    assert response.status_code == 413
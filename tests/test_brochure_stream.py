@@ -0,0 +1,92 @@
+import asyncio
+import time
+
+import pytest
+
+openai = pytest.importorskip("openai")
+httpx = pytest.importorskip("httpx")
+
+from components.async_orchestrator import (  # noqa: E402
+    AsyncSalesBrochureOrchestrator,
+)
+from components.brochure_job import collect_brochure  # noqa: E402
+from components.job_queue import JobQueue  # noqa: E402
+from core.job import JobStatus  # noqa: E402
+from core.page_snapshot import PageSnapshot  # noqa: E402
+from infrastructure.async_openai_service import AsyncOpenAIService  # noqa: E402
+from infrastructure.job_store import MemoryJobStore  # noqa: E402
+from infrastructure.prompt import PromptProvider  # noqa: E402
+from infrastructure.site_snapshot_store import MemorySiteSnapshotStore  # noqa: E402
+
+BASE_URL = "https://acme.test/"
+
+
+class FakeScraper:
+    async def fetch_page(self, url):
+        return PageSnapshot(url=url, text="Acme builds warehouse robots.", links=[])
+
+
+class CutOffAIClient:
+    """
+    Streams the start of a brochure, then loses the connection.
+    """
+
+    model = "test-model"
+
+    async def chat_completions_stream(self, system, user):
+        yield "# Acme\n\n"
+        yield "Acme builds"
+        raise openai.APIConnectionError(
+            request=httpx.Request("POST", "https://api.test/")
+        )
+
+
+def _orchestrator(site_store=None):
+    return AsyncSalesBrochureOrchestrator(
+        FakeScraper(),
+        PromptProvider(),
+        AsyncOpenAIService(CutOffAIClient(), PromptProvider()),
+        site_store=site_store,
+    )
+
+
+def test_stream_cut_off_mid_brochure_ends_in_an_error():
+    store = MemorySiteSnapshotStore()
+    orchestrator = _orchestrator(store)
+
+    async def consume():
+        events = []
+        with pytest.raises(openai.APIConnectionError):
+            async for event in orchestrator.orchestrate_stream(BASE_URL):
+                events.append(event)
+        return events
+
+    events = asyncio.run(consume())
+
+    tokens = [event["text"] for event in events if event["type"] == "token"]
+    assert tokens == ["# Acme\n\n", "Acme builds"]
+    assert not any(event["type"] == "done" for event in events)
+    # The cut-off brochure must not become the site's baseline
+    assert store.stats()["sites"] == 0
+
+
+def test_job_with_cut_off_stream_fails():
+    orchestrator = _orchestrator()
+    queue = JobQueue(
+        lambda url: asyncio.run(collect_brochure(orchestrator, url)),
+        MemoryJobStore(),
+        workers=1,
+    )
+    queue.start()
+    try:
+        job = queue.submit(BASE_URL)
+        deadline = time.monotonic() + 5
+        while queue.get(job.id).status in (JobStatus.QUEUED, JobStatus.RUNNING):
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+    finally:
+        queue.stop()
+
+    job = queue.get(job.id)
+    assert job.status == JobStatus.FAILED
+    assert job.result is None
@@ -0,0 +1,222 @@
+import asyncio
+import time
+
+import pytest
+
+pytest.importorskip("playwright")
+
+import infrastructure.async_browser_pool as async_browser_pool  # noqa: E402
+import infrastructure.browser_pool as browser_pool  # noqa: E402
+from infrastructure.async_browser_pool import AsyncPlaywrightBrowserPool  # noqa: E402
+from infrastructure.browser_pool import PlaywrightBrowserPool  # noqa: E402
+from interfaces.i_browser_pool import BrowserPoolExhaustedError  # noqa: E402
+
+
+class FakeBrowser:
+    def __init__(self, number):
+        self.number = number
+        self.connected = True
+        self.closed = False
+
+    def is_connected(self):
+        return self.connected
+
+    def new_context(self):
+        return FakeContext(self)
+
+    def close(self):
+        self.closed = True
+
+
+class FakeContext:
+    def __init__(self, browser):
+        self.browser = browser
+
+    def new_page(self):
+        return self.browser
+
+    def close(self):
+        pass
+
+
+class FakeChromium:
+    def __init__(self):
+        self.launched = []
+
+    def launch(self, headless=True):
+        self.launched.append(FakeBrowser(len(self.launched) + 1))
+        return self.launched[-1]
+
+
+class FakePlaywright:
+    def __init__(self):
+        self.chromium = FakeChromium()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class AsyncFakeBrowser(FakeBrowser):
+    """Same fake, with the async API's coroutine methods."""
+
+    async def new_context(self):
+        return AsyncFakeContext(self)
+
+    async def close(self):
+        self.closed = True
+
+
+class AsyncFakeContext(FakeContext):
+    async def new_page(self):
+        return self.browser
+
+    async def close(self):
+        pass
+
+
+class AsyncFakeChromium(FakeChromium):
+    async def launch(self, headless=True):
+        self.launched.append(AsyncFakeBrowser(len(self.launched) + 1))
+        return self.launched[-1]
+
+
+class AsyncFakePlaywright:
+    def __init__(self):
+        self.chromium = AsyncFakeChromium()
+
+    def __call__(self):
+        return self
+
+    async def start(self):
+        return self
+
+    async def stop(self):
+        pass
+
+
+async def _number(page):
+    return page.number
+
+
+async def _until_busy(pool):
+    while not pool.stats()["busy"]:
+        await asyncio.sleep(0)
+
+
+def test_sync_pool_recycles_browser_after_max_pages(monkeypatch):
+    playwright = FakePlaywright()
+    monkeypatch.setattr(browser_pool, "sync_playwright", lambda: playwright)
+    pool = PlaywrightBrowserPool(size=1, max_pages_per_browser=2)
+    pool.start()
+    try:
+        browsers = [pool.run(lambda page: page.number) for _ in range(3)]
+    finally:
+        pool.close()
+
+    assert browsers == [1, 1, 2]
+    assert playwright.chromium.launched[0].closed
+    assert pool.stats()["recycles"] == 1
+
+
+def test_sync_pool_relaunches_crashed_browser(monkeypatch):
+    playwright = FakePlaywright()
+    monkeypatch.setattr(browser_pool, "sync_playwright", lambda: playwright)
+    pool = PlaywrightBrowserPool(size=1)
+
+    def crash(page):
+        page.connected = False
+        raise RuntimeError("Target closed")
+
+    pool.start()
+    try:
+        with pytest.raises(RuntimeError, match="Target closed"):
+            pool.run(crash)
+        assert pool.run(lambda page: page.number) == 2
+    finally:
+        pool.close()
+
+    assert pool.stats()["failures"] == 1
+
+
+def test_sync_pool_fails_callers_when_workers_die(monkeypatch):
+    def broken():
+        raise RuntimeError("Executable doesn't exist")
+
+    monkeypatch.setattr(browser_pool, "sync_playwright", broken)
+    pool = PlaywrightBrowserPool(size=1, task_timeout=5)
+    pool.start()
+    try:
+        for _ in range(100):
+            if not pool.stats()["alive"]:
+                break
+            time.sleep(0.01)
+        with pytest.raises(RuntimeError, match="no running workers"):
+            pool.run(lambda page: page)
+    finally:
+        pool.close()
+
+
+def test_async_pool_rejects_callers_beyond_queue(monkeypatch):
+    monkeypatch.setattr(async_browser_pool, "async_playwright", AsyncFakePlaywright())
+    pool = AsyncPlaywrightBrowserPool(size=1, pages_per_browser=1, max_queue=0)
+
+    async def scenario():
+        await pool.start()
+        release = asyncio.Event()
+
+        async def hold(page):
+            await release.wait()
+            return page.number
+
+        first = asyncio.create_task(pool.run(hold))
+        await _until_busy(pool)
+        with pytest.raises(BrowserPoolExhaustedError):
+            await pool.run(hold)
+        release.set()
+        result = await first
+        await pool.close()
+        return result
+
+    assert asyncio.run(scenario()) == 1
+    assert pool.stats()["rejected"] == 1
+
+
+def test_async_pool_times_out_waiting_for_a_page(monkeypatch):
+    monkeypatch.setattr(async_browser_pool, "async_playwright", AsyncFakePlaywright())
+    pool = AsyncPlaywrightBrowserPool(size=1, pages_per_browser=1)
+
+    async def scenario():
+        await pool.start()
+        release = asyncio.Event()
+
+        async def hold(page):
+            await release.wait()
+
+        first = asyncio.create_task(pool.run(hold))
+        await _until_busy(pool)
+        with pytest.raises(BrowserPoolExhaustedError):
+            await pool.run(hold, timeout=0.01)
+        release.set()
+        await first
+        await pool.close()
+
+    asyncio.run(scenario())
+
+
+def test_async_pool_recycles_browser_after_max_pages(monkeypatch):
+    playwright = AsyncFakePlaywright()
+    monkeypatch.setattr(async_browser_pool, "async_playwright", playwright)
+    pool = AsyncPlaywrightBrowserPool(size=1, max_pages_per_browser=2)
+
+    async def scenario():
+        await pool.start()
+        browsers = [await pool.run(_number) for _ in range(3)]
+        await pool.close()
+        return browsers
+
+    assert asyncio.run(scenario()) == [1, 1, 2]
+    assert playwright.chromium.launched[0].closed
+    assert pool.stats()["recycles"] == 1
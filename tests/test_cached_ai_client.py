@@ -0,0 +1,172 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("openai")
+
+from openai.types.chat import ChatCompletion  # noqa: E402
+
+from infrastructure.cached_ai_client import (  # noqa: E402
+    AsyncCachedAIClient,
+    CachedAIClient,
+)
+from infrastructure.response_cache import (  # noqa: E402
+    MemoryResponseCache,
+    SqliteResponseCache,
+    TieredResponseCache,
+)
+
+
+class ScriptedAIClient:
+    """
+    Answers each call with the next of ``replies``.
+    """
+
+    model = "test-model"
+
+    def __init__(self, *replies):
+        self.replies = list(replies)
+        self.calls = 0
+
+    def chat_completions_create(self, system, user):
+        self.calls += 1
+        return ChatCompletion.model_validate(
+            {
+                "id": f"call-{self.calls}",
+                "object": "chat.completion",
+                "created": 0,
+                "model": self.model,
+                "choices": [
+                    {
+                        "index": 0,
+                        "finish_reason": "stop",
+                        "message": {
+                            "role": "assistant",
+                            "content": self.replies.pop(0),
+                        },
+                    }
+                ],
+            }
+        )
+
+
+def _content(response):
+    return response.choices[0].message.content
+
+
+def test_identical_request_is_answered_from_cache():
+    ai_client = ScriptedAIClient("# Acme")
+    client = CachedAIClient(ai_client, MemoryResponseCache())
+
+    assert _content(client.chat_completions_create("system", "user")) == "# Acme"
+    assert _content(client.chat_completions_create("system", "user")) == "# Acme"
+    assert ai_client.calls == 1
+
+
+def test_malformed_json_reply_is_not_cached():
+    ai_client = ScriptedAIClient('{"links": [', '{"links": []}')
+    client = CachedAIClient(ai_client, MemoryResponseCache(), json_reply=True)
+
+    replies = [
+        _content(client.chat_completions_create("system", "user")) for _ in range(3)
+    ]
+
+    assert replies == ['{"links": [', '{"links": []}', '{"links": []}']
+    assert ai_client.calls == 2
+
+
+def test_json_mode_is_part_of_the_key():
+    cache = MemoryResponseCache()
+    ai_client = ScriptedAIClient('{"links": []}', "Links: none")
+    CachedAIClient(ai_client, cache, json_mode=True).chat_completions_create(
+        "system", "user"
+    )
+
+    response = CachedAIClient(ai_client, cache).chat_completions_create(
+        "system", "user"
+    )
+
+    assert _content(response) == "Links: none"
+    assert ai_client.calls == 2
+
+
+def test_cached_responses_survive_a_restart(tmp_path):
+    path = str(tmp_path / "llm.sqlite3")
+    ai_client = ScriptedAIClient("# Acme")
+    CachedAIClient(ai_client, SqliteResponseCache(path)).chat_completions_create(
+        "system", "user"
+    )
+
+    cache = TieredResponseCache(MemoryResponseCache(), SqliteResponseCache(path))
+    response = CachedAIClient(ai_client, cache).chat_completions_create(
+        "system", "user"
+    )
+
+    assert _content(response) == "# Acme"
+    assert ai_client.calls == 1
+    assert cache.memory.stats()["entries"] == 1
+
+
+def test_expired_response_is_requested_again():
+    ai_client = ScriptedAIClient("# Acme", "# Acme v2")
+    client = CachedAIClient(ai_client, MemoryResponseCache(ttl=0))
+
+    client.chat_completions_create("system", "user")
+    response = client.chat_completions_create("system", "user")
+
+    assert _content(response) == "# Acme v2"
+
+
+def test_refresh_replaces_and_bypass_skips_the_cache():
+    cache = MemoryResponseCache()
+    ai_client = ScriptedAIClient("# Old", "# New", "# Uncached")
+    CachedAIClient(ai_client, cache).chat_completions_create("system", "user")
+    CachedAIClient(ai_client, cache, refresh=True).chat_completions_create(
+        "system", "user"
+    )
+    CachedAIClient(ai_client, cache, bypass=True).chat_completions_create(
+        "system", "user"
+    )
+
+    response = CachedAIClient(ai_client, cache).chat_completions_create(
+        "system", "user"
+    )
+
+    assert _content(response) == "# New"
+    assert ai_client.calls == 3
+
+
+class StreamingAIClient:
+    model = "test-model"
+
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.calls = 0
+
+    async def chat_completions_stream(self, system, user):
+        self.calls += 1
+        yield "# Ac"
+        if self.fail:
+            raise ConnectionError("Stream cut off")
+        yield "me"
+
+
+async def _collect(client):
+    return [chunk async for chunk in client.chat_completions_stream("system", "user")]
+
+
+def test_complete_stream_is_replayed_from_cache():
+    ai_client = StreamingAIClient()
+    client = AsyncCachedAIClient(ai_client, MemoryResponseCache())
+
+    assert asyncio.run(_collect(client)) == ["# Ac", "me"]
+    assert asyncio.run(_collect(client)) == ["# Acme"]
+    assert ai_client.calls == 1
+
+
+def test_cut_off_stream_is_not_cached():
+    cache = MemoryResponseCache()
+    with pytest.raises(ConnectionError):
+        asyncio.run(_collect(AsyncCachedAIClient(StreamingAIClient(True), cache)))
+
+    assert cache.stats()["entries"] == 0
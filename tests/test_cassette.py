@@ -0,0 +1,249 @@
+import asyncio
+import time
+
+import pytest
+
+pytest.importorskip("openai")
+
+from openai.types.chat import ChatCompletion  # noqa: E402
+
+from core.cassette_entry import CassetteMode  # noqa: E402
+from core.page_snapshot import PageSnapshot  # noqa: E402
+from infrastructure.cassette import JsonlCassette  # noqa: E402
+from infrastructure.cassette_ai_client import (  # noqa: E402
+    AsyncCassetteAIClient,
+    CassetteAIClient,
+)
+from infrastructure.cassette_scraper import (  # noqa: E402
+    AsyncCassetteScraperProvider,
+    CassetteScraperProvider,
+)
+from interfaces.i_cassette import CassetteMissError  # noqa: E402
+
+URL = "https://acme.test/about"
+
+
+def _completion(content):
+    return ChatCompletion.model_validate(
+        {
+            "id": "call-1",
+            "object": "chat.completion",
+            "created": 0,
+            "model": "test-model",
+            "choices": [
+                {
+                    "index": 0,
+                    "finish_reason": "stop",
+                    "message": {"role": "assistant", "content": content},
+                }
+            ],
+        }
+    )
+
+
+class FakeScraper:
+    def __init__(self):
+        self.loads = 0
+
+    def fetch_page(self, url):
+        self.loads += 1
+        return PageSnapshot(
+            url=url,
+            html="<p>Acme builds robots.</p>",
+            text="Acme builds robots.",
+            links=["https://acme.test/careers"],
+            etag='"v1"',
+        )
+
+
+class FakeAIClient:
+    model = "test-model"
+
+    def __init__(self):
+        self.calls = 0
+
+    def chat_completions_create(self, system, user):
+        self.calls += 1
+        return _completion(f"Brochure for {user}")
+
+
+class FakeAsyncAIClient(FakeAIClient):
+    def __init__(self, fail_after=None):
+        super().__init__()
+        self.chunks = ["Acme ", "builds ", "robots."]
+        self.fail_after = fail_after
+
+    async def chat_completions_create(self, system, user):
+        return super().chat_completions_create(system, user)
+
+    async def chat_completions_stream(self, system, user):
+        self.calls += 1
+        for number, chunk in enumerate(self.chunks):
+            if number == self.fail_after:
+                raise ConnectionError("stream dropped")
+            yield chunk
+
+
+class Offline:
+    """
+    Stands in for the browser and the API on replay; any call fails.
+    """
+
+    model = "test-model"
+
+    def __getattr__(self, name):
+        raise AssertionError(f"{name} called during replay")
+
+
+def _replay(path, **kwargs):
+    return JsonlCassette(str(path), mode=CassetteMode.REPLAY, **kwargs)
+
+
+@pytest.mark.parametrize("name", ["cassette.jsonl", "cassette.jsonl.gz"])
+def test_pages_replay_without_the_browser(tmp_path, name):
+    path = tmp_path / name
+    recorded = CassetteScraperProvider(
+        FakeScraper(), JsonlCassette(str(path), mode=CassetteMode.RECORD)
+    ).fetch_page(URL)
+
+    cassette = _replay(path)
+    replayed = CassetteScraperProvider(Offline(), cassette).fetch_page(
+        "https://ACME.test/about/?utm_source=ad#team"
+    )
+
+    assert replayed.url == "https://ACME.test/about/?utm_source=ad#team"
+    assert (replayed.html, replayed.text, replayed.links, replayed.etag) == (
+        recorded.html,
+        recorded.text,
+        recorded.links,
+        recorded.etag,
+    )
+    assert cassette.stats()["hits"] == 1
+
+
+def test_async_pages_replay_without_the_browser(tmp_path):
+    path = tmp_path / "cassette.jsonl.gz"
+
+    class AsyncFakeScraper(FakeScraper):
+        async def fetch_page(self, url):
+            return super().fetch_page(url)
+
+    recorder = AsyncCassetteScraperProvider(
+        AsyncFakeScraper(), JsonlCassette(str(path), mode=CassetteMode.RECORD)
+    )
+    asyncio.run(recorder.fetch_page(URL))
+
+    replayer = AsyncCassetteScraperProvider(Offline(), _replay(path))
+    assert asyncio.run(replayer.fetch_links(URL)) == ["https://acme.test/careers"]
+
+
+def test_completions_replay_without_the_api(tmp_path):
+    path = tmp_path / "cassette.jsonl.gz"
+    recorder = CassetteAIClient(
+        FakeAIClient(), JsonlCassette(str(path), mode=CassetteMode.RECORD)
+    )
+    recorded = recorder.chat_completions_create("system", "acme.test")
+
+    replayer = CassetteAIClient(Offline(), _replay(path))
+    replayed = replayer.chat_completions_create("system", "acme.test")
+
+    assert replayed == recorded
+    with pytest.raises(CassetteMissError):
+        replayer.chat_completions_create("system", "other.test")
+
+
+def test_streams_replay_chunk_by_chunk(tmp_path):
+    path = tmp_path / "cassette.jsonl.gz"
+    recorder = AsyncCassetteAIClient(
+        FakeAsyncAIClient(), JsonlCassette(str(path), mode=CassetteMode.RECORD)
+    )
+
+    async def stream(client):
+        return [chunk async for chunk in client.chat_completions_stream("s", "u")]
+
+    recorded = asyncio.run(stream(recorder))
+    replayer = AsyncCassetteAIClient(Offline(), _replay(path))
+
+    assert asyncio.run(stream(replayer)) == recorded == ["Acme ", "builds ", "robots."]
+
+
+def test_interrupted_stream_is_not_recorded(tmp_path):
+    path = tmp_path / "cassette.jsonl.gz"
+    recorder = AsyncCassetteAIClient(
+        FakeAsyncAIClient(fail_after=2),
+        JsonlCassette(str(path), mode=CassetteMode.RECORD),
+    )
+
+    async def stream():
+        return [chunk async for chunk in recorder.chat_completions_stream("s", "u")]
+
+    with pytest.raises(ConnectionError):
+        asyncio.run(stream())
+    assert recorder.stats()["recorded"] == 0
+    assert not path.exists()
+
+
+def test_lenient_replay_records_misses_for_the_next_run(tmp_path):
+    path = tmp_path / "cassette.jsonl"
+    scraper = FakeScraper()
+
+    CassetteScraperProvider(scraper, _replay(path, strict=False)).fetch_page(URL)
+    assert scraper.loads == 1
+
+    cassette = _replay(path)
+    CassetteScraperProvider(Offline(), cassette).fetch_page(URL)
+    assert cassette.stats() == {
+        "mode": CassetteMode.REPLAY,
+        "entries": 1,
+        "hits": 1,
+        "misses": 0,
+        "recorded": 0,
+    }
+
+
+def test_truncated_recording_is_skipped(tmp_path):
+    path = tmp_path / "cassette.jsonl"
+    recorder = CassetteScraperProvider(
+        FakeScraper(), JsonlCassette(str(path), mode=CassetteMode.RECORD)
+    )
+    recorder.fetch_page(URL)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"kind": "page", "key": "https://acme.test/car')
+
+    cassette = _replay(path)
+    assert cassette.stats()["entries"] == 1
+    CassetteScraperProvider(Offline(), cassette).fetch_page(URL)
+
+
+def test_replay_waits_the_scaled_recorded_duration(tmp_path):
+    path = tmp_path / "cassette.jsonl"
+    recorder = JsonlCassette(str(path), mode=CassetteMode.RECORD)
+    recorder.record("page", URL, {"url": URL, "text": "Acme"}, elapsed=0.4)
+
+    scraper = CassetteScraperProvider(Offline(), _replay(path, latency_scale=0.5))
+    started = time.perf_counter()
+    assert scraper.fetch_content(URL) == "Acme"
+    assert time.perf_counter() - started >= 0.2
+
+
+def test_cassette_is_configured_from_the_environment(monkeypatch, tmp_path):
+    pytest.importorskip("playwright")
+    from container.salesbrochure_container import SalesBrochureContainer
+
+    monkeypatch.delenv("CASSETTE_MODE", raising=False)
+    assert SalesBrochureContainer.create_cassette() is None
+
+    monkeypatch.setenv("CASSETTE_MODE", "replay")
+    monkeypatch.setenv("CASSETTE_PATH", str(tmp_path / "cassette.jsonl"))
+    monkeypatch.setenv("CASSETTE_STRICT", "0")
+    monkeypatch.setenv("CASSETTE_LATENCY", "0.5")
+    cassette = SalesBrochureContainer.create_cassette()
+    assert (cassette.mode, cassette.strict, cassette.latency_scale) == (
+        CassetteMode.REPLAY,
+        False,
+        0.5,
+    )
+
+    monkeypatch.setenv("CASSETTE_MODE", "rewind")
+    with pytest.raises(ValueError, match="rewind"):
+        SalesBrochureContainer.create_cassette()
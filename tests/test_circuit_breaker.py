@@ -0,0 +1,65 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("openai")
+
+from core.circuit_breaker import CircuitBreaker, CircuitOpenError  # noqa: E402
+from core.retry_policy import RetryPolicy  # noqa: E402
+from infrastructure.resilient_ai_client import AsyncResilientAIClient  # noqa: E402
+
+
+class HangingAIClient:
+    model = "test-model"
+
+    def __init__(self):
+        self.started = asyncio.Event()
+        self.hang = True
+
+    async def chat_completions_create(self, system, user):
+        self.started.set()
+        if self.hang:
+            await asyncio.Event().wait()
+        return "ok"
+
+    async def chat_completions_stream(self, system, user):
+        self.started.set()
+        if self.hang:
+            await asyncio.Event().wait()
+        yield "ok"
+
+
+def half_open_breaker() -> CircuitBreaker:
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.01)
+    breaker.record_failure()
+    return breaker
+
+
+async def cancel_trial(breaker: CircuitBreaker, stream: bool) -> str:
+    ai_client = HangingAIClient()
+    client = AsyncResilientAIClient(ai_client, RetryPolicy(), breaker)
+    await asyncio.sleep(0.02)
+    assert breaker.state == "half_open"
+
+    if stream:
+        call = client.chat_completions_stream("system", "user").__anext__()
+    else:
+        call = client.chat_completions_create("system", "user")
+    task = asyncio.ensure_future(call)
+    await ai_client.started.wait()
+    with pytest.raises(CircuitOpenError):
+        breaker.allow()
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    ai_client.hang = False
+    return await client.chat_completions_create("system", "user")
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_cancelled_half_open_trial_is_released(stream):
+    breaker = half_open_breaker()
+
+    assert asyncio.run(cancel_trial(breaker, stream)) == "ok"
+    assert breaker.state == "closed"
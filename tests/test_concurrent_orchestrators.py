@@ -0,0 +1,106 @@
+import asyncio
+import json
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("openai")
+
+from components.async_orchestrator import (  # noqa: E402
+    AsyncSalesBrochureOrchestrator,
+)
+from components.orchestrator import SalesBrochureOrchestrator  # noqa: E402
+from core.page_snapshot import PageSnapshot  # noqa: E402
+from infrastructure.async_openai_service import AsyncOpenAIService  # noqa: E402
+from infrastructure.openai_service import OpenAIService  # noqa: E402
+from infrastructure.prompt import PromptProvider  # noqa: E402
+
+SITES = [f"https://site-{number}.test/" for number in range(8)]
+
+
+def _page(url):
+    # Slow enough for concurrent requests to overlap
+    time.sleep(0.02)
+    return PageSnapshot(
+        url=url, text=f"Company at {url} builds robots.", links=[f"{url}about"]
+    )
+
+
+def _reply(system, user):
+    if system == PromptProvider().system_prompt():
+        about = re.search(r"https://[\w.-]+/about", user).group()
+        content = json.dumps({"links": [{"type": "about", "url": about}]})
+    else:
+        content = " ".join(sorted(set(re.findall(r"https://[\w./-]+", user))))
+    return SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content=content))],
+        usage=None,
+    )
+
+
+class SiteScraper:
+    def fetch_page(self, url):
+        return _page(url)
+
+    def fetch_links(self, url):
+        return _page(url).links
+
+    def fetch_content(self, url):
+        return _page(url).text
+
+
+class AsyncSiteScraper:
+    async def fetch_page(self, url):
+        return await asyncio.to_thread(_page, url)
+
+    async def fetch_links(self, url):
+        return (await self.fetch_page(url)).links
+
+    async def fetch_content(self, url):
+        return (await self.fetch_page(url)).text
+
+
+class EchoAIClient:
+    """
+    Selects each site's about page and writes a brochure listing the URLs
+    in its prompt.
+    """
+
+    model = "test-model"
+
+    def chat_completions_create(self, system, user):
+        return _reply(system, user)
+
+
+class AsyncEchoAIClient(EchoAIClient):
+    async def chat_completions_create(self, system, user):
+        await asyncio.sleep(0.01)
+        return _reply(system, user)
+
+
+def test_one_sync_orchestrator_serves_many_threads():
+    orchestrator = SalesBrochureOrchestrator(
+        SiteScraper(), PromptProvider(), OpenAIService(EchoAIClient(), PromptProvider())
+    )
+
+    with ThreadPoolExecutor(max_workers=len(SITES)) as pool:
+        brochures = list(pool.map(orchestrator.orchestrate, SITES))
+
+    assert brochures == [f"{url} {url}about" for url in SITES]
+
+
+def test_one_async_orchestrator_serves_many_tasks():
+    orchestrator = AsyncSalesBrochureOrchestrator(
+        AsyncSiteScraper(),
+        PromptProvider(),
+        AsyncOpenAIService(AsyncEchoAIClient(), PromptProvider()),
+    )
+
+    async def scenario():
+        return await asyncio.gather(*(orchestrator.orchestrate(url) for url in SITES))
+
+    brochures = asyncio.run(scenario())
+    assert brochures == [f"{url} {url}about" for url in SITES]
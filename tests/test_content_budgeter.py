@@ -0,0 +1,32 @@
+from components.content_budgeter import ContentBudgeter
+from utils.token_estimate import count_tokens
+
+
+def _paragraph(words: int) -> str:
+    return " ".join(f"product{i} platform customers" for i in range(words // 3))
+
+
+def test_paragraph_over_budget_is_split_not_dropped():
+    contents = _paragraph(300)
+    # Over the budget but under map_reduce_ratio times it
+    budget = count_tokens(contents, "gpt-4") * 2 // 3
+    budgeter = ContentBudgeter(token_budget=budget, model="gpt-4")
+
+    result = budgeter.fit(contents)
+
+    assert result.mode == "trim"
+    assert result.text
+    assert contents.startswith(result.text)
+    assert 0 < result.tokens_out <= budget
+
+
+def test_paragraph_over_chunk_size_is_split_across_chunks():
+    budgeter = ContentBudgeter(token_budget=100, model="gpt-4", chunk_tokens=150)
+    contents = "## https://example.com/about\n" + _paragraph(600)
+
+    result = budgeter.fit(contents)
+
+    assert result.mode == "map_reduce"
+    assert len(result.chunks) > 1
+    for chunk in result.chunks:
+        assert count_tokens(chunk, "gpt-4") <= 150 + 10  # page header
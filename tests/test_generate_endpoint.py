@@ -0,0 +1,61 @@
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")
+pytest.importorskip("playwright")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+import sales_brochure_fastapi as api  # noqa: E402
+from components.async_orchestrator import (  # noqa: E402
+    AsyncSalesBrochureOrchestrator,
+)
+from core.single_flight import AsyncSingleFlight  # noqa: E402
+from infrastructure.async_openai_service import AsyncOpenAIService  # noqa: E402
+from infrastructure.async_playwright_scraper import (  # noqa: E402
+    AsyncPlaywrightWebScraper,
+)
+from infrastructure.prompt import PromptProvider  # noqa: E402
+from interfaces.i_async_browser_pool import IAsyncBrowserPool  # noqa: E402
+from interfaces.i_browser_pool import BrowserPoolExhaustedError  # noqa: E402
+
+
+class SaturatedBrowserPool(IAsyncBrowserPool):
+    async def start(self):
+        pass
+
+    async def close(self):
+        pass
+
+    async def run(self, task, timeout=None):
+        raise BrowserPoolExhaustedError("Browser pool is exhausted")
+
+    def stats(self):
+        return {}
+
+
+class UnusedAIClient:
+    model = "test-model"
+
+    async def chat_completions_create(self, system, user):
+        raise AssertionError("The scrape stage failed; no LLM call expected")
+
+
+@pytest.fixture
+def client():
+    orchestrator = AsyncSalesBrochureOrchestrator(
+        AsyncPlaywrightWebScraper(browser_pool=SaturatedBrowserPool()),
+        PromptProvider(),
+        AsyncOpenAIService(UnusedAIClient(), PromptProvider()),
+    )
+    api.app.state.brochure_flight = AsyncSingleFlight()
+    api.app.state.orchestrators = {(False, False): orchestrator}
+    # No lifespan: the state above stands in for the app-scoped objects
+    return TestClient(api.app)
+
+
+def test_saturated_browser_pool_returns_503(client):
+    response = client.post("/generate_prompt", json={"base_url": "https://a.test/"})
+
+    assert response.status_code == 503
+    assert response.json()["detail"] == "Browser pool is exhausted"
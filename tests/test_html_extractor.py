@@ -0,0 +1,118 @@
+import pytest
+
+pytest.importorskip("lxml")
+
+from infrastructure.html_extractor import (  # noqa: E402
+    InPageExtractor,
+    ReadabilityExtractor,
+    _HtmlExtractor,
+)
+
+LANDING_PAGE = """
+<html><body>
+  <header class="site-header"><a href="/">Acme</a><nav><a href="/a">A</a></nav></header>
+  <div id="app">
+    <section class="hero">
+      <h1>Warehouse robots for everyone</h1>
+      <p>Acme builds autonomous picking robots that work alongside people.</p>
+    </section>
+    <section class="features">
+      <div class="card"><h3>Fast picking</h3>
+        <p>Robots pick up to 600 items an hour, day and night.</p></div>
+      <div class="card"><h3>Easy setup</h3>
+        <p>Installation takes a weekend, with no changes to your shelving.</p></div>
+      <div class="card"><h3>Safe by design</h3>
+        <p>Lidar and vision stop the robot before it gets close to anyone.</p></div>
+    </section>
+    <section class="customers">
+      <h2>Customers</h2>
+      <p>Retailers, grocers and 3PLs in twelve countries run Acme fleets.</p>
+    </section>
+    <section class="careers">
+      <h2>Careers</h2>
+      <p>We are hiring engineers, field technicians and account managers.</p>
+    </section>
+  </div>
+  <div class="cookie-banner"><p>We use cookies to improve your visit here.</p></div>
+  <footer><p>Copyright Acme Robotics, all rights reserved, since 2014.</p></footer>
+</body></html>
+"""
+
+ARTICLE_PAGE = """
+<html><body>
+  <div class="wrapper">
+    <div class="container">
+      <article>
+        <h1>Why we built Acme</h1>
+        <p>Warehouses lose hours every day walking between shelves, and
+        hiring has not kept up with demand for years.</p>
+        <p>Our robots bring the shelf to the picker, so people spend their
+        time on the work that needs judgement, not on walking.</p>
+      </article>
+    </div>
+    <div class="links"><ul>
+      <li><a href="/x">Another post about our robots and warehouses</a></li>
+      <li><a href="/y">Yet another post about our robots and people</a></li>
+    </ul></div>
+  </div>
+</body></html>
+"""
+
+
+def test_sectioned_landing_page_is_kept_whole():
+    text = ReadabilityExtractor().extract("https://acme.test/", LANDING_PAGE).text
+
+    for expected in (
+        "# Warehouse robots for everyone",
+        "### Fast picking",
+        "### Easy setup",
+        "### Safe by design",
+        "## Customers",
+        "## Careers",
+        "We are hiring engineers",
+    ):
+        assert expected in text
+    assert "cookies" not in text
+    assert "Copyright" not in text
+
+
+def test_article_page_keeps_article_only():
+    snapshot = ReadabilityExtractor().extract("https://acme.test/blog", ARTICLE_PAGE)
+
+    assert snapshot.text.startswith("# Why we built Acme")
+    assert "bring the shelf to the picker" in snapshot.text
+    assert "Another post" not in snapshot.text
+    assert "https://acme.test/x" in snapshot.links
+
+
+def test_html_backend_must_implement_parse():
+    class NoParseExtractor(_HtmlExtractor):
+        pass
+
+    with pytest.raises(TypeError):
+        NoParseExtractor()
+
+
+def test_page_data_gives_the_same_snapshot_for_every_extractor():
+    data = {"links": ["/about", "mailto:hi@acme.test"], "paragraphs": ["Acme", ""]}
+
+    snapshots = [
+        extractor.extract_page_data("https://acme.test/", data)
+        for extractor in (InPageExtractor(), ReadabilityExtractor())
+    ]
+
+    assert snapshots[0] == snapshots[1]
+    assert snapshots[0].links == ["https://acme.test/about"]
+    assert snapshots[0].text == "Acme"
+
+
+def test_default_extractor_keeps_main_content(monkeypatch):
+    pytest.importorskip("openai")
+    pytest.importorskip("playwright")
+    from container.salesbrochure_container import SalesBrochureContainer
+
+    monkeypatch.delenv("HTML_EXTRACTOR", raising=False)
+
+    extractor = SalesBrochureContainer.create_html_extractor()
+
+    assert isinstance(extractor, ReadabilityExtractor)
@@ -0,0 +1,165 @@
+import threading
+import time
+
+import pytest
+
+from components.job_queue import JobQueue, JobQueueFullError
+from core.job import JobStatus
+from infrastructure.job_store import MemoryJobStore, SqliteJobStore
+
+
+class GatedJob:
+    """
+    Job function that waits for ``release`` before returning a brochure,
+    or raising ``error``.
+    """
+
+    def __init__(self, error=None):
+        self.error = error
+        self.release = threading.Event()
+
+    def __call__(self, base_url):
+        self.release.wait(5)
+        if self.error is not None:
+            raise self.error
+        return {"result": f"# {base_url}", "stage_timings": {"generate": 0.5}}
+
+
+def _wait_for(queue, job, status):
+    for _ in range(500):
+        if queue.get(job.id).status == status:
+            return queue.get(job.id)
+        time.sleep(0.01)
+    raise AssertionError(f"Job stayed {queue.get(job.id).status}")
+
+
+@pytest.fixture
+def gated():
+    job_fn = GatedJob()
+    yield job_fn
+    job_fn.release.set()
+
+
+def test_job_moves_from_queued_to_running_to_succeeded(gated):
+    queue = JobQueue(gated, MemoryJobStore(), workers=1, result_ttl=60)
+    queue.start()
+    try:
+        first = queue.submit("https://a.test/")
+        second = queue.submit("https://b.test/")
+
+        _wait_for(queue, first, JobStatus.RUNNING)
+        assert queue.get(second.id).status == JobStatus.QUEUED
+        assert queue.stats()["running"] == 1
+
+        gated.release.set()
+        done = _wait_for(queue, first, JobStatus.SUCCEEDED)
+    finally:
+        queue.stop()
+
+    assert done.result == "# https://a.test/"
+    assert set(done.stage_timings) == {"queued", "generate"}
+    assert done.expires_at == pytest.approx(done.finished_at + 60)
+    assert queue.stats()["succeeded"] == 2
+
+
+def test_failing_job_records_its_error():
+    job_fn = GatedJob(error=RuntimeError("Scrape failed"))
+    job_fn.release.set()
+    queue = JobQueue(job_fn, MemoryJobStore(), workers=1)
+    queue.start()
+    try:
+        job = _wait_for(queue, queue.submit("https://a.test/"), JobStatus.FAILED)
+    finally:
+        queue.stop()
+
+    assert job.error == "Scrape failed"
+    assert job.result is None
+
+
+def test_full_queue_refuses_jobs(gated):
+    store = MemoryJobStore()
+    queue = JobQueue(gated, store, workers=1, max_queue=1)
+    queue.start()
+    try:
+        _wait_for(queue, queue.submit("https://a.test/"), JobStatus.RUNNING)
+        queue.submit("https://b.test/")
+        with pytest.raises(JobQueueFullError):
+            queue.submit("https://c.test/")
+    finally:
+        gated.release.set()
+        queue.stop()
+
+
+def test_stop_fails_jobs_that_never_started(gated):
+    queue = JobQueue(gated, MemoryJobStore(), workers=1)
+    queue.start()
+    running = queue.submit("https://a.test/")
+    waiting = queue.submit("https://b.test/")
+    _wait_for(queue, running, JobStatus.RUNNING)
+
+    gated.release.set()
+    queue.stop()
+
+    assert queue.get(running.id).status == JobStatus.SUCCEEDED
+    assert queue.get(waiting.id).status == JobStatus.FAILED
+    with pytest.raises(JobQueueFullError):
+        queue.submit("https://c.test/")
+
+
+def test_finished_jobs_expire(gated):
+    gated.release.set()
+    queue = JobQueue(gated, MemoryJobStore(), workers=1, result_ttl=0)
+    queue.start()
+    try:
+        job = queue.submit("https://a.test/")
+        for _ in range(500):
+            if queue.get(job.id) is None:
+                break
+            time.sleep(0.01)
+    finally:
+        queue.stop()
+
+    assert queue.get(job.id) is None
+
+
+def test_sqlite_store_keeps_jobs_across_restarts(tmp_path, gated):
+    path = str(tmp_path / "jobs.sqlite3")
+    gated.release.set()
+    queue = JobQueue(gated, SqliteJobStore(path), workers=1)
+    queue.start()
+    try:
+        job = _wait_for(queue, queue.submit("https://a.test/"), JobStatus.SUCCEEDED)
+    finally:
+        queue.stop()
+
+    assert SqliteJobStore(path).get(job.id) == job
+
+
+def test_job_endpoints_return_202_404_and_503(gated):
+    pytest.importorskip("fastapi")
+    pytest.importorskip("httpx")
+    pytest.importorskip("playwright")
+    from fastapi.testclient import TestClient
+
+    import sales_brochure_fastapi as api
+
+    queue = JobQueue(gated, MemoryJobStore(), workers=1, max_queue=1)
+    api.app.state.job_queue = queue
+    client = TestClient(api.app)
+    queue.start()
+    try:
+        created = client.post("/jobs", json={"base_url": "https://a.test/"})
+        _wait_for(queue, queue.get(created.json()["job_id"]), JobStatus.RUNNING)
+        client.post("/jobs", json={"base_url": "https://b.test/"})
+        refused = client.post("/jobs", json={"base_url": "https://c.test/"})
+        job = client.get(f"/jobs/{created.json()['job_id']}")
+        missing = client.get("/jobs/unknown")
+    finally:
+        gated.release.set()
+        queue.stop()
+
+    assert created.status_code == 202
+    assert created.json()["status"] == JobStatus.QUEUED
+    assert refused.status_code == 503
+    assert job.json()["status"] == JobStatus.RUNNING
+    assert missing.status_code == 404
@@ -0,0 +1,35 @@
+from components.link_prefilter import LinkPrefilter
+
+BASE = "https://example.com/"
+
+
+def _candidates(links):
+    return LinkPrefilter().filter(BASE, links).candidates
+
+
+def test_locale_variants_collapse_but_short_paths_do_not():
+    candidates = _candidates(
+        [
+            "/about",
+            "/en/about",
+            "/en-us/about",
+            "/pt_br/about",
+            "/ai/products",
+            "/go/pricing",
+            "/products",
+        ]
+    )
+
+    assert "https://example.com/about" in candidates
+    assert not any("/en" in url or "/pt_br" in url for url in candidates)
+    assert "https://example.com/ai/products" in candidates
+    assert "https://example.com/go/pricing" in candidates
+    assert "https://example.com/products" in candidates
+
+
+def test_deny_wins_unless_the_page_itself_is_allowed():
+    candidates = _candidates(
+        ["/about/privacy", "/careers/search", "/blog/careers", "/blog/launch-day"]
+    )
+
+    assert candidates == ["https://example.com/blog/careers"]
@@ -0,0 +1,33 @@
+from core.llm_usage_stats import LLMUsageStats
+from core.metrics import MetricsRegistry
+
+
+def test_collector_keys_become_labels_not_metric_names():
+    usage = LLMUsageStats()
+    usage.record("brochure", "gpt-4o", 1.0, prompt_tokens=10)
+    usage.record("select_links", "gpt-4o-mini", 0.5, prompt_tokens=5)
+    metrics = MetricsRegistry()
+    metrics.register_collector("llm_usage", usage.stats, labels=("operation", "model"))
+
+    lines = metrics.render().splitlines()
+
+    assert lines.count("# TYPE brochure_llm_usage_calls gauge") == 1
+    assert 'brochure_llm_usage_calls{operation="brochure",model="gpt-4o"} 1' in lines
+    assert (
+        'brochure_llm_usage_prompt_tokens{operation="select_links",'
+        'model="gpt-4o-mini"} 5'
+    ) in lines
+    assert not any("gpt" in line.split("{")[0] for line in lines)
+
+
+def test_unlabelled_collector_keeps_nested_names_and_hit_rate():
+    metrics = MetricsRegistry()
+    metrics.register_collector(
+        "page_cache", lambda: {"hits": 3, "misses": 1, "disk": {"entries": 2}}
+    )
+
+    lines = metrics.render().splitlines()
+
+    assert "brochure_page_cache_hits 3" in lines
+    assert "brochure_page_cache_disk_entries 2" in lines
+    assert "brochure_page_cache_hit_rate 0.75" in lines
@@ -0,0 +1,115 @@
+import asyncio
+
+import pytest
+
+from core.llm_usage_stats import LLMUsageStats
+from core.model_route import BROCHURE, DEFAULT_MODEL_ROUTES, SELECT_LINKS
+from infrastructure.fallback_ai_client import AsyncFallbackAIClient, FallbackAIClient
+
+
+class ModelClient:
+    """
+    Answers with its model name, or fails with ``error`` (after yielding
+    ``chunks_before_error`` chunks when streaming).
+    """
+
+    def __init__(self, model, calls, error=None, chunks_before_error=0):
+        self.model = model
+        self.calls = calls
+        self.error = error
+        self.chunks_before_error = chunks_before_error
+
+    def chat_completions_create(self, system, user):
+        self.calls.append(self.model)
+        if self.error is not None:
+            raise self.error
+        return self.model
+
+    async def chat_completions_stream(self, system, user):
+        self.calls.append(self.model)
+        for number in range(self.chunks_before_error):
+            yield f"{self.model}-{number}"
+        if self.error is not None:
+            raise self.error
+        yield self.model
+
+
+def test_models_are_tried_in_route_order():
+    calls, stats = [], LLMUsageStats()
+    client = FallbackAIClient(
+        [
+            ModelClient("gpt-4o-mini", calls, TimeoutError("slow")),
+            ModelClient("gpt-4o", calls, ConnectionError("down")),
+            ModelClient("gpt-4", calls),
+        ],
+        SELECT_LINKS,
+        stats,
+    )
+
+    assert client.chat_completions_create("system", "user") == "gpt-4"
+    assert calls == ["gpt-4o-mini", "gpt-4o", "gpt-4"]
+    assert client.model == "gpt-4o-mini"
+    assert stats.stats()[SELECT_LINKS]["gpt-4o-mini"]["fallbacks"] == 1
+    assert stats.stats()[SELECT_LINKS]["gpt-4o"]["fallbacks"] == 1
+
+
+def test_last_model_error_is_raised():
+    calls = []
+    client = FallbackAIClient(
+        [
+            ModelClient("gpt-4", calls, TimeoutError("slow")),
+            ModelClient("gpt-4o", calls, ConnectionError("down")),
+        ],
+        BROCHURE,
+    )
+
+    with pytest.raises(ConnectionError):
+        client.chat_completions_create("system", "user")
+
+
+async def _stream(client):
+    return [chunk async for chunk in client.chat_completions_stream("system", "user")]
+
+
+def test_stream_falls_back_before_its_first_chunk():
+    calls = []
+    client = AsyncFallbackAIClient(
+        [
+            ModelClient("gpt-4", calls, TimeoutError("slow")),
+            ModelClient("gpt-4o", calls),
+        ],
+        BROCHURE,
+    )
+
+    assert asyncio.run(_stream(client)) == ["gpt-4o"]
+
+
+def test_stream_does_not_fall_back_after_its_first_chunk():
+    calls = []
+    client = AsyncFallbackAIClient(
+        [
+            ModelClient("gpt-4", calls, ConnectionError("cut"), chunks_before_error=1),
+            ModelClient("gpt-4o", calls),
+        ],
+        BROCHURE,
+    )
+
+    with pytest.raises(ConnectionError):
+        asyncio.run(_stream(client))
+    assert calls == ["gpt-4"]
+
+
+def test_routes_are_configured_from_the_environment(monkeypatch):
+    pytest.importorskip("openai")
+    pytest.importorskip("playwright")
+    from container.salesbrochure_container import SalesBrochureContainer
+
+    monkeypatch.setenv("LLM_MODELS_BROCHURE", "gpt-4o, gpt-4o-mini")
+    monkeypatch.setenv("LLM_JSON_MODE", "0")
+
+    routes = SalesBrochureContainer.create_model_routes()
+
+    assert routes[BROCHURE].models == ("gpt-4o", "gpt-4o-mini")
+    assert routes[SELECT_LINKS].models == DEFAULT_MODEL_ROUTES[SELECT_LINKS].models
+    assert not routes[SELECT_LINKS].json_mode
+    assert DEFAULT_MODEL_ROUTES[SELECT_LINKS].json_mode
@@ -0,0 +1,165 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from core.page_cache_entry import PageCacheEntry
+from core.page_snapshot import PageSnapshot
+from infrastructure.cached_scraper import CachedScraperProvider
+from infrastructure.http_revalidator import HttpRevalidator
+from infrastructure.page_cache import (
+    MemoryPageCache,
+    SqlitePageCache,
+    TieredPageCache,
+)
+
+URL = "https://acme.test/about"
+
+
+def _entry(url, text="x" * 10, **fields):
+    return PageCacheEntry(url=url, text=text, **fields)
+
+
+class CountingScraper:
+    def __init__(self, snapshot=None):
+        self.snapshot = snapshot
+        self.calls = 0
+
+    def fetch_page(self, url):
+        self.calls += 1
+        return self.snapshot or PageSnapshot(
+            url=url, text="Acme", html="<p>Acme</p>", etag='"v1"'
+        )
+
+
+class FakeRevalidator:
+    def __init__(self, unchanged):
+        self.unchanged = unchanged
+        self.checked = []
+
+    def is_unchanged(self, url, etag, last_modified):
+        self.checked.append((url, etag, last_modified))
+        return self.unchanged
+
+
+def test_memory_tier_evicts_least_recently_used_over_budget():
+    cache = MemoryPageCache(max_bytes=25)
+    cache.set("a", _entry("a"))
+    cache.set("b", _entry("b"))
+    cache.get("a")
+
+    cache.set("c", _entry("c"))
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_memory_tier_skips_entries_larger_than_budget():
+    cache = MemoryPageCache(max_bytes=5)
+    cache.set("a", _entry("a"))
+
+    assert cache.stats()["entries"] == 0
+
+
+def test_disk_tier_keeps_newest_entries(tmp_path):
+    cache = SqlitePageCache(str(tmp_path / "pages.sqlite3"), max_entries=2)
+    for number, key in enumerate("abc"):
+        cache.set(key, _entry(key, links=[f"/{key}"], stored_at=number))
+
+    assert cache.get("a") is None
+    assert cache.get("c") == _entry("c", links=["/c"], stored_at=2)
+    assert cache.stats()["evictions"] == 1
+
+
+def test_disk_hits_are_promoted_to_memory(tmp_path):
+    disk = SqlitePageCache(str(tmp_path / "pages.sqlite3"))
+    disk.set("a", _entry("a"))
+    cache = TieredPageCache(MemoryPageCache(), disk)
+
+    assert cache.get("a") is not None
+    assert cache.memory.get("a") is not None
+
+
+def test_fresh_page_is_served_from_cache():
+    scraper = CountingScraper()
+    cached = CachedScraperProvider(scraper, MemoryPageCache())
+
+    cached.fetch_page(URL)
+    snapshot = cached.fetch_page("https://ACME.test/about/?utm_source=ad#team")
+
+    assert snapshot.text == "Acme"
+    assert scraper.calls == 1
+    assert cached.stats()["hits"] == 1
+
+
+def test_stale_page_is_revalidated_instead_of_rendered():
+    scraper = CountingScraper()
+    revalidator = FakeRevalidator(unchanged=True)
+    cached = CachedScraperProvider(
+        scraper, MemoryPageCache(), ttl=0, revalidator=revalidator
+    )
+
+    cached.fetch_page(URL)
+    before = time.time()
+    snapshot = cached.fetch_page(URL)
+
+    assert snapshot.text == "Acme"
+    assert scraper.calls == 1
+    assert revalidator.checked == [(URL, '"v1"', None)]
+    assert cached.cache.get(URL).stored_at >= before
+    assert cached.stats()["revalidated"] == 1
+
+
+def test_changed_page_is_rendered_again():
+    scraper = CountingScraper()
+    cached = CachedScraperProvider(
+        scraper, MemoryPageCache(), ttl=0, revalidator=FakeRevalidator(False)
+    )
+
+    cached.fetch_page(URL)
+    cached.fetch_page(URL)
+
+    assert scraper.calls == 2
+
+
+def test_empty_page_is_not_cached():
+    scraper = CountingScraper(PageSnapshot(url=URL))
+    cached = CachedScraperProvider(scraper, MemoryPageCache())
+
+    cached.fetch_page(URL)
+    cached.fetch_page(URL)
+
+    assert scraper.calls == 2
+
+
+class ConditionalHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.headers.get("If-None-Match") == '"v1"':
+            self.send_response(304)
+        else:
+            self.send_response(200)
+            self.send_header("ETag", '"v2"')
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), ConditionalHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/"
+    server.shutdown()
+    server.server_close()
+
+
+def test_revalidator_treats_304_as_unchanged(server_url):
+    revalidator = HttpRevalidator()
+
+    assert revalidator.is_unchanged(server_url, '"v1"', None)
+    assert not revalidator.is_unchanged(server_url, '"v0"', None)
+    assert not revalidator.is_unchanged(server_url, None, None)
@@ -0,0 +1,86 @@
+import asyncio
+from collections import Counter
+
+from components.page_crawler import AsyncPageCrawler
+from core.page_snapshot import PageSnapshot
+
+
+class SlowScraper:
+    """
+    Takes ``delays[url]`` seconds per page (0.01 by default) and tracks how
+    many pages, overall and per domain, are in flight at once.
+    """
+
+    def __init__(self, delays=None, errors=(), empty=()):
+        self.delays = delays or {}
+        self.errors = set(errors)
+        self.empty = set(empty)
+        self.active = Counter()
+        self.peak = Counter()
+
+    async def fetch_page(self, url):
+        domain = url.split("/")[2]
+        for key in ("all", domain):
+            self.active[key] += 1
+            self.peak[key] = max(self.peak[key], self.active[key])
+        try:
+            await asyncio.sleep(self.delays.get(url, 0.01))
+            if url in self.errors:
+                raise RuntimeError("Connection reset")
+            if url in self.empty:
+                return PageSnapshot(url=url)
+            return PageSnapshot(url=url, text=f"Text of {url}")
+        finally:
+            for key in ("all", domain):
+                self.active[key] -= 1
+
+
+def _urls(domain, count):
+    return [f"https://{domain}/page-{i}" for i in range(count)]
+
+
+def test_crawl_is_bounded_globally_and_per_domain():
+    scraper = SlowScraper()
+    crawler = AsyncPageCrawler(scraper, max_concurrency=3, per_domain_concurrency=2)
+    urls = _urls("a.test", 4) + _urls("b.test", 4)
+
+    result = asyncio.run(crawler.crawl(urls))
+
+    assert [page.url for page in result.pages] == urls[: crawler.max_pages]
+    assert scraper.peak["all"] == 3
+    assert scraper.peak["a.test"] == 2
+
+
+def test_crawl_skips_duplicates_beyond_max_pages():
+    crawler = AsyncPageCrawler(SlowScraper(), max_pages=2)
+    urls = _urls("a.test", 3)
+
+    result = asyncio.run(crawler.crawl([urls[0], urls[0], urls[1], urls[2]]))
+
+    assert [page.url for page in result.pages] == urls[:2]
+
+
+def test_failed_empty_and_slow_pages_are_reported():
+    slow, broken, empty, good = _urls("a.test", 4)
+    scraper = SlowScraper(delays={slow: 1}, errors=[broken], empty=[empty])
+    crawler = AsyncPageCrawler(scraper, page_timeout=0.1)
+
+    result = asyncio.run(crawler.crawl([slow, broken, empty, good]))
+
+    assert [page.url for page in result.pages] == [good]
+    assert result.failed == [broken, empty]
+    assert result.timed_out == [slow]
+    assert result.partial
+
+
+def test_total_budget_returns_the_pages_fetched_so_far():
+    slow, fast = _urls("a.test", 2)
+    scraper = SlowScraper(delays={slow: 5})
+    crawler = AsyncPageCrawler(scraper, total_budget=0.2)
+
+    result = asyncio.run(crawler.crawl([slow, fast]))
+
+    assert [page.url for page in result.pages] == [fast]
+    assert result.timed_out == [slow]
+    assert result.elapsed < 1
+    assert scraper.active["all"] == 0
@@ -0,0 +1,182 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("playwright")
+pytest.importorskip("bs4")
+
+from core.load_profile import LOAD_PROFILES  # noqa: E402
+from core.scrape_stats import ScrapeStats  # noqa: E402
+from infrastructure.async_playwright_scraper import (  # noqa: E402
+    AsyncPlaywrightWebScraper,
+)
+from interfaces.i_async_browser_pool import IAsyncBrowserPool  # noqa: E402
+
+URL = "https://acme.test/"
+TEXT = "Acme builds warehouse robots for retailers across Europe. " * 8
+
+
+class FakeResponse:
+    headers = {}
+
+
+class FakeRoute:
+    def __init__(self, resource_type, url, handled):
+        self.request = SimpleNamespace(resource_type=resource_type, url=url)
+        self.handled = handled
+
+    async def abort(self):
+        self.handled.append(("abort", self.request.url))
+
+    async def continue_(self):
+        self.handled.append(("continue", self.request.url))
+
+
+class FakePage:
+    """
+    Requests a page, its logo and a tracker. Unless ``static``, shows the
+    text only once the network is idle, like a page rendered by
+    client-side JavaScript after its stylesheets load.
+    """
+
+    REQUESTS = (
+        ("document", URL),
+        ("image", "https://acme.test/logo.png"),
+        ("script", "https://www.googletagmanager.com/gtm.js"),
+    )
+
+    def __init__(self, static=False):
+        self.idle = static
+        self.router = None
+        self.handled = []
+
+    async def route(self, pattern, handler):
+        self.router = handler
+
+    def on(self, event, handler):
+        pass
+
+    async def goto(self, url, wait_until=None, timeout=None):
+        for resource_type, request_url in self.REQUESTS:
+            if self.router is not None:
+                await self.router(FakeRoute(resource_type, request_url, self.handled))
+        return FakeResponse()
+
+    async def wait_for_load_state(self, state):
+        self.idle = self.idle or state == "networkidle"
+
+    async def wait_for_timeout(self, ms):
+        pass
+
+    async def content(self):
+        body = f"<p>{TEXT}</p>" if self.idle else "<div id='app'></div>"
+        return f"<html><body>{body}</body></html>"
+
+
+class FakeBrowserPool(IAsyncBrowserPool):
+    def __init__(self, static=False):
+        self.static = static
+        self.pages = []
+
+    async def start(self):
+        pass
+
+    async def close(self):
+        pass
+
+    async def run(self, task, timeout=None):
+        self.pages.append(FakePage(self.static))
+        return await task(self.pages[-1])
+
+    def stats(self):
+        return {}
+
+
+class FakeHttpFetcher:
+    def __init__(self, html):
+        self.html = html
+        self.fetched = []
+
+    def fetch(self, url):
+        self.fetched.append(url)
+        return self.html, {"etag": '"v1"'}, len(self.html)
+
+
+def _scraper(profile, pool, stats, http_fetcher=None):
+    return AsyncPlaywrightWebScraper(
+        browser_pool=pool,
+        load_profile=LOAD_PROFILES[profile],
+        stats=stats,
+        http_fetcher=http_fetcher,
+    )
+
+
+def test_thin_fast_render_falls_back_to_full_render():
+    pool, stats = FakeBrowserPool(), ScrapeStats()
+
+    snapshot = asyncio.run(_scraper("fast", pool, stats).fetch_page(URL))
+
+    assert snapshot.text.strip() == TEXT.strip()
+    assert len(pool.pages) == 2
+    assert stats.stats()["fast"]["full_renders"] == 1
+
+
+def test_full_profile_renders_once():
+    pool, stats = FakeBrowserPool(), ScrapeStats()
+
+    snapshot = asyncio.run(_scraper("full", pool, stats).fetch_page(URL))
+
+    assert snapshot.text.strip() == TEXT.strip()
+    assert len(pool.pages) == 1
+    assert stats.stats()["full"]["full_renders"] == 0
+
+
+def test_fast_profile_blocks_images_and_trackers():
+    pool, stats = FakeBrowserPool(static=True), ScrapeStats()
+
+    asyncio.run(_scraper("fast", pool, stats).fetch_page(URL))
+
+    assert pool.pages[0].handled == [
+        ("continue", URL),
+        ("abort", "https://acme.test/logo.png"),
+        ("abort", "https://www.googletagmanager.com/gtm.js"),
+    ]
+    assert stats.stats()["fast"]["blocked"] == 2
+    assert stats.stats()["fast"]["full_renders"] == 0
+
+
+def test_http_profile_skips_the_browser_for_server_rendered_pages():
+    pool, stats = FakeBrowserPool(), ScrapeStats()
+    http_fetcher = FakeHttpFetcher(f"<html><body><p>{TEXT}</p></body></html>")
+
+    snapshot = asyncio.run(_scraper("http", pool, stats, http_fetcher).fetch_page(URL))
+
+    assert snapshot.etag == '"v1"'
+    assert pool.pages == []
+    assert stats.stats()["http"]["http"] == 1
+
+
+def test_http_profile_renders_pages_that_need_javascript():
+    pool, stats = FakeBrowserPool(static=True), ScrapeStats()
+    http_fetcher = FakeHttpFetcher("<html><body><div id='app'></div></body></html>")
+
+    snapshot = asyncio.run(_scraper("http", pool, stats, http_fetcher).fetch_page(URL))
+
+    assert snapshot.text.strip() == TEXT.strip()
+    assert http_fetcher.fetched == [URL]
+    assert stats.stats()["http"]["fallbacks"] == 1
+
+
+def test_load_profile_defaults_to_fast_with_extra_blocked_domains(monkeypatch):
+    pytest.importorskip("openai")
+    from container.salesbrochure_container import SalesBrochureContainer
+
+    monkeypatch.delenv("SCRAPER_LOAD_PROFILE", raising=False)
+    monkeypatch.setenv("SCRAPER_BLOCK_DOMAINS", "chat.acme.test, ")
+
+    profile = SalesBrochureContainer.create_load_profile()
+
+    assert profile.name == "fast"
+    assert profile.should_block("script", "https://chat.acme.test/widget.js")
+    assert not profile.should_block("script", "https://acme.test/app.js")
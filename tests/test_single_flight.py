@@ -0,0 +1,121 @@
+import asyncio
+
+import pytest
+
+from core.single_flight import AsyncSingleFlight
+from infrastructure.single_flight_ai_client import AsyncSingleFlightAIClient
+
+
+class SlowWork:
+    def __init__(self, result="done", error=None):
+        self.result = result
+        self.error = error
+        self.runs = 0
+        self.cancelled = False
+
+    async def __call__(self):
+        self.runs += 1
+        try:
+            await asyncio.sleep(0.05)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+def test_concurrent_calls_with_one_key_run_once():
+    flight, work = AsyncSingleFlight(), SlowWork()
+
+    async def scenario():
+        return await asyncio.gather(*(flight.do("a", work) for _ in range(3)))
+
+    assert asyncio.run(scenario()) == ["done"] * 3
+    assert work.runs == 1
+    assert flight.stats() == {"in_flight": 0, "started": 1, "coalesced": 2}
+
+
+def test_calls_with_other_keys_or_later_calls_run_again():
+    flight, work = AsyncSingleFlight(), SlowWork()
+
+    async def scenario():
+        await asyncio.gather(flight.do("a", work), flight.do("b", work))
+        await flight.do("a", work)
+
+    asyncio.run(scenario())
+    assert work.runs == 3
+
+
+def test_error_reaches_every_waiter_and_releases_the_key():
+    flight, work = AsyncSingleFlight(), SlowWork(error=ValueError("boom"))
+
+    async def scenario():
+        return await asyncio.gather(
+            flight.do("a", work), flight.do("a", work), return_exceptions=True
+        )
+
+    errors = asyncio.run(scenario())
+    assert [type(e) for e in errors] == [ValueError, ValueError]
+    assert flight.stats()["in_flight"] == 0
+
+
+def test_cancelling_one_waiter_leaves_the_others_running():
+    flight, work = AsyncSingleFlight(), SlowWork()
+
+    async def scenario():
+        first = asyncio.ensure_future(flight.do("a", work))
+        second = asyncio.ensure_future(flight.do("a", work))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        return await second
+
+    assert asyncio.run(scenario()) == "done"
+    assert not work.cancelled
+
+
+def test_cancelling_every_waiter_cancels_the_work():
+    flight, work = AsyncSingleFlight(), SlowWork()
+
+    async def scenario():
+        waiter = asyncio.ensure_future(flight.do("a", work))
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        await asyncio.sleep(0)
+
+    asyncio.run(scenario())
+    assert work.cancelled
+    assert flight.stats()["in_flight"] == 0
+
+
+class CountingAIClient:
+    model = "test-model"
+
+    def __init__(self):
+        self.calls = []
+
+    async def chat_completions_create(self, system, user):
+        self.calls.append(user)
+        await asyncio.sleep(0.05)
+        return f"Reply to {user}"
+
+
+def test_identical_llm_requests_share_one_call():
+    ai_client = CountingAIClient()
+    client = AsyncSingleFlightAIClient(ai_client, AsyncSingleFlight())
+
+    async def scenario():
+        return await asyncio.gather(
+            client.chat_completions_create("system", "acme"),
+            client.chat_completions_create("system", "acme"),
+            client.chat_completions_create("system", "globex"),
+        )
+
+    assert asyncio.run(scenario()) == [
+        "Reply to acme",
+        "Reply to acme",
+        "Reply to globex",
+    ]
+    assert sorted(ai_client.calls) == ["acme", "globex"]
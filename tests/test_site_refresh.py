@@ -0,0 +1,186 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+openai = pytest.importorskip("openai")
+httpx = pytest.importorskip("httpx")
+
+from components.async_orchestrator import (  # noqa: E402
+    AsyncSalesBrochureOrchestrator,
+)
+from components.content_budgeter import ContentBudgeter  # noqa: E402
+from components.orchestrator import SalesBrochureOrchestrator  # noqa: E402
+from core.brochure_request import BrochureRequest  # noqa: E402
+from core.crawl_result import CrawlResult  # noqa: E402
+from core.page_snapshot import PageSnapshot  # noqa: E402
+from infrastructure.async_openai_service import AsyncOpenAIService  # noqa: E402
+from infrastructure.openai_service import OpenAIService  # noqa: E402
+from infrastructure.prompt import PromptProvider  # noqa: E402
+from infrastructure.site_snapshot_store import MemorySiteSnapshotStore  # noqa: E402
+
+BASE_URL = "https://acme.test/"
+LINKS = ["https://acme.test/about", "https://acme.test/careers"]
+
+
+class FakeScraper:
+    def fetch_page(self, url):
+        return PageSnapshot(url=url, text="Acme builds warehouse robots.", links=LINKS)
+
+    def fetch_links(self, url):
+        return LINKS
+
+    def fetch_content(self, url):
+        return self.fetch_page(url).text
+
+
+class FlakyAIClient:
+    """
+    Fails the operations listed in ``down``; answers every other call.
+    """
+
+    model = "test-model"
+
+    def __init__(self, down=("select_links",)):
+        self.down = set(down)
+        self.calls = []
+
+    def chat_completions_create(self, system, user):
+        operation = (
+            "select_links" if system == PromptProvider().system_prompt() else "brochure"
+        )
+        self.calls.append(operation)
+        if operation in self.down:
+            raise openai.APIConnectionError(
+                request=httpx.Request("POST", "https://api.test/")
+            )
+        if operation == "select_links":
+            content = json.dumps({"links": [{"type": "about", "url": LINKS[0]}]})
+        else:
+            content = f"# Acme\n\n{user.count('acme.test/about')} about links"
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=content))]
+        )
+
+
+def test_failed_link_selection_is_not_stored_as_baseline():
+    ai_client = FlakyAIClient()
+    store = MemorySiteSnapshotStore()
+    orchestrator = SalesBrochureOrchestrator(
+        FakeScraper(),
+        PromptProvider(),
+        OpenAIService(ai_client, PromptProvider()),
+        site_store=store,
+    )
+
+    degraded = orchestrator.run(BrochureRequest(base_url=BASE_URL))
+    assert degraded.stages["stages"]["select_links"]["status"] == "fallback"
+    assert degraded.relevant_links == []
+    assert store.stats()["sites"] == 0
+
+    ai_client.down.clear()
+    ai_client.calls.clear()
+    recovered = orchestrator.run(BrochureRequest(base_url=BASE_URL))
+    assert ai_client.calls == ["select_links", "brochure"]
+    assert recovered.relevant_links == [LINKS[0]]
+    assert store.stats()["sites"] == 1
+
+    ai_client.calls.clear()
+    assert (
+        orchestrator.run(BrochureRequest(base_url=BASE_URL)).brochure
+        == recovered.brochure
+    )
+    assert ai_client.calls == []
+
+
+def test_failed_brochure_is_not_stored_as_baseline():
+    ai_client = FlakyAIClient(down=("brochure",))
+    store = MemorySiteSnapshotStore()
+    orchestrator = SalesBrochureOrchestrator(
+        FakeScraper(),
+        PromptProvider(),
+        OpenAIService(ai_client, PromptProvider()),
+        site_store=store,
+    )
+
+    with pytest.raises(openai.APIConnectionError):
+        orchestrator.run(BrochureRequest(base_url=BASE_URL))
+    assert store.stats()["sites"] == 0
+
+    ai_client.down.clear()
+    orchestrator.run(BrochureRequest(base_url=BASE_URL))
+    assert store.stats()["sites"] == 1
+
+
+class FakeAsyncScraper:
+    def __init__(self, pages):
+        self.pages = pages
+
+    async def fetch_page(self, url):
+        return PageSnapshot(url=url, text=self.pages[url], links=LINKS)
+
+
+class FakeCrawler:
+    def __init__(self, pages):
+        self.pages = pages
+
+    async def crawl(self, urls):
+        return CrawlResult(
+            pages=[PageSnapshot(url=url, text=self.pages[url]) for url in urls]
+        )
+
+
+class SummaryAIClient:
+    """
+    Selects every link, and summarises each chunk by its first line.
+    """
+
+    model = "test-model"
+
+    def __init__(self):
+        self.summarised = []
+
+    async def chat_completions_create(self, system, user):
+        prompts = PromptProvider()
+        if system == prompts.system_prompt():
+            content = json.dumps({"links": [{"url": url} for url in LINKS]})
+        elif system == prompts.summary_system_prompt():
+            page = next((url for url in LINKS if url in user), BASE_URL)
+            self.summarised.append(page)
+            content = f"Summary of {page}"
+        else:
+            content = "# Acme"
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=content))],
+            usage=None,
+        )
+
+
+def _page(topic):
+    return " ".join(f"Acme {topic} sentence number {i}." for i in range(12))
+
+
+def test_changed_page_is_the_only_one_summarised_again():
+    pages = {
+        BASE_URL: _page("landing"),
+        LINKS[0]: _page("about"),
+        LINKS[1]: _page("careers"),
+    }
+    ai_client = SummaryAIClient()
+    orchestrator = AsyncSalesBrochureOrchestrator(
+        FakeAsyncScraper(pages),
+        PromptProvider(),
+        AsyncOpenAIService(ai_client, PromptProvider()),
+        page_crawler=FakeCrawler(pages),
+        content_budgeter=ContentBudgeter(token_budget=60, chunk_tokens=200),
+        site_store=MemorySiteSnapshotStore(),
+    )
+
+    asyncio.run(orchestrator.orchestrate(BASE_URL))
+    assert sorted(ai_client.summarised) == sorted([BASE_URL, *LINKS])
+
+    ai_client.summarised.clear()
+    pages[LINKS[1]] = _page("hiring")
+    asyncio.run(orchestrator.orchestrate(BASE_URL))
+    assert ai_client.summarised == [LINKS[1]]
@@ -0,0 +1,166 @@
+import asyncio
+import time
+
+import pytest
+
+from core.stage_graph import AsyncStageGraph, Stage, StageGraph
+
+
+def _sleep_then(value, seconds=0.2):
+    def run(*args):
+        time.sleep(seconds)
+        return value
+
+    return run
+
+
+def _async_sleep_then(value, seconds=0.2):
+    async def run(*args):
+        await asyncio.sleep(seconds)
+        return value
+
+    return run
+
+
+def _fail(*args):
+    raise RuntimeError("stage down")
+
+
+def _stages(make):
+    """
+    ``links`` and ``budget`` both need only ``page``; ``brochure`` needs
+    both, and ``links`` is slower.
+    """
+    return [
+        Stage("scrape", make("<page>", 0.05), ("url",), ("page",)),
+        Stage("select_links", make(["/about"], 0.3), ("page",), ("links",)),
+        Stage("budget", make("<text>", 0.2), ("page",), ("text",)),
+        Stage(
+            "generate",
+            lambda links, text: f"{text} {links}",
+            ("links", "text"),
+            ("brochure",),
+        ),
+    ]
+
+
+def test_independent_stages_run_at_the_same_time():
+    started = time.perf_counter()
+    result = StageGraph(_stages(_sleep_then)).run({"url": "https://acme.test/"})
+
+    assert time.perf_counter() - started < 0.5
+    assert result.values["brochure"] == "<text> ['/about']"
+    assert result.critical_path == ["scrape", "select_links", "generate"]
+    assert result.runs["budget"].started == pytest.approx(
+        result.runs["select_links"].started, abs=0.05
+    )
+
+
+def test_async_independent_stages_run_at_the_same_time():
+    graph = AsyncStageGraph(_stages(_async_sleep_then))
+
+    started = time.perf_counter()
+    result = asyncio.run(graph.run({"url": "https://acme.test/"}))
+
+    assert time.perf_counter() - started < 0.5
+    assert result.values["brochure"] == "<text> ['/about']"
+    assert result.critical_path == ["scrape", "select_links", "generate"]
+
+
+@pytest.mark.parametrize("run", [_fail, _sleep_then(["/slow"], 1.0)])
+def test_failed_or_slow_stage_uses_its_fallback(run):
+    events = []
+    graph = StageGraph(
+        [
+            Stage(
+                "select_links",
+                run,
+                ("page",),
+                ("links",),
+                timeout=0.1,
+                fallback=lambda page: [],
+            )
+        ]
+    )
+
+    started = time.perf_counter()
+    result = graph.run({"page": "<page>"}, lambda run, outputs: events.append(outputs))
+
+    assert time.perf_counter() - started < 0.5
+    assert result.values["links"] == []
+    assert result.runs["select_links"].status == "fallback"
+    assert events == [None, {"links": []}]
+    stage = result.to_dict()["stages"]["select_links"]
+    assert stage["error"].startswith(("RuntimeError", "TimeoutError"))
+
+
+@pytest.mark.parametrize("run", [_fail, _async_sleep_then(["/slow"], 1.0)])
+def test_async_failed_or_slow_stage_uses_its_fallback(run):
+    graph = AsyncStageGraph(
+        [
+            Stage(
+                "select_links",
+                run,
+                ("page",),
+                ("links",),
+                timeout=0.1,
+                fallback=lambda page: [],
+            )
+        ]
+    )
+
+    result = asyncio.run(graph.run({"page": "<page>"}))
+
+    assert result.values["links"] == []
+    assert result.runs["select_links"].status == "fallback"
+
+
+def test_stage_without_fallback_raises_its_own_error():
+    graph = StageGraph(
+        [
+            Stage("scrape", _fail, ("url",), ("page",)),
+            Stage("generate", lambda page: page, ("page",), ("brochure",)),
+        ]
+    )
+
+    with pytest.raises(RuntimeError, match="stage down"):
+        graph.run({"url": "https://acme.test/"})
+
+
+def test_async_stage_without_fallback_cancels_the_others():
+    cancelled = []
+
+    async def slow(url):
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.append("crawl")
+            raise
+
+    async def fail(url):
+        await asyncio.sleep(0.05)
+        raise TimeoutError("scrape timed out")
+
+    graph = AsyncStageGraph(
+        [
+            Stage("scrape", fail, ("url",), ("page",)),
+            Stage("crawl", slow, ("url",), ("pages",)),
+        ]
+    )
+
+    async def scenario():
+        with pytest.raises(TimeoutError, match="scrape timed out"):
+            await graph.run({"url": "https://acme.test/"})
+        await asyncio.sleep(0)
+
+    asyncio.run(scenario())
+    assert cancelled == ["crawl"]
+
+
+def test_graph_rejects_stages_that_can_never_start():
+    with pytest.raises(ValueError, match="produced by both"):
+        StageGraph([Stage("a", _fail, (), ("page",)), Stage("b", _fail, (), ("page",))])
+
+    graph = StageGraph([Stage("generate", _fail, ("text",), ("brochure",))])
+    with pytest.raises(ValueError, match="missing inputs"):
+        graph.run({"url": "https://acme.test/"})
@@ -1,6 +1,28 @@
+import json
+
 import requests
 import streamlit as st
 
+STREAM_URL = "http://localhost:8000/generate_brochure/stream"
+
+STAGE_LABELS = {
+    "scrape": "🔍 Scraping the website",
+    "select_links": "🧩 Selecting relevant pages",
+    "crawl": "🌐 Reading relevant pages",
+    "budget": "✂️ Condensing page contents",
+    "generate": "📝 Writing the brochure",
+}
+
+
+def iter_sse(response):
+    """
+    Yield parsed JSON payloads from a Server-Sent Events response.
+    """
+    for line in response.iter_lines(decode_unicode=True):
+        if line and line.startswith("data:"):
+            yield json.loads(line[len("data:") :].strip())
+
+
 st.title("📚 LLM Powered Sales Brochure")
 st.markdown("<br>", unsafe_allow_html=True)
 
@@ -17,22 +39,38 @@ with st.form("my_form"):
         if not text:
             st.error("⚠️ Please enter a product or service.")
         else:
-            with st.spinner("⏳ Generating your sales brochure..."):
-                try:
-                    response = requests.post(
-                        "http://localhost:8000/generate_prompt",
-                        json={"base_url": text},
-                    )
-                    if response.status_code == 200:
-                        data = response.json()
-                        company_brochure = data.get("company_brochure")
-                        st.markdown(
-                            f"📝 **Example Brochure Content:**\n\n{company_brochure}"
-                        )
-                    else:
+            status = st.status("⏳ Generating your sales brochure...")
+            placeholder = st.empty()
+            company_brochure = ""
+            try:
+                with requests.post(
+                    STREAM_URL, json={"base_url": text}, stream=True
+                ) as response:
+                    if response.status_code != 200:
                         st.error(f"❌ Failed to fetch links: {response.text}")
-                except Exception as e:
-                    st.error(f"❌ An error occurred: {str(e)}")
-                    st.stop()
+                        st.stop()
+
+                    for event in iter_sse(response):
+                        if event["type"] == "progress":
+                            label = STAGE_LABELS.get(event["stage"], event["stage"])
+                            if event["status"] == "started":
+                                status.update(label=f"{label}...")
+                            else:
+                                status.write(f"✅ {label}")
+                        elif event["type"] == "token":
+                            # Render partial markdown as it arrives
+                            company_brochure += event["text"]
+                            placeholder.markdown(
+                                f"📝 **Example Brochure Content:**\n\n{company_brochure}"
+                            )
+                        elif event["type"] == "error":
+                            status.update(label="❌ Generation failed", state="error")
+                            st.error(f"❌ An error occurred: {event['detail']}")
+                            st.stop()
+
+                status.update(label="✅ Brochure ready", state="complete")
+            except Exception as e:
+                st.error(f"❌ An error occurred: {str(e)}")
+                st.stop()
 
 # streamlit run sales_brochure_ui.py